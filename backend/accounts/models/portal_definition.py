@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from django.db import models
 
+from core.managers.tenant_resolution import TenantResolutionQuerySet
+
 
 class PortalDefinition(models.Model):
     """
@@ -25,5 +27,7 @@ class PortalDefinition(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = TenantResolutionQuerySet.as_manager()
+
     def __str__(self) -> str:
         return f"{self.code} ({self.domain})"
\ No newline at end of file
@@ -1,12 +1,73 @@
-from rest_framework.pagination import CursorPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
+from audit_logging.services.query.audit_cursor import paginate
 
-class AuditCursorPagination(CursorPagination):
+
+class AuditCursorPagination(BasePagination):
+    """
+    Keyset pagination over (occurred_at, id), newest first.
+
+    Cursors carry the last row's position instead of an offset, so
+    deep pages cost the same as the first one.
+    """
 
     page_size = 50
 
-    ordering = "-occurred_at"
+    cursor_query_param = "cursor"
 
     page_size_query_param = "page_size"
 
-    max_page_size = 200
\ No newline at end of file
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+
+        try:
+            page = paginate(
+                queryset,
+                cursor=request.query_params.get(self.cursor_query_param),
+                limit=self.get_page_size(request),
+            )
+        except ValueError:
+            raise NotFound("Invalid cursor")
+
+        self.page = page
+        return page.items
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self._link(self.page.next_cursor),
+            "previous": self._link(self.page.previous_cursor),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def _link(self, cursor: str | None) -> str | None:
+        if cursor is None:
+            return None
+
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            cursor,
+        )
@@ -1,6 +1,9 @@
 import csv
 import io
+import itertools
+import json
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Count, QuerySet
 from django.http import StreamingHttpResponse
 from django.utils import timezone
@@ -9,11 +12,12 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.filters import OrderingFilter
 from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.utils.streaming import streaming_content
+
 from audit_logging.api.filters.audit_filters import AuditEventFilter
 from audit_logging.api.pagination.audit_pagination import (
     AuditCursorPagination,
@@ -26,6 +30,7 @@ from audit_logging.api.serializers.audit_event_serializer import (
     SensitiveAuditEventSerializer,
 )
 from audit_logging.models.audit_event import AuditEvent
+from audit_logging.services.query.audit_cursor import iterate
 
 from audit_logging.services.query.audit_query_policy import (
     AuditQueryPolicy,
@@ -44,18 +49,14 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
         CanViewAuditLogs,
     )
 
+    # no OrderingFilter — keyset pages need the fixed (occurred_at, id) order
     filter_backends = (
         DjangoFilterBackend,
         SearchFilter,
-        OrderingFilter,
     )
 
     filterset_class = AuditEventFilter
 
-    ordering = (
-        "-occurred_at",
-    )
-
     search_fields = (
         "action",
         "object_type",
@@ -205,7 +206,7 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
         qs = (
             self.get_queryset()
             .filter(object_type=object_type, object_id=str(object_id))
-            .order_by("occurred_at")
+            .order_by("occurred_at", "id")
         )
         serializer_class = self.get_serializer_class()
         serializer = serializer_class(qs[:200], many=True, context={"request": request})
@@ -222,7 +223,8 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
         Respects all filters from the standard list endpoint.
         Capped at 10,000 rows for safety.
         """
-        qs = self.filter_queryset(self.get_queryset())[:10_000]
+        qs = self.filter_queryset(self.get_queryset())
+        events = itertools.islice(iterate(qs, descending=True), 10_000)
 
         def rows():
             buf = io.StringIO()
@@ -237,7 +239,7 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
             buf.truncate(0)
             buf.seek(0)
 
-            for ev in qs.iterator(chunk_size=500):
+            for ev in events:
                 writer.writerow([
                     ev.id, ev.occurred_at.isoformat(),
                     ev.action, ev.actor_id,
@@ -251,6 +253,43 @@ class AuditEventViewSet(viewsets.ReadOnlyModelViewSet):
                 buf.seek(0)
 
         filename = f"audit-export-{timezone.now().strftime('%Y%m%d-%H%M%S')}.csv"
-        response = StreamingHttpResponse(rows(), content_type="text/csv")
+        response = StreamingHttpResponse(
+            streaming_content(request, rows(), thread_sensitive=True),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    # --------------------------------------------------
+    # NDJSON export
+    # --------------------------------------------------
+
+    @action(detail=False, methods=["get"], url_path="export-ndjson")
+    def export_ndjson(self, request):
+        """
+        Stream every filtered audit event as newline-delimited JSON.
+
+        For compliance pulls: no row cap. Rows are read in keyset
+        batches oldest first, so memory and per-query cost stay flat
+        however large the export. Under ASGI the lines are pulled one
+        at a time through an async iterator rather than collected
+        before the first byte is sent.
+        """
+        qs = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+
+        def lines():
+            for ev in iterate(qs):
+                yield json.dumps(
+                    serializer_class(ev, context=context).data,
+                    cls=DjangoJSONEncoder,
+                ) + "\n"
+
+        filename = f"audit-export-{timezone.now().strftime('%Y%m%d-%H%M%S')}.ndjson"
+        response = StreamingHttpResponse(
+            streaming_content(request, lines(), thread_sensitive=True),
+            content_type="application/x-ndjson",
+        )
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
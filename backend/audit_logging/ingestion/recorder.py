@@ -1,11 +1,22 @@
 import logging
+from functools import partial
 from typing import Iterable, Protocol
 
+from django.conf import settings
+from django.db import transaction
+
 from audit_logging.models.audit_event import AuditEvent
 from audit_logging.ingestion.processors import get_default_processors
+from audit_logging.recovery.failure_capture import AuditFailureCapture
+from audit_logging.storage.buffered_writer import AuditBufferedWriter
+from audit_logging.storage.writer import AuditWriter
 
 logger = logging.getLogger("audit")
 
+# Buffer events in Redis and bulk-insert them from a periodic flush
+# instead of writing one row per event on the request path.
+BUFFERED_INGESTION = getattr(settings, "AUDIT_BUFFERED_INGESTION", False)
+
 
 # --------------------------------------------------
 # Processor contract (STRICT)
@@ -25,6 +36,7 @@ class AuditRecorder:
     Central ingestion orchestrator.
 
     Responsibilities:
+    - persist event (directly, or via the write-behind buffer)
     - dispatch event to processors
     - isolate failures
     - never break request flow
@@ -38,6 +50,66 @@ class AuditRecorder:
 
     @classmethod
     def ingest(cls, event: AuditEvent) -> AuditEvent:
+        # tenant check needs the caller's trace, so it runs here
+        try:
+            AuditWriter().prepare(event)
+        except Exception as exc:
+            AuditFailureCapture.capture(event, exc)
+            return event
+
+        # Rolled-back work must not leave audit rows behind, and the
+        # tenant's chain head must not stay locked for the rest of the
+        # caller's transaction. Both paths run after it commits (or
+        # at once, outside a transaction).
+        if BUFFERED_INGESTION:
+            transaction.on_commit(partial(cls._push, event))
+        else:
+            transaction.on_commit(partial(cls._write, event))
+
+        return event
+
+    @classmethod
+    def flush_buffer(cls, limit: int | None = None) -> int:
+        """
+        Persist one batch from the head of the buffer.
+
+        Returns the number of buffer entries consumed; 0 means the
+        buffer is empty.
+        """
+        events, taken = AuditBufferedWriter.peek(limit)
+        if not taken:
+            return 0
+
+        cls._persist(events)
+        AuditBufferedWriter.trim(taken)
+
+        return taken
+
+    # -------------------------
+    # write paths
+    # -------------------------
+
+    @classmethod
+    def _write(cls, event: AuditEvent) -> None:
+        if AuditWriter().append(event) is not None:
+            cls.dispatch(event)
+
+    @classmethod
+    def _push(cls, event: AuditEvent) -> None:
+        if not AuditBufferedWriter.push(event):
+            cls._persist([event])
+
+    @classmethod
+    def _persist(cls, events: list[AuditEvent]) -> None:
+        for event in AuditBufferedWriter.write_batch(events):
+            cls.dispatch(event)
+
+    # -------------------------
+    # processors
+    # -------------------------
+
+    @classmethod
+    def dispatch(cls, event: AuditEvent) -> None:
         processors = cls._get_processors()
 
         for processor in processors:
@@ -59,8 +131,6 @@ class AuditRecorder:
                 # FUTURE HOOK (important)
                 # AuditFailureCapture.capture(event, exc)
 
-        return event
-
     # -------------------------
     # processor loading
     # -------------------------
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.2 on 2026-10-16 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit_logging', '0003_auditevent_occurred_at_default'),
+        ('websites', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditevent',
+            name='chain_seq',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='auditevent',
+            constraint=models.UniqueConstraint(fields=('website', 'chain_seq'), name='uniq_audit_event_chain_seq_per_website'),
+        ),
+        migrations.CreateModel(
+            name='AuditChainHead',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_seq', models.PositiveBigIntegerField(default=0)),
+                ('last_hash', models.CharField(blank=True, max_length=128, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('website', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='audit_chain_head', to='websites.website')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AuditChainCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('segment_index', models.PositiveBigIntegerField()),
+                ('first_seq', models.PositiveBigIntegerField()),
+                ('last_seq', models.PositiveBigIntegerField()),
+                ('previous_hash', models.CharField(blank=True, max_length=128, null=True)),
+                ('head_hash', models.CharField(max_length=128)),
+                ('merkle_root', models.CharField(max_length=64)),
+                ('signature', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('website', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audit_chain_checkpoints', to='websites.website')),
+            ],
+            options={
+                'ordering': ['website', 'segment_index'],
+                'constraints': [models.UniqueConstraint(fields=('website', 'segment_index'), name='uniq_audit_checkpoint_segment_per_website')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-16 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit_logging', '0004_audit_chain_segments'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditevent',
+            name='audit_loggi_website_7bf547_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditevent',
+            index=models.Index(fields=['website', 'occurred_at', 'id'], name='audit_evt_site_time_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditevent',
+            index=models.Index(fields=['actor_id', 'occurred_at', 'id'], name='audit_evt_actor_time_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditevent',
+            index=models.Index(fields=['occurred_at', 'id'], name='audit_evt_time_id_idx'),
+        ),
+    ]
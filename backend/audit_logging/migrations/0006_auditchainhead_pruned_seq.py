@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-16 23:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit_logging', '0005_auditevent_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditchainhead',
+            name='pruned_seq',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
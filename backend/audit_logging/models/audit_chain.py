@@ -0,0 +1,85 @@
+from django.db import models
+
+
+class AuditChainHead(models.Model):
+    """
+    Tip of one tenant's audit hash chain.
+
+    Writers lock this row to append, so tenants never contend with
+    each other and appends within a tenant are strictly ordered.
+    """
+
+    website = models.OneToOneField(
+        "websites.Website",
+        on_delete=models.CASCADE,
+        related_name="audit_chain_head",
+    )
+
+    last_seq = models.PositiveBigIntegerField(default=0)
+
+    last_hash = models.CharField(
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+
+    # Events up to this seq were purged by retention, whole sealed
+    # segments at a time; their checkpoints are kept.
+    pruned_seq = models.PositiveBigIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"AuditChainHead(website={self.website_id}, seq={self.last_seq})"
+
+
+class AuditChainCheckpoint(models.Model):
+    """
+    Signed Merkle root over one fixed-size segment of a tenant chain.
+
+    Segment ``n`` covers chain_seq ``n * size + 1`` to ``(n + 1) * size``.
+    Segments verify independently, so full-history checks parallelize.
+    """
+
+    website = models.ForeignKey(
+        "websites.Website",
+        on_delete=models.CASCADE,
+        related_name="audit_chain_checkpoints",
+    )
+
+    segment_index = models.PositiveBigIntegerField()
+
+    first_seq = models.PositiveBigIntegerField()
+    last_seq = models.PositiveBigIntegerField()
+
+    # previous_hash of the first event — links to the prior segment
+    previous_hash = models.CharField(
+        max_length=128,
+        null=True,
+        blank=True,
+    )
+
+    # integrity_hash of the last event
+    head_hash = models.CharField(max_length=128)
+
+    merkle_root = models.CharField(max_length=64)
+
+    signature = models.CharField(max_length=64)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["website", "segment_index"]
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["website", "segment_index"],
+                name="uniq_audit_checkpoint_segment_per_website",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"AuditChainCheckpoint(website={self.website_id}, "
+            f"segment={self.segment_index})"
+        )
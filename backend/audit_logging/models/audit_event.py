@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 from django.db import models
+from django.utils import timezone
 
 
 class AuditSeverity(models.TextChoices):
@@ -40,8 +41,11 @@ class AuditEvent(models.Model):
     # Time
     # -------------------------
 
+    # Stamped when the event is built, not when the row is written,
+    # so buffered events keep their real time and order.
     occurred_at = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         db_index=True,
     )
 
@@ -118,6 +122,14 @@ class AuditEvent(models.Model):
         blank=True,
     )
 
+    # Position in the tenant's hash chain. Null for events written
+    # before chains were kept per tenant.
+    chain_seq = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+    )
+
     # -------------------------
     # Request context
     # -------------------------
@@ -276,7 +288,20 @@ class AuditEvent(models.Model):
         ordering = ["-occurred_at"]
 
         indexes = [
-            models.Index(fields=["website", "occurred_at"]),
+            # keyset pagination walks (occurred_at, id) — see
+            # services/query/audit_cursor.py
+            models.Index(
+                fields=["website", "occurred_at", "id"],
+                name="audit_evt_site_time_id_idx",
+            ),
+            models.Index(
+                fields=["actor_id", "occurred_at", "id"],
+                name="audit_evt_actor_time_id_idx",
+            ),
+            models.Index(
+                fields=["occurred_at", "id"],
+                name="audit_evt_time_id_idx",
+            ),
             models.Index(fields=["website", "action"]),
             models.Index(fields=["website", "actor_id"]),
             models.Index(fields=["object_type", "object_id"]),
@@ -288,7 +313,11 @@ class AuditEvent(models.Model):
             models.UniqueConstraint(
                 fields=["website", "idempotency_key"],
                 name="uniq_audit_event_idempotency_per_website",
-            )
+            ),
+            models.UniqueConstraint(
+                fields=["website", "chain_seq"],
+                name="uniq_audit_event_chain_seq_per_website",
+            ),
         ]
 
     # -------------------------
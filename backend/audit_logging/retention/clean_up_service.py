@@ -1,19 +1,75 @@
 from datetime import timedelta
 
+from django.db import transaction
 from django.utils import timezone
 
+from audit_logging.models.audit_chain import (
+    AuditChainCheckpoint,
+    AuditChainHead,
+)
 from audit_logging.models.audit_event import AuditEvent
+from audit_logging.tamper_detection.checkpoints import AuditCheckpointService
 
 
 class AuditCleanupService:
 
     @staticmethod
-    def purge_old_events(days: int = 365):
+    def purge_old_events(days: int = 365) -> int:
+        """
+        Delete audit events older than ``days``.
+
+        Chained events are removed a whole sealed segment at a time,
+        and only once every event in the segment is past the cutoff.
+        The chain head's pruned_seq records how far a chain was cut so
+        verification starts after it instead of reporting the purged
+        segments as missing.
+
+        Returns the number of events deleted.
+        """
 
         cutoff = timezone.now() - timedelta(days=days)
 
-        return (
+        # events written before chains were kept per tenant
+        deleted, _ = (
             AuditEvent.objects
-            .filter(occurred_at__lt=cutoff)
+            .filter(chain_seq__isnull=True, occurred_at__lt=cutoff)
             .delete()
-        )
\ No newline at end of file
+        )
+
+        for head in AuditChainHead.objects.iterator():
+            deleted += AuditCleanupService._prune_chain(head, cutoff)
+
+        return deleted
+
+    @staticmethod
+    def _prune_chain(head: AuditChainHead, cutoff) -> int:
+
+        sealed = set(
+            AuditChainCheckpoint.objects
+            .filter(website_id=head.website_id)
+            .values_list("segment_index", flat=True)
+        )
+
+        deleted = 0
+        segment_index = AuditCheckpointService.completed_segments(head.pruned_seq)
+
+        while segment_index in sealed:
+            first_seq, last_seq = AuditCheckpointService.bounds(segment_index)
+            segment = AuditEvent.objects.filter(
+                website_id=head.website_id,
+                chain_seq__range=(first_seq, last_seq),
+            )
+
+            if segment.filter(occurred_at__gte=cutoff).exists():
+                break
+
+            with transaction.atomic():
+                count, _ = segment.delete()
+                AuditChainHead.objects.filter(pk=head.pk).update(
+                    pruned_seq=last_seq,
+                )
+
+            deleted += count
+            segment_index += 1
+
+        return deleted
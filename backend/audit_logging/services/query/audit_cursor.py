@@ -0,0 +1,170 @@
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator
+
+from django.db.models import Q, QuerySet
+
+from audit_logging.models.audit_event import AuditEvent
+
+
+@dataclass(frozen=True)
+class AuditCursor:
+    """
+    Keyset position in an (occurred_at, id) ordered audit listing.
+
+    RULES:
+    - opaque to clients (urlsafe base64 JSON)
+    - ``reverse`` cursors page back towards the start of the listing
+    """
+
+    occurred_at: datetime
+    id: uuid.UUID
+    reverse: bool = False
+
+    @classmethod
+    def from_event(cls, event: AuditEvent, *, reverse: bool = False) -> "AuditCursor":
+        return cls(occurred_at=event.occurred_at, id=event.id, reverse=reverse)
+
+    def encode(self) -> str:
+        raw = json.dumps(
+            [self.occurred_at.isoformat(), str(self.id), int(self.reverse)]
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "AuditCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            occurred_at, event_id, reverse = json.loads(
+                base64.urlsafe_b64decode(padded.encode())
+            )
+            return cls(
+                occurred_at=datetime.fromisoformat(occurred_at),
+                id=uuid.UUID(event_id),
+                reverse=bool(reverse),
+            )
+        except (TypeError, ValueError) as exc:
+            raise ValueError("invalid audit cursor") from exc
+
+
+@dataclass(frozen=True)
+class AuditPage:
+    """
+    One keyset page. Cursors are None at either end of the listing.
+    """
+
+    items: list[AuditEvent]
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+
+def _ordered(qs: QuerySet, *, descending: bool) -> QuerySet:
+    if descending:
+        return qs.order_by("-occurred_at", "-id")
+    return qs.order_by("occurred_at", "id")
+
+
+def _after(qs: QuerySet, cursor: AuditCursor, *, descending: bool) -> QuerySet:
+    """
+    Rows strictly past ``cursor`` in the walk direction, ordered for it.
+    """
+
+    if descending:
+        qs = qs.filter(
+            Q(occurred_at__lt=cursor.occurred_at)
+            | Q(occurred_at=cursor.occurred_at, id__lt=cursor.id)
+        )
+    else:
+        qs = qs.filter(
+            Q(occurred_at__gt=cursor.occurred_at)
+            | Q(occurred_at=cursor.occurred_at, id__gt=cursor.id)
+        )
+
+    return _ordered(qs, descending=descending)
+
+
+def paginate(
+    qs: QuerySet,
+    *,
+    cursor: str | None,
+    limit: int,
+    descending: bool = True,
+) -> AuditPage:
+    """
+    Keyset page over (occurred_at, id).
+
+    Every page is a bounded index range scan, so page 10,000 costs
+    the same as page 1. Raises ValueError for a malformed cursor.
+    """
+
+    position = AuditCursor.decode(cursor) if cursor else None
+    backwards = bool(position and position.reverse)
+
+    # a reverse cursor walks the opposite direction, then flips
+    walk_descending = descending != backwards
+
+    page_qs = (
+        _after(qs, position, descending=walk_descending)
+        if position
+        else _ordered(qs, descending=walk_descending)
+    )
+
+    rows = list(page_qs[:limit + 1])
+    has_more = len(rows) > limit
+    items = rows[:limit]
+
+    if backwards:
+        items.reverse()
+
+    if not items:
+        return AuditPage(items=[])
+
+    more_forward = has_more if not backwards else True
+    more_backward = bool(position) if not backwards else has_more
+
+    return AuditPage(
+        items=items,
+        next_cursor=(
+            AuditCursor.from_event(items[-1]).encode()
+            if more_forward
+            else None
+        ),
+        previous_cursor=(
+            AuditCursor.from_event(items[0], reverse=True).encode()
+            if more_backward
+            else None
+        ),
+    )
+
+
+def iterate(
+    qs: QuerySet,
+    *,
+    after: AuditCursor | None = None,
+    batch_size: int = 1000,
+    descending: bool = False,
+) -> Iterator[AuditEvent]:
+    """
+    Stream every row in keyset batches.
+
+    Each batch is a short indexed query, so long exports hold no
+    server-side cursor or transaction open.
+    """
+
+    while True:
+        batch_qs = (
+            _after(qs, after, descending=descending)
+            if after
+            else _ordered(qs, descending=descending)
+        )
+        batch = list(batch_qs[:batch_size])
+
+        yield from batch
+
+        if len(batch) < batch_size:
+            return
+
+        after = AuditCursor.from_event(batch[-1])
@@ -5,6 +5,10 @@ from django.db.models import QuerySet
 from audit_logging.models.audit_dead_letter import AuditDeadLetter
 from audit_logging.models.audit_event import AuditEvent
 
+from audit_logging.services.query.audit_cursor import (
+    AuditPage,
+    paginate,
+)
 from audit_logging.services.query.audit_query_service import (
     AuditQueryService,
 )
@@ -41,6 +45,17 @@ class AuditQueryPolicy:
 
         return self._apply_sensitivity(qs)
 
+    def search_events_page(
+        self,
+        query: AuditEventQuery,
+    ) -> AuditPage:
+
+        return paginate(
+            self.search_events(query),
+            cursor=query.cursor,
+            limit=query.limit,
+        )
+
     def timeline_for_object(
         self,
         object_type: str,
@@ -65,6 +80,21 @@ class AuditQueryPolicy:
 
         return self._apply_sensitivity(qs)
 
+    def timeline_for_actor_page(
+        self,
+        actor_id: int,
+        *,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> AuditPage:
+
+        return paginate(
+            self.timeline_for_actor(actor_id),
+            cursor=cursor,
+            limit=limit,
+            descending=False,
+        )
+
     def trace_by_correlation(
         self,
         correlation_id: str,
@@ -2,6 +2,7 @@ from django.db.models import QuerySet
 
 from audit_logging.models.audit_event import AuditEvent
 from audit_logging.models.audit_dead_letter import AuditDeadLetter
+from audit_logging.services.query.audit_cursor import AuditPage, paginate
 from audit_logging.services.query.audit_query_types import AuditEventQuery
 
 
@@ -60,7 +61,18 @@ class AuditQueryService:
         if query.occurred_before:
             qs = qs.filter(occurred_at__lte=query.occurred_before)
 
-        return qs.order_by("-occurred_at")
+        return qs.order_by("-occurred_at", "-id")
+
+    @staticmethod
+    def search_events_page(query: AuditEventQuery) -> AuditPage:
+        """
+        Keyset page of search_events(), newest first.
+        """
+        return paginate(
+            AuditQueryService.search_events(query),
+            cursor=query.cursor,
+            limit=query.limit,
+        )
 
     # --------------------------------------------------
     # TIMELINE
@@ -71,7 +83,7 @@ class AuditQueryService:
         return (
             AuditEvent.objects
             .filter(object_type=object_type, object_id=object_id)
-            .order_by("occurred_at")
+            .order_by("occurred_at", "id")
         )
 
     @staticmethod
@@ -79,7 +91,24 @@ class AuditQueryService:
         return (
             AuditEvent.objects
             .filter(actor_id=actor_id)
-            .order_by("occurred_at")
+            .order_by("occurred_at", "id")
+        )
+
+    @staticmethod
+    def timeline_for_actor_page(
+        actor_id: int,
+        *,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> AuditPage:
+        """
+        Keyset page of timeline_for_actor(), oldest first.
+        """
+        return paginate(
+            AuditQueryService.timeline_for_actor(actor_id),
+            cursor=cursor,
+            limit=limit,
+            descending=False,
         )
 
     # --------------------------------------------------
@@ -91,7 +120,7 @@ class AuditQueryService:
         return (
             AuditEvent.objects
             .filter(correlation_id=correlation_id)
-            .order_by("occurred_at")
+            .order_by("occurred_at", "id")
         )
 
     # --------------------------------------------------
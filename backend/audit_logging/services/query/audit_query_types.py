@@ -35,6 +35,9 @@ class AuditEventQuery:
 
     limit: int = 100
 
+    # opaque keyset cursor from a previous AuditPage
+    cursor: str | None = None
+
     def __post_init__(self):
         if self.limit <= 0:
             raise ValueError("limit must be positive")
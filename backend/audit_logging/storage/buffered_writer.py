@@ -0,0 +1,206 @@
+"""
+Write-behind buffer for audit events.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, transaction
+from redis import Redis
+from redis.exceptions import RedisError
+
+from audit_logging.models.audit_event import AuditEvent
+from audit_logging.recovery.failure_capture import AuditFailureCapture
+from audit_logging.tamper_detection.chain import AuditChainService
+
+logger = logging.getLogger("audit")
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> Redis:
+    """
+    Return the process-wide Redis client.
+    """
+    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+class AuditBufferedWriter:
+    """
+    Buffer audit events in a Redis list and insert them in bulk.
+
+    Requests validate the event and RPUSH it once their transaction
+    commits. A periodic flush reads the list head in order, chains
+    integrity hashes under one head lock per tenant, and writes the
+    batch with a single bulk_create. Rows that cannot be written go to
+    the dead-letter store through AuditFailureCapture.
+    """
+
+    BUFFER_KEY = "audit_logging:ingest_buffer"
+    FLUSH_BATCH_SIZE = getattr(settings, "AUDIT_BUFFER_FLUSH_BATCH_SIZE", 500)
+
+    @staticmethod
+    def _client() -> Redis:
+        return _shared_client()
+
+    # -------------------------
+    # Serialization
+    # -------------------------
+
+    @staticmethod
+    def _serialize(event: AuditEvent) -> str:
+        return json.dumps(
+            {
+                field.attname: field.value_from_object(event)
+                for field in AuditEvent._meta.concrete_fields
+            },
+            cls=DjangoJSONEncoder,
+        )
+
+    @staticmethod
+    def _deserialize(raw: str) -> AuditEvent:
+        data = json.loads(raw)
+        return AuditEvent(**{
+            field.attname: field.to_python(data[field.attname])
+            for field in AuditEvent._meta.concrete_fields
+            if field.attname in data
+        })
+
+    # -------------------------
+    # Buffer
+    # -------------------------
+
+    @classmethod
+    def push(cls, event: AuditEvent) -> bool:
+        """
+        Append a validated event to the buffer.
+
+        Returns False when Redis is unavailable so the caller can fall
+        back to a direct write.
+        """
+        try:
+            cls._client().rpush(cls.BUFFER_KEY, cls._serialize(event))
+        except RedisError:
+            logger.warning("Audit ingest buffer unavailable; writing directly.")
+            return False
+        return True
+
+    @classmethod
+    def peek(cls, limit: int | None = None) -> tuple[list[AuditEvent], int]:
+        """
+        Read up to ``limit`` events from the head of the buffer.
+
+        Entries stay in Redis until trim() so a crashed flush is
+        retried. Returns the events and the number of entries read,
+        which includes unreadable entries that were skipped.
+        """
+        raw = cls._client().lrange(
+            cls.BUFFER_KEY,
+            0,
+            (limit or cls.FLUSH_BATCH_SIZE) - 1,
+        )
+
+        events = []
+        for item in raw:
+            try:
+                events.append(cls._deserialize(item))
+            except Exception:
+                logger.exception(
+                    "Unreadable buffered audit event dropped",
+                    extra={"payload": item[:500]},
+                )
+
+        return events, len(raw)
+
+    @classmethod
+    def trim(cls, count: int) -> None:
+        """
+        Drop ``count`` flushed entries from the head of the buffer.
+        """
+        cls._client().ltrim(cls.BUFFER_KEY, count, -1)
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+
+    @classmethod
+    def write_batch(cls, events: list[AuditEvent]) -> list[AuditEvent]:
+        """
+        Persist events in buffer order.
+
+        Events already stored — by id, or by (website, idempotency_key)
+        — are skipped so a retried flush never leaves gaps in a chain.
+        If the bulk insert fails, rows are written one at a time and
+        the failures dead-lettered.
+
+        Returns the events that were written.
+        """
+        events = cls._unwritten(events)
+        if not events:
+            return []
+
+        try:
+            with transaction.atomic():
+                AuditChainService.attach_integrity_batch(events)
+                AuditEvent.objects.bulk_create(
+                    events,
+                    batch_size=cls.FLUSH_BATCH_SIZE,
+                )
+            return events
+
+        except DatabaseError as exc:
+            logger.warning(
+                "Audit bulk insert failed; writing rows individually",
+                extra={"count": len(events), "error": str(exc)},
+            )
+
+        written = []
+        for event in events:
+            # A partly applied bulk_create marks rows as saved.
+            event._state.adding = True
+            try:
+                with transaction.atomic():
+                    AuditChainService.attach_integrity(event)
+                    event.save()
+            except Exception as exc:
+                AuditFailureCapture.capture(event, exc)
+                continue
+
+            written.append(event)
+
+        return written
+
+    @staticmethod
+    def _unwritten(events: list[AuditEvent]) -> list[AuditEvent]:
+        ids = [event.id for event in events]
+        keys = {event.idempotency_key for event in events if event.idempotency_key}
+
+        stored_ids = set(
+            AuditEvent.objects
+            .filter(pk__in=ids)
+            .values_list("pk", flat=True)
+        )
+        seen_keys = set(
+            AuditEvent.objects
+            .filter(idempotency_key__in=keys)
+            .values_list("website_id", "idempotency_key")
+        ) if keys else set()
+
+        pending = []
+        for event in events:
+            if event.id in stored_ids:
+                continue
+
+            if event.idempotency_key:
+                key = (event.website_id, event.idempotency_key)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+
+            pending.append(event)
+
+        return pending
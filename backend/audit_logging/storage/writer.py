@@ -1,9 +1,11 @@
 import logging
 
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from audit_logging.models.audit_event import AuditEvent
 from audit_logging.recovery.failure_capture import AuditFailureCapture
+from audit_logging.tamper_detection.chain import AuditChainService
 from audit_logging.tracing.trace import Trace
 
 logger = logging.getLogger("audit")
@@ -21,27 +23,55 @@ class AuditWriter:
 
     def write(self, event: AuditEvent) -> AuditEvent | None:
         try:
-            trace = Trace.snapshot()
-            expected_website = trace.get("website_id")
-
-            if not expected_website:
-                raise ValidationError("Missing tenant context")
-
-            if event.website is None:
-                raise ValidationError("AuditEvent.website required")
+            self.prepare(event)
+        except Exception as exc:
+            AuditFailureCapture.capture(event, exc)
+            return None
 
-            if str(event.website.id) != str(expected_website):
-                raise ValidationError("Cross-tenant write blocked")
+        return self.append(event)
 
-            if event.object_id is not None:
-                event.object_id = str(event.object_id)
+    def append(self, event: AuditEvent) -> AuditEvent | None:
+        """
+        Chain and insert a prepared event in its own transaction.
 
-            if event.metadata is None:
-                event.metadata = {}
+        The tenant's chain head stays locked until this transaction
+        commits, so call it outside the caller's transaction —
+        AuditRecorder defers it with on_commit.
+        """
+        try:
+            with transaction.atomic():
+                AuditChainService.attach_integrity(event)
+                event.save()
 
-            event.save()
             return event
 
         except Exception as exc:
             AuditFailureCapture.capture(event, exc)
-            return None
\ No newline at end of file
+            return None
+
+    def prepare(self, event: AuditEvent) -> AuditEvent:
+        """
+        Validate tenant context and normalize fields.
+
+        Must run while the caller's trace is active — the buffered
+        path calls it before the event leaves the request.
+        """
+        trace = Trace.snapshot()
+        expected_website = trace.get("website_id")
+
+        if not expected_website:
+            raise ValidationError("Missing tenant context")
+
+        if event.website_id is None:
+            raise ValidationError("AuditEvent.website required")
+
+        if str(event.website_id) != str(expected_website):
+            raise ValidationError("Cross-tenant write blocked")
+
+        if event.object_id is not None:
+            event.object_id = str(event.object_id)
+
+        if event.metadata is None:
+            event.metadata = {}
+
+        return event
@@ -1,14 +1,39 @@
+from typing import Iterator
+
 from audit_logging.models.audit_event import AuditEvent
+from audit_logging.services.query.audit_cursor import (
+    AuditCursor,
+    AuditPage,
+    iterate,
+    paginate,
+)
 
 
 class AuditStream:
 
     @staticmethod
     def latest(limit: int = 50):
-        return AuditEvent.objects.order_by("-occurred_at")[:limit]
+        return AuditEvent.objects.order_by("-occurred_at", "-id")[:limit]
+
+    @staticmethod
+    def since(timestamp, *, cursor: str | None = None, limit: int = 500) -> AuditPage:
+        """
+        Events from ``timestamp`` onwards, oldest first, one keyset
+        page at a time. Pass the page's next_cursor to resume.
+        """
+        return paginate(
+            AuditEvent.objects.filter(occurred_at__gte=timestamp),
+            cursor=cursor,
+            limit=limit,
+            descending=False,
+        )
 
     @staticmethod
-    def since(timestamp):
-        return AuditEvent.objects.filter(
-            occurred_at__gte=timestamp
-        ).order_by("occurred_at")
\ No newline at end of file
+    def iter_since(timestamp, *, after: AuditCursor | None = None) -> Iterator[AuditEvent]:
+        """
+        Every event from ``timestamp`` onwards, streamed in keyset batches.
+        """
+        return iterate(
+            AuditEvent.objects.filter(occurred_at__gte=timestamp),
+            after=after,
+        )
@@ -1,35 +1,107 @@
+from collections import defaultdict
+from functools import partial
+
+from django.db import transaction
+
+from audit_logging.models.audit_chain import AuditChainHead
 from audit_logging.models.audit_event import AuditEvent
+from audit_logging.tamper_detection.checkpoints import (
+    AuditCheckpointService,
+)
 from audit_logging.tamper_detection.hashing import (
     AuditHashingService,
 )
 
 
 class AuditChainService:
+    """
+    Per-tenant hash chains.
+
+    Each website has its own chain with its own head row. Appending
+    locks only that row, so tenants write in parallel. Must run inside
+    the transaction that inserts the events — the head lock is held
+    until it commits — and that transaction should do nothing else:
+    writers append after the originating request has committed.
+    """
 
     @staticmethod
     def attach_integrity(event: AuditEvent):
 
-        previous = (
-            AuditEvent.objects
-            .order_by("-occurred_at")
-            .first()
-        )
+        AuditChainService.attach_integrity_batch([event])
+
+    @staticmethod
+    def attach_integrity_batch(events: list[AuditEvent]):
+        """
+        Chain a batch in order, one head lock per website.
+        """
+
+        by_website = defaultdict(list)
+        for event in events:
+            by_website[event.website_id].append(event)
+
+        # fixed lock order keeps concurrent batches deadlock-free
+        for website_id in sorted(by_website):
+            head = AuditChainService._lock_head(website_id)
+
+            seq = head.last_seq
+            previous_hash = head.last_hash
+
+            for event in by_website[website_id]:
+                seq += 1
+                event.chain_seq = seq
+                AuditChainService._seal(event, previous_hash)
+                previous_hash = event.integrity_hash
+
+            # a segment just filled up — checkpoint it after commit
+            if (
+                AuditCheckpointService.completed_segments(seq)
+                > AuditCheckpointService.completed_segments(head.last_seq)
+            ):
+                transaction.on_commit(
+                    partial(AuditChainService._queue_checkpoints, website_id)
+                )
+
+            head.last_seq = seq
+            head.last_hash = previous_hash
+            head.save(update_fields=["last_seq", "last_hash", "updated_at"])
 
-        previous_hash = (
-            previous.integrity_hash
-            if previous
-            else None
+    @staticmethod
+    def _lock_head(website_id) -> AuditChainHead:
+
+        AuditChainHead.objects.get_or_create(website_id=website_id)
+
+        return (
+            AuditChainHead.objects
+            .select_for_update()
+            .get(website_id=website_id)
         )
 
+    @staticmethod
+    def _queue_checkpoints(website_id):
+        from audit_logging.tasks import seal_audit_segments_task
+
+        seal_audit_segments_task.delay(website_id)
+
+    @staticmethod
+    def expected_hash(*, event_id, action, occurred_at, previous_hash) -> str:
+
         payload = {
-            "id": str(event.id),
-            "action": event.action,
-            "occurred_at": str(event.occurred_at),
+            "id": str(event_id),
+            "action": action,
+            "occurred_at": str(occurred_at),
             "previous_hash": previous_hash,
         }
 
+        return AuditHashingService.compute_hash(payload)
+
+    @staticmethod
+    def _seal(event: AuditEvent, previous_hash):
+
         event.previous_hash = previous_hash
 
-        event.integrity_hash = (
-            AuditHashingService.compute_hash(payload)
-        )
\ No newline at end of file
+        event.integrity_hash = AuditChainService.expected_hash(
+            event_id=event.id,
+            action=event.action,
+            occurred_at=event.occurred_at,
+            previous_hash=previous_hash,
+        )
@@ -0,0 +1,205 @@
+import hashlib
+import hmac
+import logging
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from audit_logging.models.audit_chain import (
+    AuditChainCheckpoint,
+    AuditChainHead,
+)
+from audit_logging.models.audit_event import AuditEvent
+from audit_logging.tamper_detection.hashing import (
+    AuditHashingService,
+)
+
+logger = logging.getLogger("audit")
+
+# Events per checkpoint. Changing it invalidates existing checkpoints.
+SEGMENT_SIZE = getattr(settings, "AUDIT_CHAIN_SEGMENT_SIZE", 1000)
+
+
+class AuditCheckpointService:
+    """
+    Seal completed chain segments with a signed Merkle root.
+    """
+
+    # -------------------------
+    # Segment arithmetic
+    # -------------------------
+
+    @staticmethod
+    def completed_segments(last_seq: int) -> int:
+        return last_seq // SEGMENT_SIZE
+
+    @staticmethod
+    def bounds(segment_index: int) -> tuple[int, int]:
+        first = segment_index * SEGMENT_SIZE + 1
+        return first, first + SEGMENT_SIZE - 1
+
+    # -------------------------
+    # Signing
+    # -------------------------
+
+    @staticmethod
+    def sign(
+        *,
+        website_id,
+        segment_index: int,
+        first_seq: int,
+        last_seq: int,
+        previous_hash: str | None,
+        head_hash: str,
+        merkle_root: str,
+    ) -> str:
+
+        key = getattr(
+            settings,
+            "AUDIT_CHECKPOINT_SIGNING_KEY",
+            settings.SECRET_KEY,
+        )
+
+        message = "|".join(
+            str(part) for part in (
+                website_id,
+                segment_index,
+                first_seq,
+                last_seq,
+                previous_hash or "",
+                head_hash,
+                merkle_root,
+            )
+        )
+
+        return hmac.new(
+            key.encode(),
+            message.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+    @staticmethod
+    def signature_valid(checkpoint: AuditChainCheckpoint) -> bool:
+
+        expected = AuditCheckpointService.sign(
+            website_id=checkpoint.website_id,
+            segment_index=checkpoint.segment_index,
+            first_seq=checkpoint.first_seq,
+            last_seq=checkpoint.last_seq,
+            previous_hash=checkpoint.previous_hash,
+            head_hash=checkpoint.head_hash,
+            merkle_root=checkpoint.merkle_root,
+        )
+
+        return hmac.compare_digest(expected, checkpoint.signature)
+
+    # -------------------------
+    # Sealing
+    # -------------------------
+
+    @staticmethod
+    def seal_segment(website_id, segment_index: int) -> AuditChainCheckpoint | None:
+        """
+        Checkpoint one segment.
+
+        Returns None if the segment is not complete yet. Sealing an
+        already sealed segment returns the existing checkpoint.
+        """
+
+        existing = AuditChainCheckpoint.objects.filter(
+            website_id=website_id,
+            segment_index=segment_index,
+        ).first()
+        if existing:
+            return existing
+
+        first_seq, last_seq = AuditCheckpointService.bounds(segment_index)
+
+        rows = list(
+            AuditEvent.objects
+            .filter(
+                website_id=website_id,
+                chain_seq__range=(first_seq, last_seq),
+            )
+            .order_by("chain_seq")
+            .values_list("previous_hash", "integrity_hash")
+        )
+
+        if len(rows) != SEGMENT_SIZE:
+            return None
+
+        merkle_root = AuditHashingService.merkle_root(
+            [integrity_hash for _, integrity_hash in rows]
+        )
+        previous_hash = rows[0][0]
+        head_hash = rows[-1][1]
+
+        try:
+            with transaction.atomic():
+                return AuditChainCheckpoint.objects.create(
+                    website_id=website_id,
+                    segment_index=segment_index,
+                    first_seq=first_seq,
+                    last_seq=last_seq,
+                    previous_hash=previous_hash,
+                    head_hash=head_hash,
+                    merkle_root=merkle_root,
+                    signature=AuditCheckpointService.sign(
+                        website_id=website_id,
+                        segment_index=segment_index,
+                        first_seq=first_seq,
+                        last_seq=last_seq,
+                        previous_hash=previous_hash,
+                        head_hash=head_hash,
+                        merkle_root=merkle_root,
+                    ),
+                )
+        except IntegrityError:
+            # sealed concurrently
+            return AuditChainCheckpoint.objects.get(
+                website_id=website_id,
+                segment_index=segment_index,
+            )
+
+    @staticmethod
+    def seal_pending(website_id=None) -> int:
+        """
+        Checkpoint every completed, unsealed segment.
+
+        Returns the number of checkpoints created.
+        """
+
+        heads = AuditChainHead.objects.all()
+        if website_id is not None:
+            heads = heads.filter(website_id=website_id)
+
+        created = 0
+
+        for head in heads.iterator():
+            sealed = set(
+                AuditChainCheckpoint.objects
+                .filter(website_id=head.website_id)
+                .values_list("segment_index", flat=True)
+            )
+
+            for segment_index in range(
+                AuditCheckpointService.completed_segments(head.last_seq)
+            ):
+                if segment_index in sealed:
+                    continue
+
+                if AuditCheckpointService.seal_segment(
+                    head.website_id,
+                    segment_index,
+                ):
+                    created += 1
+                else:
+                    logger.warning(
+                        "Audit chain segment incomplete; not sealed",
+                        extra={
+                            "website_id": head.website_id,
+                            "segment_index": segment_index,
+                        },
+                    )
+
+        return created
@@ -15,4 +15,29 @@ class AuditHashingService:
 
         return hashlib.sha256(
             serialized.encode()
-        ).hexdigest()
\ No newline at end of file
+        ).hexdigest()
+
+    @staticmethod
+    def merkle_root(leaves: list[str]) -> str:
+        """
+        Root of a binary Merkle tree over hex leaf hashes.
+        An odd node at any level is paired with itself.
+        """
+
+        if not leaves:
+            return hashlib.sha256(b"").hexdigest()
+
+        level = list(leaves)
+
+        while len(level) > 1:
+            if len(level) % 2:
+                level.append(level[-1])
+
+            level = [
+                hashlib.sha256(
+                    (level[i] + level[i + 1]).encode()
+                ).hexdigest()
+                for i in range(0, len(level), 2)
+            ]
+
+        return level[0]
@@ -1,19 +1,236 @@
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
+
+from django.db import connections
+
+from audit_logging.models.audit_chain import (
+    AuditChainCheckpoint,
+    AuditChainHead,
+)
+from audit_logging.models.audit_event import AuditEvent
+from audit_logging.tamper_detection.chain import AuditChainService
+from audit_logging.tamper_detection.checkpoints import (
+    SEGMENT_SIZE,
+    AuditCheckpointService,
+)
 from audit_logging.tamper_detection.hashing import (
     AuditHashingService,
 )
 
+
+def _init_worker():
+    import django
+
+    django.setup()
+
+
+def _verify_segment_job(website_id, segment_index: int) -> dict:
+    return AuditIntegrityVerifier.verify_segment(website_id, segment_index)
+
+
 class AuditIntegrityVerifier:
 
     @staticmethod
     def verify(event):
 
-        payload = {
-            "id": str(event.id),
-            "action": event.action,
-            "occurred_at": str(event.occurred_at),
-            "previous_hash": event.previous_hash,
+        expected = AuditChainService.expected_hash(
+            event_id=event.id,
+            action=event.action,
+            occurred_at=event.occurred_at,
+            previous_hash=event.previous_hash,
+        )
+
+        return expected == event.integrity_hash
+
+    @staticmethod
+    def verify_segment(website_id, segment_index: int) -> dict:
+        """
+        Verify one chain segment on its own.
+
+        Recomputes every hash, checks sequence continuity and links
+        (including the link into the previous segment), and — when
+        the segment is sealed — its Merkle root and signature. The
+        segment holding the chain head must run up to the head's
+        sequence and end on its hash, so rows deleted from the
+        unsealed tail are reported too.
+
+        Segments purged by retention only have their checkpoint
+        signature checked; the first kept segment anchors on the last
+        purged checkpoint's head hash.
+        """
+
+        first_seq, last_seq = AuditCheckpointService.bounds(segment_index)
+
+        # Read the head first: rows up to its seq are already committed,
+        # and later appends are left for the next run.
+        head_seq, head_hash, pruned_seq = (
+            AuditChainHead.objects
+            .filter(website_id=website_id)
+            .values_list("last_seq", "last_hash", "pruned_seq")
+            .first()
+        ) or (0, None, 0)
+        expected_last = min(last_seq, head_seq)
+        pruned = last_seq <= pruned_seq
+
+        rows = [] if pruned else list(
+            AuditEvent.objects
+            .filter(
+                website_id=website_id,
+                chain_seq__range=(max(first_seq - 1, 1), expected_last),
+            )
+            .order_by("chain_seq")
+            .values_list(
+                "id",
+                "action",
+                "occurred_at",
+                "previous_hash",
+                "integrity_hash",
+                "chain_seq",
+            )
+        )
+
+        errors = []
+
+        # the row before the segment only anchors the first link
+        anchor_hash = None
+        if rows and rows[0][5] == first_seq - 1:
+            anchor_hash = rows.pop(0)[4]
+
+        elif not pruned and first_seq - 1 == pruned_seq > 0:
+            # the anchor row was purged; its sealed checkpoint remains
+            anchor = AuditChainCheckpoint.objects.filter(
+                website_id=website_id,
+                segment_index=segment_index - 1,
+            ).first()
+            if anchor is None or not AuditCheckpointService.signature_valid(anchor):
+                errors.append("purged anchor checkpoint missing or invalid")
+            else:
+                anchor_hash = anchor.head_hash
+
+        expected_seq = first_seq
+        previous_hash = anchor_hash
+
+        for event_id, action, occurred_at, prev, integrity_hash, seq in rows:
+            if seq != expected_seq:
+                errors.append(f"missing seq {expected_seq}-{seq - 1}")
+
+            elif prev != previous_hash:
+                errors.append(f"broken link at seq {seq}")
+
+            expected = AuditChainService.expected_hash(
+                event_id=event_id,
+                action=action,
+                occurred_at=occurred_at,
+                previous_hash=prev,
+            )
+            if expected != integrity_hash:
+                errors.append(f"hash mismatch at seq {seq} ({event_id})")
+
+            expected_seq = seq + 1
+            previous_hash = integrity_hash
+
+        if not pruned:
+            if expected_seq <= expected_last:
+                errors.append(f"missing seq {expected_seq}-{expected_last}")
+
+            elif expected_last == head_seq and previous_hash != head_hash:
+                errors.append("chain head hash mismatch")
+
+        checkpoint = AuditChainCheckpoint.objects.filter(
+            website_id=website_id,
+            segment_index=segment_index,
+        ).first()
+
+        if checkpoint is not None:
+            if not AuditCheckpointService.signature_valid(checkpoint):
+                errors.append("checkpoint signature invalid")
+
+            if not pruned:
+                merkle_root = AuditHashingService.merkle_root(
+                    [row[4] for row in rows]
+                )
+                if merkle_root != checkpoint.merkle_root:
+                    errors.append("checkpoint merkle root mismatch")
+
+                if rows and rows[-1][4] != checkpoint.head_hash:
+                    errors.append("checkpoint head hash mismatch")
+
+        elif pruned:
+            errors.append("purged segment has no checkpoint")
+
+        return {
+            "website_id": website_id,
+            "segment_index": segment_index,
+            "first_seq": first_seq,
+            "last_seq": last_seq,
+            "checked": len(rows),
+            "sealed": checkpoint is not None,
+            "pruned": pruned,
+            "valid": not errors,
+            "errors": errors,
         }
 
-        expected = AuditHashingService.compute_hash(payload)
+    @staticmethod
+    def segments(website_id=None) -> list[tuple]:
+        """
+        (website_id, segment_index) for every segment with events.
+
+        Segments purged by retention are skipped.
+        """
+
+        heads = AuditChainHead.objects.filter(last_seq__gt=0)
+        if website_id is not None:
+            heads = heads.filter(website_id=website_id)
+
+        return [
+            (head_website_id, segment_index)
+            for head_website_id, last_seq, pruned_seq in heads.values_list(
+                "website_id",
+                "last_seq",
+                "pruned_seq",
+            )
+            for segment_index in range(
+                pruned_seq // SEGMENT_SIZE,
+                math.ceil(last_seq / SEGMENT_SIZE),
+            )
+        ]
+
+    @staticmethod
+    def verify_history(
+        *,
+        website_id=None,
+        workers: int | None = None,
+    ) -> Iterator[dict]:
+        """
+        Verify full chain history, streaming one result per segment.
+
+        Segments are checked in parallel across a process pool
+        (``workers`` defaults to the CPU count) and yielded as they
+        finish. ``workers=1`` runs in-process, which is what Celery
+        workers must use — they cannot fork a pool.
+        """
+
+        segments = AuditIntegrityVerifier.segments(website_id)
+
+        if workers == 1:
+            for segment in segments:
+                yield AuditIntegrityVerifier.verify_segment(*segment)
+            return
+
+        # children must open their own connections
+        connections.close_all()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+        ) as pool:
+            futures = [
+                pool.submit(_verify_segment_job, *segment)
+                for segment in segments
+            ]
 
-        return expected == event.integrity_hash
\ No newline at end of file
+            for future in as_completed(futures):
+                yield future.result()
@@ -2,6 +2,8 @@ import logging
 
 from celery import shared_task
 from celery.exceptions import MaxRetriesExceededError
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
@@ -11,6 +13,12 @@ from audit_logging.models.audit_dead_letter import AuditDeadLetter
 
 logger = logging.getLogger("audit")
 
+# Upper bound on batches per flush run, so one run cannot hold the
+# worker indefinitely while producers keep the buffer busy.
+AUDIT_FLUSH_MAX_BATCHES = getattr(settings, "AUDIT_BUFFER_FLUSH_MAX_BATCHES", 20)
+AUDIT_FLUSH_LOCK_KEY = "audit_logging:flush_lock"
+AUDIT_FLUSH_LOCK_SECONDS = 5 * 60
+
 
 @shared_task(bind=True, max_retries=3)
 def process_audit_event_task(self, audit_id: str):
@@ -106,4 +114,58 @@ def _process_event(event: AuditEvent):
         pass
 
     if event.is_sensitive:
-        pass
\ No newline at end of file
+        pass
+
+
+# --------------------------------------------------
+# BUFFERED INGESTION
+# --------------------------------------------------
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": 3},
+)
+def flush_audit_buffer_task(self) -> int:
+    """
+    Bulk-insert buffered audit events.
+
+    A single flusher runs at a time so the hash chain follows buffer
+    order.
+    """
+    from audit_logging.ingestion.recorder import AuditRecorder
+
+    if not cache.add(AUDIT_FLUSH_LOCK_KEY, 1, timeout=AUDIT_FLUSH_LOCK_SECONDS):
+        return 0
+
+    flushed = 0
+    try:
+        for _ in range(AUDIT_FLUSH_MAX_BATCHES):
+            taken = AuditRecorder.flush_buffer()
+            if not taken:
+                break
+            flushed += taken
+    finally:
+        cache.delete(AUDIT_FLUSH_LOCK_KEY)
+
+    return flushed
+
+
+# --------------------------------------------------
+# INTEGRITY CHECKPOINTS
+# --------------------------------------------------
+
+@shared_task
+def seal_audit_segments_task(website_id=None) -> int:
+    """
+    Checkpoint completed hash-chain segments.
+
+    Queued when a tenant's chain fills a segment, and run hourly as
+    a catch-up for all tenants.
+    """
+    from audit_logging.tamper_detection.checkpoints import (
+        AuditCheckpointService,
+    )
+
+    return AuditCheckpointService.seal_pending(website_id)
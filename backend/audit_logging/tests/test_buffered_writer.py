@@ -0,0 +1,167 @@
+"""
+Audit write-behind buffer tests.
+
+Tests cover:
+- Pushed events round-trip through the buffer unchanged
+- Push reports a Redis outage so callers can write directly
+- Flush writes a batch in buffer order and trims it
+- A failed flush leaves the batch buffered for the next run
+- Retried flushes skip events that were already stored
+"""
+from unittest.mock import patch
+
+import pytest
+from django.db import DatabaseError
+from django.utils import timezone
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from audit_logging.ingestion.recorder import AuditRecorder
+from audit_logging.models.audit_event import AuditEvent
+from audit_logging.storage.buffered_writer import AuditBufferedWriter
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis list commands used."""
+
+    def __init__(self):
+        self.lists = {}
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return list(items[start:end + 1 if end != -1 else None])
+
+    def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        self.lists[key] = items[start:end + 1 if end != -1 else None]
+
+
+@pytest.fixture
+def fake_redis():
+    fake = FakeRedis()
+    with patch.object(AuditBufferedWriter, "_client", return_value=fake):
+        yield fake
+
+
+@pytest.fixture(autouse=True)
+def no_dispatch():
+    with patch.object(AuditRecorder, "dispatch"):
+        yield
+
+
+def _event(website, action="order.updated", **kwargs):
+    return AuditEvent(website=website, action=action, **kwargs)
+
+
+def _buffered(fake_redis):
+    return fake_redis.lists.get(AuditBufferedWriter.BUFFER_KEY, [])
+
+
+@pytest.mark.django_db
+class TestAuditBufferedWriter:
+    """Test buffered audit ingestion."""
+
+    def test_push_round_trips_event(self, fake_redis, website):
+        # The buffer's JSON keeps millisecond precision.
+        event = _event(
+            website,
+            occurred_at=timezone.now().replace(microsecond=123000),
+            object_id="42",
+            metadata={"field": "status"},
+            idempotency_key="order-42-status",
+        )
+
+        assert AuditBufferedWriter.push(event) is True
+
+        (restored,), taken = AuditBufferedWriter.peek()
+        assert taken == 1
+        assert restored.id == event.id
+        assert restored.website_id == website.id
+        assert restored.occurred_at == event.occurred_at
+        assert restored.metadata == {"field": "status"}
+        assert restored.idempotency_key == "order-42-status"
+
+    def test_push_reports_redis_outage(self, website):
+        with patch.object(
+            AuditBufferedWriter,
+            "_client",
+            side_effect=RedisConnectionError("down"),
+        ):
+            assert AuditBufferedWriter.push(_event(website)) is False
+
+    def test_flush_writes_batch_in_order_and_trims(self, fake_redis, website):
+        events = [_event(website, action=f"step.{n}") for n in range(3)]
+        for event in events:
+            AuditBufferedWriter.push(event)
+
+        assert AuditRecorder.flush_buffer() == 3
+
+        assert _buffered(fake_redis) == []
+        stored = list(
+            AuditEvent.objects.filter(website=website).order_by("chain_seq")
+        )
+        assert [event.action for event in stored] == [
+            "step.0",
+            "step.1",
+            "step.2",
+        ]
+        assert stored[1].previous_hash == stored[0].integrity_hash
+
+    def test_unreadable_entries_are_skipped_and_trimmed(
+        self,
+        fake_redis,
+        website,
+    ):
+        fake_redis.rpush(AuditBufferedWriter.BUFFER_KEY, "{not json")
+        AuditBufferedWriter.push(_event(website))
+
+        assert AuditRecorder.flush_buffer() == 2
+
+        assert _buffered(fake_redis) == []
+        assert AuditEvent.objects.filter(website=website).count() == 1
+
+    def test_failed_flush_leaves_batch_buffered(self, fake_redis, website):
+        AuditBufferedWriter.push(_event(website))
+
+        with patch.object(
+            AuditBufferedWriter,
+            "write_batch",
+            side_effect=DatabaseError("database unavailable"),
+        ), pytest.raises(DatabaseError):
+            AuditRecorder.flush_buffer()
+
+        assert len(_buffered(fake_redis)) == 1
+        assert not AuditEvent.objects.filter(website=website).exists()
+
+        assert AuditRecorder.flush_buffer() == 1
+        assert _buffered(fake_redis) == []
+        assert AuditEvent.objects.filter(website=website).count() == 1
+
+    def test_retried_flush_skips_stored_events(self, fake_redis, website):
+        event = _event(website, idempotency_key="once")
+        AuditBufferedWriter.push(event)
+        AuditBufferedWriter.push(event)
+        AuditBufferedWriter.push(_event(website, idempotency_key="once"))
+
+        assert AuditRecorder.flush_buffer() == 3
+
+        assert AuditEvent.objects.filter(website=website).count() == 1
+
+    def test_bulk_failure_falls_back_to_row_writes(self, fake_redis, website):
+        AuditBufferedWriter.push(_event(website, action="first"))
+        AuditBufferedWriter.push(_event(website, action="second"))
+
+        with patch.object(
+            AuditEvent.objects,
+            "bulk_create",
+            side_effect=DatabaseError("bulk insert failed"),
+        ):
+            assert AuditRecorder.flush_buffer() == 2
+
+        assert set(
+            AuditEvent.objects.filter(website=website)
+            .values_list("action", flat=True)
+        ) == {"first", "second"}
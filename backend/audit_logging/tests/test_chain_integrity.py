@@ -0,0 +1,226 @@
+"""
+Audit hash chain integrity tests.
+
+Tests cover:
+- Merkle roots, including odd levels
+- Checkpoint HMAC signing and tamper detection
+- Segment verification: edits, gaps, tail truncation, checkpoints
+- Direct writes append to the chain only after the caller commits
+"""
+import hashlib
+import hmac
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+from django.test import override_settings
+
+from audit_logging.ingestion.recorder import AuditRecorder
+from audit_logging.models.audit_chain import (
+    AuditChainCheckpoint,
+    AuditChainHead,
+)
+from audit_logging.models.audit_event import AuditEvent
+from audit_logging.storage.writer import AuditWriter
+from audit_logging.tamper_detection.chain import AuditChainService
+from audit_logging.tamper_detection.checkpoints import AuditCheckpointService
+from audit_logging.tamper_detection.hashing import AuditHashingService
+from audit_logging.tamper_detection.verifier import AuditIntegrityVerifier
+from audit_logging.tracing.trace import Trace
+
+
+def _h(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def no_checkpoint_tasks():
+    with patch.object(AuditChainService, "_queue_checkpoints"):
+        yield
+
+
+@pytest.fixture
+def small_segments():
+    with patch(
+        "audit_logging.tamper_detection.checkpoints.SEGMENT_SIZE",
+        4,
+    ), patch(
+        "audit_logging.tamper_detection.verifier.SEGMENT_SIZE",
+        4,
+    ):
+        yield
+
+
+@pytest.fixture
+def chain(website, small_segments):
+    """Six chained events: sealed segment 0 (1-4), open segment 1 (5-6)."""
+    for n in range(6):
+        AuditWriter().append(AuditEvent(website=website, action=f"step.{n}"))
+    AuditCheckpointService.seal_pending(website.id)
+    return website
+
+
+def _verify(website, segment_index):
+    return AuditIntegrityVerifier.verify_segment(website.id, segment_index)
+
+
+class TestMerkleRoot:
+    """Test the segment Merkle root."""
+
+    def test_empty_segment(self):
+        assert AuditHashingService.merkle_root([]) == _h("")
+
+    def test_single_leaf_is_its_own_root(self):
+        assert AuditHashingService.merkle_root(["a" * 64]) == "a" * 64
+
+    def test_pairs_hash_left_then_right(self):
+        assert AuditHashingService.merkle_root(["a", "b"]) == _h("ab")
+        assert AuditHashingService.merkle_root(["b", "a"]) == _h("ba")
+
+    def test_odd_node_is_paired_with_itself(self):
+        assert AuditHashingService.merkle_root(["a", "b", "c"]) == _h(
+            _h("ab") + _h("cc")
+        )
+
+
+class TestCheckpointSigning:
+    """Test checkpoint HMAC signatures."""
+
+    PARTS = {
+        "website_id": 7,
+        "segment_index": 2,
+        "first_seq": 2001,
+        "last_seq": 3000,
+        "previous_hash": "p" * 64,
+        "head_hash": "h" * 64,
+        "merkle_root": "m" * 64,
+    }
+
+    @override_settings(AUDIT_CHECKPOINT_SIGNING_KEY="checkpoint-key")
+    def test_signature_is_hmac_sha256_over_all_fields(self):
+        message = "|".join([
+            "7", "2", "2001", "3000", "p" * 64, "h" * 64, "m" * 64,
+        ])
+        expected = hmac.new(
+            b"checkpoint-key",
+            message.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        assert AuditCheckpointService.sign(**self.PARTS) == expected
+
+    @override_settings(AUDIT_CHECKPOINT_SIGNING_KEY="checkpoint-key")
+    def test_every_field_is_signed(self):
+        original = AuditCheckpointService.sign(**self.PARTS)
+
+        for field in self.PARTS:
+            changed = dict(self.PARTS, **{field: "0"})
+            assert AuditCheckpointService.sign(**changed) != original, field
+
+    def test_signature_depends_on_key(self):
+        with override_settings(AUDIT_CHECKPOINT_SIGNING_KEY="one"):
+            first = AuditCheckpointService.sign(**self.PARTS)
+        with override_settings(AUDIT_CHECKPOINT_SIGNING_KEY="two"):
+            second = AuditCheckpointService.sign(**self.PARTS)
+
+        assert first != second
+
+
+@pytest.mark.django_db
+class TestVerifySegment:
+    """Test per-segment chain verification."""
+
+    def test_intact_chain_verifies(self, chain):
+        sealed = _verify(chain, 0)
+        tail = _verify(chain, 1)
+
+        assert sealed["valid"], sealed["errors"]
+        assert sealed["sealed"] is True
+        assert sealed["checked"] == 4
+        assert tail["valid"], tail["errors"]
+        assert tail["sealed"] is False
+
+    def test_edited_row_is_reported(self, chain):
+        AuditEvent.objects.filter(website=chain, chain_seq=2).update(
+            action="step.forged",
+        )
+
+        result = _verify(chain, 0)
+
+        assert not result["valid"]
+        assert any(e.startswith("hash mismatch at seq 2") for e in result["errors"])
+        assert "checkpoint merkle root mismatch" not in result["errors"]
+
+    def test_deleted_row_is_reported(self, chain):
+        AuditEvent.objects.filter(website=chain, chain_seq=3).delete()
+
+        result = _verify(chain, 0)
+
+        assert "missing seq 3-3" in result["errors"]
+        assert "checkpoint merkle root mismatch" in result["errors"]
+
+    def test_truncated_unsealed_tail_is_reported(self, chain):
+        AuditEvent.objects.filter(website=chain, chain_seq=6).delete()
+
+        result = _verify(chain, 1)
+
+        assert not result["valid"]
+        assert "missing seq 6-6" in result["errors"]
+
+    def test_replaced_tail_is_reported(self, chain):
+        AuditChainHead.objects.filter(website=chain).update(last_hash="0" * 64)
+
+        result = _verify(chain, 1)
+
+        assert "chain head hash mismatch" in result["errors"]
+
+    def test_rewritten_checkpoint_is_reported(self, chain):
+        AuditChainCheckpoint.objects.filter(
+            website=chain,
+            segment_index=0,
+        ).update(merkle_root="0" * 64)
+
+        result = _verify(chain, 0)
+
+        assert "checkpoint signature invalid" in result["errors"]
+        assert "checkpoint merkle root mismatch" in result["errors"]
+
+    def test_rows_appended_after_head_read_are_ignored(self, chain):
+        AuditChainHead.objects.filter(website=chain).update(
+            last_seq=5,
+            last_hash=AuditEvent.objects.get(
+                website=chain,
+                chain_seq=5,
+            ).integrity_hash,
+        )
+
+        result = _verify(chain, 1)
+
+        assert result["valid"], result["errors"]
+        assert result["checked"] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_direct_write_locks_chain_head_only_after_commit(website):
+    with patch.object(
+        Trace,
+        "snapshot",
+        return_value={"website_id": website.id},
+    ), patch.object(AuditRecorder, "dispatch"), patch(
+        "audit_logging.ingestion.recorder.BUFFERED_INGESTION",
+        False,
+    ):
+        with transaction.atomic():
+            AuditRecorder.ingest(AuditEvent(website=website, action="paid"))
+
+            assert not AuditChainHead.objects.filter(website=website).exists()
+            assert not AuditEvent.objects.filter(website=website).exists()
+
+        with transaction.atomic():
+            AuditRecorder.ingest(AuditEvent(website=website, action="lost"))
+            transaction.set_rollback(True)
+
+    event = AuditEvent.objects.get(website=website)
+    assert event.action == "paid"
+    assert event.chain_seq == 1
+    assert AuditChainHead.objects.get(website=website).last_seq == 1
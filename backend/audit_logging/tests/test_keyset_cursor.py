@@ -0,0 +1,185 @@
+"""
+Audit keyset pagination and export tests.
+
+Tests cover:
+- Cursors round-trip and malformed cursors are rejected
+- Pages tie-break on (occurred_at, id) with no gaps or repeats
+- Reverse cursors page back to the start
+- AuditStream.since resumes from its next_cursor
+- The NDJSON export streams every event oldest first, also under ASGI
+"""
+import json
+import uuid
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from audit_logging.api.views.audit_event_views import AuditEventViewSet
+from audit_logging.models.audit_event import AuditEvent
+from audit_logging.services.query.audit_cursor import (
+    AuditCursor,
+    iterate,
+    paginate,
+)
+from audit_logging.streams.audit_stream import AuditStream
+
+
+def _events(website, count, *, occurred_at=None):
+    occurred_at = occurred_at or timezone.now()
+    return [
+        AuditEvent.objects.create(
+            website=website,
+            action=f"step.{n}",
+            occurred_at=occurred_at,
+        )
+        for n in range(count)
+    ]
+
+
+def _walk(qs, *, limit, descending=True):
+    seen, cursor = [], None
+    while True:
+        page = paginate(qs, cursor=cursor, limit=limit, descending=descending)
+        seen.extend(event.id for event in page.items)
+        if page.next_cursor is None:
+            return seen, page
+        cursor = page.next_cursor
+
+
+class TestAuditCursor:
+    """Test AuditCursor encoding."""
+
+    def test_round_trip(self):
+        cursor = AuditCursor(
+            occurred_at=timezone.now(),
+            id=uuid.uuid4(),
+            reverse=True,
+        )
+
+        assert AuditCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WzEsMl0"])
+    def test_malformed_cursor_raises_value_error(self, token):
+        with pytest.raises(ValueError):
+            AuditCursor.decode(token)
+
+
+@pytest.mark.django_db
+class TestPaginate:
+    """Test keyset paginate()."""
+
+    def test_ties_on_occurred_at_break_on_id(self, website):
+        events = _events(website, 5)
+
+        seen, _ = _walk(AuditEvent.objects.all(), limit=2)
+
+        assert seen == sorted((e.id for e in events), reverse=True)
+
+    def test_ascending_walk_orders_by_time_then_id(self, website):
+        now = timezone.now()
+        later = _events(website, 2, occurred_at=now)
+        earlier = _events(website, 2, occurred_at=now - timedelta(minutes=1))
+
+        seen, _ = _walk(AuditEvent.objects.all(), limit=3, descending=False)
+
+        assert seen == (
+            sorted(e.id for e in earlier) + sorted(e.id for e in later)
+        )
+
+    def test_previous_cursor_pages_back(self, website):
+        _events(website, 5)
+        qs = AuditEvent.objects.all()
+
+        first = paginate(qs, cursor=None, limit=2)
+        second = paginate(qs, cursor=first.next_cursor, limit=2)
+        back = paginate(qs, cursor=second.previous_cursor, limit=2)
+
+        assert first.previous_cursor is None
+        assert [e.id for e in back.items] == [e.id for e in first.items]
+        assert back.previous_cursor is None
+
+    def test_iterate_crosses_batches(self, website):
+        events = _events(website, 5)
+
+        ids = [e.id for e in iterate(AuditEvent.objects.all(), batch_size=2)]
+
+        assert ids == sorted(e.id for e in events)
+
+
+@pytest.mark.django_db
+class TestAuditStreamSince:
+    """Test AuditStream.since."""
+
+    def test_resumes_from_next_cursor(self, website):
+        now = timezone.now()
+        _events(website, 1, occurred_at=now - timedelta(days=1))
+        recent = _events(website, 3, occurred_at=now)
+
+        first = AuditStream.since(now, limit=2)
+        second = AuditStream.since(now, cursor=first.next_cursor, limit=2)
+
+        assert [e.id for e in first.items + second.items] == sorted(
+            e.id for e in recent
+        )
+        assert second.next_cursor is None
+
+
+@pytest.mark.django_db
+class TestNdjsonExport:
+    """Test AuditEventViewSet.export_ndjson."""
+
+    view = staticmethod(AuditEventViewSet.as_view({"get": "export_ndjson"}))
+
+    @pytest.fixture
+    def staff(self, django_user_model, website):
+        return django_user_model.objects.create_user(
+            username="auditor",
+            email="auditor@example.com",
+            password="pass",
+            website=website,
+            is_staff=True,
+        )
+
+    @pytest.fixture
+    def history(self, website):
+        now = timezone.now()
+        return (
+            _events(website, 2, occurred_at=now - timedelta(hours=1))
+            + _events(website, 2, occurred_at=now)
+        )
+
+    @staticmethod
+    def _expected(history):
+        return [
+            str(e.id)
+            for e in sorted(history, key=lambda e: (e.occurred_at, e.id))
+        ]
+
+    def test_streams_every_event_oldest_first(self, staff, history):
+        request = APIRequestFactory().get("/export-ndjson/")
+        force_authenticate(request, user=staff)
+
+        response = self.view(request)
+        body = b"".join(response.streaming_content).decode()
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        ids = [json.loads(line)["id"] for line in body.splitlines()]
+        assert ids == self._expected(history)
+
+    def test_asgi_export_is_an_async_stream(self, staff, history):
+        request = AsyncRequestFactory().get("/export-ndjson/")
+        force_authenticate(request, user=staff)
+
+        response = self.view(request)
+
+        async def collect():
+            return [line async for line in response.streaming_content]
+
+        assert response.is_async
+        lines = async_to_sync(collect)()
+        ids = [json.loads(line)["id"] for line in lines]
+        assert ids == self._expected(history)
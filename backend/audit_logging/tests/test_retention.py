@@ -0,0 +1,115 @@
+"""
+Audit retention tests.
+
+Tests cover:
+- The retention window and the deleted count
+- Chained events are purged a whole sealed segment at a time
+- The remaining chain still verifies after a purge
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from audit_logging.models.audit_chain import AuditChainHead
+from audit_logging.models.audit_event import AuditEvent
+from audit_logging.retention.clean_up_service import AuditCleanupService
+from audit_logging.storage.writer import AuditWriter
+from audit_logging.tamper_detection.chain import AuditChainService
+from audit_logging.tamper_detection.checkpoints import AuditCheckpointService
+from audit_logging.tamper_detection.verifier import AuditIntegrityVerifier
+
+
+@pytest.fixture(autouse=True)
+def small_segments():
+    with (
+        patch.object(AuditChainService, "_queue_checkpoints"),
+        patch("audit_logging.tamper_detection.checkpoints.SEGMENT_SIZE", 4),
+        patch("audit_logging.tamper_detection.verifier.SEGMENT_SIZE", 4),
+    ):
+        yield
+
+
+@pytest.fixture
+def history(website):
+    """
+    Ten chained events, 1-6 two years old and 7-10 recent, so segment 0
+    (1-4) is fully expired and segment 1 (5-8) straddles the cutoff.
+    """
+    old = timezone.now() - timedelta(days=730)
+    for n in range(10):
+        AuditWriter().append(
+            AuditEvent(
+                website=website,
+                action=f"step.{n}",
+                occurred_at=old if n < 6 else timezone.now(),
+            )
+        )
+    AuditCheckpointService.seal_pending(website.id)
+    return website
+
+
+@pytest.mark.django_db
+class TestPurgeOldEvents:
+    """Test AuditCleanupService.purge_old_events."""
+
+    def test_only_fully_expired_sealed_segments_are_purged(self, history):
+        deleted = AuditCleanupService.purge_old_events(days=365)
+
+        assert deleted == 4
+        assert sorted(
+            AuditEvent.objects.filter(website=history)
+            .values_list("chain_seq", flat=True)
+        ) == list(range(5, 11))
+        assert AuditChainHead.objects.get(website=history).pruned_seq == 4
+
+    def test_days_sets_the_cutoff(self, history):
+        assert AuditCleanupService.purge_old_events(days=1000) == 0
+        assert AuditEvent.objects.filter(website=history).count() == 10
+
+    def test_unchained_events_are_counted(self, history):
+        AuditEvent.objects.create(
+            website=history,
+            action="legacy",
+            occurred_at=timezone.now() - timedelta(days=730),
+        )
+
+        assert AuditCleanupService.purge_old_events(days=365) == 5
+        assert not AuditEvent.objects.filter(action="legacy").exists()
+
+    def test_repeat_purge_is_a_no_op(self, history):
+        AuditCleanupService.purge_old_events(days=365)
+
+        assert AuditCleanupService.purge_old_events(days=365) == 0
+
+    def test_history_verifies_after_purge(self, history):
+        AuditCleanupService.purge_old_events(days=365)
+
+        results = list(
+            AuditIntegrityVerifier.verify_history(
+                website_id=history.id,
+                workers=1,
+            )
+        )
+
+        assert [r["segment_index"] for r in results] == [1, 2]
+        assert all(r["valid"] for r in results), results
+
+    def test_purged_segment_verifies_on_its_checkpoint(self, history):
+        AuditCleanupService.purge_old_events(days=365)
+
+        result = AuditIntegrityVerifier.verify_segment(history.id, 0)
+
+        assert result["pruned"] is True
+        assert result["valid"], result["errors"]
+
+    def test_tampering_after_purge_is_still_reported(self, history):
+        AuditCleanupService.purge_old_events(days=365)
+        AuditEvent.objects.filter(website=history, chain_seq=5).update(
+            previous_hash="0" * 64,
+        )
+
+        result = AuditIntegrityVerifier.verify_segment(history.id, 1)
+
+        assert not result["valid"]
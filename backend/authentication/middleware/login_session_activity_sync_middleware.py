@@ -12,6 +12,9 @@ class LoginSessionActivitySyncMiddleware:
     """
     Update LoginSession.last_activity for authenticated requests when a
     session token can be resolved.
+
+    Activity is buffered and flushed in bulk, and requests already
+    handled by the enforcement middleware are skipped.
     """
 
     def __init__(self, get_response):
@@ -24,6 +27,9 @@ class LoginSessionActivitySyncMiddleware:
         if not user or not user.is_authenticated:
             return response
 
+        if getattr(request, "_login_session", None) is not None:
+            return response
+
         auth = request.META.get("HTTP_AUTHORIZATION", "")
         if not auth.startswith("Bearer "):
             return response
@@ -44,6 +50,6 @@ class LoginSessionActivitySyncMiddleware:
         )
 
         if session is not None:
-            LoginSessionService.touch_session(session=session)
+            LoginSessionService.record_activity(session=session)
 
         return response
\ No newline at end of file
@@ -61,7 +61,7 @@ class LoginSessionEnforcementMiddleware:
                         )
 
                     # THIS IS THE IMPORTANT PART
-                    LoginSessionService.touch_session(session=session)
+                    LoginSessionService.record_activity(session=session)
 
                     # attach for downstream use
                     request._login_session = session
@@ -34,6 +34,11 @@ class SessionActivityMiddleware:
             "SESSION_WARNING_TIME",
             5 * 60,
         )
+        self.write_interval = getattr(
+            settings,
+            "SESSION_ACTIVITY_WRITE_INTERVAL",
+            60,
+        )
 
     def __call__(self, request):
         response = self.get_response(request)
@@ -64,8 +69,13 @@ class SessionActivityMiddleware:
             idle_time = max(now_ts - last_activity, 0)
             idle_remaining = max(effective_timeout - idle_time, 0)
 
-            request.session["last_activity_ts"] = now_ts
-            request.session.modified = True
+            # Rewrite the session only when the stored timestamp is
+            # older than the write interval.
+            if now_ts - last_activity >= self.write_interval:
+                request.session["last_activity_ts"] = now_ts
+                request.session.modified = True
+            elif "last_activity_ts" not in request.session:
+                request.session["last_activity_ts"] = now_ts
 
         response["X-Session-Idle-Time"] = str(int(idle_time))
         response["X-Session-Remaining"] = str(int(idle_remaining))
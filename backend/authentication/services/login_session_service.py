@@ -9,6 +9,9 @@ from django.db import transaction
 from django.utils.timezone import now
 
 from authentication.models.login_session import LoginSession
+from authentication.services.session_activity_buffer_service import (
+    SessionActivityBufferService,
+)
 from authentication.services.token_service import TokenService
 
 
@@ -154,7 +157,9 @@ class LoginSessionService:
             session=session,
         )
 
-        reference_time = session.last_activity_at or session.logged_in_at
+        reference_time = LoginSessionService.get_last_activity_at(
+            session=session,
+        )
         if reference_time is None:
             return False
 
@@ -282,6 +287,45 @@ class LoginSessionService:
         session.touch()
         return session
 
+    @staticmethod
+    def record_activity(
+        *,
+        session: LoginSession,
+    ) -> LoginSession:
+        """
+        Record request activity without writing to the database.
+
+        The timestamp is buffered and flushed in bulk by
+        ``flush_session_activity_task``. Falls back to a direct write
+        when the buffer is unavailable.
+
+        Args:
+            session: LoginSession instance.
+
+        Returns:
+            The session with its in-memory last activity updated.
+        """
+        recorded = SessionActivityBufferService.record(
+            session=session,
+            at=timezone.now(),
+        )
+        if not recorded:
+            session.touch()
+        return session
+
+    @staticmethod
+    def get_last_activity_at(
+        *,
+        session: LoginSession,
+    ):
+        """
+        Return the latest known activity time, including buffered touches.
+        """
+        return (
+            SessionActivityBufferService.get_last_activity(session=session)
+            or session.logged_in_at
+        )
+
     @staticmethod
     def get_active_sessions(
         *,
@@ -397,7 +441,9 @@ class LoginSessionService:
             session=session,
         )
 
-        reference_time = session.last_activity_at or session.logged_in_at
+        reference_time = LoginSessionService.get_last_activity_at(
+            session=session,
+        )
         if reference_time is None:
             return timeout_seconds
 
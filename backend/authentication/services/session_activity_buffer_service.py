@@ -0,0 +1,215 @@
+"""
+Write-behind buffer for LoginSession activity timestamps.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+
+from django.conf import settings
+from redis import Redis
+from redis.exceptions import RedisError
+
+from authentication.models.login_session import LoginSession
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> Redis:
+    """
+    Return the process-wide Redis client.
+    """
+    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+class SessionActivityBufferService:
+    """
+    Buffer last-seen timestamps in Redis and flush them in bulk.
+
+    Authenticated requests record activity with one Redis HSET instead
+    of an UPDATE on the primary database. A periodic task moves the
+    buffered timestamps into ``LoginSession.last_activity_at``. Idle
+    checks read the buffered value so they never see a stale row.
+
+    A flush renames the buffer to its own key and lists that key in
+    FLUSHING_KEYS until it is done, so reads still find timestamps that
+    are mid-flush. A failed flush merges its snapshot back into the
+    buffer; one whose worker died is swept back by the next flush.
+    """
+
+    BUFFER_KEY = "authentication:session_activity"
+    FLUSHING_KEYS = f"{BUFFER_KEY}:flushing"
+    FLUSH_BATCH_SIZE = 500
+    ORPHAN_TTL_SECONDS = 60 * 60
+    # Longer than any flush takes; older in-flight keys are orphans.
+    STALE_FLUSH_SECONDS = 10 * 60
+
+    @staticmethod
+    def _client() -> Redis:
+        return _shared_client()
+
+    @staticmethod
+    def _to_datetime(value: str | None) -> datetime | None:
+        if not value:
+            return None
+        return datetime.fromtimestamp(float(value), tz=dt_timezone.utc)
+
+    @classmethod
+    def record(cls, *, session: LoginSession, at: datetime) -> bool:
+        """
+        Buffer an activity timestamp for a session.
+
+        Returns False when Redis is unavailable so the caller can fall
+        back to a direct write.
+        """
+        try:
+            cls._client().hset(
+                cls.BUFFER_KEY,
+                str(session.pk),
+                at.timestamp(),
+            )
+        except RedisError:
+            logger.warning(
+                "Session activity buffer unavailable; writing directly."
+            )
+            return False
+
+        session.last_activity_at = at
+        return True
+
+    @classmethod
+    def get_last_activity(cls, *, session: LoginSession) -> datetime | None:
+        """
+        Return the newest of the buffered and stored activity timestamps.
+
+        Buffered values include any snapshot that is being flushed.
+        """
+        stored = session.last_activity_at
+        field = str(session.pk)
+
+        try:
+            client = cls._client()
+            pipe = client.pipeline(transaction=False)
+            pipe.hget(cls.BUFFER_KEY, field)
+            pipe.smembers(cls.FLUSHING_KEYS)
+            value, flushing_keys = pipe.execute()
+
+            values = [value]
+            if flushing_keys:
+                pipe = client.pipeline(transaction=False)
+                for key in flushing_keys:
+                    pipe.hget(key, field)
+                values.extend(pipe.execute())
+        except RedisError:
+            return stored
+
+        seen = [
+            buffered
+            for buffered in map(cls._to_datetime, values)
+            if buffered is not None
+        ]
+        if stored is not None:
+            seen.append(stored)
+        return max(seen, default=None)
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Write buffered timestamps to the database in bulk.
+
+        The buffer is renamed before reading so touches that arrive
+        during the flush land in a fresh hash. Stored timestamps only
+        move forward. If the write fails the snapshot is merged back
+        into the buffer for the next run. Returns the number of
+        sessions updated.
+        """
+        client = cls._client()
+        cls._recover_stale(client)
+
+        flushing_key = (
+            f"{cls.FLUSHING_KEYS}:{int(time.time())}:{uuid.uuid4().hex}"
+        )
+        client.sadd(cls.FLUSHING_KEYS, flushing_key)
+
+        try:
+            if not client.renamenx(cls.BUFFER_KEY, flushing_key):
+                client.srem(cls.FLUSHING_KEYS, flushing_key)
+                return 0
+        except RedisError as exc:
+            client.srem(cls.FLUSHING_KEYS, flushing_key)
+            if "no such key" in str(exc).lower():
+                return 0
+            raise
+
+        client.expire(flushing_key, cls.ORPHAN_TTL_SECONDS)
+
+        try:
+            updated = cls._write(client.hgetall(flushing_key))
+        except Exception:
+            cls._restore(client, flushing_key)
+            raise
+
+        client.delete(flushing_key)
+        client.srem(cls.FLUSHING_KEYS, flushing_key)
+        return updated
+
+    @classmethod
+    def _write(cls, raw: dict[str, str]) -> int:
+        buffered = {
+            int(session_id): cls._to_datetime(value)
+            for session_id, value in raw.items()
+        }
+
+        sessions = LoginSession.objects.filter(
+            pk__in=list(buffered),
+        ).only("id", "last_activity_at")
+
+        changed: list[LoginSession] = []
+        for session in sessions.iterator(chunk_size=cls.FLUSH_BATCH_SIZE):
+            seen_at = buffered[session.pk]
+            if (
+                session.last_activity_at is None
+                or seen_at > session.last_activity_at
+            ):
+                session.last_activity_at = seen_at
+                changed.append(session)
+
+        LoginSession.objects.bulk_update(
+            changed,
+            ["last_activity_at"],
+            batch_size=cls.FLUSH_BATCH_SIZE,
+        )
+
+        return len(changed)
+
+    @classmethod
+    def _restore(cls, client: Redis, flushing_key: str) -> None:
+        """
+        Merge a flushing snapshot back into the buffer.
+
+        HSETNX keeps any newer touch recorded since the rename.
+        """
+        pipe = client.pipeline(transaction=False)
+        for session_id, value in client.hgetall(flushing_key).items():
+            pipe.hsetnx(cls.BUFFER_KEY, session_id, value)
+        pipe.delete(flushing_key)
+        pipe.srem(cls.FLUSHING_KEYS, flushing_key)
+        pipe.execute()
+
+    @classmethod
+    def _recover_stale(cls, client: Redis) -> None:
+        """Restore snapshots left behind by flushes that never finished."""
+        cutoff = time.time() - cls.STALE_FLUSH_SECONDS
+        for flushing_key in client.smembers(cls.FLUSHING_KEYS):
+            started = flushing_key.rsplit(":", 2)[-2]
+            if started.isdigit() and int(started) < cutoff:
+                logger.warning(
+                    "Restoring orphaned session activity snapshot %s.",
+                    flushing_key,
+                )
+                cls._restore(client, flushing_key)
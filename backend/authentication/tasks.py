@@ -14,6 +14,9 @@ from authentication.models.registration_token import RegistrationToken
 from authentication.services.account_deletion_service import (
     AccountDeletionService,
 )
+from authentication.services.session_activity_buffer_service import (
+    SessionActivityBufferService,
+)
 
 
 @shared_task(
@@ -154,4 +157,17 @@ def purge_retained_account_deletions_task(self) -> int:
         service.mark_purged(request_obj=request_obj)
         count += 1
 
-    return count
\ No newline at end of file
+    return count
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_kwargs={"max_retries": 3},
+)
+def flush_session_activity_task(self) -> int:
+    """
+    Write buffered session activity to LoginSession rows in bulk.
+    """
+    return SessionActivityBufferService.flush()
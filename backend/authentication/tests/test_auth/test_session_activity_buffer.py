@@ -0,0 +1,243 @@
+"""
+Session activity buffer tests.
+
+Tests cover:
+- Buffered touches do not write to the database
+- Idle checks read the buffered timestamp
+- Flush writes buffered timestamps in bulk
+- Fallback to a direct write when Redis is unavailable
+- Timestamps stay readable while a flush is in progress
+- A failed or abandoned flush is merged back into the buffer
+"""
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import DatabaseError
+from django.utils import timezone
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+from authentication.models.login_session import LoginSession
+from authentication.services.login_session_service import LoginSessionService
+from authentication.services.session_activity_buffer_service import (
+    SessionActivityBufferService,
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands used."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.sets = {}
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+
+    def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, str(value))
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def renamenx(self, src, dst):
+        if src not in self.hashes:
+            raise ResponseError("no such key")
+        self.hashes[dst] = self.hashes.pop(src)
+        return True
+
+    def expire(self, key, seconds):
+        return True
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues calls and runs them against FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.calls.append((method, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+@pytest.fixture
+def fake_redis():
+    fake = FakeRedis()
+    with patch.object(
+        SessionActivityBufferService,
+        "_client",
+        return_value=fake,
+    ):
+        yield fake
+
+
+@pytest.fixture
+def login_session(client_user, website):
+    session, _ = LoginSessionService.start_session(
+        user=client_user,
+        website=website,
+    )
+    LoginSession.objects.filter(pk=session.pk).update(
+        last_activity_at=timezone.now() - timedelta(hours=1),
+    )
+    session.refresh_from_db()
+    return session
+
+
+@pytest.mark.django_db
+class TestSessionActivityBuffer:
+    """Test write-behind session activity."""
+
+    def test_record_activity_does_not_write_row(
+        self,
+        fake_redis,
+        login_session,
+    ):
+        stored_before = login_session.last_activity_at
+
+        LoginSessionService.record_activity(session=login_session)
+
+        login_session.refresh_from_db()
+        assert login_session.last_activity_at == stored_before
+
+    def test_idle_check_reads_buffered_value(
+        self,
+        fake_redis,
+        login_session,
+    ):
+        LoginSessionService.record_activity(session=login_session)
+        stale = LoginSession.objects.get(pk=login_session.pk)
+
+        remaining = LoginSessionService.get_idle_remaining_seconds(
+            session=stale,
+        )
+        timeout = LoginSessionService.get_idle_timeout_seconds(session=stale)
+
+        assert remaining >= timeout - 5
+
+    def test_flush_writes_buffered_timestamps(
+        self,
+        fake_redis,
+        login_session,
+    ):
+        LoginSessionService.record_activity(session=login_session)
+        buffered_at = login_session.last_activity_at
+
+        assert SessionActivityBufferService.flush() == 1
+        assert SessionActivityBufferService.flush() == 0
+
+        login_session.refresh_from_db()
+        assert abs(
+            (login_session.last_activity_at - buffered_at).total_seconds()
+        ) < 1
+
+    def test_record_activity_falls_back_to_direct_write(self, login_session):
+        stored_before = login_session.last_activity_at
+
+        with patch.object(
+            SessionActivityBufferService,
+            "_client",
+            side_effect=RedisConnectionError("down"),
+        ):
+            LoginSessionService.record_activity(session=login_session)
+
+        login_session.refresh_from_db()
+        assert login_session.last_activity_at > stored_before
+
+    def test_idle_check_reads_value_being_flushed(
+        self,
+        fake_redis,
+        login_session,
+    ):
+        LoginSessionService.record_activity(session=login_session)
+        stale = LoginSession.objects.get(pk=login_session.pk)
+        seen_mid_flush = []
+
+        def write(raw):
+            seen_mid_flush.append(
+                SessionActivityBufferService.get_last_activity(session=stale)
+            )
+            return 0
+
+        with patch.object(SessionActivityBufferService, "_write", side_effect=write):
+            SessionActivityBufferService.flush()
+
+        assert abs(
+            (seen_mid_flush[0] - login_session.last_activity_at).total_seconds()
+        ) < 1
+
+    def test_failed_flush_is_merged_back(
+        self,
+        fake_redis,
+        login_session,
+        other_client,
+        website,
+    ):
+        other, _ = LoginSessionService.start_session(
+            user=other_client,
+            website=website,
+        )
+        earlier = timezone.now() - timedelta(minutes=5)
+        SessionActivityBufferService.record(session=login_session, at=earlier)
+        SessionActivityBufferService.record(session=other, at=earlier)
+        newer = timezone.now()
+
+        def fail(raw):
+            # a touch lands while the snapshot is being written
+            SessionActivityBufferService.record(session=login_session, at=newer)
+            raise DatabaseError("primary unavailable")
+
+        with (
+            patch.object(SessionActivityBufferService, "_write", side_effect=fail),
+            pytest.raises(DatabaseError),
+        ):
+            SessionActivityBufferService.flush()
+
+        buffer = fake_redis.hgetall(SessionActivityBufferService.BUFFER_KEY)
+        assert float(buffer[str(login_session.pk)]) == newer.timestamp()
+        assert float(buffer[str(other.pk)]) == earlier.timestamp()
+        assert not fake_redis.smembers(SessionActivityBufferService.FLUSHING_KEYS)
+
+        SessionActivityBufferService.flush()
+        login_session.refresh_from_db()
+        assert abs((login_session.last_activity_at - newer).total_seconds()) < 1
+
+    def test_abandoned_flush_is_recovered(self, fake_redis, login_session):
+        seen_at = timezone.now()
+        orphan = f"{SessionActivityBufferService.FLUSHING_KEYS}:1:dead"
+        fake_redis.hset(orphan, str(login_session.pk), seen_at.timestamp())
+        fake_redis.sadd(SessionActivityBufferService.FLUSHING_KEYS, orphan)
+
+        assert SessionActivityBufferService.flush() == 1
+
+        login_session.refresh_from_db()
+        assert abs((login_session.last_activity_at - seen_at).total_seconds()) < 1
+        assert not fake_redis.smembers(SessionActivityBufferService.FLUSHING_KEYS)
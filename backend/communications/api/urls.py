@@ -17,6 +17,7 @@ from communications.api.views.sla_views import CommunicationThreadSLAViewSet
 from communications.api.views.tag_views import CommunicationThreadTagAssignmentViewSet
 from communications.api.views.tag_views import CommunicationThreadTagViewSet
 from communications.api.views.thread_views import CommunicationThreadViewSet
+from communications.api.views.sse_views import CommunicationAsyncSSEView
 from communications.api.views.sse_views import CommunicationSSEView
 from communications.api.views.read_receipt_views import CommunicationReadReceiptViewSet
 from communications.api.views.attachment_views import CommunicationAttachmentViewSet
@@ -103,5 +104,10 @@ router.register(
 
 urlpatterns = [
     path("events/", CommunicationSSEView.as_view(), name="events"),
+    path(
+        "events/stream/",
+        CommunicationAsyncSSEView.as_view(),
+        name="events-stream",
+    ),
     path("", include(router.urls)),
 ]
\ No newline at end of file
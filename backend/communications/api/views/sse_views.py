@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from contextlib import aclosing
+
+from asgiref.sync import sync_to_async
 from django.http import StreamingHttpResponse
+from django.views import View
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from communications.sse.async_event_bus import CommunicationSSEAsyncEventBus
 from communications.sse.event_bus import CommunicationSSEEventBus
+from communications.sse.event_bus import CONTROL_EVENTS
 from communications.sse.event_bus import format_sse_event
 from communications.sse.event_formatter import (
     CommunicationSSEEventFormatter,
@@ -24,29 +31,125 @@ class CommunicationSSEView(APIView):
         Open SSE stream.
         """
         user = request.user
+        last_event_id = _last_event_id(request)
 
         def event_stream():
-            for item in CommunicationSSEEventBus.subscribe():
+            for item in CommunicationSSEEventBus.subscribe(
+                user_id=user.id,
+                last_event_id=last_event_id,
+            ):
                 event_name = item.get("event", "message")
                 data = item.get("data", {})
 
-                if not _user_can_receive_event(user=user, data=data):
+                if event_name not in CONTROL_EVENTS and not (
+                    _user_can_receive_event(user=user, data=data)
+                ):
                     continue
 
                 rendered = CommunicationSSEEventFormatter.format(
                     event=event_name,
                     data=data,
+                    event_id=item.get("id"),
                 )
 
                 yield rendered.encode("utf-8")
 
-        response = StreamingHttpResponse(
-            event_stream(),
-            content_type="text/event-stream",
-        )
-        response["Cache-Control"] = "no-cache"
-        response["X-Accel-Buffering"] = "no"
-        return response
+        return _sse_response(event_stream())
+
+
+class CommunicationSSEAccessView(APIView):
+    """
+    Authentication, permission and throttle checks for the async stream.
+
+    Runs the same DRF policy as CommunicationSSEView, so both streams
+    accept the same credentials and share one connection rate limit.
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [CommunicationSSEThrottle]
+
+    def get(self, request):
+        return Response(status=204)
+
+
+_check_sse_access = CommunicationSSEAccessView.as_view()
+
+
+class CommunicationAsyncSSEView(View):
+    """
+    Stream communication events from the ASGI application.
+
+    An idle stream costs one coroutine instead of a sync worker, and
+    reconnecting clients resume from ``Last-Event-ID``. Requests are
+    authenticated and throttled exactly like CommunicationSSEView.
+    """
+
+    async def get(self, request):
+        """
+        Open async SSE stream.
+        """
+        denied = await sync_to_async(_sse_access_denied)(request)
+        if denied is not None:
+            return denied
+
+        user = request.user
+        last_event_id = _last_event_id(request)
+
+        async def event_stream():
+            yield b"retry: 3000\n\n"
+
+            async with aclosing(
+                CommunicationSSEAsyncEventBus.subscribe(
+                    user_id=user.id,
+                    last_event_id=last_event_id,
+                ),
+            ) as events:
+                async for item in events:
+                    rendered = CommunicationSSEEventFormatter.format(
+                        event=item.get("event", "message"),
+                        data=item.get("data", {}),
+                        event_id=item.get("id"),
+                    )
+
+                    yield rendered.encode("utf-8")
+
+        return _sse_response(event_stream())
+
+
+def _sse_response(stream) -> StreamingHttpResponse:
+    """
+    Wrap an event stream in an unbuffered SSE response.
+    """
+    response = StreamingHttpResponse(
+        stream,
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _last_event_id(request) -> str | None:
+    """
+    Return the resume cursor sent by a reconnecting client.
+    """
+    return (
+        request.headers.get("Last-Event-ID")
+        or request.GET.get("last_event_id")
+        or None
+    )
+
+
+def _sse_access_denied(request):
+    """
+    Return the rendered error response if the stream may not open.
+
+    DRF sets the authenticated user on ``request`` when access is granted.
+    """
+    response = _check_sse_access(request)
+    if response.status_code == 204:
+        return None
+    return response.render()
 
 
 def _user_can_receive_event(*, user, data: dict) -> bool:
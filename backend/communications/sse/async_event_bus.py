@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from django.conf import settings
+from redis.asyncio import Redis
+
+from communications.sse.event_bus import CommunicationSSEEventBus
+from communications.sse.event_bus import HEARTBEAT_SECONDS
+from communications.sse.event_bus import decode_replay_entries
+from communications.sse.event_bus import is_after
+from communications.sse.event_bus import lagged_event
+from communications.sse.event_bus import parse_event_id
+from communications.sse.event_bus import ping_event
+from communications.sse.fanout import CommunicationSSEAsyncFanout
+
+
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, Redis] = (
+    WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def _shared_client() -> Redis:
+    """
+    Return the async Redis client for the running event loop.
+
+    ``redis.asyncio`` connections are bound to the loop that opened
+    them, so each loop gets its own client and pool.
+    """
+    loop = asyncio.get_running_loop()
+
+    with _clients_lock:
+        client = _clients.get(loop)
+
+        if client is None:
+            client = Redis.from_url(
+                settings.COMMUNICATIONS_REDIS_URL,
+                decode_responses=True,
+            )
+            _clients[loop] = client
+
+        return client
+
+
+class CommunicationSSEAsyncEventBus:
+    """
+    ``redis.asyncio`` read side of the communication SSE bus.
+
+    Publishing stays on ``CommunicationSSEEventBus``; this class only
+    serves streams, so channel names and the replay log are shared.
+    """
+
+    @staticmethod
+    def _client() -> Redis:
+        """
+        Return async Redis client.
+        """
+        return _shared_client()
+
+    @classmethod
+    def _fanout(cls) -> CommunicationSSEAsyncFanout:
+        """
+        Return the fan-out shared by this process and event loop.
+        """
+        return CommunicationSSEAsyncFanout.for_process(
+            client_factory=cls._client,
+            mailbox_size=getattr(
+                settings,
+                "COMMUNICATIONS_SSE_MAILBOX_SIZE",
+                256,
+            ),
+        )
+
+    @classmethod
+    async def replay(
+        cls,
+        *,
+        user_id: int,
+        last_event_id: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the events a user missed after ``last_event_id``.
+        """
+        if parse_event_id(last_event_id) is None:
+            return []
+
+        entries = await cls._client().xrange(
+            CommunicationSSEEventBus.replay_key(user_id=user_id),
+            min=last_event_id,
+            count=CommunicationSSEEventBus.replay_length() + 1,
+        )
+        return decode_replay_entries(
+            entries=entries,
+            last_event_id=last_event_id,
+        )
+
+    @classmethod
+    async def subscribe(
+        cls,
+        *,
+        user_id: int,
+        last_event_id: str | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Subscribe to one user's event stream.
+
+        Sends a ``lagged`` event and ends when the client falls too far
+        behind; the browser then reconnects with ``Last-Event-ID`` and
+        resumes from the replay.
+        """
+        channel = CommunicationSSEEventBus.user_channel(user_id=user_id)
+        fanout = cls._fanout()
+        mailbox = fanout.register(channel=channel)
+        cursor = parse_event_id(last_event_id)
+        delivered_id = last_event_id
+
+        try:
+            if last_event_id:
+                for event in await cls.replay(
+                    user_id=user_id,
+                    last_event_id=last_event_id,
+                ):
+                    cursor = parse_event_id(event["id"])
+                    delivered_id = event["id"]
+                    yield event
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        mailbox.get(),
+                        timeout=HEARTBEAT_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    yield ping_event()
+                    continue
+
+                if event is CommunicationSSEAsyncFanout.LAGGED:
+                    yield lagged_event(last_event_id=delivered_id)
+                    return
+
+                if not is_after(event=event, cursor=cursor):
+                    continue
+
+                delivered_id = event.get("id") or delivered_id
+                yield event
+        finally:
+            fanout.unregister(channel=channel, mailbox=mailbox)
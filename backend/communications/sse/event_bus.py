@@ -4,6 +4,8 @@ import json
 import queue
 import time
 from collections.abc import Generator
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 from django.conf import settings
 from redis import Redis
@@ -11,14 +13,34 @@ from redis import Redis
 from communications.sse.event_formatter import (
     CommunicationSSEEventFormatter,
 )
+from communications.sse.fanout import CommunicationSSEFanout
 
 
+HEARTBEAT_SECONDS = 15
+LAGGED_EVENT = "lagged"
+CONTROL_EVENTS = frozenset({"ping", LAGGED_EVENT})
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> Redis:
+    """
+    Return the process-wide Redis client.
+
+    The client's connection pool resets itself after a fork.
+    """
+    return Redis.from_url(
+        settings.COMMUNICATIONS_REDIS_URL,
+        decode_responses=True,
+    )
+
 
 class CommunicationSSEEventBus:
     """
     Redis-backed SSE event bus.
 
-    Works across multiple Django/Gunicorn workers.
+    Works across multiple Django/Gunicorn workers. Events are published
+    to one channel per recipient user and each worker process shares a
+    single pub/sub connection across its open streams.
     """
 
     @staticmethod
@@ -26,15 +48,12 @@ class CommunicationSSEEventBus:
         """
         Return Redis client.
         """
-        return Redis.from_url(
-            settings.COMMUNICATIONS_REDIS_URL,
-            decode_responses=True,
-        )
+        return _shared_client()
 
     @staticmethod
     def _channel() -> str:
         """
-        Return communication SSE channel.
+        Return communication SSE channel prefix.
         """
         return getattr(
             settings,
@@ -43,57 +62,246 @@ class CommunicationSSEEventBus:
         )
 
     @classmethod
-    def publish(cls, *, event: dict[str, Any]) -> None:
+    def user_channel(cls, *, user_id: int) -> str:
+        """
+        Return the channel carrying events for one user.
+        """
+        return f"{cls._channel()}:user:{user_id}"
+
+    @classmethod
+    def replay_key(cls, *, user_id: int) -> str:
+        """
+        Return the capped stream holding recent events for one user.
+        """
+        return f"{cls._channel()}:replay:{user_id}"
+
+    @staticmethod
+    def replay_length() -> int:
+        """
+        Return how many recent events are kept per user for resume.
+        """
+        return getattr(settings, "COMMUNICATIONS_SSE_REPLAY_LENGTH", 200)
+
+    @staticmethod
+    def _replay_ttl() -> int:
+        """
+        Return how long an idle user's replay stream is kept.
         """
-        Publish event to Redis channel.
+        return getattr(
+            settings,
+            "COMMUNICATIONS_SSE_REPLAY_TTL_SECONDS",
+            3600,
+        )
+
+    @classmethod
+    def _fanout(cls) -> CommunicationSSEFanout:
+        """
+        Return the fan-out shared by this worker process.
+        """
+        return CommunicationSSEFanout.for_process(
+            client_factory=cls._client,
+            mailbox_size=getattr(
+                settings,
+                "COMMUNICATIONS_SSE_MAILBOX_SIZE",
+                256,
+            ),
+        )
+
+    @staticmethod
+    def _recipient_ids(event: dict[str, Any]) -> Iterable[int]:
+        """
+        Return the recipient user ids carried in event meta.
         """
-        payload = json.dumps(event)
-        cls._client().publish(cls._channel(), payload)
+        meta = event.get("data", {}).get("meta", {})
+        return dict.fromkeys(meta.get("recipient_user_ids") or ())
 
     @classmethod
-    def subscribe(cls) -> Generator[dict[str, Any], None, None]:
+    def publish(cls, *, event: dict[str, Any]) -> None:
         """
-        Subscribe to Redis event stream.
+        Publish event to each recipient's Redis channel.
+
+        Each recipient's copy is first appended to their replay stream
+        and carries the stream entry id, which clients echo back as
+        ``Last-Event-ID`` when they reconnect.
         """
+        recipient_ids = list(cls._recipient_ids(event))
+
+        if not recipient_ids:
+            return
+
         client = cls._client()
-        pubsub = client.pubsub(ignore_subscribe_messages=True)
-        pubsub.subscribe(cls._channel())
+        body = json.dumps(event)
+        pipeline = client.pipeline(transaction=False)
 
-        try:
-            last_ping_at = time.monotonic()
+        for user_id in recipient_ids:
+            replay_key = cls.replay_key(user_id=user_id)
+            pipeline.xadd(
+                replay_key,
+                {"event": body},
+                maxlen=cls.replay_length(),
+                approximate=True,
+            )
+            pipeline.expire(replay_key, cls._replay_ttl())
 
-            while True:
-                message = pubsub.get_message(timeout=15)
+        event_ids = pipeline.execute()[0::2]
+        pipeline = client.pipeline(transaction=False)
+
+        for user_id, event_id in zip(recipient_ids, event_ids):
+            pipeline.publish(
+                cls.user_channel(user_id=user_id),
+                json.dumps({**event, "id": event_id}),
+            )
+
+        pipeline.execute()
+
+    @classmethod
+    def replay(
+        cls,
+        *,
+        user_id: int,
+        last_event_id: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the events a user missed after ``last_event_id``.
+        """
+        if parse_event_id(last_event_id) is None:
+            return []
 
-                if message is not None:
-                    raw_data = message.get("data")
+        entries = cls._client().xrange(
+            cls.replay_key(user_id=user_id),
+            min=last_event_id,
+            count=cls.replay_length() + 1,
+        )
+        return decode_replay_entries(
+            entries=entries,
+            last_event_id=last_event_id,
+        )
 
-                    if not raw_data:
-                        continue
+    @classmethod
+    def subscribe(
+        cls,
+        *,
+        user_id: int,
+        last_event_id: str | None = None,
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Subscribe to one user's event stream.
 
-                    try:
-                        event = json.loads(str(raw_data))
-                    except json.JSONDecodeError:
-                        continue
+        The live subscription is registered before replaying, and live
+        events already covered by the replay are skipped. A client that
+        falls too far behind receives a ``lagged`` event and the stream
+        ends, so it resyncs instead of silently missing events.
+        """
+        channel = cls.user_channel(user_id=user_id)
+        fanout = cls._fanout()
+        mailbox = fanout.register(channel=channel)
+        cursor = parse_event_id(last_event_id)
+        delivered_id = last_event_id
 
+        try:
+            if last_event_id:
+                for event in cls.replay(
+                    user_id=user_id,
+                    last_event_id=last_event_id,
+                ):
+                    cursor = parse_event_id(event["id"])
+                    delivered_id = event["id"]
                     yield event
-                    last_ping_at = time.monotonic()
+
+            while True:
+                try:
+                    event = mailbox.get(timeout=HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ping_event()
                     continue
 
-                if time.monotonic() - last_ping_at >= 15:
-                    yield {
-                        "event": "ping",
-                        "data": {
-                            "type": "ping",
-                            "payload": {},
-                            "meta": {
-                                "timestamp": time.time(),
-                            },
-                        },
-                    }
-                    last_ping_at = time.monotonic()
+                if event is CommunicationSSEFanout.LAGGED:
+                    yield lagged_event(last_event_id=delivered_id)
+                    return
+
+                if not is_after(event=event, cursor=cursor):
+                    continue
+
+                delivered_id = event.get("id") or delivered_id
+                yield event
         finally:
-            pubsub.close()
+            fanout.unregister(channel=channel, mailbox=mailbox)
+
+
+def parse_event_id(event_id: str | None) -> tuple[int, int] | None:
+    """
+    Parse a Redis stream entry id into a comparable tuple.
+    """
+    if not event_id:
+        return None
+
+    milliseconds, _, sequence = str(event_id).partition("-")
+
+    try:
+        return int(milliseconds), int(sequence or 0)
+    except ValueError:
+        return None
+
+
+def is_after(*, event: dict[str, Any], cursor: tuple[int, int] | None) -> bool:
+    """
+    Return whether an event is newer than the resume cursor.
+    """
+    if cursor is None:
+        return True
+
+    event_id = parse_event_id(event.get("id"))
+    return event_id is None or event_id > cursor
+
+
+def decode_replay_entries(
+    *,
+    entries: list[tuple[str, dict[str, str]]],
+    last_event_id: str,
+) -> list[dict[str, Any]]:
+    """
+    Decode replay stream entries strictly after ``last_event_id``.
+    """
+    cursor = parse_event_id(last_event_id)
+    events: list[dict[str, Any]] = []
+
+    for entry_id, fields in entries:
+        if parse_event_id(entry_id) <= cursor:
+            continue
+
+        try:
+            event = json.loads(fields["event"])
+        except (KeyError, json.JSONDecodeError):
+            continue
+
+        events.append({**event, "id": entry_id})
+
+    return events
+
+
+def ping_event() -> dict[str, Any]:
+    """
+    Build the heartbeat event sent to idle streams.
+    """
+    return CommunicationSSEEventFormatter.build_event(
+        event_type="ping",
+        payload={},
+        meta={"timestamp": time.time()},
+    )
+
+
+def lagged_event(*, last_event_id: str | None) -> dict[str, Any]:
+    """
+    Build the reset event sent to a stream that fell too far behind.
+
+    Carries the last event id the client received, so it can resume
+    from the replay log or refetch its state if that has rolled over.
+    """
+    return CommunicationSSEEventFormatter.build_event(
+        event_type=LAGGED_EVENT,
+        payload={"last_event_id": last_event_id},
+        meta={"timestamp": time.time()},
+    )
 
 
 def format_sse_event(*, event: str, data: dict[str, Any]) -> str:
@@ -103,4 +311,4 @@ def format_sse_event(*, event: str, data: dict[str, Any]) -> str:
     return CommunicationSSEEventFormatter.format(
         event=event,
         data=data,
-    )
\ No newline at end of file
+    )
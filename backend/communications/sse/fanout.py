@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+log = logging.getLogger(__name__)
+
+
+class CommunicationSSEFanout:
+    """
+    Per-process fan-out for communication SSE streams.
+
+    Every open stream in a worker process shares one Redis pub/sub
+    connection. Channels are subscribed on demand while at least one
+    local stream listens on them, so an event is decoded once per
+    process and only reaches the mailboxes of its local recipients.
+
+    A stream whose mailbox overflows receives ``LAGGED`` and should
+    tell its client to resync, rather than silently losing events.
+    """
+
+    LAGGED: dict[str, Any] = {"event": "lagged"}
+
+    POLL_TIMEOUT_SECONDS = 0.5
+    RECONNECT_DELAY_SECONDS = 1.0
+
+    _instance: CommunicationSSEFanout | None = None
+    _instance_pid: int | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        client_factory: Callable[[], Redis],
+        mailbox_size: int = 256,
+    ) -> None:
+        self._client_factory = client_factory
+        self._mailbox_size = mailbox_size
+        self._lock = threading.Lock()
+        self._mailboxes: dict[str, set[Any]] = {}
+        self._pending_subscribe: set[str] = set()
+        self._pending_unsubscribe: set[str] = set()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def for_process(
+        cls,
+        *,
+        client_factory: Callable[[], Redis],
+        mailbox_size: int = 256,
+    ) -> CommunicationSSEFanout:
+        """
+        Return the fan-out shared by the current worker process.
+
+        A fresh instance is built after a fork so preloaded Gunicorn
+        workers never inherit the parent's listener thread.
+        """
+        pid = os.getpid()
+
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance_pid != pid:
+                cls._instance = cls(
+                    client_factory=client_factory,
+                    mailbox_size=mailbox_size,
+                )
+                cls._instance_pid = pid
+
+            return cls._instance
+
+    def _new_mailbox(self) -> Any:
+        """
+        Return an empty bounded mailbox.
+        """
+        return queue.Queue(maxsize=self._mailbox_size)
+
+    def _deliver(self, *, mailbox: Any, event: dict[str, Any]) -> None:
+        """
+        Deliver an event, flagging the stream as lagged when full.
+        """
+        try:
+            mailbox.put_nowait(event)
+        except queue.Full:
+            _flag_lagged(mailbox=mailbox, marker=self.LAGGED)
+
+    def register(self, *, channel: str) -> Any:
+        """
+        Register a local mailbox for a channel.
+        """
+        mailbox = self._new_mailbox()
+
+        with self._lock:
+            mailboxes = self._mailboxes.setdefault(channel, set())
+
+            if not mailboxes:
+                self._pending_unsubscribe.discard(channel)
+                self._pending_subscribe.add(channel)
+
+            mailboxes.add(mailbox)
+
+        self._ensure_listener()
+        return mailbox
+
+    def unregister(self, *, channel: str, mailbox: Any) -> None:
+        """
+        Remove a local mailbox, dropping the channel when unused.
+        """
+        with self._lock:
+            mailboxes = self._mailboxes.get(channel)
+
+            if mailboxes is None:
+                return
+
+            mailboxes.discard(mailbox)
+
+            if not mailboxes:
+                del self._mailboxes[channel]
+                self._pending_subscribe.discard(channel)
+                self._pending_unsubscribe.add(channel)
+
+    def subscriber_count(self, *, channel: str) -> int:
+        """
+        Return the number of local mailboxes for a channel.
+        """
+        with self._lock:
+            return len(self._mailboxes.get(channel, ()))
+
+    def dispatch(self, *, channel: str, raw_data: Any) -> int:
+        """
+        Decode one message and deliver it to local mailboxes.
+        """
+        with self._lock:
+            mailboxes = list(self._mailboxes.get(channel, ()))
+
+        if not mailboxes or not raw_data:
+            return 0
+
+        try:
+            event = json.loads(str(raw_data))
+        except json.JSONDecodeError:
+            return 0
+
+        for mailbox in mailboxes:
+            self._deliver(mailbox=mailbox, event=event)
+
+        return len(mailboxes)
+
+    def _ensure_listener(self) -> None:
+        """
+        Start the listener thread once per instance.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._thread = threading.Thread(
+                target=self._run,
+                name="communications-sse-fanout",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _take_pending(self) -> tuple[set[str], set[str]]:
+        """
+        Return and clear pending subscription changes.
+        """
+        with self._lock:
+            to_subscribe = self._pending_subscribe
+            to_unsubscribe = self._pending_unsubscribe
+            self._pending_subscribe = set()
+            self._pending_unsubscribe = set()
+            return to_subscribe, to_unsubscribe
+
+    def _requeue_all(self) -> None:
+        """
+        Mark every active channel for resubscription after a reconnect.
+        """
+        with self._lock:
+            self._pending_subscribe = set(self._mailboxes)
+            self._pending_unsubscribe = set()
+
+    def _run(self) -> None:
+        """
+        Own the shared pub/sub connection for this process.
+
+        Subscription changes are applied from this thread only, so the
+        connection is never written to concurrently.
+        """
+        while True:
+            pubsub = None
+
+            try:
+                pubsub = self._client_factory().pubsub(
+                    ignore_subscribe_messages=True,
+                )
+
+                while True:
+                    to_subscribe, to_unsubscribe = self._take_pending()
+
+                    if to_subscribe:
+                        pubsub.subscribe(*to_subscribe)
+
+                    if to_unsubscribe:
+                        pubsub.unsubscribe(*to_unsubscribe)
+
+                    message = pubsub.get_message(
+                        timeout=self.POLL_TIMEOUT_SECONDS,
+                    )
+
+                    if message is None:
+                        continue
+
+                    self.dispatch(
+                        channel=str(message.get("channel")),
+                        raw_data=message.get("data"),
+                    )
+            except RedisError as exc:
+                log.warning("Communication SSE fan-out lost Redis: %s", exc)
+                self._requeue_all()
+                time.sleep(self.RECONNECT_DELAY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except RedisError:
+                        pass
+
+
+def _flag_lagged(*, mailbox: Any, marker: dict[str, Any]) -> None:
+    """
+    Replace a full mailbox's backlog with the lagged marker.
+
+    The pending events are discarded because the client resyncs from
+    the replay log anyway. Works for both thread and asyncio queues;
+    the fan-out is the only producer, so the put cannot fail.
+    """
+    while not mailbox.empty():
+        try:
+            mailbox.get_nowait()
+        except (queue.Empty, asyncio.QueueEmpty):
+            break
+
+    mailbox.put_nowait(marker)
+
+
+class CommunicationSSEAsyncFanout(CommunicationSSEFanout):
+    """
+    Event-loop fan-out for async communication SSE streams.
+
+    Shares one ``redis.asyncio`` pub/sub connection per process and
+    event loop. A stream whose mailbox overflows receives ``LAGGED``
+    and should close, so the client reconnects with ``Last-Event-ID``
+    and catches up from the replay log instead of buffering here.
+    """
+
+    _instance: CommunicationSSEAsyncFanout | None = None
+    _instance_pid: int | None = None
+    _instance_loop: asyncio.AbstractEventLoop | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        client_factory: Callable[[], AsyncRedis],
+        mailbox_size: int = 256,
+    ) -> None:
+        super().__init__(
+            client_factory=client_factory,  # type: ignore[arg-type]
+            mailbox_size=mailbox_size,
+        )
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def for_process(  # type: ignore[override]
+        cls,
+        *,
+        client_factory: Callable[[], AsyncRedis],
+        mailbox_size: int = 256,
+    ) -> CommunicationSSEAsyncFanout:
+        """
+        Return the fan-out shared by the current process and loop.
+        """
+        pid = os.getpid()
+        loop = asyncio.get_running_loop()
+
+        with cls._instance_lock:
+            if (
+                cls._instance is None
+                or cls._instance_pid != pid
+                or cls._instance_loop is not loop
+            ):
+                cls._instance = cls(
+                    client_factory=client_factory,
+                    mailbox_size=mailbox_size,
+                )
+                cls._instance_pid = pid
+                cls._instance_loop = loop
+
+            return cls._instance
+
+    def _new_mailbox(self) -> asyncio.Queue:
+        """
+        Return an empty bounded asyncio mailbox.
+        """
+        return asyncio.Queue(maxsize=self._mailbox_size)
+
+    def _deliver(self, *, mailbox: Any, event: dict[str, Any]) -> None:
+        """
+        Deliver an event, flagging the stream as lagged when full.
+        """
+        try:
+            mailbox.put_nowait(event)
+        except asyncio.QueueFull:
+            _flag_lagged(mailbox=mailbox, marker=self.LAGGED)
+
+    def _ensure_listener(self) -> None:
+        """
+        Start the listener task once per instance.
+        """
+        if self._task is not None and not self._task.done():
+            return
+
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_async(),
+            name="communications-sse-async-fanout",
+        )
+
+    async def _run_async(self) -> None:
+        """
+        Own the shared async pub/sub connection for this loop.
+        """
+        while True:
+            pubsub = None
+
+            try:
+                pubsub = self._client_factory().pubsub(
+                    ignore_subscribe_messages=True,
+                )
+
+                while True:
+                    to_subscribe, to_unsubscribe = self._take_pending()
+
+                    if to_subscribe:
+                        await pubsub.subscribe(*to_subscribe)
+
+                    if to_unsubscribe:
+                        await pubsub.unsubscribe(*to_unsubscribe)
+
+                    if not pubsub.subscribed:
+                        await asyncio.sleep(self.POLL_TIMEOUT_SECONDS)
+                        continue
+
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=self.POLL_TIMEOUT_SECONDS,
+                    )
+
+                    if message is None:
+                        continue
+
+                    self.dispatch(
+                        channel=str(message.get("channel")),
+                        raw_data=message.get("data"),
+                    )
+            except RedisError as exc:
+                log.warning(
+                    "Communication SSE async fan-out lost Redis: %s",
+                    exc,
+                )
+                self._requeue_all()
+                await asyncio.sleep(self.RECONNECT_DELAY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except RedisError:
+                        pass
@@ -1,8 +1,20 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.test import AsyncRequestFactory
+from django.test import RequestFactory
+from django.test import SimpleTestCase
 from django.test import TestCase
+from django.test import override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from unittest import mock
 
 from communications.api.serializers import CommunicationThreadCreateSerializer
+from communications.api.throttles import CommunicationSSEThrottle
+from communications.api.views.sse_views import CommunicationAsyncSSEView
+from communications.api.views.sse_views import _sse_access_denied
 from communications.constants import CommunicationParticipantRole
 from communications.constants import CommunicationThreadKind
 from communications.integrations.registry import CommunicationAdapterRegistry
@@ -11,6 +23,15 @@ from communications.models import CommunicationParticipant
 from communications.models import CommunicationThread
 from communications.selectors.message_selectors import CommunicationMessageSelector
 from communications.selectors.thread_selectors import CommunicationThreadSelector
+from communications.sse.async_event_bus import CommunicationSSEAsyncEventBus
+from communications.sse.async_event_bus import (
+    _shared_client as _shared_async_client,
+)
+from communications.sse.event_bus import CommunicationSSEEventBus
+from communications.sse.event_bus import decode_replay_entries
+from communications.sse.event_bus import is_after
+from communications.sse.fanout import CommunicationSSEAsyncFanout
+from communications.sse.fanout import CommunicationSSEFanout
 from files_management.enums import FileKind
 from files_management.enums import FilePurpose
 from files_management.enums import FileVisibility
@@ -171,3 +192,260 @@ class CommunicationIntegrationTests(TestCase):
             policy.can_view(user=self.client_user, attachment=attachment),
         )
         self.assertFalse(policy.can_view(user=self.outsider, attachment=attachment))
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    },
+)
+class CommunicationAsyncSSEAccessTests(TestCase):
+    """
+    Coverage for authentication and throttling of the async SSE stream.
+    """
+
+    def setUp(self) -> None:
+        website = Website.objects.create(
+            name="Gradecrest",
+            domain="https://gradecrest.test",
+        )
+        self.user = User.objects.create_user(
+            email="client@gradecrest.test",
+            username="client",
+            password="pass",
+            role="client",
+            website=website,
+        )
+        self.token = str(AccessToken.for_user(self.user))
+        patcher = mock.patch.dict(
+            CommunicationSSEThrottle.THROTTLE_RATES,
+            {"communication_sse_connect": "1/min"},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _open_stream(self, **kwargs):
+        request = AsyncRequestFactory().get("/events/stream/", **kwargs)
+        return async_to_sync(CommunicationAsyncSSEView.as_view())(request)
+
+    def test_stream_requires_credentials(self) -> None:
+        self.assertEqual(self._open_stream().status_code, 401)
+
+    def test_stream_ignores_query_string_token(self) -> None:
+        response = self._open_stream(data={"token": self.token})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_bearer_token_authenticates_and_is_throttled(self) -> None:
+        def open_with_header():
+            request = RequestFactory().get(
+                "/events/stream/",
+                HTTP_AUTHORIZATION=f"Bearer {self.token}",
+            )
+            return request, _sse_access_denied(request)
+
+        request, denied = open_with_header()
+        self.assertIsNone(denied)
+        self.assertEqual(request.user, self.user)
+
+        _, denied = open_with_header()
+        self.assertEqual(denied.status_code, 429)
+
+
+class CommunicationSSEFanoutTests(SimpleTestCase):
+    """
+    Coverage for per-user SSE channels and in-process fan-out.
+    """
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(CommunicationSSEFanout, "_ensure_listener")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fanout = CommunicationSSEFanout(
+            client_factory=mock.Mock(),
+            mailbox_size=2,
+        )
+
+    def test_dispatch_only_reaches_local_recipient_mailboxes(self) -> None:
+        first = self.fanout.register(channel="sse:user:1")
+        second = self.fanout.register(channel="sse:user:1")
+        other = self.fanout.register(channel="sse:user:2")
+
+        delivered = self.fanout.dispatch(
+            channel="sse:user:1",
+            raw_data='{"event": "x"}',
+        )
+
+        self.assertEqual(delivered, 2)
+        self.assertEqual(first.get_nowait(), {"event": "x"})
+        self.assertEqual(second.get_nowait(), {"event": "x"})
+        self.assertTrue(other.empty())
+
+    def test_full_mailbox_is_flagged_lagged(self) -> None:
+        mailbox = self.fanout.register(channel="sse:user:1")
+
+        for index in range(3):
+            self.fanout.dispatch(
+                channel="sse:user:1",
+                raw_data=f'{{"n": {index}}}',
+            )
+
+        self.assertIs(mailbox.get_nowait(), CommunicationSSEFanout.LAGGED)
+        self.assertTrue(mailbox.empty())
+
+    def test_lagging_stream_gets_reset_event_and_ends(self) -> None:
+        channel = CommunicationSSEEventBus.user_channel(user_id=1)
+        mailbox = self.fanout.register(channel=channel)
+        self.fanout.register = mock.Mock(return_value=mailbox)
+
+        for index in range(3):
+            self.fanout.dispatch(
+                channel=channel,
+                raw_data=f'{{"n": {index}}}',
+            )
+
+        with (
+            mock.patch.object(
+                CommunicationSSEEventBus,
+                "_fanout",
+                return_value=self.fanout,
+            ),
+            mock.patch.object(
+                CommunicationSSEEventBus,
+                "replay",
+                return_value=[{"event": "a", "id": "10-1"}],
+            ),
+        ):
+            events = list(
+                CommunicationSSEEventBus.subscribe(
+                    user_id=1,
+                    last_event_id="10-0",
+                ),
+            )
+
+        self.assertEqual([e["event"] for e in events], ["a", "lagged"])
+        self.assertEqual(
+            events[1]["data"]["payload"],
+            {"last_event_id": "10-1"},
+        )
+        self.assertEqual(self.fanout.subscriber_count(channel=channel), 0)
+
+    def test_last_unregister_schedules_unsubscribe(self) -> None:
+        mailbox = self.fanout.register(channel="sse:user:1")
+        self.assertEqual(self.fanout._take_pending(), ({"sse:user:1"}, set()))
+
+        self.fanout.unregister(channel="sse:user:1", mailbox=mailbox)
+
+        self.assertEqual(self.fanout.subscriber_count(channel="sse:user:1"), 0)
+        self.assertEqual(self.fanout._take_pending(), (set(), {"sse:user:1"}))
+
+    def test_publish_targets_each_recipient_channel_once(self) -> None:
+        client = mock.Mock()
+        pipeline = client.pipeline.return_value
+        pipeline.execute.return_value = ["10-0", True, "10-1", True]
+        event = {
+            "event": "communication.message.created",
+            "data": {"meta": {"recipient_user_ids": [3, 5, 3]}},
+        }
+
+        with mock.patch.object(
+            CommunicationSSEEventBus,
+            "_client",
+            return_value=client,
+        ):
+            CommunicationSSEEventBus.publish(event=event)
+
+        channels = [call.args[0] for call in pipeline.publish.call_args_list]
+        self.assertEqual(
+            channels,
+            [
+                CommunicationSSEEventBus.user_channel(user_id=3),
+                CommunicationSSEEventBus.user_channel(user_id=5),
+            ],
+        )
+        self.assertEqual(pipeline.xadd.call_count, 2)
+        self.assertIn('"id": "10-1"', pipeline.publish.call_args.args[1])
+
+    def test_replay_skips_entries_up_to_last_event_id(self) -> None:
+        entries = [
+            ("10-0", {"event": '{"event": "a"}'}),
+            ("10-1", {"event": '{"event": "b"}'}),
+            ("11-0", {"event": "not-json"}),
+        ]
+
+        events = decode_replay_entries(entries=entries, last_event_id="10-0")
+
+        self.assertEqual(events, [{"event": "b", "id": "10-1"}])
+        self.assertFalse(is_after(event={"id": "10-1"}, cursor=(10, 1)))
+        self.assertTrue(is_after(event={"id": "10-2"}, cursor=(10, 1)))
+
+    async def test_async_fanout_flags_lagging_stream(self) -> None:
+        fanout = CommunicationSSEAsyncFanout(
+            client_factory=mock.Mock(),
+            mailbox_size=1,
+        )
+
+        with mock.patch.object(CommunicationSSEAsyncFanout, "_ensure_listener"):
+            mailbox = fanout.register(channel="sse:user:1")
+
+        fanout.dispatch(channel="sse:user:1", raw_data='{"n": 1}')
+        fanout.dispatch(channel="sse:user:1", raw_data='{"n": 2}')
+
+        self.assertIs(mailbox.get_nowait(), CommunicationSSEAsyncFanout.LAGGED)
+        self.assertTrue(mailbox.empty())
+
+    async def test_async_lagging_stream_gets_reset_event(self) -> None:
+        channel = CommunicationSSEEventBus.user_channel(user_id=1)
+        fanout = CommunicationSSEAsyncFanout(
+            client_factory=mock.Mock(),
+            mailbox_size=1,
+        )
+
+        with mock.patch.object(CommunicationSSEAsyncFanout, "_ensure_listener"):
+            mailbox = fanout.register(channel=channel)
+
+        fanout.register = mock.Mock(return_value=mailbox)
+        fanout.dispatch(channel=channel, raw_data='{"n": 1}')
+        fanout.dispatch(channel=channel, raw_data='{"n": 2}')
+
+        with (
+            mock.patch.object(
+                CommunicationSSEAsyncEventBus,
+                "_fanout",
+                return_value=fanout,
+            ),
+            mock.patch.object(
+                CommunicationSSEAsyncEventBus,
+                "replay",
+                mock.AsyncMock(return_value=[{"event": "a", "id": "10-1"}]),
+            ),
+        ):
+            events = [
+                event
+                async for event in CommunicationSSEAsyncEventBus.subscribe(
+                    user_id=1,
+                    last_event_id="10-0",
+                )
+            ]
+
+        self.assertEqual([e["event"] for e in events], ["a", "lagged"])
+        self.assertEqual(
+            events[1]["data"]["payload"],
+            {"last_event_id": "10-1"},
+        )
+        self.assertEqual(fanout.subscriber_count(channel=channel), 0)
+
+    def test_async_redis_client_is_per_event_loop(self) -> None:
+        async def client():
+            return _shared_async_client()
+
+        async def same_loop_clients():
+            return _shared_async_client(), _shared_async_client()
+
+        first, second = asyncio.run(same_loop_clients())
+        other = asyncio.run(client())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
@@ -0,0 +1,80 @@
+"""
+Convert and maintain monthly-partitioned tables.
+
+    python manage.py partition_tables                      # status + maintenance
+    python manage.py partition_tables --convert cms_intelligence.GSCDailyMetric
+    python manage.py partition_tables --convert cms_intelligence.GSCDailyMetric --dry-run
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.partition_service import PARTITIONED_TABLES, PartitionService
+
+
+class Command(BaseCommand):
+    help = 'Convert registered tables to monthly partitions and apply retention.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert',
+            metavar='MODEL',
+            help="Rebuild 'app_label.Model' as a partitioned table.",
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would happen without changing anything.',
+        )
+
+    def handle(self, *args, **options):
+        if not PartitionService.is_supported():
+            raise CommandError('Table partitioning requires PostgreSQL.')
+
+        if options['convert']:
+            self._convert(options['convert'], options)
+            return
+
+        for spec in PARTITIONED_TABLES:
+            if not PartitionService.is_partitioned(spec.table):
+                self.stdout.write(f"{spec.table}: not partitioned")
+                continue
+
+            partitions = PartitionService.monthly_partitions(spec.table)
+            expired = PartitionService.expired_partitions(spec)
+            self.stdout.write(
+                f"{spec.table}: {len(partitions)} partitions, "
+                f"{len(expired)} past {spec.retention} month retention"
+            )
+
+        if options['dry_run']:
+            return
+
+        for table, result in PartitionService.maintain().items():
+            self.stdout.write(self.style.SUCCESS(
+                f"{table}: created {result['created']}, "
+                f"dropped {', '.join(result['dropped']) or 'none'}"
+            ))
+
+    def _convert(self, model, options):
+        spec = PartitionService.spec_for(model)
+        if spec is None:
+            raise CommandError(f"{model} is not a registered partitioned table.")
+
+        if PartitionService.is_partitioned(spec.table):
+            self.stdout.write(f"{spec.table} is already partitioned.")
+            return
+
+        if options['dry_run']:
+            self.stdout.write(
+                f"Would rebuild {spec.table} partitioned by month on "
+                f"{spec.column}, keeping {spec.retention} months."
+            )
+            return
+
+        try:
+            statements = PartitionService.convert(spec)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        for statement in statements:
+            self.stdout.write(statement)
+        self.stdout.write(self.style.SUCCESS(f"{spec.table} partitioned."))
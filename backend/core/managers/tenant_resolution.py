@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class TenantResolutionQuerySet(models.QuerySet):
+    """
+    QuerySet for tenant models whose bulk writes refresh the tenant map.
+
+    Queryset updates and bulk writes skip post_save, so the tenant
+    resolution signal receivers never see them.
+    """
+
+    @staticmethod
+    def _invalidate_tenant_map() -> None:
+        from core.services.tenant_resolution_cache import TenantResolutionCache
+
+        TenantResolutionCache.invalidate_after_write()
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        if rows:
+            self._invalidate_tenant_map()
+        return rows
+
+    update.alters_data = True
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        rows = super().bulk_update(objs, fields, batch_size=batch_size)
+        if rows:
+            self._invalidate_tenant_map()
+        return rows
+
+    bulk_update.alters_data = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        created = super().bulk_create(objs, *args, **kwargs)
+        if created:
+            self._invalidate_tenant_map()
+        return created
+
+    bulk_create.alters_data = True
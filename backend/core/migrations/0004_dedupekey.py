@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-17 01:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_alter_dashboardcardconfig_icon'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DedupeKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=100)),
+                ('key', models.CharField(max_length=256)),
+                ('claim_id', models.UUIDField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'core_dedupe_key',
+                'indexes': [models.Index(fields=['scope', 'created_at'], name='core_dedupe_scope_b68a7b_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scope', 'key'), name='uniq_dedupe_key_per_scope')],
+            },
+        ),
+    ]
@@ -1,14 +1,17 @@
 from .base import BaseModel, WebsiteSpecificBaseModel
+from .dedupe_key import DedupeKey
 
 try:
     from .config_versioning import ConfigVersion
     __all__ = [
         "BaseModel",
         "WebsiteSpecificBaseModel",
+        "DedupeKey",
         "ConfigVersion",
     ]
 except ImportError:
     __all__ = [
         "BaseModel",
         "WebsiteSpecificBaseModel",
+        "DedupeKey",
     ]
@@ -0,0 +1,40 @@
+"""
+Dedupe keys for month-partitioned tables.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+
+class DedupeKey(models.Model):
+    """
+    A claimed key that must stay unique across all time.
+
+    PostgreSQL only enforces unique keys on a partitioned table when
+    they include the partition column, so tables partitioned by month
+    (see core.services.partition_service) keep their global keys here.
+    A key is claimed in the same transaction as the row it guards and
+    released once that row is gone.
+    """
+
+    # 'app_label.Model' of the table the key belongs to
+    scope = models.CharField(max_length=100)
+    key = models.CharField(max_length=256)
+    # groups the keys inserted by one claim_many() call
+    claim_id = models.UUIDField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'core_dedupe_key'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['scope', 'key'],
+                name='uniq_dedupe_key_per_scope',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['scope', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.key}"
@@ -0,0 +1,69 @@
+"""
+Global uniqueness for keys on month-partitioned tables.
+
+Rows claim their key in core_dedupe_key inside the transaction that
+inserts them, so a rolled-back insert releases its claim. Keys are
+released once no live row in the owning table carries them, which is
+what lets an event be legitimately re-sent after retention.
+"""
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+
+from django.db import IntegrityError
+from django.db.models import Exists, OuterRef, QuerySet
+
+from core.models.dedupe_key import DedupeKey
+
+
+class DedupeKeyService:
+    """
+    Claim and release dedupe keys.
+    """
+
+    @staticmethod
+    def claim_many(scope: str, keys: Iterable[str]) -> set[str]:
+        """
+        Claim keys that are free. Returns the keys claimed by this call.
+        """
+        keys = set(keys)
+        if not keys:
+            return set()
+
+        claim_id = uuid.uuid4()
+        DedupeKey.objects.bulk_create(
+            [DedupeKey(scope=scope, key=key, claim_id=claim_id) for key in keys],
+            ignore_conflicts=True,
+        )
+        return set(
+            DedupeKey.objects.filter(
+                scope=scope, claim_id=claim_id,
+            ).values_list('key', flat=True)
+        )
+
+    @staticmethod
+    def claim(scope: str, key: str) -> None:
+        """
+        Claim one key, raising IntegrityError if it is already taken.
+
+        Mirrors the error a unique column raises, so get_or_create()
+        keeps working unchanged for models that claim in save().
+        """
+        if not DedupeKeyService.claim_many(scope, [key]):
+            raise IntegrityError(f"Duplicate {scope} key {key!r}.")
+
+    @staticmethod
+    def release_unused(scope: str, rows: QuerySet, field: str, *, before) -> int:
+        """
+        Release keys claimed before `before` that no row in `rows`
+        carries. Returns how many were released.
+        """
+        live = rows.filter(**{field: OuterRef('key')})
+        released, _ = (
+            DedupeKey.objects
+            .filter(scope=scope, created_at__lt=before)
+            .filter(~Exists(live))
+            .delete()
+        )
+        return released
@@ -0,0 +1,506 @@
+"""
+Monthly PostgreSQL range partitioning for append-heavy tables.
+
+Each registered table is partitioned by month on a timestamp or date
+column. Partitions are named ``<table>_pYYYYMM``, and a
+``<table>_pdefault`` partition catches rows outside every range.
+
+Retention drops whole partitions instead of DELETEing rows. An expired
+month is optionally archived to storage as gzipped CSV while it is
+still attached, then detached and dropped in one transaction. That
+costs the same whatever the row count, and it leaves no dead tuples
+behind for autovacuum. A failed archive leaves the partition attached
+for the next run.
+
+Only tables whose unique constraints all include the partition column
+can be converted: PostgreSQL cannot enforce a unique key across
+partitions otherwise, and narrowing it to one month would let
+duplicates through. Tables that need a global key (the outboxes) claim
+it in core_dedupe_key instead, and their keys are released once the
+partition holding the row is dropped.
+
+Everything here is a no-op on databases other than PostgreSQL and on
+tables that have not been converted yet. Callers keep their row-level
+cleanup as the fallback for that case.
+"""
+from __future__ import annotations
+
+import gzip
+import logging
+import re
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.services.dedupe_key_service import DedupeKeyService
+
+logger = logging.getLogger(__name__)
+
+# Months of future partitions kept ready ahead of the current one.
+PARTITION_MONTHS_AHEAD = getattr(settings, 'PARTITION_MONTHS_AHEAD', 2)
+
+# Storage prefix for archived partitions.
+PARTITION_ARCHIVE_PREFIX = getattr(
+    settings, 'PARTITION_ARCHIVE_PREFIX', 'archives/partitions'
+)
+
+_PARTITION_SUFFIX = re.compile(r'_p(\d{4})(\d{2})$')
+
+
+@dataclass(frozen=True)
+class PartitionSpec:
+    """
+    A table partitioned by month.
+
+    Attributes:
+        model:          'app_label.ModelName'
+        column:         Partition key column (timestamp or date).
+        retain_months:  Whole months kept before the current one.
+                        Overridable via settings.PARTITION_RETENTION_MONTHS.
+        archive:        Export a partition to storage before dropping it.
+        keep:           Lookups for rows that must not be dropped; an
+                        expired partition holding any is kept for now.
+        dedupe_field:   Column whose keys live in core_dedupe_key, to be
+                        released after a partition is dropped.
+    """
+    model: str
+    column: str
+    retain_months: int
+    archive: bool = False
+    keep: dict = field(default_factory=dict)
+    dedupe_field: str | None = None
+
+    @property
+    def model_class(self):
+        return apps.get_model(self.model)
+
+    @property
+    def table(self) -> str:
+        return self.model_class._meta.db_table
+
+    @property
+    def retention(self) -> int:
+        overrides = getattr(settings, 'PARTITION_RETENTION_MONTHS', {})
+        return overrides.get(self.model, self.retain_months)
+
+
+# AuditEvent is not listed: its retention purges whole sealed chain
+# segments (AuditCleanupService), which month boundaries do not follow,
+# and its (website, chain_seq) key is part of tamper detection rather
+# than a dedupe key that core_dedupe_key could hold.
+PARTITIONED_TABLES = [
+    PartitionSpec(
+        'notifications_system.Outbox', 'created_at', retain_months=2,
+        keep={'status__in': ['pending', 'processing']},
+        dedupe_field='dedupe_key',
+    ),
+    PartitionSpec(
+        'event_system.EventOutbox', 'created_at', retain_months=3,
+        keep={'status__in': ['pending', 'processing']},
+        dedupe_field='idempotency_key',
+    ),
+    PartitionSpec(
+        'cms_intelligence.GSCDailyMetric', 'date', retain_months=25, archive=True,
+    ),
+    PartitionSpec(
+        'cms_intelligence.GA4DailyMetric', 'date', retain_months=25, archive=True,
+    ),
+]
+
+
+def _month_start(value) -> date:
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.replace(day=1)
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _utc_midnight(day: date) -> datetime:
+    # partition bounds are read in the connection's time zone, UTC
+    return datetime(day.year, day.month, day.day, tzinfo=dt_timezone.utc)
+
+
+class PartitionService:
+    """
+    Create, retire and archive monthly partitions.
+    """
+
+    @staticmethod
+    def spec_for(model: str) -> PartitionSpec | None:
+        return next(
+            (spec for spec in PARTITIONED_TABLES if spec.model == model),
+            None,
+        )
+
+    @staticmethod
+    def partition_name(table: str, month: date) -> str:
+        return f"{table}_p{month:%Y%m}"
+
+    # -------------------------
+    # Introspection
+    # -------------------------
+
+    @staticmethod
+    def is_supported() -> bool:
+        return connection.vendor == 'postgresql'
+
+    @staticmethod
+    def is_partitioned(table: str) -> bool:
+        if not PartitionService.is_supported():
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT 1 FROM pg_partitioned_table pt
+                JOIN pg_class c ON c.oid = pt.partrelid
+                WHERE c.relname = %s
+                """,
+                [table],
+            )
+            return cursor.fetchone() is not None
+
+    @staticmethod
+    def monthly_partitions(table: str) -> dict[date, str]:
+        """Month -> partition name for the table's monthly partitions."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.relname FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                JOIN pg_class p ON p.oid = i.inhparent
+                WHERE p.relname = %s
+                """,
+                [table],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+
+        partitions = {}
+        for name in names:
+            match = _PARTITION_SUFFIX.search(name)
+            if match:
+                partitions[date(int(match[1]), int(match[2]), 1)] = name
+        return partitions
+
+    # -------------------------
+    # Creation
+    # -------------------------
+
+    @staticmethod
+    def create_partition(table: str, month: date) -> str:
+        qn = connection.ops.quote_name
+        name = PartitionService.partition_name(table, month)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {qn(name)} PARTITION OF {qn(table)} "
+                f"FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{_add_months(month, 1).isoformat()}')"
+            )
+        return name
+
+    @staticmethod
+    def ensure_partitions(spec: PartitionSpec, *, now=None) -> int:
+        """
+        Create this month's and the next PARTITION_MONTHS_AHEAD months'
+        partitions. Returns how many were missing.
+        """
+        if not PartitionService.is_partitioned(spec.table):
+            return 0
+
+        current = _month_start(now or timezone.now())
+        existing = PartitionService.monthly_partitions(spec.table)
+
+        created = 0
+        for offset in range(PARTITION_MONTHS_AHEAD + 1):
+            month = _add_months(current, offset)
+            if month not in existing:
+                PartitionService.create_partition(spec.table, month)
+                created += 1
+        return created
+
+    # -------------------------
+    # Retention
+    # -------------------------
+
+    @staticmethod
+    def retention_cutoff(spec: PartitionSpec, *, now=None) -> date:
+        """First month kept; partitions before it are expired."""
+        return _add_months(_month_start(now or timezone.now()), -spec.retention)
+
+    @staticmethod
+    def expired_partitions(spec: PartitionSpec, *, now=None) -> list[str]:
+        cutoff = PartitionService.retention_cutoff(spec, now=now)
+        return [
+            name
+            for month, name in sorted(
+                PartitionService.monthly_partitions(spec.table).items()
+            )
+            if month < cutoff
+        ]
+
+    @staticmethod
+    def holds_kept_rows(spec: PartitionSpec, partition: str) -> bool:
+        """Whether a monthly partition still has rows matching spec.keep."""
+        if not spec.keep:
+            return False
+        match = _PARTITION_SUFFIX.search(partition)
+        month = date(int(match[1]), int(match[2]), 1)
+        return spec.model_class._base_manager.filter(
+            **{
+                f"{spec.column}__gte": _utc_midnight(month),
+                f"{spec.column}__lt": _utc_midnight(_add_months(month, 1)),
+            },
+            **spec.keep,
+        ).exists()
+
+    @staticmethod
+    def apply_retention(spec: PartitionSpec, *, now=None) -> list[str]:
+        """
+        Archive (if configured), then detach and drop expired partitions.
+
+        The archive is taken while the partition is still attached, and
+        detach and drop share one transaction, so a failure at any step
+        leaves the partition attached and it is retried on the next run.
+        A partition still holding spec.keep rows is left for a later run.
+        Dedupe keys whose rows were dropped are released afterwards.
+
+        Returns the dropped partition names. Empty when the table is
+        not partitioned.
+        """
+        if not PartitionService.is_partitioned(spec.table):
+            return []
+
+        dropped = []
+        for name in PartitionService.expired_partitions(spec, now=now):
+            if PartitionService.holds_kept_rows(spec, name):
+                logger.warning(
+                    "Partition %s still holds rows to keep; not dropped.", name,
+                )
+                continue
+
+            if spec.archive:
+                try:
+                    PartitionService.archive(spec.table, name)
+                except Exception:
+                    logger.exception(
+                        "Archiving partition %s failed; kept for retry.", name,
+                    )
+                    continue
+
+            PartitionService.retire(spec.table, name)
+            dropped.append(name)
+            logger.info("Partition %s retired from %s.", name, spec.table)
+
+        if dropped and spec.dedupe_field:
+            DedupeKeyService.release_unused(
+                spec.model,
+                spec.model_class._base_manager.all(),
+                spec.dedupe_field,
+                before=_utc_midnight(PartitionService.retention_cutoff(spec, now=now)),
+            )
+        return dropped
+
+    @staticmethod
+    def retire(table: str, partition: str) -> None:
+        """Detach and drop a partition atomically."""
+        qn = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(partition)}"
+            )
+            cursor.execute(f"DROP TABLE {qn(partition)}")
+
+    @staticmethod
+    def archive(table: str, partition: str) -> str:
+        """
+        Stream a partition to storage as gzipped CSV via COPY.
+
+        Returns the storage path.
+        """
+        path = f"{PARTITION_ARCHIVE_PREFIX}/{table}/{partition}.csv.gz"
+
+        with tempfile.TemporaryFile() as spool:
+            with gzip.GzipFile(fileobj=spool, mode='wb') as gz, \
+                    connection.cursor() as cursor, \
+                    cursor.copy(
+                        f"COPY {connection.ops.quote_name(partition)} "
+                        f"TO STDOUT WITH (FORMAT csv, HEADER true)"
+                    ) as copy:
+                for chunk in copy:
+                    gz.write(chunk)
+
+            spool.seek(0)
+            if default_storage.exists(path):
+                default_storage.delete(path)
+            default_storage.save(path, File(spool))
+
+        return path
+
+    @staticmethod
+    def maintain(*, now=None) -> dict[str, dict]:
+        """
+        Pre-create upcoming partitions and retire expired ones for
+        every registered table.
+        """
+        summary = {}
+        for spec in PARTITIONED_TABLES:
+            if not PartitionService.is_partitioned(spec.table):
+                continue
+            summary[spec.table] = {
+                'created': PartitionService.ensure_partitions(spec, now=now),
+                'dropped': PartitionService.apply_retention(spec, now=now),
+            }
+        return summary
+
+    # -------------------------
+    # Conversion
+    # -------------------------
+
+    @staticmethod
+    def convert(spec: PartitionSpec) -> list[str]:
+        """
+        Rebuild a regular table as a monthly-partitioned one.
+
+        The rows are copied inside one transaction, so run this in a
+        maintenance window. PostgreSQL requires every unique constraint
+        on a partitioned table to include the partition column, so a
+        table with any unique constraint or index without it is refused
+        rather than having the key silently narrowed to one month. The
+        primary key becomes (pk, column); the pk sequence still keeps
+        ids unique.
+
+        Returns the SQL statements that were executed.
+        """
+        table = spec.table
+        model = spec.model_class
+        pk_column = model._meta.pk.column
+        qn = connection.ops.quote_name
+        legacy = f"{table}__unpartitioned"
+
+        if PartitionService.is_partitioned(table):
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT conname FROM pg_constraint
+                WHERE contype = 'f' AND confrelid = %s::regclass
+                """,
+                [table],
+            )
+            referencing = [row[0] for row in cursor.fetchall()]
+            if referencing:
+                raise ValueError(
+                    f"{table} is referenced by foreign keys "
+                    f"{', '.join(referencing)}; drop them before partitioning."
+                )
+
+            # standalone indexes (not backing a constraint)
+            cursor.execute(
+                """
+                SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i
+                WHERE i.indrelid = %s::regclass
+                AND NOT EXISTS (
+                    SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid
+                )
+                """,
+                [table],
+            )
+            index_defs = [row[0] for row in cursor.fetchall()]
+
+            cursor.execute(
+                """
+                SELECT conname, contype, pg_get_constraintdef(oid)
+                FROM pg_constraint
+                WHERE conrelid = %s::regclass AND contype IN ('u', 'f')
+                """,
+                [table],
+            )
+            constraints = cursor.fetchall()
+
+            unique_defs = [
+                (name, definition) for name, kind, definition in constraints
+                if kind == 'u'
+            ] + [
+                (definition.split()[3], definition) for definition in index_defs
+                if definition.startswith('CREATE UNIQUE INDEX')
+            ]
+            narrow = [
+                name for name, definition in unique_defs
+                if not PartitionService._includes_column(definition, spec.column)
+            ]
+            if narrow:
+                raise ValueError(
+                    f"Unique constraints {', '.join(narrow)} on {table} do not "
+                    f"include {spec.column}, so they cannot be enforced across "
+                    f"partitions; {table} cannot be partitioned by month."
+                )
+
+            cursor.execute(f"SELECT min({qn(spec.column)}) FROM {qn(table)}")
+            oldest = cursor.fetchone()[0]
+
+        first_month = _month_start(oldest or timezone.now())
+        last_month = _add_months(_month_start(timezone.now()), PARTITION_MONTHS_AHEAD)
+
+        statements = [
+            f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy)}",
+            f"CREATE TABLE {qn(table)} (LIKE {qn(legacy)} INCLUDING DEFAULTS "
+            f"INCLUDING CONSTRAINTS INCLUDING STORAGE INCLUDING COMMENTS) "
+            f"PARTITION BY RANGE ({qn(spec.column)})",
+            f"ALTER TABLE {qn(table)} ADD PRIMARY KEY "
+            f"({qn(pk_column)}, {qn(spec.column)})",
+            f"CREATE TABLE {qn(table + '_pdefault')} PARTITION OF {qn(table)} DEFAULT",
+        ]
+
+        month = first_month
+        while month <= last_month:
+            statements.append(
+                f"CREATE TABLE {qn(PartitionService.partition_name(table, month))} "
+                f"PARTITION OF {qn(table)} FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{_add_months(month, 1).isoformat()}')"
+            )
+            month = _add_months(month, 1)
+
+        if model._meta.pk.get_internal_type() in ('AutoField', 'BigAutoField'):
+            sequence = f"{table}_{pk_column}_partitioned_seq"
+            statements += [
+                f"CREATE SEQUENCE {qn(sequence)} OWNED BY {qn(table)}.{qn(pk_column)}",
+                f"SELECT setval('{sequence}', "
+                f"COALESCE((SELECT max({qn(pk_column)}) FROM {qn(legacy)}), 0) + 1, false)",
+                f"ALTER TABLE {qn(table)} ALTER COLUMN {qn(pk_column)} "
+                f"SET DEFAULT nextval('{sequence}')",
+            ]
+
+        statements += [
+            f"INSERT INTO {qn(table)} SELECT * FROM {qn(legacy)}",
+            f"DROP TABLE {qn(legacy)}",
+        ]
+
+        # names are free again once the legacy table is gone
+        statements += index_defs
+        statements += [
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}"
+            for name, _kind, definition in constraints
+        ]
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+
+        return statements
+
+    @staticmethod
+    def _includes_column(definition: str, column: str) -> bool:
+        """Whether the first column list of a definition names column."""
+        head = definition.partition(')')[0]
+        return column in re.split(r'[\s,()"]+', head)
@@ -0,0 +1,159 @@
+"""
+In-process host -> (portal, website) resolution map.
+
+The tenant set is tiny and rarely changes, so every process keeps the
+whole map in memory, built on the first lookup. Writes to Website or
+PortalDefinition (saves, deletes and queryset updates) bump a shared
+version key; processes notice the new version within
+VERSION_CHECK_SECONDS and rebuild.
+"""
+import copy
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.models.portal_definition import PortalDefinition
+from websites.models.websites import Website
+
+def normalize_host(value: str) -> str:
+    """
+    Reduce a host or URL-style domain to a bare lowercase host.
+
+    Website.domain historically stores values like https://example.com,
+    while request.get_host() returns example.com.
+    """
+    parsed = urlsplit(value if "://" in value else f"//{value}")
+    return (parsed.hostname or value).lower().strip().removeprefix("www.")
+
+
+class TenantResolutionCache:
+    """
+    Resolve request hosts to tenants with dict lookups.
+    """
+
+    VERSION_KEY = "core:tenant_resolution:version"
+    VERSION_CHECK_SECONDS = 5
+    MAX_RESOLVED_HOSTS = 10_000
+
+    _lock = threading.Lock()
+    _version = None
+    _checked_at = 0.0
+    _portals_by_host: dict = {}
+    _portals_by_code: dict = {}
+    _websites_by_host: dict = {}
+    _resolved: dict = {}
+    _loaded = False
+
+    @classmethod
+    def resolve(cls, host: str):
+        """
+        Return (portal, website) for a host.
+
+        Unknown hosts resolve to (None, None) and are remembered too, so
+        repeated misses stay in memory. Returned instances are copies so
+        request code cannot mutate the shared map.
+        """
+        cls._ensure_fresh()
+        host = normalize_host(host)
+
+        resolved = cls._resolved.get(host)
+        if resolved is None:
+            resolved = cls._resolve_uncached(host)
+            if len(cls._resolved) >= cls.MAX_RESOLVED_HOSTS:
+                cls._resolved.clear()
+            cls._resolved[host] = resolved
+
+        portal, website = resolved
+        return (
+            copy.copy(portal) if portal is not None else None,
+            copy.copy(website) if website is not None else None,
+        )
+
+    @classmethod
+    def get_portal_by_code(cls, code: str):
+        cls._ensure_fresh()
+        portal = cls._portals_by_code.get(code)
+        return copy.copy(portal) if portal is not None else None
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Publish a new version so every process rebuilds its map.
+        """
+        cache.set(cls.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        with cls._lock:
+            cls._loaded = False
+
+    @classmethod
+    def invalidate_after_write(cls) -> None:
+        """
+        Bump the version now and again once the write commits.
+
+        The immediate bump covers readers on this connection; the one on
+        commit stops other processes from keeping a pre-commit map.
+        """
+        cls.invalidate()
+        transaction.on_commit(cls.invalidate)
+
+    @classmethod
+    def _resolve_uncached(cls, host: str):
+        portal = cls._portals_by_host.get(host)
+
+        # Try the exact host first, then the parent domain. The fallback
+        # lets portal SPAs on app.* subdomains resolve their tenant's
+        # branding: app.gradecrest.com -> gradecrest.com Website.
+        website = cls._websites_by_host.get(host)
+        if website is None:
+            parts = host.split(".")
+            if len(parts) > 2:
+                website = cls._websites_by_host.get(".".join(parts[1:]))
+
+        return portal, website
+
+    @classmethod
+    def _ensure_fresh(cls) -> None:
+        now = time.monotonic()
+        if cls._loaded and now - cls._checked_at < cls.VERSION_CHECK_SECONDS:
+            return
+
+        version = cache.get(cls.VERSION_KEY)
+        if version is None:
+            cache.add(cls.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+            version = cache.get(cls.VERSION_KEY)
+
+        with cls._lock:
+            cls._checked_at = now
+            if cls._loaded and version is not None and version == cls._version:
+                return
+            cls._build(version=version)
+
+    @classmethod
+    def _build(cls, *, version) -> None:
+        portals_by_host = {}
+        portals_by_code = {}
+        for portal in PortalDefinition.objects.all():
+            portals_by_code.setdefault(portal.code, portal)
+            if portal.is_active and portal.domain:
+                portals_by_host.setdefault(normalize_host(portal.domain), portal)
+
+        websites_by_host = {}
+        for website in Website.objects.filter(
+            is_active=True,
+            is_deleted=False,
+        ):
+            if website.domain:
+                websites_by_host.setdefault(
+                    normalize_host(website.domain),
+                    website,
+                )
+
+        cls._portals_by_host = portals_by_host
+        cls._portals_by_code = portals_by_code
+        cls._websites_by_host = websites_by_host
+        cls._resolved = {}
+        cls._version = version
+        cls._loaded = True
@@ -2,4 +2,4 @@
 Signals for the core app.
 """
 from . import config_versioning # noqa
-
+from . import tenant_resolution # noqa
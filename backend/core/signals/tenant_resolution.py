@@ -0,0 +1,20 @@
+"""
+Refresh the in-process tenant resolution map when tenants change.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models.portal_definition import PortalDefinition
+from core.services.tenant_resolution_cache import TenantResolutionCache
+from websites.models.websites import Website
+
+
+@receiver(post_save, sender=Website)
+@receiver(post_delete, sender=Website)
+@receiver(post_save, sender=PortalDefinition)
+@receiver(post_delete, sender=PortalDefinition)
+def invalidate_tenant_resolution(sender, **kwargs):
+    """
+    Refresh the tenant map after a Website or PortalDefinition write.
+    """
+    TenantResolutionCache.invalidate_after_write()
@@ -7,4 +7,29 @@
 # Task to send scheduled notifications.
 # """
 # notification = Notification.objects.get(id=notification_id)
-# notification.send()
\ No newline at end of file
+# notification.send()
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='core.tasks.maintain_table_partitions')
+def maintain_table_partitions() -> None:
+    """
+    Pre-create next months' partitions and retire expired ones.
+
+    No-op until a table has been converted with
+    `manage.py partition_tables --convert`. Run daily.
+    """
+    from core.services.partition_service import PartitionService
+
+    for table, result in PartitionService.maintain().items():
+        logger.info(
+            "maintain_table_partitions: %s created=%s dropped=%s.",
+            table,
+            result['created'],
+            result['dropped'],
+        )
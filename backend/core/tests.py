@@ -0,0 +1,232 @@
+import unittest
+from datetime import date, datetime
+from unittest import mock
+
+from django.db import IntegrityError, connection
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.utils import timezone
+
+from accounts.models.portal_definition import PortalDefinition
+from core.middleware.portal_tenant_resolver import PortalTenantResolverMiddleware
+from core.models.dedupe_key import DedupeKey
+from core.services.dedupe_key_service import DedupeKeyService
+from core.services.partition_service import PartitionService, PartitionSpec
+from core.services.tenant_resolution_cache import TenantResolutionCache
+from event_system.models.event_outbox import EventOutbox
+from notifications_system.models.outbox import Outbox
+from notifications_system.tasks.maintenance import cleanup_processed_outbox
+from websites.models.websites import Website
+
+
+class TenantResolutionCacheTests(TestCase):
+    """
+    Tests for the in-process host -> tenant map.
+    """
+
+    def setUp(self) -> None:
+        self.website = Website.objects.create(
+            name="Gradecrest",
+            domain="https://gradecrest.test",
+        )
+        self.portal = PortalDefinition.objects.create(
+            code="client_portal",
+            name="Client portal",
+            domain="gradecrest.test",
+        )
+        TenantResolutionCache.invalidate()
+        self.addCleanup(TenantResolutionCache.invalidate)
+
+    def test_middleware_load_runs_no_queries(self) -> None:
+        with self.assertNumQueries(0):
+            PortalTenantResolverMiddleware(lambda request: None)
+
+    def test_first_request_builds_map_and_later_requests_hit_memory(self) -> None:
+        middleware = PortalTenantResolverMiddleware(lambda request: None)
+        request = RequestFactory().get("/", HTTP_HOST="www.gradecrest.test:8000")
+
+        middleware.process_request(request)
+
+        self.assertEqual(request.website, self.website)
+        self.assertEqual(request.portal, self.portal)
+
+        with self.assertNumQueries(0):
+            middleware.process_request(
+                RequestFactory().get("/", HTTP_HOST="gradecrest.test")
+            )
+
+    def test_subdomain_falls_back_to_parent_website(self) -> None:
+        portal, website = TenantResolutionCache.resolve("app.gradecrest.test")
+
+        self.assertIsNone(portal)
+        self.assertEqual(website, self.website)
+
+    def test_unknown_host_is_negatively_cached(self) -> None:
+        self.assertEqual(
+            TenantResolutionCache.resolve("unknown.test"),
+            (None, None),
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                TenantResolutionCache.resolve("unknown.test"),
+                (None, None),
+            )
+
+    def test_save_refreshes_map(self) -> None:
+        TenantResolutionCache.resolve("gradecrest.test")
+
+        self.website.domain = "https://gradecrest.example"
+        self.website.save()
+
+        _portal, website = TenantResolutionCache.resolve("gradecrest.example")
+        self.assertEqual(website, self.website)
+
+    def test_queryset_update_refreshes_map(self) -> None:
+        TenantResolutionCache.resolve("gradecrest.test")
+
+        Website.objects.filter(pk=self.website.pk).update(is_active=False)
+
+        _portal, website = TenantResolutionCache.resolve("gradecrest.test")
+        self.assertIsNone(website)
+
+    def test_resolved_instances_are_copies(self) -> None:
+        _portal, website = TenantResolutionCache.resolve("gradecrest.test")
+        website.name = "Mutated"
+
+        _portal, website = TenantResolutionCache.resolve("gradecrest.test")
+        self.assertEqual(website.name, "Gradecrest")
+
+
+class PartitionKeyColumnTests(SimpleTestCase):
+    """
+    Tests for detecting unique keys that omit the partition column.
+    """
+
+    def test_constraint_definition(self) -> None:
+        definition = "UNIQUE (site_id, date, page_path, query)"
+
+        self.assertTrue(PartitionService._includes_column(definition, "date"))
+        self.assertFalse(PartitionService._includes_column(definition, "created_at"))
+
+    def test_index_definition_ignores_predicate(self) -> None:
+        definition = (
+            'CREATE UNIQUE INDEX uniq_key ON public.notif_outbox '
+            'USING btree ("dedupe_key") WHERE (created_at IS NOT NULL)'
+        )
+
+        self.assertTrue(PartitionService._includes_column(definition, "dedupe_key"))
+        self.assertFalse(PartitionService._includes_column(definition, "created_at"))
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+class PartitionServiceTests(TestCase):
+    """
+    Tests for table conversion and partition retention.
+    """
+
+    NOW = timezone.make_aware(datetime(2026, 10, 16))
+
+    def test_convert_refuses_unique_key_without_partition_column(self) -> None:
+        spec = PartitionSpec(
+            "audit_logging.AuditEvent", "occurred_at", retain_months=24,
+        )
+
+        with self.assertRaisesMessage(ValueError, "cannot be enforced"):
+            PartitionService.convert(spec)
+
+        self.assertFalse(PartitionService.is_partitioned(spec.table))
+
+    def test_failed_archive_keeps_partition_attached(self) -> None:
+        spec = PartitionService.spec_for("cms_intelligence.GSCDailyMetric")
+        PartitionService.convert(spec)
+        expired = PartitionService.create_partition(spec.table, date(2023, 1, 1))
+
+        with mock.patch.object(
+            PartitionService, "archive", side_effect=OSError("storage down"),
+        ):
+            dropped = PartitionService.apply_retention(spec, now=self.NOW)
+
+        self.assertEqual(dropped, [])
+        self.assertIn(expired, PartitionService.monthly_partitions(spec.table).values())
+
+        with mock.patch.object(PartitionService, "archive") as archive:
+            dropped = PartitionService.apply_retention(spec, now=self.NOW)
+
+        archive.assert_called_once_with(spec.table, expired)
+        self.assertEqual(dropped, [expired])
+        self.assertNotIn(
+            expired, PartitionService.monthly_partitions(spec.table).values(),
+        )
+
+    def test_outbox_converts_and_keeps_pending_months(self) -> None:
+        spec = PartitionService.spec_for("notifications_system.Outbox")
+        PartitionService.convert(spec)
+        expired = PartitionService.create_partition(spec.table, date(2023, 1, 1))
+        Outbox.objects.create(
+            event_key="order.paid",
+            dedupe_key="pending",
+            created_at=timezone.make_aware(datetime(2023, 1, 10)),
+        )
+        DedupeKey.objects.update(created_at=timezone.make_aware(datetime(2023, 1, 10)))
+
+        self.assertEqual(PartitionService.apply_retention(spec, now=self.NOW), [])
+
+        Outbox.objects.filter(dedupe_key="pending").update(status=Outbox.PROCESSED)
+
+        self.assertEqual(
+            PartitionService.apply_retention(spec, now=self.NOW), [expired],
+        )
+        self.assertFalse(DedupeKey.objects.filter(key="pending").exists())
+
+
+class DedupeKeyTests(TestCase):
+    """
+    Tests for outbox keys held in core_dedupe_key.
+    """
+
+    def test_claim_many_returns_only_new_keys(self) -> None:
+        self.assertEqual(DedupeKeyService.claim_many("scope", ["a", "b"]), {"a", "b"})
+        self.assertEqual(DedupeKeyService.claim_many("scope", ["b", "c"]), {"c"})
+        self.assertEqual(DedupeKeyService.claim_many("other", ["a"]), {"a"})
+
+    def test_outbox_get_or_create_still_deduplicates(self) -> None:
+        first, created = Outbox.objects.get_or_create(
+            dedupe_key="order.paid:1", defaults={"event_key": "order.paid"},
+        )
+        again, created_again = Outbox.objects.get_or_create(
+            dedupe_key="order.paid:1", defaults={"event_key": "order.paid"},
+        )
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(again, first)
+
+    def test_duplicate_event_outbox_key_raises(self) -> None:
+        fields = {
+            "event_type": "order.paid",
+            "domain": "orders",
+            "routing_key": "orders.order.paid",
+            "idempotency_key": "order.paid:1",
+        }
+        EventOutbox.objects.create(**fields)
+
+        with self.assertRaises(IntegrityError):
+            EventOutbox.objects.create(**fields)
+
+        self.assertEqual(EventOutbox.objects.count(), 1)
+
+    def test_cleanup_recycles_keys_of_expired_outbox_rows(self) -> None:
+        old = timezone.now() - timezone.timedelta(days=30)
+        Outbox.objects.create(event_key="order.paid", dedupe_key="old")
+        Outbox.objects.create(event_key="order.paid", dedupe_key="live")
+        Outbox.objects.filter(dedupe_key="old").update(
+            status=Outbox.PROCESSED, processed_at=old,
+        )
+        DedupeKey.objects.update(created_at=old)
+
+        cleanup_processed_outbox()
+
+        self.assertEqual(
+            list(DedupeKey.objects.values_list("key", flat=True)), ["live"],
+        )
+        Outbox.objects.create(event_key="order.paid", dedupe_key="old")
@@ -0,0 +1,44 @@
+"""
+Helpers for streaming responses that must not be buffered under ASGI.
+"""
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+
+_DONE = object()
+
+
+async def aiter_in_thread(iterator, *, thread_sensitive=False):
+    """
+    Drive a blocking iterator from an async consumer, one item at a time.
+
+    Under ASGI, Django drains a sync ``StreamingHttpResponse`` iterator
+    into a list before sending anything. Wrapping it here pulls each
+    item in a worker thread as the client reads, so the response stays
+    streamed.
+
+    By default consecutive items may be produced on different threads,
+    so the iterator must not touch the database. Pass
+    ``thread_sensitive=True`` for iterators that query: every pull then
+    runs on the shared sync thread that owns the request's connection.
+    """
+    pull = sync_to_async(next, thread_sensitive=thread_sensitive)
+    try:
+        while (item := await pull(iterator, _DONE)) is not _DONE:
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=thread_sensitive)()
+
+
+def streaming_content(request, iterator, *, thread_sensitive=False):
+    """
+    Return ``iterator`` in the form the serving handler streams.
+
+    ASGI gets an async wrapper; WSGI keeps the plain iterator, since
+    Django would otherwise buffer an async one to serve it synchronously.
+    """
+    raw = getattr(request, "_request", request)
+    if isinstance(raw, ASGIRequest):
+        return aiter_in_thread(iterator, thread_sensitive=thread_sensitive)
+    return iterator
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.2 on 2026-10-17 01:17
+
+from django.db import migrations, models
+
+
+def claim_existing_keys(apps, schema_editor):
+    """
+    Claim the idempotency_key of existing rows before the unique index goes.
+    """
+    EventOutbox = apps.get_model('event_system', 'EventOutbox')
+    DedupeKey = apps.get_model('core', 'DedupeKey')
+
+    keys = (
+        EventOutbox.objects.order_by()
+        .values_list('idempotency_key', flat=True)
+        .distinct()
+        .iterator(chunk_size=1000)
+    )
+    batch = []
+    for key in keys:
+        batch.append(DedupeKey(scope='event_system.EventOutbox', key=key))
+        if len(batch) == 1000:
+            DedupeKey.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    DedupeKey.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event_system', '0001_initial'),
+        ('core', '0004_dedupekey'),
+    ]
+
+    operations = [
+        migrations.RunPython(claim_existing_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='eventoutbox',
+            name='idempotency_key',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
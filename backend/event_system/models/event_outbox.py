@@ -1,5 +1,5 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 
 
 class EventStatus(models.TextChoices):
@@ -16,6 +16,9 @@ class EventOutbox(models.Model):
     Reliable event delivery outbox (production-grade).
 
     This is a transport layer, NOT a domain model.
+
+    idempotency_key is kept unique in core_dedupe_key rather than by a
+    unique index, so the table can be partitioned by created_at.
     """
 
     id = models.UUIDField(
@@ -51,7 +54,7 @@ class EventOutbox(models.Model):
     # Idempotency protection
     idempotency_key = models.CharField(
         max_length=255,
-        unique=True,
+        db_index=True,
     )
 
     status = models.CharField(
@@ -102,4 +105,15 @@ class EventOutbox(models.Model):
         ]
 
     def __str__(self) -> str:
-        return f"{self.domain}:{self.event_type} ({self.status})"
\ No newline at end of file
+        return f"{self.domain}:{self.event_type} ({self.status})"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        from core.services.dedupe_key_service import DedupeKeyService
+
+        # raises IntegrityError on a duplicate, like the unique index did
+        with transaction.atomic():
+            DedupeKeyService.claim(self._meta.label, self.idempotency_key)
+            super().save(*args, **kwargs)
\ No newline at end of file
@@ -55,4 +55,47 @@ class EventAuditService:
             correlation_id=correlation_id,
             retry_count=retry_count,
             event_status=event_status,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def log_many(entries: list[dict]) -> None:
+        """
+        log() for many entries: one cache write and one bulk INSERT.
+
+        Each entry takes the same keyword arguments as log().
+        """
+        if not entries:
+            return
+
+        cache.set_many(
+            {
+                f"audit:{entry['event_id']}:{entry['stage']}": {
+                    "event_type": entry["event_type"],
+                    "stage": entry["stage"],
+                    "message": entry.get("message", ""),
+                    "duration_ms": entry.get("duration_ms"),
+                    "payload": entry.get("payload") or {},
+                    "worker_id": entry.get("worker_id"),
+                    "correlation_id": entry.get("correlation_id"),
+                    "retry_count": entry.get("retry_count"),
+                    "event_status": entry.get("event_status"),
+                }
+                for entry in entries
+            },
+            timeout=86400,
+        )
+
+        EventAuditLog.objects.bulk_create([
+            EventAuditLog(
+                event_id=entry["event_id"],
+                event_type=entry["event_type"],
+                stage=entry["stage"],
+                message=entry.get("message", ""),
+                worker_id=entry.get("worker_id"),
+                duration_ms=entry.get("duration_ms"),
+                correlation_id=entry.get("correlation_id"),
+                retry_count=entry.get("retry_count"),
+                event_status=entry.get("event_status"),
+            )
+            for entry in entries
+        ])
@@ -38,4 +38,39 @@ class EventClaimService:
             if updated == 0:
                 return None
 
-            return EventOutbox.objects.get(id=event_id)
\ No newline at end of file
+            return EventOutbox.objects.get(id=event_id)
+
+    @classmethod
+    def claim_batch(cls, limit: int) -> list[EventOutbox]:
+        """
+        Claim up to ``limit`` pending events, oldest first.
+
+        One SKIP LOCKED select picks the rows and one UPDATE marks
+        them processing, so concurrent workers get disjoint batches.
+        """
+
+        with transaction.atomic():
+            events = list(
+                EventOutbox.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=EventStatus.PENDING)
+                .order_by("created_at")[:limit]
+            )
+
+            if not events:
+                return []
+
+            now = timezone.now()
+
+            EventOutbox.objects.filter(
+                id__in=[event.id for event in events],
+            ).update(
+                status=EventStatus.PROCESSING,
+                updated_at=now,
+            )
+
+            for event in events:
+                event.status = EventStatus.PROCESSING
+                event.updated_at = now
+
+            return events
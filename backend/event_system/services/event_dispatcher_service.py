@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Dict, Optional
 
 from django.conf import settings
@@ -95,4 +96,28 @@ class EventDispatcherService:
             outbox.status = "failed"
             outbox.save(update_fields=["status"])
 
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def dispatch_pending(*, time_budget: float = 50.0) -> int:
+        """
+        Drain pending outbox events in adaptive batches.
+
+        Stops when the queue is empty or ``time_budget`` seconds have
+        passed, whichever comes first.
+
+        Returns:
+            Number of events claimed.
+        """
+        from event_system.services.event_engine_service import EventEngine
+
+        deadline = time.monotonic() + time_budget
+        claimed = 0
+
+        while time.monotonic() < deadline:
+            count = EventEngine.process_batch()
+            if not count:
+                break
+            claimed += count
+
+        return claimed
@@ -1,3 +1,6 @@
+from functools import partial
+
+from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
 
@@ -9,6 +12,25 @@ from event_system.services.event_execution_record_service import EventExecutionR
 from event_system.services.event_metrics_service import EventMetricsService
 from event_system.services.event_audit_service import EventAuditService
 
+# Batch size adapts to backlog depth between these bounds: a short
+# queue gets small batches (low latency, short locks), a deep one
+# large batches (fewer round trips per event).
+BATCH_MIN_SIZE = getattr(settings, "EVENT_BATCH_MIN_SIZE", 10)
+BATCH_MAX_SIZE = getattr(settings, "EVENT_BATCH_MAX_SIZE", 500)
+
+# Claim roughly this share of the visible backlog per batch, so
+# parallel workers split a deep queue instead of one taking it all.
+BATCH_BACKLOG_SHARE = 4
+
+BATCH_STATUS_FIELDS = [
+    "status",
+    "attempts",
+    "last_error",
+    "processed_at",
+    "ignored_at",
+    "updated_at",
+]
+
 
 class EventEngine:
     """
@@ -68,7 +90,7 @@ class EventEngine:
                 )
 
         except Exception as exc:
-            EventMetricsService.end(start)
+            duration_ms = EventMetricsService.end(start)
 
             event.attempts += 1
             event.last_error = str(exc)
@@ -81,4 +103,149 @@ class EventEngine:
 
             event.save(update_fields=["attempts", "status", "last_error"])
 
-            raise
\ No newline at end of file
+            EventAuditService.log(**cls._failure_audit(event, duration_ms))
+
+            raise
+
+    # -------------------------
+    # Batch mode
+    # -------------------------
+
+    @classmethod
+    def batch_size(cls) -> int:
+        """
+        Batch size for the current backlog.
+
+        The depth probe is a bounded COUNT, so it stays cheap however
+        deep the queue is.
+        """
+        probe_limit = BATCH_MAX_SIZE * BATCH_BACKLOG_SHARE
+        depth = (
+            EventOutbox.objects
+            .filter(status=EventStatus.PENDING)
+            .values("id")[:probe_limit]
+            .count()
+        )
+
+        return max(BATCH_MIN_SIZE, min(BATCH_MAX_SIZE, depth // BATCH_BACKLOG_SHARE))
+
+    @classmethod
+    def process_batch(cls, limit: int | None = None) -> int:
+        """
+        Claim and process a batch of pending events.
+
+        Handlers run inside one transaction, each under its own
+        savepoint, so a failing handler rolls back only its own
+        work and is audited as failed or dead_letter. Statuses are written with one bulk_update, audit rows
+        with one bulk_create, and idempotency / execution records
+        with one cache round trip each once the batch commits.
+
+        Returns the number of events claimed.
+        """
+        events = EventClaimService.claim_batch(limit or cls.batch_size())
+        if not events:
+            return 0
+
+        event_ids = [str(event.id) for event in events]
+        already_done = (
+            IdempotencyService.processed_ids(event_ids)
+            | EventExecutionRecordService.run_ids(event_ids)
+        )
+
+        ran: list[str] = []
+        audit_entries: list[dict] = []
+
+        with transaction.atomic():
+            for event in events:
+                cls._process_claimed(
+                    event,
+                    already_done=str(event.id) in already_done,
+                    ran=ran,
+                    audit_entries=audit_entries,
+                )
+
+            EventOutbox.objects.bulk_update(events, BATCH_STATUS_FIELDS)
+            EventAuditService.log_many(audit_entries)
+
+            transaction.on_commit(partial(cls._mark_batch_done, ran))
+
+        return len(events)
+
+    @classmethod
+    def _process_claimed(
+        cls,
+        event: EventOutbox,
+        *,
+        already_done: bool,
+        ran: list[str],
+        audit_entries: list[dict],
+    ) -> None:
+        now = timezone.now()
+        event.updated_at = now
+
+        # side effects already applied — close the row out
+        if already_done:
+            event.status = EventStatus.PROCESSED
+            event.processed_at = now
+            return
+
+        handler = EventRouter.get(event.event_type)
+        if handler is None:
+            event.status = EventStatus.IGNORED
+            event.ignored_at = now
+            return
+
+        start = EventMetricsService.start()
+
+        try:
+            with transaction.atomic():
+                handler(event)
+
+        except Exception as exc:
+            duration_ms = EventMetricsService.end(start)
+
+            event.attempts += 1
+            event.last_error = str(exc)
+            event.status = (
+                EventStatus.DEAD_LETTER
+                if event.attempts >= event.max_attempts
+                else EventStatus.FAILED
+            )
+            audit_entries.append(cls._failure_audit(event, duration_ms))
+            return
+
+        event.status = EventStatus.PROCESSED
+        event.processed_at = timezone.now()
+        ran.append(str(event.id))
+
+        audit_entries.append({
+            "event_id": str(event.id),
+            "event_type": event.event_type,
+            "stage": "dispatched",
+            "duration_ms": EventMetricsService.end(start),
+        })
+
+    @staticmethod
+    def _failure_audit(event: EventOutbox, duration_ms: int) -> dict:
+        """Audit entry for a handler failure, in log() keyword form."""
+        return {
+            "event_id": str(event.id),
+            "event_type": event.event_type,
+            "stage": (
+                "dead_letter"
+                if event.status == EventStatus.DEAD_LETTER
+                else "failed"
+            ),
+            "message": event.last_error,
+            "duration_ms": duration_ms,
+            "retry_count": event.attempts,
+            "event_status": event.status,
+        }
+
+    @staticmethod
+    def _mark_batch_done(event_ids: list[str]) -> None:
+        if not event_ids:
+            return
+
+        EventExecutionRecordService.mark_run_many(event_ids)
+        IdempotencyService.mark_processed_many(event_ids)
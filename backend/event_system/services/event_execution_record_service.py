@@ -16,6 +16,18 @@ class EventExecutionRecordService:
     def mark_run(cls, event_id: str) -> None:
         cache.set(cls.PREFIX + event_id, True, timeout=86400 * 7)
 
+    @classmethod
+    def run_ids(cls, event_ids: list[str]) -> set[str]:
+        found = cache.get_many([cls.PREFIX + event_id for event_id in event_ids])
+        return {key[len(cls.PREFIX):] for key in found}
+
+    @classmethod
+    def mark_run_many(cls, event_ids: list[str]) -> None:
+        cache.set_many(
+            {cls.PREFIX + event_id: True for event_id in event_ids},
+            timeout=86400 * 7,
+        )
+
     @classmethod
     def clear(cls, event_id: str) -> None:
         cache.delete(cls.PREFIX + event_id)
\ No newline at end of file
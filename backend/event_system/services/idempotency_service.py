@@ -26,6 +26,23 @@ class IdempotencyService:
             timeout=ttl,
         )
 
+    @classmethod
+    def processed_ids(cls, event_ids: list[str]) -> set[str]:
+        """Subset of ``event_ids`` already processed — one cache round trip."""
+        found = cache.get_many([cls.PREFIX + event_id for event_id in event_ids])
+        return {key[len(cls.PREFIX):] for key in found}
+
+    @classmethod
+    def mark_processed_many(
+        cls,
+        event_ids: list[str],
+        ttl: int = 86400,
+    ) -> None:
+        """Mark many events processed — one cache round trip."""
+        cache.set_many(
+            {cls.PREFIX + event_id: True for event_id in event_ids},
+            timeout=ttl,
+        )
 
     @staticmethod
     def claim(event_id: str, ttl: int = 300) -> bool:
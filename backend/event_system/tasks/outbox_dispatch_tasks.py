@@ -1,13 +1,67 @@
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+
+from event_system.models.event_outbox import EventOutbox, EventStatus
 from event_system.services.event_dispatcher_service import (
     EventDispatcherService,
 )
 
+logger = logging.getLogger(__name__)
+
+# Seconds one drain run may spend before handing over to a fresh task.
+DRAIN_TIME_BUDGET = getattr(settings, "EVENT_OUTBOX_DRAIN_SECONDS", 50)
+
+# Concurrent drain loops. Each holds one slot while it runs.
+DRAIN_WORKERS = getattr(settings, "EVENT_OUTBOX_DRAIN_WORKERS", 4)
+DRAIN_SLOT_KEY = "event_system:drain_slot:{}"
 
-def dispatch_outbox_events() -> None:
+
+def dispatch_outbox_events() -> int:
     """
     Periodic outbox dispatcher.
 
     Runs via Celery beat or cron.
     """
 
-    EventDispatcherService.dispatch_pending()
\ No newline at end of file
+    return EventDispatcherService.dispatch_pending()
+
+
+@shared_task(name="event_system.drain_event_outbox")
+def drain_event_outbox() -> int:
+    """
+    Batch worker mode.
+
+    Drains the outbox for up to DRAIN_TIME_BUDGET seconds. If a
+    backlog is left, it queues itself again right away instead of
+    waiting for the next beat tick. Up to DRAIN_WORKERS loops run
+    in parallel; batches are claimed with SKIP LOCKED, so they never
+    overlap.
+    """
+
+    slot = _acquire_slot()
+    if slot is None:
+        return 0
+
+    try:
+        claimed = EventDispatcherService.dispatch_pending(
+            time_budget=DRAIN_TIME_BUDGET,
+        )
+    finally:
+        cache.delete(slot)
+
+    if EventOutbox.objects.filter(status=EventStatus.PENDING).exists():
+        drain_event_outbox.delay()
+
+    logger.info("drain_event_outbox: claimed %s events.", claimed)
+    return claimed
+
+
+def _acquire_slot() -> str | None:
+    for index in range(DRAIN_WORKERS):
+        key = DRAIN_SLOT_KEY.format(index)
+        if cache.add(key, 1, timeout=DRAIN_TIME_BUDGET + 60):
+            return key
+    return None
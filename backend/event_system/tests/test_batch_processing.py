@@ -0,0 +1,177 @@
+"""
+Event outbox batch processing tests.
+
+Tests cover:
+- claim_batch takes the oldest pending rows with SKIP LOCKED
+- batch_size follows backlog depth within its bounds
+- A failing handler is marked failed / dead_letter and audited
+- dispatch_pending drains until the queue is empty
+"""
+import uuid
+from unittest.mock import patch
+
+import pytest
+from django.db.models import QuerySet
+
+from event_system.models.event_audit_log import EventAuditLog
+from event_system.models.event_outbox import EventOutbox, EventStatus
+from event_system.router.event_router import EventRouter
+from event_system.services import event_engine_service
+from event_system.services.event_claim_service import EventClaimService
+from event_system.services.event_dispatcher_service import (
+    EventDispatcherService,
+)
+from event_system.services.event_engine_service import EventEngine
+
+
+def _pending(count, event_type='order.paid', **fields):
+    return [
+        EventOutbox.objects.create(
+            event_type=event_type,
+            domain='orders',
+            routing_key=f'orders.{event_type}',
+            idempotency_key=str(uuid.uuid4()),
+            **fields,
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture
+def routes():
+    with patch.dict(EventRouter._routes, clear=True):
+        yield EventRouter._routes
+
+
+@pytest.mark.django_db
+class TestClaimBatch:
+    """Test EventClaimService.claim_batch."""
+
+    def test_claims_oldest_pending_rows(self):
+        events = _pending(5)
+        _pending(1, status=EventStatus.PROCESSED)
+
+        claimed = EventClaimService.claim_batch(3)
+
+        assert [e.id for e in claimed] == [e.id for e in events[:3]]
+        assert EventOutbox.objects.filter(
+            status=EventStatus.PROCESSING,
+        ).count() == 3
+
+    def test_consecutive_claims_are_disjoint(self):
+        _pending(4)
+
+        first = {e.id for e in EventClaimService.claim_batch(2)}
+        second = {e.id for e in EventClaimService.claim_batch(2)}
+
+        assert len(first) == len(second) == 2
+        assert not first & second
+        assert EventClaimService.claim_batch(2) == []
+
+    def test_rows_are_selected_with_skip_locked(self):
+        _pending(1)
+
+        with patch.object(
+            QuerySet,
+            'select_for_update',
+            autospec=True,
+            side_effect=QuerySet.select_for_update,
+        ) as select_for_update:
+            EventClaimService.claim_batch(1)
+
+        assert select_for_update.call_args.kwargs == {'skip_locked': True}
+
+
+@pytest.mark.django_db
+class TestBatchSize:
+    """Test EventEngine.batch_size."""
+
+    @pytest.fixture(autouse=True)
+    def bounds(self):
+        with (
+            patch.object(event_engine_service, 'BATCH_MIN_SIZE', 2),
+            patch.object(event_engine_service, 'BATCH_MAX_SIZE', 5),
+        ):
+            yield
+
+    def test_empty_queue_uses_minimum(self):
+        assert EventEngine.batch_size() == 2
+
+    def test_takes_a_share_of_the_backlog(self):
+        _pending(12)
+
+        assert EventEngine.batch_size() == 3
+
+    def test_deep_queue_is_capped(self):
+        _pending(40)
+
+        assert EventEngine.batch_size() == 5
+
+
+@pytest.mark.django_db
+class TestProcessBatch:
+    """Test EventEngine.process_batch."""
+
+    def test_successes_are_processed_and_audited(self, routes):
+        routes['order.paid'] = lambda event: None
+        events = _pending(3)
+
+        assert EventEngine.process_batch(limit=10) == 3
+
+        assert set(
+            EventOutbox.objects.values_list('status', flat=True)
+        ) == {EventStatus.PROCESSED}
+        assert EventAuditLog.objects.filter(
+            stage='dispatched',
+            event_id__in=[e.id for e in events],
+        ).count() == 3
+
+    def test_failure_is_isolated_and_audited(self, routes):
+        def handler(event):
+            if event.payload.get('fail'):
+                raise ValueError('boom')
+
+        routes['order.paid'] = handler
+        ok = _pending(1)[0]
+        bad = _pending(1, payload={'fail': True})[0]
+        dead = _pending(1, payload={'fail': True}, attempts=4)[0]
+
+        EventEngine.process_batch(limit=10)
+
+        ok.refresh_from_db()
+        bad.refresh_from_db()
+        dead.refresh_from_db()
+        assert ok.status == EventStatus.PROCESSED
+        assert bad.status == EventStatus.FAILED
+        assert bad.attempts == 1
+        assert bad.last_error == 'boom'
+        assert dead.status == EventStatus.DEAD_LETTER
+
+        failed = EventAuditLog.objects.get(event_id=bad.id)
+        assert failed.stage == 'failed'
+        assert failed.message == 'boom'
+        assert failed.retry_count == 1
+        assert failed.event_status == EventStatus.FAILED
+        assert EventAuditLog.objects.get(event_id=dead.id).stage == 'dead_letter'
+
+    def test_unrouted_events_are_ignored(self, routes):
+        event = _pending(1, event_type='order.unknown')[0]
+
+        EventEngine.process_batch(limit=10)
+
+        event.refresh_from_db()
+        assert event.status == EventStatus.IGNORED
+        assert not EventAuditLog.objects.filter(event_id=event.id).exists()
+
+
+@pytest.mark.django_db
+def test_dispatch_pending_drains_every_batch(routes):
+    routes['order.paid'] = lambda event: None
+    _pending(7)
+
+    with patch.object(EventEngine, 'batch_size', return_value=3):
+        assert EventDispatcherService.dispatch_pending(time_budget=30) == 7
+
+    assert not EventOutbox.objects.exclude(
+        status=EventStatus.PROCESSED,
+    ).exists()
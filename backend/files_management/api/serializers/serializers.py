@@ -5,6 +5,7 @@ from rest_framework import serializers
 from files_management.models.file_attachment import FileAttachment
 from files_management.models.managed_file import ManagedFile
 from files_management.models.file_quota import FileQuota
+from files_management.models.upload_session import UploadSession
 
 
 
@@ -109,3 +110,53 @@ class FileQuotaSerializer(serializers.ModelSerializer):
             "current_size_bytes", "current_files_count",
             "usage_percent", "remaining_bytes",
         ]
+
+
+class UploadSessionCreateSerializer(serializers.Serializer):
+    """
+    Direct upload session input.
+    """
+
+    filename = serializers.CharField(max_length=255)
+    size_bytes = serializers.IntegerField(min_value=1)
+    sha256 = serializers.CharField(min_length=64, max_length=64)
+    purpose = serializers.CharField(max_length=64)
+    mime_type = serializers.CharField(max_length=255, required=False)
+    is_public = serializers.BooleanField(default=False, required=False)
+
+
+class UploadSessionPartsSerializer(serializers.Serializer):
+    """
+    Part URL request input. Omit part_numbers for the first batch.
+    """
+
+    part_numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+    )
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Read-only representation of a direct upload session.
+    """
+
+    file_id = serializers.IntegerField(source="managed_file_id", read_only=True)
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            "uuid",
+            "original_filename",
+            "mime_type",
+            "expected_size_bytes",
+            "part_size_bytes",
+            "part_count",
+            "status",
+            "failure_reason",
+            "file_id",
+            "expires_at",
+            "completed_at",
+        ]
+        read_only_fields = fields
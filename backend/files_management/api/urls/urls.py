@@ -7,6 +7,13 @@ from files_management.api.views.views import (
     FileUploadView,
 )
 from files_management.api.views.views import FileQuotaView, ManagedFileViewSet
+from files_management.api.views.upload_session_views import (
+    LocalUploadPartView,
+    UploadSessionCompleteView,
+    UploadSessionCreateView,
+    UploadSessionDetailView,
+    UploadSessionPartsView,
+)
 
 router = DefaultRouter()
 
@@ -15,6 +22,31 @@ router.register("quota", FileQuotaView, basename="file-quota")
 
 urlpatterns = [
     path("upload/", FileUploadView.as_view(), name="file-upload"),
+    path(
+        "upload-sessions/",
+        UploadSessionCreateView.as_view(),
+        name="file-upload-session",
+    ),
+    path(
+        "upload-sessions/<uuid:session_uuid>/",
+        UploadSessionDetailView.as_view(),
+        name="file-upload-session-detail",
+    ),
+    path(
+        "upload-sessions/<uuid:session_uuid>/parts/",
+        UploadSessionPartsView.as_view(),
+        name="file-upload-session-parts",
+    ),
+    path(
+        "upload-sessions/<uuid:session_uuid>/parts/<int:part_number>/",
+        LocalUploadPartView.as_view(),
+        name="file-upload-session-local-part",
+    ),
+    path(
+        "upload-sessions/<uuid:session_uuid>/complete/",
+        UploadSessionCompleteView.as_view(),
+        name="file-upload-session-complete",
+    ),
     path("attach/", FileAttachView.as_view(), name="file-attach"),
     path(
         "download/<int:attachment_id>/",
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from files_management.api.exceptions import (
+    bad_request_response,
+    not_found_response,
+)
+from files_management.api.serializers.serializers import (
+    UploadSessionCreateSerializer,
+    UploadSessionPartsSerializer,
+    UploadSessionSerializer,
+)
+from files_management.enums import UploadSessionStatus
+from files_management.exceptions import FileManagementError
+from files_management.models import UploadSession
+from files_management.selectors import UploadSessionSelector
+from files_management.services import UploadSessionService
+from files_management.storage import (
+    LocalMultipartBackend,
+    get_multipart_backend,
+)
+
+
+def _get_request_website(request):
+    return getattr(request, "website", None) or getattr(request.user, "website", None)
+
+
+def _get_session(request, session_uuid):
+    return UploadSessionSelector.for_uploader(
+        session_uuid=session_uuid,
+        website=_get_request_website(request),
+        user=request.user,
+    )
+
+
+class UploadSessionCreateView(GenericAPIView):
+    """
+    Start a direct-to-storage upload.
+
+    Returns the session and presigned URLs for its first parts. The
+    client PUTs each part to its URL, then calls the complete endpoint.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = UploadSessionCreateSerializer
+
+    def post(self, request):
+        serializer = UploadSessionCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            session = UploadSessionService.start(
+                website=_get_request_website(request),
+                uploaded_by=request.user,
+                filename=data["filename"],
+                size_bytes=data["size_bytes"],
+                sha256=data["sha256"],
+                purpose=data["purpose"],
+                is_public=data["is_public"],
+                mime_type=data.get("mime_type"),
+            )
+            parts = UploadSessionService.presign_parts(session=session)
+        except FileManagementError as exc:
+            return bad_request_response(str(exc))
+
+        return Response(
+            {**UploadSessionSerializer(session).data, "parts": parts},
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class UploadSessionDetailView(GenericAPIView):
+    """
+    Poll a session's status, or abort it.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = UploadSessionSerializer
+
+    def get(self, request, session_uuid):
+        session = _get_session(request, session_uuid)
+        if session is None:
+            return not_found_response("Upload session not found.")
+
+        return Response(UploadSessionSerializer(session).data)
+
+    def delete(self, request, session_uuid):
+        session = _get_session(request, session_uuid)
+        if session is None:
+            return not_found_response("Upload session not found.")
+
+        try:
+            UploadSessionService.abort(session=session)
+        except FileManagementError as exc:
+            return bad_request_response(str(exc))
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UploadSessionPartsView(GenericAPIView):
+    """
+    Issue or refresh presigned part URLs.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = UploadSessionPartsSerializer
+
+    def post(self, request, session_uuid):
+        serializer = UploadSessionPartsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        session = _get_session(request, session_uuid)
+        if session is None:
+            return not_found_response("Upload session not found.")
+
+        try:
+            parts = UploadSessionService.presign_parts(
+                session=session,
+                part_numbers=serializer.validated_data.get("part_numbers"),
+            )
+        except FileManagementError as exc:
+            return bad_request_response(str(exc))
+
+        return Response({"parts": parts})
+
+
+class UploadSessionCompleteView(GenericAPIView):
+    """
+    Finish a direct upload once every part is stored.
+
+    Responds 202: the file is registered but stays processing until its
+    checksum has been verified and it has been scanned.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = UploadSessionSerializer
+
+    def post(self, request, session_uuid):
+        session = _get_session(request, session_uuid)
+        if session is None:
+            return not_found_response("Upload session not found.")
+
+        try:
+            managed_file = UploadSessionService.complete(session=session)
+        except FileManagementError as exc:
+            return bad_request_response(str(exc))
+
+        return Response(
+            {
+                "file_id": managed_file.id,
+                "file_uuid": str(managed_file.uuid),
+                "status": UploadSessionStatus.VERIFYING,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class LocalUploadPartView(View):
+    """
+    Part upload endpoint for the local multipart backend.
+
+    Stands in for a presigned object-storage URL: authorised by the
+    signed token in the query string, not by the session cookie.
+    """
+
+    def put(self, request, session_uuid, part_number: int):
+        if get_multipart_backend() is not LocalMultipartBackend:
+            return HttpResponse(status=404)
+
+        session = UploadSession.objects.filter(
+            uuid=session_uuid,
+            status=UploadSessionStatus.PENDING,
+        ).first()
+        if session is None or not LocalMultipartBackend.is_valid_token(
+            session,
+            part_number,
+            request.GET.get("token", ""),
+        ):
+            return HttpResponse(status=403)
+
+        if int(request.META.get("CONTENT_LENGTH") or 0) > session.part_size_bytes:
+            return HttpResponse(status=413)
+
+        LocalMultipartBackend.save_part(session, part_number, request)
+        return HttpResponse(status=200)
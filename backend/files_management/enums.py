@@ -288,3 +288,14 @@ class DeliveryGuardBlockReason(models.TextChoices):
     APPROVAL_PENDING = "approval_pending", "Awaiting Staff Approval"
     REJECTED = "rejected", "File Rejected by Staff"
     GUARD_ERROR = "guard_error", "Guard Check Error"
+
+
+class UploadSessionStatus(models.TextChoices):
+    """State of a direct-to-storage multipart upload."""
+
+    PENDING = "pending", "Awaiting Parts"
+    VERIFYING = "verifying", "Verifying Checksum"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed Verification"
+    ABORTED = "aborted", "Aborted"
+    EXPIRED = "expired", "Expired"
@@ -77,4 +77,10 @@ class FileDeliveryBlocked(FileManagementError):
     ):
         self.blocked_reason = blocked_reason
         self.amount_due = amount_due
-        super().__init__(message or f"Download blocked: {blocked_reason}")
\ No newline at end of file
+        super().__init__(message or f"Download blocked: {blocked_reason}")
+
+
+class UploadSessionError(FileManagementError):
+    """
+    Raised when a direct upload session cannot be continued or completed.
+    """
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.2 on 2026-10-16 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files_management', '0009_fileaccesslog'),
+        ('websites', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('storage_key', models.CharField(max_length=500, unique=True)),
+                ('sha256_hash', models.CharField(max_length=64)),
+                ('file_size_bytes', models.BigIntegerField()),
+                ('reference_count', models.PositiveIntegerField(default=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('bucket', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='blobs', to='files_management.filebucket')),
+                ('website', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='file_blobs', to='websites.website')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['website', 'sha256_hash'], name='files_manag_website_b2a0cd_idx')],
+            },
+        ),
+        migrations.AlterField(
+            model_name='managedfile',
+            name='storage_key',
+            field=models.CharField(db_index=True, help_text='Full path or object key in the storage backend. Shared by deduplicated uploads of the same content.', max_length=500),
+        ),
+        migrations.AddField(
+            model_name='managedfile',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='managed_files', to='files_management.fileblob'),
+        ),
+    ]
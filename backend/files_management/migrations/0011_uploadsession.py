@@ -0,0 +1,51 @@
+# Generated by Django 5.2.2 on 2026-10-16 17:05
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('files_management', '0010_fileblob_managedfile_blob'),
+        ('websites', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('purpose', models.CharField(max_length=64)),
+                ('is_public', models.BooleanField(default=False)),
+                ('original_filename', models.CharField(max_length=255)),
+                ('mime_type', models.CharField(max_length=255)),
+                ('file_extension', models.CharField(blank=True, max_length=20)),
+                ('file_kind', models.CharField(choices=[('image', 'Image'), ('document', 'Document'), ('video', 'Video'), ('audio', 'Audio'), ('archive', 'Archive'), ('external', 'External'), ('cms_image', 'CMS Image'), ('cms_attachment', 'CMS Attachment'), ('cms_media', 'CMS Media'), ('user_avatar', 'User Avatar'), ('author_photo', 'Author Profile Photo'), ('order_file', 'Order File'), ('order_attachment', 'Order Attachment'), ('writer_deliverable', 'Writer Deliverable'), ('revision_file', 'Revision File'), ('message_attachment', 'Message Attachment'), ('ticket_attachment', 'Ticket Attachment'), ('class_material', 'Class Material'), ('special_order_file', 'Special Order File'), ('newsletter_image', 'Newsletter Image'), ('system_backup', 'System Backup'), ('system_export', 'System Export'), ('other', 'Other')], default='other', max_length=32)),
+                ('expected_size_bytes', models.BigIntegerField(help_text='Size declared by the client; verified on completion.')),
+                ('expected_sha256', models.CharField(help_text='SHA-256 declared by the client; verified after completion.', max_length=64)),
+                ('storage_key', models.CharField(max_length=500, unique=True)),
+                ('backend_upload_id', models.CharField(blank=True, help_text='Multipart upload ID issued by the storage backend.', max_length=255)),
+                ('part_size_bytes', models.BigIntegerField()),
+                ('part_count', models.PositiveIntegerField()),
+                ('status', models.CharField(choices=[('pending', 'Awaiting Parts'), ('verifying', 'Verifying Checksum'), ('completed', 'Completed'), ('failed', 'Failed Verification'), ('aborted', 'Aborted'), ('expired', 'Expired')], default='pending', max_length=16)),
+                ('reserved_bytes', models.BigIntegerField(default=0, help_text='Quota held for this session until it completes or ends.')),
+                ('failure_reason', models.CharField(blank=True, max_length=255)),
+                ('expires_at', models.DateTimeField()),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('bucket', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='upload_sessions', to='files_management.filebucket')),
+                ('managed_file', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload_session', to='files_management.managedfile')),
+                ('uploaded_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+                ('website', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='websites.website')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'expires_at'], name='files_manag_status_7af9ef_idx')],
+            },
+        ),
+    ]
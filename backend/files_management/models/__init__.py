@@ -4,7 +4,9 @@ Model exports for files_management.
 
 from files_management.models.external_file_link import ExternalFileLink
 from files_management.models.file_access_grant import FileAccessGrant
+from files_management.models.file_access_log import FileAccessLog
 from files_management.models.file_attachment import FileAttachment
+from files_management.models.file_blob import FileBlob
 from files_management.models.file_category import FileCategory
 from files_management.models.file_deletion_request import (
     FileDeletionRequest,
@@ -19,11 +21,14 @@ from files_management.models.file_processing_job import FileProcessingJob
 from files_management.models.file_scan_result import FileScanResult
 from files_management.models.file_version import FileVersion
 from files_management.models.managed_file import ManagedFile
+from files_management.models.upload_session import UploadSession
 
 __all__ = [
     "ExternalFileLink",
     "FileAccessGrant",
+    "FileAccessLog",
     "FileAttachment",
+    "FileBlob",
     "FileCategory",
     "FileDeletionRequest",
     "FileDeliveryGuardResult",
@@ -34,4 +39,5 @@ __all__ = [
     "FileScanResult",
     "FileVersion",
     "ManagedFile",
+    "UploadSession",
 ]
\ No newline at end of file
@@ -0,0 +1,47 @@
+from django.db import models
+
+
+class FileBlob(models.Model):
+    """
+    A stored object shared by several ManagedFile rows.
+
+    Uploads whose content (SHA-256 and size) matches an already clean
+    file in the same tenant point at the existing object instead of
+    writing a new one. reference_count tracks how many ManagedFile rows
+    still use it; the object is removed from storage only when the
+    last reference is released.
+    """
+
+    website = models.ForeignKey(
+        "websites.Website",
+        on_delete=models.CASCADE,
+        related_name="file_blobs",
+    )
+
+    bucket = models.ForeignKey(
+        "files_management.FileBucket",
+        on_delete=models.PROTECT,
+        related_name="blobs",
+    )
+
+    storage_key = models.CharField(
+        max_length=500,
+        unique=True,
+    )
+
+    sha256_hash = models.CharField(max_length=64)
+
+    file_size_bytes = models.BigIntegerField()
+
+    reference_count = models.PositiveIntegerField(default=1)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["website", "sha256_hash"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.storage_key} ({self.reference_count} refs)"
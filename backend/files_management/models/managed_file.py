@@ -78,8 +78,20 @@ class ManagedFile(models.Model):
 
     storage_key = models.CharField(
         max_length=500,
-        unique=True,
-        help_text="Full path or object key in the storage backend.",
+        db_index=True,
+        help_text=(
+            "Full path or object key in the storage backend. Shared by "
+            "deduplicated uploads of the same content."
+        ),
+    )
+
+    # Content-addressed sharing (null = sole owner of its object)
+    blob = models.ForeignKey(
+        "files_management.FileBlob",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="managed_files",
     )
 
     original_filename = models.CharField(
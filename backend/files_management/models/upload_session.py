@@ -0,0 +1,116 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+from files_management.enums import FileKind, UploadSessionStatus
+
+
+class UploadSession(models.Model):
+    """
+    A direct-to-storage multipart upload in progress.
+
+    The client uploads parts straight to object storage through
+    presigned URLs, so file bytes never pass through a web worker.
+    Quota for the declared size is reserved when the session starts
+    and either becomes the ManagedFile's usage on completion or is
+    released when the session is aborted, expires or fails checksum
+    verification.
+    """
+
+    uuid = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+    )
+
+    website = models.ForeignKey(
+        "websites.Website",
+        on_delete=models.CASCADE,
+        related_name="upload_sessions",
+    )
+
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="upload_sessions",
+    )
+
+    bucket = models.ForeignKey(
+        "files_management.FileBucket",
+        on_delete=models.PROTECT,
+        related_name="upload_sessions",
+    )
+
+    purpose = models.CharField(max_length=64)
+
+    is_public = models.BooleanField(default=False)
+
+    original_filename = models.CharField(max_length=255)
+
+    mime_type = models.CharField(max_length=255)
+
+    file_extension = models.CharField(max_length=20, blank=True)
+
+    file_kind = models.CharField(
+        max_length=32,
+        choices=FileKind.choices,
+        default=FileKind.OTHER,
+    )
+
+    expected_size_bytes = models.BigIntegerField(
+        help_text="Size declared by the client; verified on completion.",
+    )
+
+    expected_sha256 = models.CharField(
+        max_length=64,
+        help_text="SHA-256 declared by the client; verified after completion.",
+    )
+
+    storage_key = models.CharField(max_length=500, unique=True)
+
+    backend_upload_id = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Multipart upload ID issued by the storage backend.",
+    )
+
+    part_size_bytes = models.BigIntegerField()
+
+    part_count = models.PositiveIntegerField()
+
+    status = models.CharField(
+        max_length=16,
+        choices=UploadSessionStatus.choices,
+        default=UploadSessionStatus.PENDING,
+    )
+
+    reserved_bytes = models.BigIntegerField(
+        default=0,
+        help_text="Quota held for this session until it completes or ends.",
+    )
+
+    managed_file = models.OneToOneField(
+        "files_management.ManagedFile",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="upload_session",
+    )
+
+    failure_reason = models.CharField(max_length=255, blank=True)
+
+    expires_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "expires_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.original_filename} ({self.status})"
@@ -17,6 +17,9 @@ from files_management.selectors.external_link_selectors import (
 from files_management.selectors.file_selectors import ManagedFileSelector
 from files_management.selectors.policy_selectors import FilePolicySelector
 from files_management.selectors.scan_selectors import FileScanSelector
+from files_management.selectors.upload_session_selectors import (
+    UploadSessionSelector,
+)
 
 __all__ = [
     "ExternalFileLinkSelector",
@@ -28,4 +31,5 @@ __all__ = [
     "FilePolicySelector",
     "FileScanSelector",
     "ManagedFileSelector",
+    "UploadSessionSelector",
 ]
\ No newline at end of file
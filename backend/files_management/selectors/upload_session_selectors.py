@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from files_management.models import UploadSession
+
+
+class UploadSessionSelector:
+    """
+    Read helpers for direct upload sessions.
+    """
+
+    @staticmethod
+    def for_uploader(
+        *,
+        session_uuid,
+        website,
+        user,
+    ) -> UploadSession | None:
+        """
+        Return a session started by ``user`` within a website boundary.
+        """
+
+        return UploadSession.objects.filter(
+            uuid=session_uuid,
+            website=website,
+            uploaded_by=user,
+        ).first()
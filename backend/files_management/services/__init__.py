@@ -8,6 +8,7 @@ from files_management.services.file_access_service import FileAccessService
 from files_management.services.file_attachment_service import (
     FileAttachmentService,
 )
+from files_management.services.file_blob_service import FileBlobService
 from files_management.services.file_deletion_service import (
     FileDeletionService,
 )
@@ -21,12 +22,16 @@ from files_management.services.file_processing_service import (
 from files_management.services.file_scan_service import FileScanService
 from files_management.services.file_upload_service import FileUploadService
 from files_management.services.file_version_service import FileVersionService
+from files_management.services.upload_session_service import (
+    UploadSessionService,
+)
 
 __all__ = [
     "ExternalFileLinkService",
     "FileAccessGrantService",
     "FileAccessService",
     "FileAttachmentService",
+    "FileBlobService",
     "FileDeletionService",
     "FileDownloadService",
     "FilePolicyService",
@@ -34,4 +39,5 @@ __all__ = [
     "FileScanService",
     "FileUploadService",
     "FileVersionService",
+    "UploadSessionService",
 ]
\ No newline at end of file
@@ -19,15 +19,21 @@ For PDF previews (optional, install if needed):
 Each derivative is stored as its own ManagedFile with
 ``parent_file`` pointing to the original and ``derivative_type``
 set appropriately.
+
+Images are downloaded and decoded once. Every size is cut from one
+progressively shrinking copy, and the outputs are uploaded in parallel
+and recorded with a single bulk_create.
 """
 
 from __future__ import annotations
 
 import logging
 import uuid as uuid_lib
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import TYPE_CHECKING
 
+from django.conf import settings
 from django.utils import timezone
 
 if TYPE_CHECKING:
@@ -43,6 +49,9 @@ THUMBNAIL_SIZES = {
     "thumbnail_lg": (800, 800),
 }
 
+# Parallel storage uploads per file.
+DERIVATIVE_UPLOAD_WORKERS = getattr(settings, "DERIVATIVE_UPLOAD_WORKERS", 4)
+
 
 class DerivativeService:
     """Generate derived file versions (thumbnails, WebP, PDF previews)."""
@@ -58,34 +67,14 @@ class DerivativeService:
         mime = managed_file.mime_type or ""
 
         if mime.startswith("image/"):
-            # Generate thumbnails
-            for deriv_type, size in THUMBNAIL_SIZES.items():
-                try:
-                    deriv = cls._generate_image_thumbnail(
-                        managed_file, deriv_type, size
-                    )
-                    if deriv:
-                        derivatives.append(deriv)
-                except Exception as exc:
-                    logger.error(
-                        "Thumbnail %s generation failed for %s: %s",
-                        deriv_type,
-                        managed_file.uuid,
-                        exc,
-                    )
-
-            # Generate WebP version (if source isn't already WebP)
-            if mime != "image/webp":
-                try:
-                    deriv = cls._generate_webp(managed_file)
-                    if deriv:
-                        derivatives.append(deriv)
-                except Exception as exc:
-                    logger.error(
-                        "WebP generation failed for %s: %s",
-                        managed_file.uuid,
-                        exc,
-                    )
+            try:
+                derivatives.extend(cls._generate_image_derivatives(managed_file))
+            except Exception as exc:
+                logger.error(
+                    "Image derivative generation failed for %s: %s",
+                    managed_file.uuid,
+                    exc,
+                )
 
         elif mime == "application/pdf":
             # Generate PDF preview (first page as PNG)
@@ -110,88 +99,80 @@ class DerivativeService:
         return derivatives
 
     @classmethod
-    def _generate_image_thumbnail(
-        cls,
-        managed_file: ManagedFile,
-        deriv_type: str,
-        size: tuple[int, int],
-    ) -> ManagedFile | None:
-        """Create a thumbnail of the given size."""
-        from PIL import Image
-
-        # Skip if derivative already exists
-        from files_management.models import ManagedFile as MF
-
-        if MF.objects.filter(parent_file=managed_file, derivative_type=deriv_type).exists():
-            return None
-
-        image_bytes = cls._read_file_bytes(managed_file)
-        if image_bytes is None:
-            return None
-
-        try:
-            img = Image.open(BytesIO(image_bytes))
-
-            # Convert to RGB if necessary (handles RGBA, P mode, etc.)
-            if img.mode not in ("RGB", "L"):
-                img = img.convert("RGB")
-
-            # Use thumbnail (preserves aspect ratio, fits within size)
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-
-            # Save to buffer
-            buffer = BytesIO()
-            img.save(buffer, format="JPEG", quality=85, optimize=True)
-            buffer.seek(0)
-
-            return cls._save_derivative(
-                parent=managed_file,
-                file_bytes=buffer.getvalue(),
-                derivative_type=deriv_type,
-                mime_type="image/jpeg",
-                extension="jpg",
-                width=img.width,
-                height=img.height,
-            )
-        except Exception as exc:
-            logger.error("Image thumbnail error: %s", exc)
-            return None
+    def _generate_image_derivatives(cls, managed_file: ManagedFile) -> list:
+        """
+        Create missing thumbnails and the WebP copy from one decode.
 
-    @classmethod
-    def _generate_webp(cls, managed_file: ManagedFile) -> ManagedFile | None:
-        """Create a WebP version of an image."""
+        Thumbnails are cut largest first, each shrinking the previous
+        result in place. Without a WebP copy to make, JPEG sources are
+        decoded straight at a reduced scale via ``Image.draft``.
+        """
         from PIL import Image
         from files_management.models import ManagedFile as MF
 
-        if MF.objects.filter(parent_file=managed_file, derivative_type="webp").exists():
-            return None
+        existing = set(
+            MF.objects
+            .filter(parent_file=managed_file)
+            .values_list("derivative_type", flat=True)
+        )
+        sizes = sorted(
+            (
+                (deriv_type, size)
+                for deriv_type, size in THUMBNAIL_SIZES.items()
+                if deriv_type not in existing
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        want_webp = (
+            managed_file.mime_type != "image/webp" and "webp" not in existing
+        )
+        if not sizes and not want_webp:
+            return []
 
         image_bytes = cls._read_file_bytes(managed_file)
         if image_bytes is None:
-            return None
+            return []
 
-        try:
-            img = Image.open(BytesIO(image_bytes))
+        img = Image.open(BytesIO(image_bytes))
+        outputs = []
 
-            if img.mode not in ("RGB", "RGBA", "L"):
-                img = img.convert("RGB")
+        if want_webp:
+            try:
+                webp = img if img.mode in ("RGB", "RGBA", "L") else img.convert("RGB")
+                buffer = BytesIO()
+                webp.save(buffer, format="WEBP", quality=80, method=4)
+                outputs.append((
+                    "webp", buffer.getvalue(), "image/webp", "webp",
+                    webp.width, webp.height,
+                ))
+                img = webp
+            except Exception as exc:
+                logger.error("WebP conversion error: %s", exc)
+        elif sizes:
+            # JPEG: decode at the smallest DCT scale still >= the target
+            img.draft(img.mode, sizes[0][1])
 
-            buffer = BytesIO()
-            img.save(buffer, format="WEBP", quality=80, method=4)
-            buffer.seek(0)
+        if sizes:
+            try:
+                # Convert to RGB if necessary (handles RGBA, P mode, etc.)
+                if img.mode not in ("RGB", "L"):
+                    img = img.convert("RGB")
+
+                for deriv_type, size in sizes:
+                    # in place; reducing_gap does integer reduce() first
+                    img.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+                    buffer = BytesIO()
+                    img.save(buffer, format="JPEG", quality=85, optimize=True)
+                    outputs.append((
+                        deriv_type, buffer.getvalue(), "image/jpeg", "jpg",
+                        img.width, img.height,
+                    ))
+            except Exception as exc:
+                logger.error("Image thumbnail error: %s", exc)
 
-            return cls._save_derivative(
-                parent=managed_file,
-                file_bytes=buffer.getvalue(),
-                derivative_type="webp",
-                mime_type="image/webp",
-                extension="webp",
-                width=img.width,
-                height=img.height,
-            )
-        except Exception as exc:
-            logger.error("WebP conversion error: %s", exc)
-            return None
+        return cls._save_derivatives(managed_file, outputs)
 
     @classmethod
     def _generate_pdf_preview(
@@ -289,10 +270,92 @@ class DerivativeService:
         height: int | None = None,
     ) -> ManagedFile:
         """Create a ManagedFile record for a derivative and upload to storage."""
+        derivative = cls._build_derivative(
+            parent, file_bytes, derivative_type, mime_type, extension, width, height,
+        )
+        cls._upload_derivative(parent, derivative, file_bytes)
+        derivative.save()
+
+        logger.info(
+            "Created %s derivative for %s → %s",
+            derivative_type,
+            parent.uuid,
+            derivative.uuid,
+        )
+        return derivative
+
+    @classmethod
+    def _save_derivatives(cls, parent: ManagedFile, outputs: list[tuple]) -> list:
+        """
+        Upload encoded outputs concurrently, then insert their records in
+        one bulk_create. Outputs whose upload fails are left out.
+
+        ``outputs`` holds (derivative_type, bytes, mime_type, extension,
+        width, height) tuples.
+        """
+        from files_management.models import ManagedFile
+        from files_management.services.storage_service import StorageService
+
+        if not outputs:
+            return []
+
+        # boto3 clients are thread-safe; creating them is not
+        client = StorageService._get_client(parent.bucket)
+
+        pending = [
+            (
+                cls._build_derivative(
+                    parent,
+                    file_bytes=file_bytes,
+                    derivative_type=derivative_type,
+                    mime_type=mime_type,
+                    extension=extension,
+                    width=width,
+                    height=height,
+                ),
+                file_bytes,
+            )
+            for derivative_type, file_bytes, mime_type, extension, width, height
+            in outputs
+        ]
+
+        def _upload(item):
+            derivative, file_bytes = item
+            try:
+                cls._upload_derivative(parent, derivative, file_bytes, client=client)
+                return derivative
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=min(DERIVATIVE_UPLOAD_WORKERS, len(pending)),
+        ) as executor:
+            uploaded = [d for d in executor.map(_upload, pending) if d is not None]
+
+        derivatives = ManagedFile.objects.bulk_create(uploaded)
+
+        logger.info(
+            "Created %s derivatives for %s",
+            ", ".join(d.derivative_type for d in derivatives),
+            parent.uuid,
+        )
+        return derivatives
+
+    @classmethod
+    def _build_derivative(
+        cls,
+        parent: ManagedFile,
+        file_bytes: bytes,
+        derivative_type: str,
+        mime_type: str,
+        extension: str,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> ManagedFile:
+        """Build an unsaved ManagedFile for a derivative."""
         import hashlib
 
         from files_management.enums import (
-            FileKind,
             FileLifecycleStatus,
             FileScanStatus,
         )
@@ -305,27 +368,7 @@ class DerivativeService:
         parent_prefix = parent.storage_key.rsplit("/", 1)[0]
         storage_key = f"{parent_prefix}/{derivative_type}_{file_uuid}.{extension}"
 
-        # Upload to storage
-        try:
-            from files_management.services.storage_service import StorageService
-
-            client = StorageService._get_client(parent.bucket)
-            extra_args = {"ContentType": mime_type}
-            if parent.is_public:
-                extra_args["ACL"] = "public-read"
-
-            client.put_object(
-                Bucket=parent.bucket.spaces_bucket_name,
-                Key=storage_key,
-                Body=file_bytes,
-                **extra_args,
-            )
-        except Exception as exc:
-            logger.error("Derivative upload failed: %s", exc)
-            raise
-
-        # Create the derivative record
-        derivative = ManagedFile.objects.create(
+        return ManagedFile(
             uuid=file_uuid,
             website=parent.website,
             site=parent.site,
@@ -347,10 +390,29 @@ class DerivativeService:
             height_px=height,
         )
 
-        logger.info(
-            "Created %s derivative for %s → %s",
-            derivative_type,
-            parent.uuid,
-            derivative.uuid,
-        )
-        return derivative
\ No newline at end of file
+    @classmethod
+    def _upload_derivative(
+        cls,
+        parent: ManagedFile,
+        derivative: ManagedFile,
+        file_bytes: bytes,
+        client=None,
+    ) -> None:
+        """Upload derivative bytes to the parent's bucket."""
+        try:
+            from files_management.services.storage_service import StorageService
+
+            client = client or StorageService._get_client(parent.bucket)
+            extra_args = {"ContentType": derivative.mime_type}
+            if parent.is_public:
+                extra_args["ACL"] = "public-read"
+
+            client.put_object(
+                Bucket=parent.bucket.spaces_bucket_name,
+                Key=derivative.storage_key,
+                Body=file_bytes,
+                **extra_args,
+            )
+        except Exception as exc:
+            logger.error("Derivative upload failed: %s", exc)
+            raise
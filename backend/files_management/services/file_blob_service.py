@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.utils import timezone
+
+from files_management.enums import FileLifecycleStatus, FileScanStatus
+from files_management.models.file_blob import FileBlob
+from files_management.models.managed_file import ManagedFile
+
+
+class FileBlobService:
+    """
+    Reference-counted sharing of stored objects between ManagedFiles.
+
+    A blob is created lazily the first time an existing file's object
+    gets a second reference. Files without a blob own their object
+    outright, as before.
+    """
+
+    REUSABLE_SCAN_STATUSES = (
+        FileScanStatus.CLEAN,
+        FileScanStatus.PASSED,
+    )
+
+    REUSABLE_LIFECYCLE_STATUSES = (
+        FileLifecycleStatus.ACTIVE,
+        FileLifecycleStatus.ARCHIVED,
+    )
+
+    @classmethod
+    def find_reusable(
+        cls,
+        *,
+        website,
+        uploaded_by,
+        bucket,
+        sha256_hash: str,
+        file_size_bytes: int,
+        is_public: bool,
+    ) -> ManagedFile | None:
+        """
+        Return the oldest clean original file with identical content.
+
+        Only the uploader's own files are candidates: a reference
+        inherits the source's scan result, so matching across users
+        would reveal that someone else stored the same content.
+        """
+
+        return (
+            ManagedFile.objects
+            .filter(
+                website=website,
+                uploaded_by=uploaded_by,
+                bucket=bucket,
+                sha256_hash=sha256_hash,
+                file_size_bytes=file_size_bytes,
+                is_public=is_public,
+                parent_file__isnull=True,
+                scan_status__in=cls.REUSABLE_SCAN_STATUSES,
+                lifecycle_status__in=cls.REUSABLE_LIFECYCLE_STATUSES,
+            )
+            .order_by("created_at")
+            .first()
+        )
+
+    @classmethod
+    @transaction.atomic
+    def acquire(cls, source: ManagedFile) -> FileBlob | None:
+        """
+        Add a reference to the object behind ``source``.
+
+        The source row is locked first, the same lock release() takes,
+        so a reference is never added to an object being deleted.
+
+        Returns None if ``source`` was deleted or released meanwhile;
+        the caller should then store its own copy.
+        """
+
+        source = (
+            ManagedFile.objects
+            .select_for_update()
+            .filter(
+                pk=source.pk,
+                lifecycle_status__in=cls.REUSABLE_LIFECYCLE_STATUSES,
+            )
+            .first()
+        )
+        if source is None:
+            return None
+
+        blob_id = source.blob_id
+        if blob_id is None:
+            blob, created = FileBlob.objects.get_or_create(
+                storage_key=source.storage_key,
+                defaults={
+                    "website_id": source.website_id,
+                    "bucket_id": source.bucket_id,
+                    "sha256_hash": source.sha256_hash,
+                    "file_size_bytes": source.file_size_bytes,
+                    "reference_count": 1,
+                },
+            )
+            if created:
+                ManagedFile.objects.filter(pk=source.pk).update(blob=blob)
+            blob_id = blob.pk
+
+        blob = FileBlob.objects.select_for_update().get(pk=blob_id)
+        blob.reference_count += 1
+        blob.save(update_fields=["reference_count", "updated_at"])
+        return blob
+
+    @staticmethod
+    @transaction.atomic
+    def release(managed_file: ManagedFile) -> bool:
+        """
+        Drop ``managed_file``'s reference to its stored object.
+
+        The row is locked and marked DELETED before the blob is
+        touched, so a waiting acquire() sees it is gone.
+
+        Returns True when the caller may delete the object from
+        storage: this was the last reference, or the file never shared
+        its object.
+        """
+
+        locked = (
+            ManagedFile.objects
+            .select_for_update()
+            .filter(pk=managed_file.pk)
+            .only("blob_id")
+            .first()
+        )
+        if locked is not None:
+            managed_file.blob_id = locked.blob_id
+            ManagedFile.objects.filter(pk=locked.pk).update(
+                blob=None,
+                lifecycle_status=FileLifecycleStatus.DELETED,
+                updated_at=timezone.now(),
+            )
+
+        blob_id = managed_file.blob_id
+        managed_file.blob = None
+        managed_file.lifecycle_status = FileLifecycleStatus.DELETED
+
+        if blob_id is None:
+            # a released row still carries the shared key
+            return not FileBlob.objects.filter(
+                storage_key=managed_file.storage_key,
+            ).exists()
+
+        blob = FileBlob.objects.select_for_update().get(pk=blob_id)
+
+        blob.reference_count -= 1
+        if blob.reference_count > 0:
+            blob.save(update_fields=["reference_count", "updated_at"])
+            return False
+
+        ManagedFile.objects.filter(blob=blob).update(blob=None)
+        blob.delete()
+        return True
@@ -1,5 +1,8 @@
 """
 FileCleanupService - retention-policy enforcement for managed files.
+
+Purging a record only removes its stored object once no deduplicated
+upload still references it (FileBlobService.release).
 """
 from __future__ import annotations
 
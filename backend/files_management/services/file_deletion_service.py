@@ -16,6 +16,7 @@ from files_management.services.file_access_service import FileAccessService
 from files_management.services.file_attachment_service import (
     FileAttachmentService,
 )
+from files_management.services.file_blob_service import FileBlobService
 from files_management.storage import FileStorageBackend
 
 
@@ -353,7 +354,7 @@ class FileDeletionService:
                 "Archive-file deletion requires a managed file."
             )
 
-        if managed_file.storage_key:
+        if managed_file.storage_key and FileBlobService.release(managed_file):
             FileStorageBackend.delete(
                 storage_name=managed_file.storage_key,
             )
@@ -148,6 +148,48 @@ class FilePolicyService:
 
         return mime_type
 
+    @classmethod
+    def validate_declared_file(
+        cls,
+        *,
+        website,
+        purpose: str,
+        filename: str,
+        size_bytes: int,
+        mime_type: str,
+    ) -> None:
+        """
+        Validate a file described by the client before it is uploaded.
+
+        Used by direct-to-storage uploads, where the bytes never reach
+        Django. The declared size is re-checked against storage when
+        the upload completes.
+        """
+
+        if size_bytes > cls.get_max_file_size_bytes(
+            website=website,
+            purpose=purpose,
+        ):
+            raise FileValidationError(
+                "Uploaded file exceeds the allowed size limit."
+            )
+
+        cls.validate_extension(
+            extension=Path(filename).suffix.lower(),
+            allowed_extensions=cls.get_allowed_extensions(
+                website=website,
+                purpose=purpose,
+            ),
+            filename=filename,
+        )
+        cls.validate_mime_type(
+            mime_type=mime_type,
+            allowed_mime_types=cls.get_allowed_mime_types(
+                website=website,
+                purpose=purpose,
+            ),
+        )
+
     @staticmethod
     def validate_size(
         *,
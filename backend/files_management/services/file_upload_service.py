@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import hashlib
 
+from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 
 from files_management.enums import FileLifecycleStatus, FileScanStatus
 from files_management.models.file_bucket import FileBucket
 from files_management.models.managed_file import ManagedFile
+from files_management.services.file_blob_service import FileBlobService
 from files_management.services.file_policy_service import FilePolicyService
 from files_management.storage import (
     FileStorageBackend,
@@ -16,6 +18,9 @@ from files_management.storage import (
 )
 from files_management.validators import normalize_filename
 
+# Point identical uploads at the existing stored object.
+DEDUPLICATE_UPLOADS = getattr(settings, "FILE_UPLOAD_DEDUPLICATION", True)
+
 
 class FileUploadService:
     """
@@ -25,6 +30,10 @@ class FileUploadService:
     through the configured Django storage backend. It does not attach the
     file to business objects. Attachment is handled separately by
     FileAttachmentService.
+
+    Content already stored and scanned clean for the tenant is not
+    written again: the new record shares the existing object, its scan
+    result and its derivatives through a reference-counted FileBlob.
     """
 
     @classmethod
@@ -84,16 +93,39 @@ class FileUploadService:
         sha256_hash = cls._sha256(uploaded_file)
         uploaded_file.seek(0)
 
-        saved_name = FileStorageBackend.save(
-            storage_key=storage_key,
-            content=uploaded_file,
-        )
-
         file_kind = MimeTypeDetector.detect_kind(
             mime_type=mime_type,
             filename=original_filename,
         )
 
+        if DEDUPLICATE_UPLOADS:
+            source = FileBlobService.find_reusable(
+                website=website,
+                uploaded_by=uploaded_by,
+                bucket=bucket,
+                sha256_hash=sha256_hash,
+                file_size_bytes=uploaded_file.size,
+                is_public=is_public,
+            )
+            if source is not None:
+                managed_file = cls._create_reference(
+                    source=source,
+                    website=website,
+                    uploaded_by=uploaded_by,
+                    original_filename=original_filename,
+                    mime_type=mime_type,
+                    file_extension=file_extension,
+                    file_kind=file_kind,
+                    metadata=metadata,
+                )
+                if managed_file is not None:
+                    return managed_file
+
+        saved_name = FileStorageBackend.save(
+            storage_key=storage_key,
+            content=uploaded_file,
+        )
+
         return ManagedFile.objects.create(
             website=website,
             uploaded_by=uploaded_by,
@@ -112,6 +144,94 @@ class FileUploadService:
             metadata=metadata or {},
         )
 
+    @classmethod
+    def _create_reference(
+        cls,
+        *,
+        source: ManagedFile,
+        website,
+        uploaded_by,
+        original_filename: str,
+        mime_type: str,
+        file_extension: str,
+        file_kind: str,
+        metadata: dict | None,
+    ) -> ManagedFile | None:
+        """
+        Register an upload that shares ``source``'s stored object.
+
+        Scan results are copied and the source's derivatives are shared
+        too, so neither scanning nor derivative generation runs again.
+        Returns None if the source's object was released meanwhile.
+        """
+
+        blob = FileBlobService.acquire(source)
+        if blob is None:
+            return None
+
+        managed_file = ManagedFile.objects.create(
+            website=website,
+            uploaded_by=uploaded_by,
+            bucket=source.bucket,
+            file=source.file.name,
+            original_filename=original_filename,
+            file_size_bytes=source.file_size_bytes,
+            mime_type=mime_type,
+            file_extension=file_extension,
+            file_kind=file_kind,
+            sha256_hash=source.sha256_hash,
+            storage_key=source.storage_key,
+            blob=blob,
+            lifecycle_status=FileLifecycleStatus.ACTIVE,
+            scan_status=source.scan_status,
+            scan_completed_at=source.scan_completed_at,
+            scan_engine=source.scan_engine,
+            scan_result_detail=source.scan_result_detail,
+            scanned_at=source.scanned_at,
+            width_px=source.width_px,
+            height_px=source.height_px,
+            page_count=source.page_count,
+            duration_seconds=source.duration_seconds,
+            is_public=source.is_public,
+            metadata=metadata or {},
+        )
+
+        derivatives = []
+        for derivative in source.derivatives.filter(
+            lifecycle_status__in=FileBlobService.REUSABLE_LIFECYCLE_STATUSES,
+        ):
+            derivative_blob = FileBlobService.acquire(derivative)
+            if derivative_blob is None:
+                continue
+
+            derivatives.append(ManagedFile(
+                **{
+                    field.attname: getattr(derivative, field.attname)
+                    for field in ManagedFile._meta.concrete_fields
+                    if field.attname not in cls._PER_RECORD_FIELDS
+                },
+                uploaded_by=uploaded_by,
+                parent_file=managed_file,
+                blob=derivative_blob,
+            ))
+
+        ManagedFile.objects.bulk_create(derivatives)
+        return managed_file
+
+    # Fields a shared derivative does not copy from its source.
+    _PER_RECORD_FIELDS = {
+        "id",
+        "uuid",
+        "uploaded_by_id",
+        "parent_file_id",
+        "blob_id",
+        "download_count",
+        "last_accessed_at",
+        "created_at",
+        "updated_at",
+        "deleted_at",
+    }
+
     @staticmethod
     def _get_default_bucket(*, is_public: bool) -> FileBucket:
         bucket_type = "tenant_public" if is_public else "tenant_private"
@@ -15,7 +15,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from django.db.models import Sum, Count
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Greatest
 
 if TYPE_CHECKING:
     pass
@@ -92,6 +93,59 @@ class QuotaService:
             "remaining_bytes": quota.remaining_bytes,
         }
 
+    @classmethod
+    def reserve(
+        cls,
+        website,
+        file_size_bytes: int,
+    ) -> dict:
+        """
+        Claim quota for an upload before its bytes arrive.
+
+        The usage counters are bumped in one conditional UPDATE, so two
+        concurrent reservations cannot both squeeze into the remaining
+        space. Returns the same shape as ``check_upload_allowed``.
+        """
+        from files_management.models.file_quota import FileQuota
+
+        result = cls.check_upload_allowed(website, file_size_bytes)
+        if not result["allowed"]:
+            return result
+
+        reserved = FileQuota.objects.filter(
+            website=website,
+            current_size_bytes__lte=F("max_total_size_bytes") - file_size_bytes,
+            current_files_count__lt=F("max_files_count"),
+        ).update(
+            current_size_bytes=F("current_size_bytes") + file_size_bytes,
+            current_files_count=F("current_files_count") + 1,
+        )
+
+        if not reserved:
+            return {
+                **result,
+                "allowed": False,
+                "reason": "Upload would exceed tenant quota",
+            }
+
+        return result
+
+    @classmethod
+    def release_reservation(
+        cls,
+        website,
+        file_size_bytes: int,
+    ) -> None:
+        """Return quota claimed by ``reserve`` for an upload that never landed."""
+        from files_management.models.file_quota import FileQuota
+
+        FileQuota.objects.filter(website=website).update(
+            current_size_bytes=Greatest(
+                F("current_size_bytes") - file_size_bytes, 0
+            ),
+            current_files_count=Greatest(F("current_files_count") - 1, 0),
+        )
+
     @classmethod
     def recalculate_quota(cls, website) -> dict:
         """
@@ -101,14 +155,25 @@ class QuotaService:
 
         Returns the updated counts.
         """
-        from files_management.enums import FileLifecycleStatus
+        from files_management.enums import (
+            FileLifecycleStatus,
+            UploadSessionStatus,
+        )
         from files_management.models.file_quota import FileQuota
         from files_management.models.managed_file import ManagedFile
+        from files_management.models.upload_session import UploadSession
+
+        # Uploads are charged on arrival, before the virus scan
+        # activates them, so files still processing count as live.
+        live_statuses = [
+            FileLifecycleStatus.ACTIVE,
+            FileLifecycleStatus.PROCESSING,
+        ]
 
-        # Count only active, non-derivative files
+        # Count only live, non-derivative files
         live_files = ManagedFile.objects.filter(
             website=website,
-            lifecycle_status=FileLifecycleStatus.ACTIVE,
+            lifecycle_status__in=live_statuses,
             parent_file__isnull=True, # exclude derivatives
         )
 
@@ -123,11 +188,24 @@ class QuotaService:
         # Also count derivatives (they use quota too)
         derivative_size = ManagedFile.objects.filter(
             website=website,
-            lifecycle_status=FileLifecycleStatus.ACTIVE,
+            lifecycle_status__in=live_statuses,
             parent_file__isnull=False,
         ).aggregate(total=Sum("file_size_bytes"))["total"] or 0
 
-        combined_size = total_size + derivative_size
+        # Quota reserved by direct uploads that have not landed yet
+        reserved = UploadSession.objects.filter(
+            website=website,
+            status__in=[
+                UploadSessionStatus.PENDING,
+                UploadSessionStatus.VERIFYING,
+            ],
+        ).aggregate(
+            total_size=Sum("reserved_bytes"),
+            total_count=Count("id"),
+        )
+        total_count += reserved["total_count"] or 0
+
+        combined_size = total_size + derivative_size + (reserved["total_size"] or 0)
 
         quota, _ = FileQuota.objects.get_or_create(website=website)
         old_size = quota.current_size_bytes
@@ -335,13 +335,18 @@ class StorageService:
         from files_management.models.file_quota import FileQuota
 
         if hard:
-            # Remove from storage
+            from files_management.services.file_blob_service import (
+                FileBlobService,
+            )
+
+            # Remove from storage unless deduplicated uploads still use it
             try:
-                client = cls._get_client(managed_file.bucket)
-                client.delete_object(
-                    Bucket=managed_file.bucket.spaces_bucket_name,
-                    Key=managed_file.storage_key,
-                )
+                if FileBlobService.release(managed_file):
+                    client = cls._get_client(managed_file.bucket)
+                    client.delete_object(
+                        Bucket=managed_file.bucket.spaces_bucket_name,
+                        Key=managed_file.storage_key,
+                    )
             except ClientError as exc:
                 logger.warning(
                     "Spaces delete failed for %s (may already be gone): %s",
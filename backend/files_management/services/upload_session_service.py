@@ -0,0 +1,549 @@
+"""
+UploadSessionService — direct-to-storage multipart uploads.
+
+The client declares the file (name, size, SHA-256), gets presigned part
+URLs and uploads the parts straight to object storage, in parallel if
+it likes. Web workers only issue URLs and bookkeeping:
+
+1. ``start``: validate against FilePolicy, reserve quota, open the
+   multipart upload.
+2. ``presign_parts``: hand out (or refresh) part URLs.
+3. ``complete``: check every part is present and the sizes add up,
+   assemble the object, confirm its stored size and register the
+   ManagedFile as PROCESSING.
+4. ``verify`` (Celery): stream the object, compare its SHA-256 with the
+   declared one and check its sniffed MIME type against FilePolicy, then
+   queue the virus scan — or delete the object and give the quota back
+   on a mismatch.
+
+Sessions never completed, or stuck verifying, are ended by
+``expire_stale``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import mimetypes
+import re
+from datetime import timedelta
+from typing import Any, cast
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from files_management.enums import (
+    FileLifecycleStatus,
+    FileScanStatus,
+    UploadSessionStatus,
+)
+from files_management.exceptions import (
+    FileValidationError,
+    UploadSessionError,
+)
+from files_management.models.managed_file import ManagedFile
+from files_management.models.upload_session import UploadSession
+from files_management.services.file_policy_service import FilePolicyService
+from files_management.services.file_upload_service import FileUploadService
+from files_management.services.quota_service import QuotaService
+from files_management.storage import (
+    FileStoragePathBuilder,
+    MimeTypeDetector,
+    get_multipart_backend,
+)
+from files_management.validators import (
+    MAGIC_READ_SIZE,
+    normalize_filename,
+    sniff_mime_type,
+)
+
+logger = logging.getLogger(__name__)
+
+# Preferred part size; raised for files that would exceed MAX_PARTS.
+PART_SIZE_BYTES = getattr(settings, "FILE_UPLOAD_PART_SIZE", 8 * 1024 * 1024)
+
+# How long a client has to finish uploading.
+SESSION_TTL_SECONDS = getattr(settings, "FILE_UPLOAD_SESSION_TTL_SECONDS", 24 * 3600)
+
+# Lifetime of each presigned part URL.
+PART_URL_EXPIRY_SECONDS = getattr(
+    settings, "FILE_UPLOAD_PART_URL_EXPIRY_SECONDS", 3600
+)
+
+# S3 multipart limits: parts other than the last must be >= 5 MiB.
+MIN_PART_SIZE_BYTES = 5 * 1024 * 1024
+MAX_PARTS = 10_000
+
+# Part URLs issued per request.
+PRESIGN_BATCH_SIZE = 1000
+
+VERIFY_CHUNK_SIZE = 1024 * 1024
+
+# Sessions still verifying this long after completion are failed.
+VERIFY_TIMEOUT_SECONDS = getattr(
+    settings, "FILE_UPLOAD_VERIFY_TIMEOUT_SECONDS", 6 * 3600
+)
+
+_SHA256_RE = re.compile(r"[0-9a-f]{64}")
+
+
+class UploadSessionService:
+    """Direct-to-storage multipart uploads with presigned part URLs."""
+
+    @classmethod
+    def start(
+        cls,
+        *,
+        website,
+        uploaded_by,
+        filename: str,
+        size_bytes: int,
+        sha256: str,
+        purpose: str,
+        is_public: bool = False,
+        mime_type: str | None = None,
+    ) -> UploadSession:
+        """
+        Validate a declared upload, reserve its quota and open a
+        multipart upload for it.
+        """
+
+        if size_bytes <= 0:
+            raise FileValidationError("Declared file size must be positive.")
+
+        sha256 = (sha256 or "").lower()
+        if not _SHA256_RE.fullmatch(sha256):
+            raise FileValidationError(
+                "A hex-encoded SHA-256 checksum is required."
+            )
+
+        original_filename = normalize_filename(filename)
+        file_extension = (
+            original_filename.rsplit(".", 1)[-1].lower()
+            if "." in original_filename
+            else ""
+        )
+        mime_type = (
+            mime_type
+            or mimetypes.guess_type(original_filename)[0]
+            or "application/octet-stream"
+        )
+
+        FilePolicyService.validate_declared_file(
+            website=website,
+            purpose=purpose,
+            filename=original_filename,
+            size_bytes=size_bytes,
+            mime_type=mime_type,
+        )
+
+        bucket = FileUploadService._get_default_bucket(is_public=is_public)
+        storage_key = FileStoragePathBuilder.build_key(
+            website_id=website.id,
+            original_name=original_filename,
+            purpose=purpose,
+        )
+        part_size = cls.part_size_for(size_bytes)
+
+        quota = QuotaService.reserve(website, size_bytes)
+        if not quota["allowed"]:
+            raise FileValidationError(quota["reason"])
+
+        try:
+            upload_id = get_multipart_backend().create(
+                bucket=bucket,
+                storage_key=storage_key,
+                mime_type=mime_type,
+                is_public=is_public,
+            )
+            return UploadSession.objects.create(
+                website=website,
+                uploaded_by=uploaded_by,
+                bucket=bucket,
+                purpose=purpose,
+                is_public=is_public,
+                original_filename=original_filename,
+                mime_type=mime_type,
+                file_extension=file_extension,
+                file_kind=MimeTypeDetector.detect_kind(
+                    mime_type=mime_type,
+                    filename=original_filename,
+                ),
+                expected_size_bytes=size_bytes,
+                expected_sha256=sha256,
+                storage_key=storage_key,
+                backend_upload_id=upload_id,
+                part_size_bytes=part_size,
+                part_count=math.ceil(size_bytes / part_size),
+                reserved_bytes=size_bytes,
+                expires_at=timezone.now() + timedelta(seconds=SESSION_TTL_SECONDS),
+            )
+        except Exception:
+            QuotaService.release_reservation(website, size_bytes)
+            raise
+
+    @classmethod
+    def presign_parts(
+        cls,
+        *,
+        session: UploadSession,
+        part_numbers: list[int] | None = None,
+    ) -> list[dict]:
+        """
+        Return presigned upload URLs for the requested parts, or for the
+        first PRESIGN_BATCH_SIZE parts when none are named.
+        """
+
+        cls._require_open(session)
+
+        if part_numbers is None:
+            part_numbers = list(
+                range(1, min(session.part_count, PRESIGN_BATCH_SIZE) + 1)
+            )
+        if len(part_numbers) > PRESIGN_BATCH_SIZE:
+            raise UploadSessionError(
+                f"At most {PRESIGN_BATCH_SIZE} part URLs can be issued at once."
+            )
+        for number in part_numbers:
+            if not 1 <= number <= session.part_count:
+                raise UploadSessionError(f"Part {number} is out of range.")
+
+        remaining = (session.expires_at - timezone.now()).total_seconds()
+        urls = get_multipart_backend().presign_parts(
+            session,
+            part_numbers,
+            expires_in=max(1, min(PART_URL_EXPIRY_SECONDS, int(remaining))),
+        )
+        return [
+            {"part_number": number, "url": urls[number]}
+            for number in part_numbers
+        ]
+
+    @classmethod
+    def complete(cls, *, session: UploadSession) -> ManagedFile:
+        """
+        Assemble the uploaded parts and register the ManagedFile.
+
+        Missing parts leave the session open so the client can retry
+        them. The checksum is verified afterwards on a worker; the file
+        stays PROCESSING until then.
+        """
+        from files_management.tasks import verify_upload_session
+
+        backend = get_multipart_backend()
+
+        with transaction.atomic():
+            session = (
+                UploadSession.objects
+                .select_for_update()
+                .select_related("bucket", "website")
+                .get(pk=session.pk)
+            )
+            cls._require_open(session)
+
+            parts = {
+                number: part
+                for number, part in backend.list_parts(session).items()
+                if number <= session.part_count
+            }
+            missing = session.part_count - len(parts)
+            if missing:
+                raise UploadSessionError(f"Upload is missing {missing} part(s).")
+            if sum(part["size"] for part in parts.values()) != session.expected_size_bytes:
+                raise UploadSessionError(
+                    "Uploaded parts do not add up to the declared size."
+                )
+
+            backend.complete(session, parts)
+
+            if backend.object_size(session) == session.expected_size_bytes:
+                managed_file = ManagedFile.objects.create(
+                    website=session.website,
+                    uploaded_by=session.uploaded_by,
+                    bucket=session.bucket,
+                    file=session.storage_key,
+                    original_filename=session.original_filename,
+                    file_size_bytes=session.expected_size_bytes,
+                    mime_type=session.mime_type,
+                    file_extension=session.file_extension,
+                    file_kind=session.file_kind,
+                    sha256_hash=session.expected_sha256,
+                    storage_key=session.storage_key,
+                    lifecycle_status=FileLifecycleStatus.PROCESSING,
+                    scan_status=FileScanStatus.NOT_SCANNED,
+                    is_public=session.is_public,
+                )
+                session.managed_file = managed_file
+                session.status = UploadSessionStatus.VERIFYING
+                session.save(update_fields=["managed_file", "status", "updated_at"])
+
+                session_id = session.pk
+                transaction.on_commit(
+                    lambda: cast(Any, verify_upload_session).delay(session_id)
+                )
+                return managed_file
+
+            backend.delete_object(session)
+            cls._close(
+                session,
+                UploadSessionStatus.FAILED,
+                reason="Stored size does not match the declared size.",
+            )
+
+        raise FileValidationError(
+            "Uploaded file size does not match the declared size."
+        )
+
+    @classmethod
+    def verify(cls, session_id: int) -> bool:
+        """
+        Check the assembled object against the declared SHA-256 and the
+        purpose's allowed MIME types, sniffed from its leading bytes.
+
+        On a match the session completes and the virus scan is queued.
+        Otherwise the object and its record are removed and the
+        reserved quota is released.
+        """
+        from files_management.tasks import scan_file_for_viruses
+
+        session = (
+            UploadSession.objects
+            .select_related("bucket", "website", "managed_file")
+            .filter(pk=session_id, status=UploadSessionStatus.VERIFYING)
+            .first()
+        )
+        if session is None:
+            return False
+
+        if session.managed_file is None:
+            with transaction.atomic():
+                cls._discard(
+                    session,
+                    reason="File was removed before verification.",
+                )
+            return False
+
+        backend = get_multipart_backend()
+        hasher = hashlib.sha256()
+        header = b""
+        for chunk in backend.iter_object(session, VERIFY_CHUNK_SIZE):
+            if len(header) < MAGIC_READ_SIZE:
+                header += chunk[:MAGIC_READ_SIZE - len(header)]
+            hasher.update(chunk)
+
+        reason = ""
+        if hasher.hexdigest() != session.expected_sha256:
+            reason = "Checksum does not match the declared SHA-256."
+        else:
+            try:
+                FilePolicyService.validate_mime_type(
+                    mime_type=sniff_mime_type(header, fallback=session.mime_type),
+                    allowed_mime_types=FilePolicyService.get_allowed_mime_types(
+                        website=session.website,
+                        purpose=session.purpose,
+                    ),
+                )
+            except FileValidationError:
+                reason = "Stored content type is not allowed."
+
+        with transaction.atomic():
+            # expire_stale may have failed the session meanwhile
+            if not (
+                UploadSession.objects
+                .select_for_update()
+                .filter(pk=session.pk, status=UploadSessionStatus.VERIFYING)
+                .exists()
+            ):
+                return False
+
+            if reason:
+                logger.warning(
+                    "Upload session %s failed verification (%s); removing %s",
+                    session.uuid,
+                    reason,
+                    session.storage_key,
+                )
+                cls._discard(session, reason=reason)
+                return False
+
+            # The reservation is now the file's own usage.
+            session.status = UploadSessionStatus.COMPLETED
+            session.reserved_bytes = 0
+            session.completed_at = timezone.now()
+            session.save(
+                update_fields=[
+                    "status",
+                    "reserved_bytes",
+                    "completed_at",
+                    "updated_at",
+                ]
+            )
+
+        cast(Any, scan_file_for_viruses).delay(session.managed_file_id)
+        return True
+
+    @classmethod
+    def abort(cls, *, session: UploadSession) -> None:
+        """Cancel an open session, discarding its parts and quota."""
+
+        with transaction.atomic():
+            session = (
+                UploadSession.objects
+                .select_for_update()
+                .select_related("bucket", "website")
+                .get(pk=session.pk)
+            )
+            if session.status != UploadSessionStatus.PENDING:
+                raise UploadSessionError("Only open upload sessions can be aborted.")
+
+            get_multipart_backend().abort(session)
+            cls._close(session, UploadSessionStatus.ABORTED)
+
+    @classmethod
+    def expire_stale(cls) -> int:
+        """
+        Abort open sessions past their expiry and fail sessions that
+        have been verifying for longer than VERIFY_TIMEOUT_SECONDS.
+        Returns the count.
+        """
+
+        backend = get_multipart_backend()
+        now = timezone.now()
+        stale_ids = list(
+            UploadSession.objects
+            .filter(
+                status=UploadSessionStatus.PENDING,
+                expires_at__lte=now,
+            )
+            .values_list("pk", flat=True)
+        )
+        stuck_ids = list(
+            UploadSession.objects
+            .filter(
+                status=UploadSessionStatus.VERIFYING,
+                updated_at__lte=now - timedelta(seconds=VERIFY_TIMEOUT_SECONDS),
+            )
+            .values_list("pk", flat=True)
+        )
+
+        expired = 0
+        for session_id in stale_ids:
+            with transaction.atomic():
+                session = (
+                    UploadSession.objects
+                    .select_for_update(skip_locked=True)
+                    .select_related("bucket", "website")
+                    .filter(pk=session_id, status=UploadSessionStatus.PENDING)
+                    .first()
+                )
+                if session is None:
+                    continue
+
+                try:
+                    backend.abort(session)
+                except Exception as exc:
+                    logger.warning(
+                        "Could not abort expired upload %s: %s",
+                        session.uuid,
+                        exc,
+                    )
+                cls._close(session, UploadSessionStatus.EXPIRED)
+                expired += 1
+
+        for session_id in stuck_ids:
+            with transaction.atomic():
+                session = (
+                    UploadSession.objects
+                    .select_for_update(skip_locked=True)
+                    .select_related("bucket", "website", "managed_file")
+                    .filter(pk=session_id, status=UploadSessionStatus.VERIFYING)
+                    .first()
+                )
+                if session is None:
+                    continue
+
+                try:
+                    cls._discard(
+                        session,
+                        reason="Verification did not finish in time.",
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        "Could not fail stuck upload %s: %s",
+                        session.uuid,
+                        exc,
+                    )
+                    continue
+                expired += 1
+
+        if expired:
+            logger.info("Expired %d stale upload sessions", expired)
+        return expired
+
+    @staticmethod
+    def part_size_for(size_bytes: int) -> int:
+        """Return the part size for a file, keeping within MAX_PARTS."""
+
+        return max(
+            PART_SIZE_BYTES,
+            MIN_PART_SIZE_BYTES,
+            math.ceil(size_bytes / MAX_PARTS),
+        )
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _require_open(session: UploadSession) -> None:
+        if session.status != UploadSessionStatus.PENDING:
+            raise UploadSessionError("Upload session is no longer open.")
+        if session.expires_at <= timezone.now():
+            raise UploadSessionError("Upload session has expired.")
+
+    @classmethod
+    def _discard(cls, session: UploadSession, *, reason: str) -> None:
+        """
+        Fail a verifying session, removing its assembled object and
+        ManagedFile and releasing the reserved quota.
+
+        If the file was already removed, its deletion returned the
+        quota and only the session is closed.
+        """
+
+        managed_file = session.managed_file
+        if managed_file is None:
+            session.reserved_bytes = 0
+        else:
+            get_multipart_backend().delete_object(session)
+
+        session.managed_file = None
+        cls._close(session, UploadSessionStatus.FAILED, reason=reason)
+        if managed_file is not None:
+            managed_file.delete()
+
+    @staticmethod
+    def _close(
+        session: UploadSession,
+        status: str,
+        reason: str = "",
+    ) -> None:
+        """End a session, releasing whatever quota it still holds."""
+
+        if session.reserved_bytes:
+            QuotaService.release_reservation(session.website, session.reserved_bytes)
+
+        session.status = status
+        session.reserved_bytes = 0
+        session.failure_reason = reason
+        session.save(
+            update_fields=[
+                "managed_file",
+                "status",
+                "reserved_bytes",
+                "failure_reason",
+                "updated_at",
+            ]
+        )
@@ -17,6 +17,12 @@ Configuration in settings.py::
     CLAMAV_PORT = 3310
     CLAMAV_TIMEOUT = 60 # seconds per scan
     CLAMAV_ENABLED = True # set False to skip scanning in dev
+    CLAMAV_CHUNK_SIZE = 65536 # bytes per storage read / INSTREAM chunk
+    CLAMAV_POOL_SIZE = 4 # clamd sessions per process
+
+Files are piped from storage to clamd chunk by chunk over pooled
+IDSESSION connections, so scan memory is one chunk per file however
+large the upload is.
 
 If ClamAV is unreachable, the scan is marked as ERROR (not CLEAN).
 Files with ERROR scan status are flagged for manual review.
@@ -25,9 +31,15 @@ Files with ERROR scan status are flagged for manual review.
 from __future__ import annotations
 
 import logging
+import queue
 import socket
 import struct
-from typing import TYPE_CHECKING
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from django.conf import settings
 from django.utils import timezone
@@ -42,7 +54,129 @@ CLAMAV_HOST = getattr(settings, "CLAMAV_HOST", "127.0.0.1")
 CLAMAV_PORT = getattr(settings, "CLAMAV_PORT", 3310)
 CLAMAV_TIMEOUT = getattr(settings, "CLAMAV_TIMEOUT", 60)
 CLAMAV_ENABLED = getattr(settings, "CLAMAV_ENABLED", True)
-CHUNK_SIZE = 8192
+# Bytes read from storage and sent per INSTREAM chunk.
+CHUNK_SIZE = getattr(settings, "CLAMAV_CHUNK_SIZE", 64 * 1024)
+# Open clamd sessions per process; also the batch scan concurrency.
+CLAMAV_POOL_SIZE = getattr(settings, "CLAMAV_POOL_SIZE", 4)
+# Recycle idle sessions before clamd's IdleTimeout (30s default) does.
+CLAMAV_POOL_IDLE_SECONDS = getattr(settings, "CLAMAV_POOL_IDLE_SECONDS", 20)
+
+
+class ClamdSession:
+    """
+    One clamd IDSESSION connection.
+
+    Inside a session clamd keeps the socket open between commands and
+    prefixes each reply with the command's sequence number.
+    """
+
+    def __init__(self):
+        self.sock = socket.create_connection(
+            (CLAMAV_HOST, CLAMAV_PORT),
+            timeout=CLAMAV_TIMEOUT,
+        )
+        self.sock.sendall(b"zIDSESSION\x00")
+        self.last_used = time.monotonic()
+
+    def instream(self, chunks: Iterable[bytes]) -> str:
+        """
+        Stream chunks to clamd and return its verdict line.
+
+        Protocol:
+            1. Send "zINSTREAM\\0"
+            2. Send chunks: [4-byte big-endian length][chunk data]
+            3. Send [0x00 0x00 0x00 0x00] to signal end
+            4. Read response: "<n>: stream: OK\\0" or
+               "<n>: stream: VirusName FOUND\\0"
+        """
+        self.sock.sendall(b"zINSTREAM\x00")
+
+        for chunk in chunks:
+            if chunk:
+                self.sock.sendall(struct.pack("!I", len(chunk)) + chunk)
+
+        self.sock.sendall(struct.pack("!I", 0))
+
+        response = b""
+        while b"\x00" not in response:
+            data = self.sock.recv(4096)
+            if not data:
+                raise ConnectionError("clamd closed the session")
+            response += data
+
+        self.last_used = time.monotonic()
+
+        reply = response.split(b"\x00", 1)[0].decode("utf-8", errors="replace")
+        # strip the session sequence number
+        return reply.split(": ", 1)[-1].strip()
+
+    def is_stale(self) -> bool:
+        if time.monotonic() - self.last_used > CLAMAV_POOL_IDLE_SECONDS:
+            return True
+
+        # a readable idle socket means clamd hung up
+        try:
+            self.sock.setblocking(False)
+            try:
+                return self.sock.recv(1, socket.MSG_PEEK) == b""
+            finally:
+                self.sock.settimeout(CLAMAV_TIMEOUT)
+        except BlockingIOError:
+            return False
+        except OSError:
+            return True
+
+    def close(self) -> None:
+        try:
+            self.sock.sendall(b"zEND\x00")
+        except OSError:
+            pass
+        finally:
+            self.sock.close()
+
+
+class ClamdConnectionPool:
+    """
+    Bounded pool of clamd sessions shared by the threads of a process.
+
+    At most ``size`` sessions exist at once; callers beyond that wait
+    for one to be released. Sessions that fail mid-scan are discarded,
+    never returned.
+    """
+
+    def __init__(self, size: int):
+        self._idle: queue.LifoQueue[ClamdSession] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self) -> ClamdSession:
+        if not self._slots.acquire(timeout=CLAMAV_TIMEOUT):
+            raise TimeoutError("No clamd connection available")
+
+        try:
+            while True:
+                try:
+                    session = self._idle.get_nowait()
+                except queue.Empty:
+                    return ClamdSession()
+
+                if not session.is_stale():
+                    return session
+                session.close()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, session: ClamdSession, *, healthy: bool = True) -> None:
+        if healthy:
+            self._idle.put(session)
+        else:
+            session.close()
+        self._slots.release()
+
+
+@lru_cache(maxsize=1)
+def _shared_pool() -> ClamdConnectionPool:
+    return ClamdConnectionPool(CLAMAV_POOL_SIZE)
 
 
 class VirusScanService:
@@ -61,7 +195,7 @@ class VirusScanService:
                 "engine": "ClamAV",
             }
         """
-        from files_management.enums import FileLifecycleStatus, FileScanStatus
+        from files_management.enums import FileScanStatus
 
         if not CLAMAV_ENABLED:
             logger.info("ClamAV disabled — marking file %s as skipped", managed_file.uuid)
@@ -83,156 +217,193 @@ class VirusScanService:
         managed_file.save(update_fields=["scan_status"])
 
         try:
-            # Get the file bytes
-            file_bytes = cls._get_file_bytes(managed_file)
-            if file_bytes is None:
-                raise RuntimeError("Could not read file bytes")
-
-            # Scan via INSTREAM
-            result = cls._instream_scan(file_bytes)
-
-            if result["clean"]:
-                managed_file.scan_status = FileScanStatus.CLEAN
-                managed_file.lifecycle_status = FileLifecycleStatus.ACTIVE
-            else:
-                managed_file.scan_status = FileScanStatus.INFECTED
-                managed_file.lifecycle_status = FileLifecycleStatus.QUARANTINED
-                logger.warning(
-                    "INFECTED file detected: %s (%s) — %s",
-                    managed_file.uuid,
-                    managed_file.original_filename,
-                    result["detail"],
-                )
+            result = cls._scan_stream(managed_file)
+        except Exception as exc:
+            result = cls._error_result(exc)
 
-            managed_file.scan_completed_at = timezone.now()
-            managed_file.scan_engine = "ClamAV"
-            managed_file.scan_result_detail = result["detail"]
-            managed_file.save(update_fields=[
-                "scan_status",
-                "lifecycle_status",
-                "scan_completed_at",
-                "scan_engine",
-                "scan_result_detail",
-            ])
+        cls._record(managed_file, result)
+        return result
+
+    @classmethod
+    def scan_batch(cls, managed_files: Iterable[ManagedFile]) -> dict:
+        """
+        Scan many files, CLAMAV_POOL_SIZE at a time.
+
+        Storage reads and clamd round-trips run in worker threads; model
+        updates stay on the calling thread so no extra DB connections
+        are opened. Pass files with ``bucket`` already selected.
+
+        Returns {managed_file.pk: result} with the same result shape as
+        scan_file().
+        """
+        from files_management.enums import FileScanStatus
+        from files_management.models import ManagedFile
+
+        managed_files = list(managed_files)
+        if not CLAMAV_ENABLED:
+            return {mf.pk: cls.scan_file(mf) for mf in managed_files}
+
+        ManagedFile.objects.filter(
+            pk__in=[mf.pk for mf in managed_files],
+        ).update(scan_status=FileScanStatus.SCANNING)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=CLAMAV_POOL_SIZE) as executor:
+            futures = {
+                executor.submit(cls._scan_stream, mf): mf
+                for mf in managed_files
+            }
+            for future in as_completed(futures):
+                managed_file = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = cls._error_result(exc)
+
+                cls._record(managed_file, result)
+                results[managed_file.pk] = result
+
+        return results
 
+    @classmethod
+    def _scan_stream(cls, managed_file: ManagedFile) -> dict:
+        """
+        Pipe the stored file into clamd, CHUNK_SIZE bytes at a time.
+
+        Raises if the file yields no bytes, so an empty or unreadable
+        object is reported as a scan error rather than scanned clean.
+        """
+        chunks = cls._iter_file_chunks(managed_file)
+        first = next((chunk for chunk in chunks if chunk), None)
+        if first is None:
+            raise RuntimeError("Could not read file bytes")
+
+        session = _shared_pool().acquire()
+        healthy = False
+        try:
+            result = cls._instream_scan(session, chain([first], chunks))
+            healthy = result["status"] != "scan_error"
             return result
+        finally:
+            _shared_pool().release(session, healthy=healthy)
 
-        except Exception as exc:
+    @classmethod
+    def _record(cls, managed_file: ManagedFile, result: dict) -> None:
+        """Persist a scan result on the model."""
+        from files_management.enums import FileLifecycleStatus, FileScanStatus
+
+        if result["status"] == "scan_error":
             logger.error(
                 "Virus scan error for %s: %s",
                 managed_file.uuid,
-                exc,
+                result["detail"],
             )
             managed_file.scan_status = FileScanStatus.SCANNING
             managed_file.scan_completed_at = timezone.now()
             managed_file.scan_engine = "ClamAV"
-            managed_file.scan_result_detail = str(exc)
+            managed_file.scan_result_detail = result["detail"]
             managed_file.save(update_fields=[
                 "scan_status",
                 "scan_completed_at",
                 "scan_engine",
                 "scan_result_detail",
             ])
-            return {
-                "clean": False,
-                "status": "scan_error",
-                "detail": str(exc),
-                "engine": "ClamAV",
-            }
+            return
+
+        if result["clean"]:
+            managed_file.scan_status = FileScanStatus.CLEAN
+            managed_file.lifecycle_status = FileLifecycleStatus.ACTIVE
+        else:
+            managed_file.scan_status = FileScanStatus.INFECTED
+            managed_file.lifecycle_status = FileLifecycleStatus.QUARANTINED
+            logger.warning(
+                "INFECTED file detected: %s (%s) — %s",
+                managed_file.uuid,
+                managed_file.original_filename,
+                result["detail"],
+            )
+
+        managed_file.scan_completed_at = timezone.now()
+        managed_file.scan_engine = "ClamAV"
+        managed_file.scan_result_detail = result["detail"]
+        managed_file.save(update_fields=[
+            "scan_status",
+            "lifecycle_status",
+            "scan_completed_at",
+            "scan_engine",
+            "scan_result_detail",
+        ])
+
+    @staticmethod
+    def _error_result(exc: Exception) -> dict:
+        return {
+            "clean": False,
+            "status": "scan_error",
+            "detail": str(exc),
+            "engine": "ClamAV",
+        }
 
     @classmethod
-    def _instream_scan(cls, file_bytes: bytes) -> dict:
+    def _instream_scan(cls, session: ClamdSession, chunks: Iterable[bytes]) -> dict:
         """
-        Send bytes to ClamAV via the INSTREAM protocol.
+        Scan a chunk stream on a pooled clamd session.
 
-        Protocol:
-            1. Send "zINSTREAM\\0"
-            2. Send chunks: [4-byte big-endian length][chunk data]
-            3. Send [0x00 0x00 0x00 0x00] to signal end
-            4. Read response: "stream: OK\\0" or "stream: VirusName FOUND\\0"
+        Only one chunk is held in memory at a time.
         """
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(CLAMAV_TIMEOUT)
-
-        try:
-            sock.connect((CLAMAV_HOST, CLAMAV_PORT))
-
-            # Send INSTREAM command
-            sock.sendall(b"zINSTREAM\x00")
+        result_str = session.instream(chunks)
 
-            # Send file in chunks
-            offset = 0
-            while offset < len(file_bytes):
-                chunk = file_bytes[offset:offset + CHUNK_SIZE]
-                chunk_len = struct.pack("!I", len(chunk))
-                sock.sendall(chunk_len + chunk)
-                offset += CHUNK_SIZE
-
-            # Signal end of stream
-            sock.sendall(struct.pack("!I", 0))
-
-            # Read response
-            response = b""
-            while True:
-                data = sock.recv(4096)
-                if not data:
-                    break
-                response += data
-                if b"\x00" in data:
-                    break
-
-            result_str = response.decode("utf-8", errors="replace").strip("\x00").strip()
-
-            if result_str.endswith("OK"):
-                return {
-                    "clean": True,
-                    "status": "clean",
-                    "detail": result_str,
-                    "engine": "ClamAV",
-                }
-            elif "FOUND" in result_str:
-                return {
-                    "clean": False,
-                    "status": "infected",
-                    "detail": result_str,
-                    "engine": "ClamAV",
-                }
-            else:
-                return {
-                    "clean": False,
-                    "status": "scan_error",
-                    "detail": f"Unexpected ClamAV response: {result_str}",
-                    "engine": "ClamAV",
-                }
-
-        finally:
-            sock.close()
+        if result_str.endswith("OK"):
+            return {
+                "clean": True,
+                "status": "clean",
+                "detail": result_str,
+                "engine": "ClamAV",
+            }
+        elif "FOUND" in result_str:
+            return {
+                "clean": False,
+                "status": "infected",
+                "detail": result_str,
+                "engine": "ClamAV",
+            }
+        else:
+            return {
+                "clean": False,
+                "status": "scan_error",
+                "detail": f"Unexpected ClamAV response: {result_str}",
+                "engine": "ClamAV",
+            }
 
     @classmethod
-    def _get_file_bytes(cls, managed_file: ManagedFile) -> bytes | None:
-        """Read the file bytes — from Django's storage backend."""
+    def _iter_file_chunks(cls, managed_file: ManagedFile) -> Iterator[bytes]:
+        """Yield the file in CHUNK_SIZE pieces from Django storage or Spaces."""
+        opened = False
         try:
             if managed_file.file:
                 managed_file.file.open("rb")
-                data = managed_file.file.read()
-                managed_file.file.close()
-                return data
+                opened = True
         except Exception as exc:
-            logger.debug("Could not read file via FileField: %s", exc)
+            logger.debug("Could not open file via FileField: %s", exc)
 
-        # Fallback: download from Spaces via StorageService
-        try:
-            from files_management.services.storage_service import StorageService
+        if opened:
+            try:
+                yield from managed_file.file.chunks(CHUNK_SIZE)
+            finally:
+                managed_file.file.close()
+            return
 
-            client = StorageService._get_client(managed_file.bucket)
-            response = client.get_object(
-                Bucket=managed_file.bucket.spaces_bucket_name,
-                Key=managed_file.storage_key,
-            )
-            return response["Body"].read()
-        except Exception as exc:
-            logger.error("Could not download file for scanning: %s", exc)
-            return None
+        # Fallback: stream from Spaces via StorageService
+        from files_management.services.storage_service import StorageService
+
+        client = StorageService._get_client(managed_file.bucket)
+        body = client.get_object(
+            Bucket=managed_file.bucket.spaces_bucket_name,
+            Key=managed_file.storage_key,
+        )["Body"]
+        try:
+            yield from body.iter_chunks(CHUNK_SIZE)
+        finally:
+            body.close()
 
     @classmethod
     def ping(cls) -> bool:
@@ -4,12 +4,22 @@ Storage helper exports for files_management.
 
 from files_management.storage.backends import FileStorageBackend
 from files_management.storage.mime_type_detector import MimeTypeDetector
+from files_management.storage.multipart import (
+    LocalMultipartBackend,
+    SpacesMultipartBackend,
+    get_multipart_backend,
+)
 from files_management.storage.path_builder import FileStoragePathBuilder
 from files_management.storage.signed_url_builder import SignedUrlBuilder
+from files_management.storage.zip_stream import StreamingZipWriter
 
 __all__ = [
     "FileStorageBackend",
     "FileStoragePathBuilder",
+    "LocalMultipartBackend",
     "MimeTypeDetector",
     "SignedUrlBuilder",
+    "SpacesMultipartBackend",
+    "StreamingZipWriter",
+    "get_multipart_backend",
 ]
\ No newline at end of file
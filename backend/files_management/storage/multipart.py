@@ -0,0 +1,334 @@
+"""
+Multipart upload backends for direct-to-storage uploads.
+
+Clients upload parts straight to object storage through presigned
+URLs; Django only issues the URLs and stitches the parts together
+on completion. ``SpacesMultipartBackend`` talks to DigitalOcean
+Spaces (or any S3-compatible store). ``LocalMultipartBackend`` keeps
+parts in Django's default storage behind a signed-token PUT endpoint
+so tests and local development need no object store.
+
+Select the backend with the ``FILE_MULTIPART_BACKEND`` setting
+("spaces" or "local").
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from collections.abc import Iterator
+from urllib.parse import urlencode
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core import signing
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+
+class SpacesMultipartBackend:
+    """S3 multipart uploads against the session's Spaces bucket."""
+
+    @staticmethod
+    def _client(bucket):
+        from files_management.services.storage_service import StorageService
+
+        return StorageService._get_client(bucket)
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        bucket,
+        storage_key: str,
+        mime_type: str,
+        is_public: bool,
+    ) -> str:
+        """Start a multipart upload and return its upload ID."""
+
+        params: dict = {
+            "Bucket": bucket.spaces_bucket_name,
+            "Key": storage_key,
+            "ContentType": mime_type,
+        }
+        if is_public:
+            params["ACL"] = "public-read"
+
+        response = cls._client(bucket).create_multipart_upload(**params)
+        return response["UploadId"]
+
+    @classmethod
+    def presign_parts(
+        cls,
+        session,
+        part_numbers,
+        *,
+        expires_in: int,
+    ) -> dict[int, str]:
+        """Return a presigned PUT URL per part number."""
+
+        client = cls._client(session.bucket)
+        return {
+            part_number: client.generate_presigned_url(
+                "upload_part",
+                Params={
+                    "Bucket": session.bucket.spaces_bucket_name,
+                    "Key": session.storage_key,
+                    "UploadId": session.backend_upload_id,
+                    "PartNumber": part_number,
+                },
+                ExpiresIn=expires_in,
+            )
+            for part_number in part_numbers
+        }
+
+    @classmethod
+    def list_parts(cls, session) -> dict[int, dict]:
+        """Return {part_number: {"etag", "size"}} for uploaded parts."""
+
+        paginator = cls._client(session.bucket).get_paginator("list_parts")
+        parts = {}
+        for page in paginator.paginate(
+            Bucket=session.bucket.spaces_bucket_name,
+            Key=session.storage_key,
+            UploadId=session.backend_upload_id,
+        ):
+            for part in page.get("Parts", []):
+                parts[part["PartNumber"]] = {
+                    "etag": part["ETag"],
+                    "size": part["Size"],
+                }
+        return parts
+
+    @classmethod
+    def complete(cls, session, parts: dict[int, dict]) -> None:
+        """Assemble the listed parts into the final object."""
+
+        cls._client(session.bucket).complete_multipart_upload(
+            Bucket=session.bucket.spaces_bucket_name,
+            Key=session.storage_key,
+            UploadId=session.backend_upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": number, "ETag": parts[number]["etag"]}
+                    for number in sorted(parts)
+                ],
+            },
+        )
+
+    @classmethod
+    def abort(cls, session) -> None:
+        """Discard uploaded parts. Already finished uploads are ignored."""
+
+        try:
+            cls._client(session.bucket).abort_multipart_upload(
+                Bucket=session.bucket.spaces_bucket_name,
+                Key=session.storage_key,
+                UploadId=session.backend_upload_id,
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
+
+    @classmethod
+    def object_size(cls, session) -> int | None:
+        """Return the assembled object's size, or None if it is missing."""
+
+        try:
+            response = cls._client(session.bucket).head_object(
+                Bucket=session.bucket.spaces_bucket_name,
+                Key=session.storage_key,
+            )
+        except ClientError:
+            return None
+        return int(response["ContentLength"])
+
+    @classmethod
+    def iter_object(cls, session, chunk_size: int) -> Iterator[bytes]:
+        """Stream the assembled object."""
+
+        response = cls._client(session.bucket).get_object(
+            Bucket=session.bucket.spaces_bucket_name,
+            Key=session.storage_key,
+        )
+        yield from response["Body"].iter_chunks(chunk_size)
+
+    @classmethod
+    def delete_object(cls, session) -> None:
+        """Remove the assembled object."""
+
+        cls._client(session.bucket).delete_object(
+            Bucket=session.bucket.spaces_bucket_name,
+            Key=session.storage_key,
+        )
+
+
+class LocalMultipartBackend:
+    """
+    Multipart stand-in backed by Django's default storage.
+
+    Part URLs point at the local part endpoint and carry a signed,
+    expiring token instead of an S3 signature. Meant for tests and
+    local development only: here the part bytes do pass through Django.
+    """
+
+    PART_PREFIX = "upload-parts"
+    TOKEN_SALT = "files_management.upload-part"
+
+    @staticmethod
+    def create(
+        *,
+        bucket,
+        storage_key: str,
+        mime_type: str,
+        is_public: bool,
+    ) -> str:
+        """Return a fresh upload ID; nothing is stored until parts arrive."""
+
+        return get_random_string(32)
+
+    @classmethod
+    def presign_parts(
+        cls,
+        session,
+        part_numbers,
+        *,
+        expires_in: int,
+    ) -> dict[int, str]:
+        """Return a signed local PUT URL per part number."""
+
+        expires_at = int(time.time()) + expires_in
+        urls = {}
+        for part_number in part_numbers:
+            token = signing.dumps(
+                [str(session.uuid), part_number, expires_at],
+                salt=cls.TOKEN_SALT,
+            )
+            path = reverse(
+                "file-upload-session-local-part",
+                kwargs={
+                    "session_uuid": session.uuid,
+                    "part_number": part_number,
+                },
+            )
+            urls[part_number] = f"{path}?{urlencode({'token': token})}"
+        return urls
+
+    @classmethod
+    def is_valid_token(cls, session, part_number: int, token: str) -> bool:
+        """Return whether ``token`` authorises this part's upload."""
+
+        try:
+            session_uuid, signed_part, expires_at = signing.loads(
+                token,
+                salt=cls.TOKEN_SALT,
+            )
+        except (signing.BadSignature, TypeError, ValueError):
+            return False
+
+        return (
+            session_uuid == str(session.uuid)
+            and signed_part == part_number
+            and expires_at >= time.time()
+        )
+
+    @classmethod
+    def _part_dir(cls, session) -> str:
+        return f"{cls.PART_PREFIX}/{session.backend_upload_id}"
+
+    @classmethod
+    def _part_name(cls, session, part_number: int) -> str:
+        return f"{cls._part_dir(session)}/{part_number:05d}"
+
+    @classmethod
+    def save_part(cls, session, part_number: int, content) -> int:
+        """Store (or replace) one part and return its size."""
+
+        name = cls._part_name(session, part_number)
+        if default_storage.exists(name):
+            default_storage.delete(name)
+        default_storage.save(name, File(content, name=name))
+        return default_storage.size(name)
+
+    @classmethod
+    def list_parts(cls, session) -> dict[int, dict]:
+        """Return {part_number: {"etag", "size"}} for uploaded parts."""
+
+        try:
+            _dirs, files = default_storage.listdir(cls._part_dir(session))
+        except FileNotFoundError:
+            return {}
+
+        parts = {}
+        for filename in files:
+            if not filename.isdigit():
+                continue
+            name = f"{cls._part_dir(session)}/{filename}"
+            parts[int(filename)] = {
+                "etag": filename,
+                "size": default_storage.size(name),
+            }
+        return parts
+
+    @classmethod
+    def complete(cls, session, parts: dict[int, dict]) -> None:
+        """Concatenate the parts into the final object and drop them."""
+
+        with tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024) as assembled:
+            for number in sorted(parts):
+                with default_storage.open(cls._part_name(session, number), "rb") as part:
+                    for chunk in iter(lambda: part.read(1024 * 1024), b""):
+                        assembled.write(chunk)
+            assembled.seek(0)
+            default_storage.save(
+                session.storage_key,
+                File(assembled, name=session.storage_key),
+            )
+
+        cls.abort(session)
+
+    @classmethod
+    def abort(cls, session) -> None:
+        """Delete any stored parts."""
+
+        for number in cls.list_parts(session):
+            default_storage.delete(cls._part_name(session, number))
+
+    @staticmethod
+    def object_size(session) -> int | None:
+        """Return the assembled object's size, or None if it is missing."""
+
+        if not default_storage.exists(session.storage_key):
+            return None
+        return default_storage.size(session.storage_key)
+
+    @staticmethod
+    def iter_object(session, chunk_size: int) -> Iterator[bytes]:
+        """Stream the assembled object."""
+
+        with default_storage.open(session.storage_key, "rb") as stored:
+            yield from iter(lambda: stored.read(chunk_size), b"")
+
+    @staticmethod
+    def delete_object(session) -> None:
+        """Remove the assembled object."""
+
+        default_storage.delete(session.storage_key)
+
+
+MULTIPART_BACKENDS = {
+    "spaces": SpacesMultipartBackend,
+    "local": LocalMultipartBackend,
+}
+
+
+def get_multipart_backend():
+    """Return the backend named by ``FILE_MULTIPART_BACKEND``."""
+
+    name = getattr(settings, "FILE_MULTIPART_BACKEND", "spaces")
+    try:
+        return MULTIPART_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown FILE_MULTIPART_BACKEND '{name}'.") from None
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+
+# Formats that are already compressed; deflating them again costs CPU
+# and saves next to nothing.
+STORED_EXTENSIONS = {
+    ".pdf",
+    ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp", ".epub",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic",
+    ".mp3", ".m4a", ".mp4", ".mov", ".webm",
+    ".zip", ".rar", ".7z", ".gz", ".bz2", ".xz",
+}
+
+_ZIP64_LIMIT = 0xFFFFFFFF
+_ZIP64_COUNT_LIMIT = 0xFFFF
+_ZIP64_VERSION = 45
+_MADE_BY_UNIX = (3 << 8) | _ZIP64_VERSION
+
+_FLAG_DATA_DESCRIPTOR = 0x0008
+_FLAG_UTF8 = 0x0800
+
+_METHOD_STORED = 0
+_METHOD_DEFLATED = 8
+
+
+@dataclass
+class _Entry:
+    name: bytes
+    method: int
+    dos_time: int
+    dos_date: int
+    offset: int
+    crc: int = 0
+    compressed_size: int = 0
+    size: int = 0
+
+
+class StreamingZipWriter:
+    """
+    Builds a ZIP archive as a stream of byte chunks.
+
+    Each entry is written as a local header, its data chunk by chunk,
+    and a ZIP64 data descriptor carrying the CRC and sizes. Sizes are
+    never needed up front, so nothing is buffered beyond one chunk and
+    the first bytes go out before the first file is fully read.
+
+    Usage:
+        writer = StreamingZipWriter()
+        for name, chunks in files:
+            yield from writer.add(name, chunks)
+        yield from writer.close()
+    """
+
+    def __init__(self, *, compresslevel: int = 6):
+        self.compresslevel = compresslevel
+        self._entries: list[_Entry] = []
+        self._offset = 0
+
+    @staticmethod
+    def should_compress(name: str) -> bool:
+        return Path(name).suffix.lower() not in STORED_EXTENSIONS
+
+    def add(
+        self,
+        name: str,
+        chunks: Iterable[bytes],
+        *,
+        compress: bool | None = None,
+        modified: datetime | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Yield one archive entry. compress defaults to should_compress(name).
+        """
+
+        if compress is None:
+            compress = self.should_compress(name)
+
+        dos_time, dos_date = self._dos_timestamp(modified or datetime.now())
+        entry = _Entry(
+            name=name.encode("utf-8"),
+            method=_METHOD_DEFLATED if compress else _METHOD_STORED,
+            dos_time=dos_time,
+            dos_date=dos_date,
+            offset=self._offset,
+        )
+
+        # sizes live in the data descriptor; the ZIP64 extra marks
+        # them as 64-bit
+        yield self._emit(
+            struct.pack(
+                "<IHHHHHIIIHH",
+                0x04034B50,
+                _ZIP64_VERSION,
+                _FLAG_DATA_DESCRIPTOR | _FLAG_UTF8,
+                entry.method,
+                entry.dos_time,
+                entry.dos_date,
+                0,
+                _ZIP64_LIMIT,
+                _ZIP64_LIMIT,
+                len(entry.name),
+                20,
+            )
+            + entry.name
+            + struct.pack("<HHQQ", 0x0001, 16, 0, 0)
+        )
+
+        compressor = (
+            zlib.compressobj(self.compresslevel, zlib.DEFLATED, -15)
+            if compress
+            else None
+        )
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            entry.crc = zlib.crc32(chunk, entry.crc)
+            entry.size += len(chunk)
+
+            if compressor:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    continue
+
+            entry.compressed_size += len(chunk)
+            yield self._emit(chunk)
+
+        if compressor:
+            tail = compressor.flush()
+            entry.compressed_size += len(tail)
+            yield self._emit(tail)
+
+        yield self._emit(
+            struct.pack(
+                "<IIQQ",
+                0x08074B50,
+                entry.crc,
+                entry.compressed_size,
+                entry.size,
+            )
+        )
+
+        self._entries.append(entry)
+
+    def close(self) -> Iterator[bytes]:
+        """
+        Yield the central directory and end records.
+        """
+
+        directory_offset = self._offset
+
+        for entry in self._entries:
+            yield self._emit(self._central_record(entry))
+
+        directory_size = self._offset - directory_offset
+        count = len(self._entries)
+
+        if (
+            count >= _ZIP64_COUNT_LIMIT
+            or directory_size >= _ZIP64_LIMIT
+            or directory_offset >= _ZIP64_LIMIT
+        ):
+            zip64_end_offset = self._offset
+            yield self._emit(
+                struct.pack(
+                    "<IQHHIIQQQQ",
+                    0x06064B50,
+                    44,
+                    _ZIP64_VERSION,
+                    _ZIP64_VERSION,
+                    0,
+                    0,
+                    count,
+                    count,
+                    directory_size,
+                    directory_offset,
+                )
+            )
+            yield self._emit(
+                struct.pack("<IIQI", 0x07064B50, 0, zip64_end_offset, 1)
+            )
+
+        yield self._emit(
+            struct.pack(
+                "<IHHHHIIH",
+                0x06054B50,
+                0,
+                0,
+                min(count, _ZIP64_COUNT_LIMIT),
+                min(count, _ZIP64_COUNT_LIMIT),
+                min(directory_size, _ZIP64_LIMIT),
+                min(directory_offset, _ZIP64_LIMIT),
+                0,
+            )
+        )
+
+    # -------------------------
+    # Internals
+    # -------------------------
+
+    def _emit(self, data: bytes) -> bytes:
+        self._offset += len(data)
+        return data
+
+    @staticmethod
+    def _central_record(entry: _Entry) -> bytes:
+        # 32-bit fields that overflow move into the ZIP64 extra, in
+        # this order
+        zip64 = [
+            value
+            for value in (entry.size, entry.compressed_size, entry.offset)
+            if value >= _ZIP64_LIMIT
+        ]
+        extra = (
+            struct.pack("<HH", 0x0001, 8 * len(zip64))
+            + struct.pack(f"<{len(zip64)}Q", *zip64)
+            if zip64
+            else b""
+        )
+
+        return (
+            struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                0x02014B50,
+                _MADE_BY_UNIX,
+                _ZIP64_VERSION,
+                _FLAG_DATA_DESCRIPTOR | _FLAG_UTF8,
+                entry.method,
+                entry.dos_time,
+                entry.dos_date,
+                entry.crc,
+                min(entry.compressed_size, _ZIP64_LIMIT),
+                min(entry.size, _ZIP64_LIMIT),
+                len(entry.name),
+                len(extra),
+                0,
+                0,
+                0,
+                0o100644 << 16,  # regular file, rw-r--r--
+                min(entry.offset, _ZIP64_LIMIT),
+            )
+            + entry.name
+            + extra
+        )
+
+    @staticmethod
+    def _dos_timestamp(value: datetime) -> tuple[int, int]:
+        if value.year < 1980:
+            value = datetime(1980, 1, 1)
+        return (
+            (value.hour << 11) | (value.minute << 5) | (value.second // 2),
+            ((value.year - 1980) << 9) | (value.month << 5) | value.day,
+        )
@@ -1,7 +1,13 @@
 from files_management.tasks.derivative_tasks import generate_derivatives
-from files_management.tasks.scan_tasks import scan_file_for_viruses
+from files_management.tasks.scan_tasks import (
+    scan_file_for_viruses,
+    scan_files_for_viruses_batch,
+)
+from files_management.tasks.upload_tasks import verify_upload_session
 
 __all__ = [
     "generate_derivatives",
     "scan_file_for_viruses",
+    "scan_files_for_viruses_batch",
+    "verify_upload_session",
 ]
\ No newline at end of file
@@ -99,4 +99,17 @@ def cleanup_expired_files():
         "expired_deleted": expired_count,
         "soft_deleted_purged": soft_count,
         "quarantined_deleted": quarantine_count,
-    }
\ No newline at end of file
+    }
+
+
+@shared_task
+def expire_upload_sessions():
+    """
+    Abort direct upload sessions that were never completed and release
+    the quota they reserved. Run hourly via Celery beat.
+    """
+    from files_management.services.upload_session_service import (
+        UploadSessionService,
+    )
+
+    return {"expired": UploadSessionService.expire_stale()}
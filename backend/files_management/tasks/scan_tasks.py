@@ -49,4 +49,57 @@ def scan_file_for_viruses(self, managed_file_id: int) -> None:
             "Virus scan failed for ManagedFile %s.",
             managed_file_id,
         )
-        raise self.retry(exc=exc) from exc
\ No newline at end of file
+        raise self.retry(exc=exc) from exc
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def scan_files_for_viruses_batch(self, managed_file_ids: list[int]) -> dict:
+    """
+    Scan several managed files through ClamAV concurrently.
+
+    Concurrency is bounded by CLAMAV_POOL_SIZE; each file is streamed
+    from storage so memory stays at one chunk per in-flight scan.
+    Files that hit a scan error are retried as a smaller batch.
+    """
+    from files_management.services.virus_scan_service import VirusScanService
+    from files_management.tasks.scanning import _notify_infected_file
+
+    managed_files = {
+        managed_file.pk: managed_file
+        for managed_file in (
+            ManagedFile.objects
+            .filter(pk__in=managed_file_ids)
+            .exclude(lifecycle_status=FileLifecycleStatus.DELETED)
+            .select_related("bucket", "website", "uploaded_by")
+        )
+    }
+
+    results = VirusScanService.scan_batch(managed_files.values())
+
+    infected = [
+        pk for pk, result in results.items()
+        if result["status"] == "infected"
+    ]
+    for pk in infected:
+        _notify_infected_file(managed_files[pk], results[pk])
+
+    failed = [
+        pk for pk, result in results.items()
+        if result["status"] == "scan_error"
+    ]
+    if failed:
+        logger.warning(
+            "Virus scan batch: %s of %s files failed to scan.",
+            len(failed),
+            len(results),
+        )
+        raise self.retry(
+            args=[failed],
+            kwargs={},
+            exc=RuntimeError(results[failed[0]]["detail"]),
+        )
+
+    return {
+        "scanned": len(results),
+        "infected": infected,
+    }
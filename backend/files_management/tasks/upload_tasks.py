@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def verify_upload_session(self, session_id: int) -> None:
+    """
+    Verify the SHA-256 of a completed direct upload.
+
+    Streams the object from storage on the worker so the web process
+    never reads the file bytes.
+    """
+    from files_management.services.upload_session_service import (
+        UploadSessionService,
+    )
+
+    try:
+        UploadSessionService.verify(session_id)
+    except Exception as exc:
+        logger.exception(
+            "Checksum verification failed for UploadSession %s.",
+            session_id,
+        )
+        raise self.retry(exc=exc)
@@ -0,0 +1,89 @@
+from io import BytesIO
+from unittest import mock
+
+from django.test import TestCase
+from PIL import Image
+
+from files_management.enums import BucketType, FileKind
+from files_management.models import ManagedFile
+from files_management.models.file_bucket import FileBucket
+from files_management.services.derivative_service import (
+    THUMBNAIL_SIZES,
+    DerivativeService,
+)
+from websites.models.websites import Website
+
+
+class DerivativeServiceTests(TestCase):
+    """
+    Tests for the single-decode image derivative pipeline.
+    """
+
+    def setUp(self) -> None:
+        self.website = Website.objects.create(
+            name="Gradecrest",
+            domain="gradecrest.test",
+        )
+        bucket = FileBucket.objects.create(
+            name="derivative-tests",
+            bucket_type=BucketType.TENANT_PRIVATE,
+            spaces_bucket_name="derivative-tests",
+        )
+
+        buffer = BytesIO()
+        Image.new("RGB", (1600, 1200), "teal").save(buffer, format="JPEG")
+        self.image_bytes = buffer.getvalue()
+
+        self.managed_file = ManagedFile.objects.create(
+            website=self.website,
+            bucket=bucket,
+            storage_key="uploads/website-1/cover.jpg",
+            original_filename="cover.jpg",
+            file_size_bytes=len(self.image_bytes),
+            mime_type="image/jpeg",
+            file_extension="jpg",
+            file_kind=FileKind.IMAGE,
+            sha256_hash="0" * 64,
+        )
+
+    def _generate(self):
+        client = mock.Mock()
+        with mock.patch.object(
+            DerivativeService,
+            "_read_file_bytes",
+            return_value=self.image_bytes,
+        ) as read, mock.patch(
+            "files_management.services.storage_service.StorageService._get_client",
+            return_value=client,
+        ):
+            derivatives = DerivativeService.generate_all(self.managed_file)
+        return derivatives, read, client
+
+    def test_reads_source_once_for_every_output(self) -> None:
+        derivatives, read, client = self._generate()
+
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual(client.put_object.call_count, len(THUMBNAIL_SIZES) + 1)
+        self.assertEqual(
+            set(
+                ManagedFile.objects
+                .filter(parent_file=self.managed_file)
+                .values_list("derivative_type", flat=True)
+            ),
+            {*THUMBNAIL_SIZES, "webp"},
+        )
+
+        dimensions = {
+            d.derivative_type: (d.width_px, d.height_px) for d in derivatives
+        }
+        self.assertEqual(dimensions["webp"], (1600, 1200))
+        self.assertEqual(dimensions["thumbnail_lg"], (800, 600))
+        self.assertEqual(dimensions["thumbnail_md"], (400, 300))
+
+    def test_skips_existing_derivatives_without_reading_source(self) -> None:
+        self._generate()
+
+        derivatives, read, _ = self._generate()
+
+        self.assertEqual(derivatives, [])
+        read.assert_not_called()
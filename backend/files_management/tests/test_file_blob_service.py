@@ -0,0 +1,185 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from files_management.enums import (
+    BucketType,
+    FileLifecycleStatus,
+    FilePurpose,
+    FileScanStatus,
+)
+from files_management.models import FileBlob
+from files_management.models.file_bucket import FileBucket
+from files_management.models.managed_file import ManagedFile
+from files_management.services import FileBlobService, FileUploadService
+from files_management.services.storage_service import StorageService
+from websites.models.websites import Website
+
+
+DOCX = (
+    "application/vnd.openxmlformats-officedocument."
+    "wordprocessingml.document"
+)
+
+
+@override_settings(DEFAULT_FILE_STORAGE="django.core.files.storage.InMemoryStorage")
+class FileBlobServiceTests(TestCase):
+    """
+    Tests for content-addressed upload deduplication.
+    """
+
+    def setUp(self) -> None:
+        self.website = Website.objects.create(
+            name="Gradecrest",
+            domain="gradecrest.test",
+        )
+        self.user = get_user_model().objects.create_user(
+            email="client@example.com",
+            password="pass",
+            website=self.website,
+        )
+        FileBucket.objects.create(
+            name="dedup-tests",
+            bucket_type=BucketType.TENANT_PRIVATE,
+            spaces_bucket_name="dedup-tests",
+        )
+
+    def _upload(
+        self,
+        name: str = "rubric.docx",
+        content: bytes = b"rubric",
+        user=None,
+    ):
+        return FileUploadService.upload_file(
+            website=self.website,
+            uploaded_by=user or self.user,
+            uploaded_file=SimpleUploadedFile(name, content, content_type=DOCX),
+            purpose=FilePurpose.ORDER_INSTRUCTION,
+        )
+
+    def _mark_clean(self, managed_file) -> None:
+        managed_file.scan_status = FileScanStatus.CLEAN
+        managed_file.save(update_fields=["scan_status"])
+
+    def _thumbnail(self, parent):
+        storage_key = f"{parent.storage_key}.webp"
+        return ManagedFile.objects.create(
+            website=self.website,
+            bucket=parent.bucket,
+            file=storage_key,
+            storage_key=storage_key,
+            original_filename="thumbnail.webp",
+            file_size_bytes=10,
+            mime_type="image/webp",
+            file_extension="webp",
+            file_kind=parent.file_kind,
+            sha256_hash="0" * 64,
+            parent_file=parent,
+            derivative_type="webp",
+            lifecycle_status=FileLifecycleStatus.ACTIVE,
+            scan_status=FileScanStatus.SKIPPED,
+        )
+
+    def test_identical_clean_upload_shares_stored_object(self) -> None:
+        original = self._upload()
+        self._mark_clean(original)
+
+        duplicate = self._upload(name="rubric-copy.docx")
+
+        self.assertNotEqual(duplicate.pk, original.pk)
+        self.assertEqual(duplicate.storage_key, original.storage_key)
+        self.assertEqual(duplicate.scan_status, FileScanStatus.CLEAN)
+        self.assertEqual(duplicate.original_filename, "rubric-copy.docx")
+        self.assertEqual(duplicate.blob.reference_count, 2)
+
+    def test_unscanned_content_is_stored_again(self) -> None:
+        original = self._upload()
+
+        duplicate = self._upload()
+
+        self.assertNotEqual(duplicate.storage_key, original.storage_key)
+        self.assertIsNone(duplicate.blob)
+
+    def test_other_uploaders_content_is_stored_again(self) -> None:
+        original = self._upload()
+        self._mark_clean(original)
+        other = get_user_model().objects.create_user(
+            email="other@example.com",
+            password="pass",
+            website=self.website,
+        )
+
+        duplicate = self._upload(user=other)
+
+        self.assertNotEqual(duplicate.storage_key, original.storage_key)
+        self.assertEqual(duplicate.scan_status, FileScanStatus.NOT_SCANNED)
+        self.assertIsNone(duplicate.blob)
+
+    def test_only_last_release_frees_the_object(self) -> None:
+        original = self._upload()
+        self._mark_clean(original)
+        duplicate = self._upload()
+        original.refresh_from_db()
+
+        self.assertFalse(FileBlobService.release(original))
+        self.assertEqual(FileBlob.objects.get().reference_count, 1)
+
+        # a released row never frees an object still referenced
+        self.assertFalse(FileBlobService.release(original))
+
+        self.assertTrue(FileBlobService.release(duplicate))
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_derivatives_are_shared_not_regenerated(self) -> None:
+        original = self._upload()
+        self._mark_clean(original)
+        thumbnail = self._thumbnail(original)
+
+        duplicate = self._upload()
+
+        shared = duplicate.derivatives.get()
+        thumbnail.refresh_from_db()
+        self.assertNotEqual(shared.pk, thumbnail.pk)
+        self.assertEqual(shared.storage_key, thumbnail.storage_key)
+        self.assertEqual(shared.derivative_type, "webp")
+        self.assertEqual(shared.uploaded_by, self.user)
+        self.assertEqual(shared.blob, thumbnail.blob)
+        self.assertEqual(shared.blob.reference_count, 2)
+
+    def test_released_source_is_not_reused(self) -> None:
+        original = self._upload()
+        self._mark_clean(original)
+        self.assertTrue(FileBlobService.release(original))
+
+        self.assertIsNone(FileBlobService.acquire(original))
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_hard_delete_removes_object_with_last_reference(self) -> None:
+        original = self._upload()
+        self._mark_clean(original)
+        self._thumbnail(original)
+        duplicate = self._upload()
+        shared_thumbnail = duplicate.derivatives.get()
+
+        with mock.patch.object(StorageService, "_get_client") as get_client:
+            StorageService.delete(original, hard=True)
+
+            get_client.return_value.delete_object.assert_not_called()
+            self.assertEqual(
+                sorted(FileBlob.objects.values_list("reference_count", flat=True)),
+                [1, 1],
+            )
+
+            StorageService.delete(duplicate, hard=True)
+
+        self.assertEqual(
+            get_client.return_value.delete_object.call_args_list,
+            [
+                mock.call(Bucket="dedup-tests", Key=duplicate.storage_key),
+                mock.call(Bucket="dedup-tests", Key=shared_thumbnail.storage_key),
+            ],
+        )
+        self.assertFalse(FileBlob.objects.exists())
+        self.assertFalse(ManagedFile.objects.exists())
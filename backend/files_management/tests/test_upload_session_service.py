@@ -0,0 +1,232 @@
+import hashlib
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from wagtail.models import Locale, Page, Site
+
+from files_management.enums import (
+    BucketType,
+    FileLifecycleStatus,
+    FilePurpose,
+    UploadSessionStatus,
+)
+from files_management.exceptions import FileValidationError, UploadSessionError
+from files_management.models import ManagedFile, UploadSession
+from files_management.models.file_bucket import FileBucket
+from files_management.models.file_quota import FileQuota
+from files_management.services import UploadSessionService
+from files_management.services.quota_service import QuotaService
+from files_management.services.upload_session_service import PART_SIZE_BYTES
+from websites.models.websites import Website
+
+
+DOCX = (
+    "application/vnd.openxmlformats-officedocument."
+    "wordprocessingml.document"
+)
+
+
+@override_settings(
+    DEFAULT_FILE_STORAGE="django.core.files.storage.InMemoryStorage",
+    FILE_MULTIPART_BACKEND="local",
+)
+class UploadSessionServiceTests(TestCase):
+    """
+    Tests for direct multipart uploads against the local backend.
+    """
+
+    def setUp(self) -> None:
+        self.client_api = APIClient()
+        self.website = Website.objects.create(
+            name="Gradecrest",
+            domain="gradecrest.test",
+        )
+        self.user = get_user_model().objects.create_user(
+            email="client@example.com",
+            password="pass",
+            website=self.website,
+        )
+        self.client_api.force_authenticate(self.user)
+        # No migrations run in tests, so there is no default Wagtail site
+        Locale.objects.get_or_create(language_code="en")
+        root = (
+            Page.objects.filter(depth=1).first()
+            or Page.add_root(title="Root", slug="root")
+        )
+        site = Site.objects.create(hostname="gradecrest.test", root_page=root)
+        self.quota = FileQuota.objects.create(
+            site=site,
+            website=self.website,
+        )
+        FileBucket.objects.create(
+            name="direct-upload-tests",
+            bucket_type=BucketType.TENANT_PRIVATE,
+            spaces_bucket_name="direct-upload-tests",
+        )
+
+    def _start(self, content: bytes, sha256: str | None = None) -> UploadSession:
+        return UploadSessionService.start(
+            website=self.website,
+            uploaded_by=self.user,
+            filename="thesis.docx",
+            size_bytes=len(content),
+            sha256=sha256 or hashlib.sha256(content).hexdigest(),
+            purpose=FilePurpose.ORDER_INSTRUCTION,
+            mime_type=DOCX,
+        )
+
+    def _put_parts(self, session: UploadSession, content: bytes) -> None:
+        for part in UploadSessionService.presign_parts(session=session):
+            offset = (part["part_number"] - 1) * session.part_size_bytes
+            response = self.client_api.generic(
+                "PUT",
+                part["url"],
+                content[offset:offset + session.part_size_bytes],
+                content_type="application/octet-stream",
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_parts_assemble_into_verified_file(self) -> None:
+        content = b"chapter" * (PART_SIZE_BYTES // 7 + 100)
+        session = self._start(content)
+        self.quota.refresh_from_db()
+
+        self.assertEqual(session.part_count, 2)
+        self.assertEqual(self.quota.current_size_bytes, len(content))
+
+        self._put_parts(session, content)
+        with self.captureOnCommitCallbacks():
+            response = self.client_api.post(
+                reverse(
+                    "file-upload-session-complete",
+                    kwargs={"session_uuid": session.uuid},
+                )
+            )
+        self.assertEqual(response.status_code, 202)
+
+        managed_file = ManagedFile.objects.get(pk=response.data["file_id"])
+        self.assertEqual(managed_file.lifecycle_status, FileLifecycleStatus.PROCESSING)
+        self.assertEqual(managed_file.file_size_bytes, len(content))
+
+        with mock.patch("files_management.tasks.scan_file_for_viruses.delay") as scan:
+            self.assertTrue(UploadSessionService.verify(session.pk))
+
+        scan.assert_called_once_with(managed_file.pk)
+        session.refresh_from_db()
+        self.quota.refresh_from_db()
+        self.assertEqual(session.status, UploadSessionStatus.COMPLETED)
+        self.assertEqual(session.reserved_bytes, 0)
+        self.assertEqual(self.quota.current_size_bytes, len(content))
+        self.assertEqual(self.quota.current_files_count, 1)
+
+        # Until the scan activates it, recalculation still charges the file
+        QuotaService.recalculate_quota(self.website)
+        self.quota.refresh_from_db()
+        self.assertEqual(self.quota.current_size_bytes, len(content))
+        self.assertEqual(self.quota.current_files_count, 1)
+
+    def test_checksum_mismatch_removes_file_and_releases_quota(self) -> None:
+        content = b"rubric"
+        session = self._start(content, sha256="0" * 64)
+        self._put_parts(session, content)
+
+        managed_file = UploadSessionService.complete(session=session)
+
+        self.assertFalse(UploadSessionService.verify(session.pk))
+        session.refresh_from_db()
+        self.quota.refresh_from_db()
+        self.assertEqual(session.status, UploadSessionStatus.FAILED)
+        self.assertFalse(ManagedFile.objects.filter(pk=managed_file.pk).exists())
+        self.assertEqual(self.quota.current_size_bytes, 0)
+        self.assertEqual(self.quota.current_files_count, 0)
+
+    def test_disallowed_sniffed_type_removes_file_and_releases_quota(self) -> None:
+        # a Windows executable declared as a Word document
+        content = b"MZ\x90\x00" + b"\x00" * 60
+        session = self._start(content)
+        self._put_parts(session, content)
+
+        managed_file = UploadSessionService.complete(session=session)
+
+        with mock.patch("files_management.tasks.scan_file_for_viruses.delay") as scan:
+            self.assertFalse(UploadSessionService.verify(session.pk))
+
+        scan.assert_not_called()
+        session.refresh_from_db()
+        self.quota.refresh_from_db()
+        self.assertEqual(session.status, UploadSessionStatus.FAILED)
+        self.assertEqual(session.failure_reason, "Stored content type is not allowed.")
+        self.assertFalse(ManagedFile.objects.filter(pk=managed_file.pk).exists())
+        self.assertEqual(self.quota.current_size_bytes, 0)
+
+    def test_stuck_verification_is_failed_and_cleaned_up(self) -> None:
+        content = b"rubric"
+        session = self._start(content)
+        self._put_parts(session, content)
+        managed_file = UploadSessionService.complete(session=session)
+        UploadSession.objects.filter(pk=session.pk).update(
+            updated_at=timezone.now() - timedelta(days=1),
+        )
+
+        self.assertEqual(UploadSessionService.expire_stale(), 1)
+
+        session.refresh_from_db()
+        self.quota.refresh_from_db()
+        self.assertEqual(session.status, UploadSessionStatus.FAILED)
+        self.assertIsNone(session.managed_file)
+        self.assertFalse(ManagedFile.objects.filter(pk=managed_file.pk).exists())
+        self.assertEqual(self.quota.current_size_bytes, 0)
+
+        # a late verify run leaves the failed session alone
+        self.assertFalse(UploadSessionService.verify(session.pk))
+
+    def test_missing_parts_keep_session_open(self) -> None:
+        session = self._start(b"rubric")
+
+        with self.assertRaises(UploadSessionError):
+            UploadSessionService.complete(session=session)
+
+        session.refresh_from_db()
+        self.assertEqual(session.status, UploadSessionStatus.PENDING)
+
+    def test_reservation_beyond_quota_is_refused(self) -> None:
+        self.quota.max_total_size_bytes = 4
+        self.quota.save(update_fields=["max_total_size_bytes"])
+
+        with self.assertRaises(FileValidationError):
+            self._start(b"rubric")
+
+        self.assertFalse(UploadSession.objects.exists())
+
+    def test_expired_sessions_release_quota(self) -> None:
+        session = self._start(b"rubric")
+        UploadSession.objects.filter(pk=session.pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1),
+        )
+
+        self.assertEqual(UploadSessionService.expire_stale(), 1)
+        session.refresh_from_db()
+        self.quota.refresh_from_db()
+        self.assertEqual(session.status, UploadSessionStatus.EXPIRED)
+        self.assertEqual(self.quota.current_size_bytes, 0)
+
+    def test_part_upload_requires_valid_token(self) -> None:
+        session = self._start(b"rubric")
+        url = reverse(
+            "file-upload-session-local-part",
+            kwargs={"session_uuid": session.uuid, "part_number": 1},
+        )
+
+        response = self.client_api.generic(
+            "PUT",
+            f"{url}?token=forged",
+            b"rubric",
+            content_type="application/octet-stream",
+        )
+
+        self.assertEqual(response.status_code, 403)
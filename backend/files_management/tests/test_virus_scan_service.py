@@ -0,0 +1,147 @@
+import socket
+import struct
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from files_management.services import virus_scan_service
+from files_management.services.virus_scan_service import (
+    ClamdConnectionPool,
+    VirusScanService,
+)
+
+
+class FakeClamd:
+    """
+    Minimal clamd speaking IDSESSION + INSTREAM on a local socket.
+    """
+
+    def __init__(self, verdict: bytes = b"OK"):
+        self.verdict = verdict
+        self.chunk_sizes: list[int] = []
+        self.connections = 0
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self._conns: list[socket.socket] = []
+        self._threads = [threading.Thread(target=self._serve, daemon=True)]
+        self._threads[0].start()
+
+    def close(self) -> None:
+        """Stop accepting, hang up every session and join the threads."""
+        for sock in [self.server, *self._conns]:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            self._conns.append(conn)
+            thread = threading.Thread(target=self._session, args=(conn,), daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _read(self, conn, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("client hung up")
+            data += chunk
+        return data
+
+    def _session(self, conn) -> None:
+        try:
+            assert self._read(conn, 11) == b"zIDSESSION\x00"
+            seq = 0
+            while self._read(conn, 10) == b"zINSTREAM\x00":
+                seq += 1
+                while True:
+                    (length,) = struct.unpack("!I", self._read(conn, 4))
+                    if not length:
+                        break
+                    self.chunk_sizes.append(len(self._read(conn, length)))
+                conn.sendall(b"%d: stream: %s\x00" % (seq, self.verdict))
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+
+class VirusScanServiceTests(SimpleTestCase):
+    """
+    Tests for streaming INSTREAM scans over pooled clamd sessions.
+    """
+
+    def _patch(self, clamd: FakeClamd):
+        pool = ClamdConnectionPool(2)
+        patches = [
+            mock.patch.object(virus_scan_service, "CLAMAV_PORT", clamd.port),
+            mock.patch.object(virus_scan_service, "CLAMAV_HOST", "127.0.0.1"),
+            mock.patch.object(
+                virus_scan_service,
+                "_shared_pool",
+                return_value=pool,
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        # cleanups run last-in first-out: sessions end before the server
+        self.addCleanup(clamd.close)
+        self.addCleanup(self._close_idle_sessions, pool)
+
+    @staticmethod
+    def _close_idle_sessions(pool: ClamdConnectionPool) -> None:
+        while not pool._idle.empty():
+            pool._idle.get_nowait().close()
+
+    def test_streams_chunks_and_reuses_session(self) -> None:
+        clamd = FakeClamd()
+        self._patch(clamd)
+        chunks = [b"a" * 1000, b"b" * 1000, b"c" * 10]
+
+        with mock.patch.object(
+            VirusScanService, "_iter_file_chunks", side_effect=lambda mf: iter(chunks),
+        ):
+            first = VirusScanService._scan_stream(object())
+            second = VirusScanService._scan_stream(object())
+
+        self.assertTrue(first["clean"])
+        self.assertEqual(second["detail"], "stream: OK")
+        self.assertEqual(clamd.chunk_sizes, [1000, 1000, 10] * 2)
+        self.assertEqual(clamd.connections, 1)
+
+    def test_reports_infected_stream(self) -> None:
+        self._patch(FakeClamd(verdict=b"Eicar-Signature FOUND"))
+
+        with mock.patch.object(
+            VirusScanService, "_iter_file_chunks", return_value=iter([b"X5O!P%"]),
+        ):
+            result = VirusScanService._scan_stream(object())
+
+        self.assertFalse(result["clean"])
+        self.assertEqual(result["status"], "infected")
+
+    def test_empty_read_is_a_scan_error(self) -> None:
+        clamd = FakeClamd()
+        self._patch(clamd)
+
+        for chunks in ([], [b""]):
+            with self.subTest(chunks=chunks), mock.patch.object(
+                VirusScanService, "_iter_file_chunks", return_value=iter(chunks),
+            ):
+                with self.assertRaisesMessage(RuntimeError, "Could not read file bytes"):
+                    VirusScanService._scan_stream(object())
+
+        self.assertEqual(clamd.chunk_sizes, [])
@@ -0,0 +1,58 @@
+import io
+import os
+import zipfile
+
+from django.test import SimpleTestCase
+
+from files_management.storage import StreamingZipWriter
+
+
+class StreamingZipWriterTests(SimpleTestCase):
+    """
+    Tests for the chunked ZIP archive writer.
+    """
+
+    def _build(self, files: dict[str, bytes], chunk_size: int = 4096) -> bytes:
+        writer = StreamingZipWriter()
+        parts = []
+        for name, data in files.items():
+            chunks = (
+                data[i:i + chunk_size]
+                for i in range(0, len(data), chunk_size)
+            )
+            parts.extend(writer.add(name, chunks))
+        parts.extend(writer.close())
+        return b"".join(parts)
+
+    def test_archive_round_trips_through_zipfile(self) -> None:
+        files = {
+            "notes.txt": b"essay outline " * 5000,
+            "draft.pdf": os.urandom(20000),
+            "résumé.md": b"# title",
+        }
+
+        archive = zipfile.ZipFile(io.BytesIO(self._build(files)))
+
+        self.assertIsNone(archive.testzip())
+        for name, data in files.items():
+            self.assertEqual(archive.read(name), data)
+
+    def test_compressed_formats_are_stored(self) -> None:
+        archive = zipfile.ZipFile(io.BytesIO(self._build({
+            "notes.txt": b"a" * 1000,
+            "final.docx": b"b" * 1000,
+            "figure.PNG": b"c" * 1000,
+        })))
+
+        methods = {info.filename: info.compress_type for info in archive.infolist()}
+
+        self.assertEqual(methods["notes.txt"], zipfile.ZIP_DEFLATED)
+        self.assertEqual(methods["final.docx"], zipfile.ZIP_STORED)
+        self.assertEqual(methods["figure.PNG"], zipfile.ZIP_STORED)
+
+    def test_entries_are_emitted_before_the_archive_is_closed(self) -> None:
+        writer = StreamingZipWriter()
+
+        header = next(writer.add("notes.txt", iter([b"x" * 100])))
+
+        self.assertTrue(header.startswith(b"PK\x03\x04"))
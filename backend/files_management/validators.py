@@ -24,7 +24,7 @@ from files_management.exceptions import FileValidationError
 
 # Number of bytes read for magic-byte MIME detection. 2 048 is enough for
 # all formats in our allowlist; larger reads would slow every upload.
-_MAGIC_READ_SIZE = 2048
+MAGIC_READ_SIZE = 2048
 
 
 def normalize_filename(filename: str) -> str:
@@ -70,6 +70,21 @@ def guess_mime_type(filename: str) -> str:
     return mime_type
 
 
+def sniff_mime_type(header: bytes, *, fallback: str) -> str:
+    """
+    Return the MIME type recognised from a file's leading bytes.
+
+    ``fallback`` is returned when no magic bytes match, which is common
+    for plain text, CSV and JSON.
+    """
+
+    detected_kind = _filetype.guess(header)
+    if detected_kind is not None:
+        return detected_kind.mime
+
+    return fallback
+
+
 def validate_file_size(
     uploaded_file: UploadedFile,
     *,
@@ -120,17 +135,15 @@ def validate_uploaded_file(
     # Read the file header to detect the true type regardless of what the
     # client sent in the Content-Type header of the multipart form part.
     uploaded_file.seek(0)
-    header = uploaded_file.read(_MAGIC_READ_SIZE)
+    header = uploaded_file.read(MAGIC_READ_SIZE)
     uploaded_file.seek(0)
 
-    detected_kind = _filetype.guess(header)
-    if detected_kind is not None:
-        # filetype recognised the format; use its MIME, not the header.
-        detected_mime_type = detected_kind.mime
-    else:
-        # No magic bytes matched (common for plain text / CSV / JSON).
-        # Fall back to the declared Content-Type then to filename guess.
-        detected_mime_type = uploaded_file.content_type or guess_mime_type(normalized_name)
+    # Without a magic-byte match, fall back to the declared Content-Type
+    # then to a filename guess.
+    detected_mime_type = sniff_mime_type(
+        header,
+        fallback=uploaded_file.content_type or guess_mime_type(normalized_name),
+    )
 
     validate_file_size(uploaded_file, max_size_bytes=max_size_bytes)
     validate_mime_type(
@@ -16,7 +16,8 @@ workers = min((cpu_count * 2) + 1, 8)
 # Bind address
 bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
 
-# Worker class: 'sync' for standard, 'gevent' for async workloads
+# Worker class: 'sync' for standard, 'gevent' for async workloads.
+# SSE streams are async views and belong on the ASGI app (writing_system.asgi).
 worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
 
 # Worker connections (only used with gevent/eventlet)
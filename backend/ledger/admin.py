@@ -2,10 +2,12 @@ from django.contrib import admin
 
 from ledger.models import (
     AccountBalanceSnapshot,
+    AccountRunningBalance,
     HoldRecord,
     JournalEntry,
     JournalLine,
     LedgerAccount,
+    LedgerReconciliationRun,
     ReconciliationRecord,
 )
 
@@ -245,4 +247,68 @@ class AccountBalanceSnapshotAdmin(admin.ModelAdmin):
         "reference",
     )
     ordering = ("-snapshot_date",)
-    readonly_fields = ("id", "created_at")
\ No newline at end of file
+    readonly_fields = ("id", "created_at")
+
+
+@admin.register(AccountRunningBalance)
+class AccountRunningBalanceAdmin(admin.ModelAdmin):
+    list_display = (
+        "ledger_account",
+        "website",
+        "wallet_reference",
+        "currency",
+        "is_account_total",
+        "debit_total",
+        "credit_total",
+        "line_count",
+        "updated_at",
+    )
+    list_filter = (
+        "currency",
+        "is_account_total",
+        "website",
+    )
+    search_fields = (
+        "ledger_account__code",
+        "wallet_reference",
+    )
+    ordering = ("ledger_account", "wallet_reference")
+    readonly_fields = (
+        "id",
+        "website",
+        "ledger_account",
+        "wallet_reference",
+        "currency",
+        "is_account_total",
+        "debit_total",
+        "credit_total",
+        "line_count",
+        "updated_at",
+    )
+
+
+@admin.register(LedgerReconciliationRun)
+class LedgerReconciliationRunAdmin(admin.ModelAdmin):
+    list_display = (
+        "website",
+        "started_at",
+        "finished_at",
+        "checked_since",
+        "is_clean",
+        "issue_count",
+    )
+    list_filter = (
+        "is_clean",
+        "website",
+    )
+    ordering = ("-started_at",)
+    readonly_fields = (
+        "id",
+        "website",
+        "started_at",
+        "finished_at",
+        "checked_since",
+        "is_clean",
+        "issue_count",
+        "issue_summary",
+    )
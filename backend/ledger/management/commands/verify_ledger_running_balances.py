@@ -0,0 +1,79 @@
+# ledger/management/commands/verify_ledger_running_balances.py
+"""
+Verify maintained ledger running balances against journal line sums.
+
+Use when:
+    - After deploying the running balance table (initial backfill)
+    - After a data fix that touched posted journal lines directly
+    - Periodically as a sanity check
+
+Usage:
+    python manage.py verify_ledger_running_balances
+    python manage.py verify_ledger_running_balances --website 3
+    python manage.py verify_ledger_running_balances --rebuild
+"""
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from ledger.services.running_balance_service import RunningBalanceService
+from websites.models.websites import Website
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare AccountRunningBalance rows with the full sum of posted '
+        'journal lines. With --rebuild, replace drifted rows.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--website',
+            type=int,
+            default=None,
+            metavar='WEBSITE_ID',
+            help='Only check running balances for a specific website.',
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Rebuild running balances from journal lines when drift is found.',
+        )
+
+    def handle(self, *args, **options):
+        website = None
+
+        if options['website']:
+            website = Website.objects.get(pk=options['website'])
+            self.stdout.write(f" Scoped to website_id={website.pk}")
+
+        drifts = RunningBalanceService.verify(website=website)
+
+        for drift in drifts:
+            scope = '*' if drift.is_account_total else drift.wallet_reference
+            self.stdout.write(
+                self.style.WARNING(
+                    f" DRIFT account={drift.ledger_account_id} "
+                    f"wallet={scope} "
+                    f"currency={drift.currency} "
+                    f"expected={drift.expected_debit}/{drift.expected_credit} "
+                    f"stored={drift.actual_debit}/{drift.actual_credit}"
+                )
+            )
+
+        if not drifts:
+            self.stdout.write(
+                self.style.SUCCESS(' All running balances match journal lines.')
+            )
+            return
+
+        if not options['rebuild']:
+            self.stdout.write(
+                f" {len(drifts)} drifted row(s). Run with --rebuild to fix.\n"
+            )
+            return
+
+        written = RunningBalanceService.rebuild(website=website)
+        self.stdout.write(
+            self.style.SUCCESS(f" Rebuilt {written} running balance row(s).")
+        )
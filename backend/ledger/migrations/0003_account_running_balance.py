@@ -0,0 +1,91 @@
+# Generated by Django 5.2.2 on 2026-10-16 21:10
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_running_balances(apps, schema_editor):
+    """
+    Seed running balances from posted journal lines in one grouped pass.
+    """
+    JournalLine = apps.get_model('ledger', 'JournalLine')
+    AccountRunningBalance = apps.get_model('ledger', 'AccountRunningBalance')
+    zero = Decimal('0.00')
+
+    grouped = (
+        JournalLine.objects.filter(journal_entry__status='posted')
+        .order_by()
+        .values('website_id', 'ledger_account_id', 'wallet_reference', 'currency')
+        .annotate(
+            debit=Coalesce(Sum('amount', filter=Q(entry_side='debit')), zero),
+            credit=Coalesce(Sum('amount', filter=Q(entry_side='credit')), zero),
+            lines=Count('id'),
+        )
+    )
+
+    totals = {}
+    for row in grouped.iterator():
+        for key in (
+            (row['ledger_account_id'], row['wallet_reference'], row['currency'], False),
+            (row['ledger_account_id'], '', row['currency'], True),
+        ):
+            website_id, debit, credit, lines = totals.get(key, (row['website_id'], zero, zero, 0))
+            totals[key] = (website_id, debit + row['debit'], credit + row['credit'], lines + row['lines'])
+
+    AccountRunningBalance.objects.bulk_create(
+        [
+            AccountRunningBalance(
+                website_id=website_id,
+                ledger_account_id=key[0],
+                wallet_reference=key[1],
+                currency=key[2],
+                is_account_total=key[3],
+                debit_total=debit,
+                credit_total=credit,
+                line_count=lines,
+            )
+            for key, (website_id, debit, credit, lines) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0002_initial'),
+        ('websites', '0011_add_portal_url_to_website'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountRunningBalance',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('wallet_reference', models.CharField(blank=True, default='', max_length=64)),
+                ('currency', models.CharField(default='USD', max_length=10)),
+                ('is_account_total', models.BooleanField(default=False, help_text='True for the account-wide row across all wallet references.')),
+                ('debit_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=18)),
+                ('credit_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=18)),
+                ('line_count', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('ledger_account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='running_balances', to='ledger.ledgeraccount')),
+                ('website', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='account_running_balances', to='websites.website')),
+            ],
+            options={
+                'verbose_name': 'Account Running Balance',
+                'verbose_name_plural': 'Account Running Balances',
+                'db_table': 'ledger_account_running_balances',
+                'indexes': [models.Index(fields=['website', 'ledger_account'], name='ledger_acco_website_3438f4_idx')],
+                'constraints': [models.UniqueConstraint(fields=('ledger_account', 'wallet_reference', 'currency', 'is_account_total'), name='ledger_unique_running_balance_scope')],
+            },
+        ),
+        migrations.RunPython(
+            backfill_running_balances,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.2 on 2026-10-16 21:16
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ledger', '0003_account_running_balance'),
+        ('websites', '0011_add_portal_url_to_website'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LedgerReconciliationRun',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('started_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField()),
+                ('checked_since', models.DateTimeField(blank=True, help_text='Watermark used for this run. Null means a full run.', null=True)),
+                ('is_clean', models.BooleanField(db_index=True, default=False)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('issue_summary', models.JSONField(blank=True, default=dict, help_text='Issue counts keyed by issue code.')),
+            ],
+            options={
+                'verbose_name': 'Ledger Reconciliation Run',
+                'verbose_name_plural': 'Ledger Reconciliation Runs',
+                'db_table': 'ledger_reconciliation_runs',
+                'ordering': ['-started_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(fields=['website', 'created_at'], name='ledger_jour_website_7cacef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalline',
+            index=models.Index(fields=['website', 'created_at'], name='ledger_jour_website_40d183_idx'),
+        ),
+        migrations.AddField(
+            model_name='ledgerreconciliationrun',
+            name='website',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ledger_reconciliation_runs', to='websites.website'),
+        ),
+        migrations.AddIndex(
+            model_name='ledgerreconciliationrun',
+            index=models.Index(fields=['website', 'is_clean', 'started_at'], name='ledger_reco_website_bc3cc1_idx'),
+        ),
+    ]
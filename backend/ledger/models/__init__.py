@@ -1,15 +1,19 @@
 from .account_balance_snapshot import AccountBalanceSnapshot
+from .account_running_balance import AccountRunningBalance
 from .hold_record import HoldRecord
 from .journal_entry import JournalEntry
 from .journal_line import JournalLine
 from .ledger_account import LedgerAccount
 from .reconciliation_record import ReconciliationRecord
+from .reconciliation_run import LedgerReconciliationRun
 
 __all__ = [
     "AccountBalanceSnapshot",
+    "AccountRunningBalance",
     "HoldRecord",
     "JournalEntry",
     "JournalLine",
     "LedgerAccount",
+    "LedgerReconciliationRun",
     "ReconciliationRecord",
 ]
\ No newline at end of file
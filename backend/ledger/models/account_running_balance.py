@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import uuid
+from decimal import Decimal
+
+from django.db import models
+
+from ledger.constants import DEBIT_NORMAL_ACCOUNT_TYPES
+
+
+class AccountRunningBalance(models.Model):
+    """
+    Maintained debit and credit totals of posted journal lines.
+
+    One row exists per (ledger account, wallet reference, currency),
+    plus one account-wide row per (ledger account, currency) flagged
+    with ``is_account_total``. Rows are incremented inside the posting
+    transaction, so balance reads are a single indexed row fetch.
+
+    The table is derived data. ``verify_ledger_running_balances`` checks
+    it against the full journal line sums and can rebuild it.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    website = models.ForeignKey(
+        "websites.Website",
+        on_delete=models.CASCADE,
+        related_name="account_running_balances",
+    )
+    ledger_account = models.ForeignKey(
+        "ledger.LedgerAccount",
+        on_delete=models.CASCADE,
+        related_name="running_balances",
+    )
+    wallet_reference = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+    )
+    currency = models.CharField(
+        max_length=10,
+        default="USD",
+    )
+    is_account_total = models.BooleanField(
+        default=False,
+        help_text="True for the account-wide row across all wallet references.",
+    )
+    debit_total = models.DecimalField(
+        max_digits=18,
+        decimal_places=2,
+        default=Decimal("0.00"),
+    )
+    credit_total = models.DecimalField(
+        max_digits=18,
+        decimal_places=2,
+        default=Decimal("0.00"),
+    )
+    line_count = models.PositiveBigIntegerField(
+        default=0,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "ledger_account_running_balances"
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "ledger_account",
+                    "wallet_reference",
+                    "currency",
+                    "is_account_total",
+                ],
+                name="ledger_unique_running_balance_scope",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["website", "ledger_account"]),
+        ]
+        verbose_name = "Account Running Balance"
+        verbose_name_plural = "Account Running Balances"
+
+    def __str__(self) -> str:
+        scope = "*" if self.is_account_total else self.wallet_reference
+        return (
+            f"{self.ledger_account_id} | "
+            f"{scope} | "
+            f"{self.debit_total - self.credit_total} {self.currency}"
+        )
+
+    def balance_for(self, *, account_type: str) -> Decimal:
+        """
+        Return the balance on the normal side of an account type.
+        """
+        if account_type in DEBIT_NORMAL_ACCOUNT_TYPES:
+            return self.debit_total - self.credit_total
+
+        return self.credit_total - self.debit_total
@@ -161,6 +161,7 @@ class JournalEntry(models.Model):
             models.Index(fields=["website", "payment_intent_reference"]),
             models.Index(fields=["website", "effective_at"]),
             models.Index(fields=["website", "posted_at"]),
+            models.Index(fields=["website", "created_at"]),
         ]
         verbose_name = "Journal Entry"
         verbose_name_plural = "Journal Entries"
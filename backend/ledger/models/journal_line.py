@@ -92,6 +92,7 @@ class JournalLine(models.Model):
             models.Index(fields=["website", "journal_entry"]),
             models.Index(fields=["website", "ledger_account"]),
             models.Index(fields=["website", "entry_side"]),
+            models.Index(fields=["website", "created_at"]),
             models.Index(fields=["website", "currency"]),
             models.Index(fields=["website", "user"]),
             models.Index(fields=["website", "wallet_reference"]),
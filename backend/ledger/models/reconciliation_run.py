@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import models
+
+
+class LedgerReconciliationRun(models.Model):
+    """
+    Records one ledger reconciliation pass for a tenant.
+
+    The ``started_at`` of the latest clean run is the watermark for
+    incremental runs: only entries and lines written since then are
+    re-checked.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    website = models.ForeignKey(
+        "websites.Website",
+        on_delete=models.CASCADE,
+        related_name="ledger_reconciliation_runs",
+    )
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField()
+    checked_since = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Watermark used for this run. Null means a full run.",
+    )
+    is_clean = models.BooleanField(
+        default=False,
+        db_index=True,
+    )
+    issue_count = models.PositiveIntegerField(
+        default=0,
+    )
+    issue_summary = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Issue counts keyed by issue code.",
+    )
+
+    class Meta:
+        db_table = "ledger_reconciliation_runs"
+        ordering = ["-started_at"]
+        indexes = [
+            models.Index(fields=["website", "is_clean", "started_at"]),
+        ]
+        verbose_name = "Ledger Reconciliation Run"
+        verbose_name_plural = "Ledger Reconciliation Runs"
+
+    def __str__(self) -> str:
+        state = "clean" if self.is_clean else f"{self.issue_count} issues"
+        return f"{self.website_id} | {self.started_at} | {state}"
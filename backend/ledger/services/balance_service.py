@@ -8,21 +8,21 @@ from django.db.models.functions import Coalesce
 
 from ledger.constants import (
     CREDIT_NORMAL_ACCOUNT_TYPES,
-    DEBIT_NORMAL_ACCOUNT_TYPES,
-    EntrySide,
     HoldStatus,
-    JournalEntryStatus,
 )
 from ledger.models.account_balance_snapshot import AccountBalanceSnapshot
 from ledger.models.hold_record import HoldRecord
-from ledger.models.journal_line import JournalLine
 from ledger.models.ledger_account import LedgerAccount
 from ledger.services.account_service import AccountService
+from ledger.services.running_balance_service import RunningBalanceService
 
 
 class BalanceService:
     """
-    Compute tenant-scoped ledger balances from posted journal lines.
+    Read tenant-scoped ledger balances of posted journal lines.
+
+    Posted totals come from ``AccountRunningBalance`` rows maintained
+    at posting time, so each read is one indexed row fetch.
 
     Important:
         This service reads accounting truth only.
@@ -42,38 +42,6 @@ class BalanceService:
         """
         return Decimal("0")
 
-    @staticmethod
-    def _sum_lines(
-        *,
-        account: LedgerAccount,
-        entry_side: str,
-        extra_filters: dict[str, Any] | None = None,
-    ) -> Decimal:
-        """
-        Sum posted journal line amounts for one ledger account and side.
-        """
-        filters: dict[str, Any] = {
-            "website": account.website,
-            "ledger_account": account,
-            "journal_entry__status": JournalEntryStatus.POSTED,
-            "entry_side": entry_side,
-            "currency": account.currency,
-        }
-
-        if extra_filters:
-            filters.update(extra_filters)
-
-        total = (
-            JournalLine.objects.filter(**filters).aggregate(
-                total=Coalesce(
-                    Sum("amount"),
-                    BalanceService._decimal_zero(),
-                ),
-            )["total"]
-        )
-
-        return cast(Decimal, total)
-
     @staticmethod
     def _credit_normal_balance(
         *,
@@ -84,21 +52,10 @@ class BalanceService:
         """
         Return credits minus debits for a credit-normal account.
         """
-        debit_total = BalanceService._sum_lines(
+        debit_total, credit_total = RunningBalanceService.get_totals(
             account=account,
-            entry_side=EntrySide.DEBIT,
-            extra_filters={
-                "wallet_reference": wallet_reference,
-                "currency": currency,
-            },
-        )
-        credit_total = BalanceService._sum_lines(
-            account=account,
-            entry_side=EntrySide.CREDIT,
-            extra_filters={
-                "wallet_reference": wallet_reference,
-                "currency": currency,
-            },
+            currency=currency,
+            wallet_reference=wallet_reference,
         )
 
         return credit_total - debit_total
@@ -108,18 +65,11 @@ class BalanceService:
         """
         Return the posted balance for a ledger account.
         """
-        debit_total = BalanceService._sum_lines(
+        debit_total, credit_total = RunningBalanceService.get_totals(
             account=account,
-            entry_side=EntrySide.DEBIT,
-        )
-        credit_total = BalanceService._sum_lines(
-            account=account,
-            entry_side=EntrySide.CREDIT,
+            currency=account.currency,
         )
 
-        if account.account_type in DEBIT_NORMAL_ACCOUNT_TYPES:
-            return debit_total - credit_total
-
         if account.account_type in CREDIT_NORMAL_ACCOUNT_TYPES:
             return credit_total - debit_total
 
@@ -335,6 +285,32 @@ class BalanceService:
             currency=currency,
         )
 
+    @staticmethod
+    def get_writer_recovery_balances(
+        *,
+        website: Any,
+        writer_references: list[str],
+        currency: str = "USD",
+    ) -> dict[str, Decimal]:
+        """
+        Return writer recovery balances keyed by writer reference.
+        """
+        writer_recovery = AccountService.get_system_account(
+            website=website,
+            key="writer_recovery",
+        )
+
+        totals = RunningBalanceService.get_wallet_totals(
+            account=writer_recovery,
+            currency=currency,
+            wallet_references=writer_references,
+        )
+
+        return {
+            writer_reference: credit_total - debit_total
+            for writer_reference, (debit_total, credit_total) in totals.items()
+        }
+
     @staticmethod
     def create_snapshot(
         *,
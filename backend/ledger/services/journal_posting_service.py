@@ -12,6 +12,7 @@ from ledger.exceptions import LedgerPostingError
 from ledger.models.journal_entry import JournalEntry
 from ledger.models.journal_line import JournalLine
 from ledger.models.ledger_account import LedgerAccount
+from ledger.services.running_balance_service import RunningBalanceService
 
 
 @dataclass(frozen=True)
@@ -32,6 +33,29 @@ class JournalLineInput:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class JournalEntryInput:
+    """
+    Immutable input used to post one entry as part of a batch.
+    """
+
+    entry_type: str
+    lines: list[JournalLineInput]
+    currency: str = "USD"
+    description: str = ""
+    reference: str = ""
+    source_app: str = ""
+    source_model: str = ""
+    source_object_id: str = ""
+    external_reference: str = ""
+    payment_intent_reference: str = ""
+    triggered_by: Any | None = None
+    approved_by: Any | None = None
+    reversal_of: Any | None = None
+    effective_at: Any | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
 class JournalPostingService:
     """
     Create and post balanced journal entries atomically.
@@ -44,6 +68,19 @@ class JournalPostingService:
     """
 
     ZERO = Decimal("0")
+    BULK_BATCH_SIZE = 1000
+    LINE_RELATION_FIELDS = [
+        "website",
+        "journal_entry",
+        "ledger_account",
+        "user",
+    ]
+    ENTRY_RELATION_FIELDS = [
+        "website",
+        "triggered_by",
+        "approved_by",
+        "reversal_of",
+    ]
 
     @staticmethod
     def _validate_lines(
@@ -151,27 +188,21 @@ class JournalPostingService:
                 "Cannot add lines to a non-draft journal entry."
             )
 
-        created_lines: list[JournalLine] = []
-
-        for line in lines:
-            created_line = JournalLine.objects.create(
-                website=journal_entry.website,
+        created_lines = [
+            JournalPostingService._build_line(
                 journal_entry=journal_entry,
-                ledger_account=line.ledger_account,
-                entry_side=line.entry_side,
-                amount=line.amount,
-                currency=journal_entry.currency,
-                description=line.description,
-                user=line.user,
-                wallet_reference=line.wallet_reference,
-                payment_intent_reference=line.payment_intent_reference,
-                related_object_type=line.related_object_type,
-                related_object_id=line.related_object_id,
-                metadata=dict(line.metadata or {}),
+                line=line,
             )
-            created_lines.append(created_line)
-            created_line.full_clean()
-            created_line.save()
+            for line in lines
+        ]
+
+        for created_line in created_lines:
+            JournalPostingService._clean_line(line=created_line)
+
+        JournalLine.objects.bulk_create(
+            created_lines,
+            batch_size=JournalPostingService.BULK_BATCH_SIZE,
+        )
 
         return created_lines
 
@@ -202,6 +233,7 @@ class JournalPostingService:
         JournalPostingService._validate_unique_reference(
             website=website,
             reference=reference,
+            entry_type=entry_type,
         )
 
         JournalPostingService._validate_lines(
@@ -228,7 +260,7 @@ class JournalPostingService:
             metadata=metadata,
         )
 
-        JournalPostingService.add_lines(
+        created_lines = JournalPostingService.add_lines(
             journal_entry=entry,
             lines=lines,
         )
@@ -248,8 +280,101 @@ class JournalPostingService:
             ],
         )
 
+        RunningBalanceService.apply_lines(lines=created_lines)
+
         return entry
 
+    @staticmethod
+    @transaction.atomic
+    def post_entries(
+        *,
+        website,
+        entries: list[JournalEntryInput],
+    ) -> list[JournalEntry]:
+        """
+        Post a batch of balanced entries in one pass.
+
+        Ledger accounts are locked once for the whole batch and every
+        entry is validated in memory before anything is written. Entries
+        and lines are then inserted with one bulk insert each, and the
+        running balances are updated once for all lines.
+        """
+        if not entries:
+            return []
+
+        JournalPostingService._lock_line_accounts(
+            lines=[line for entry in entries for line in entry.lines],
+        )
+
+        for entry in entries:
+            JournalPostingService._validate_lines(
+                website=website,
+                currency=entry.currency,
+                lines=entry.lines,
+            )
+
+        JournalPostingService._validate_unique_references(
+            website=website,
+            entries=entries,
+        )
+
+        posted_at = timezone.now()
+        entry_number = JournalPostingService._build_entry_number(
+            website=website,
+        )
+
+        journal_entries = [
+            JournalEntry(
+                website=website,
+                entry_number=f"{entry_number}-{index}",
+                entry_type=entry.entry_type,
+                status=JournalEntryStatus.POSTED,
+                currency=entry.currency,
+                description=entry.description,
+                reference=entry.reference,
+                source_app=entry.source_app,
+                source_model=entry.source_model,
+                source_object_id=entry.source_object_id,
+                external_reference=entry.external_reference,
+                payment_intent_reference=entry.payment_intent_reference,
+                triggered_by=entry.triggered_by,
+                approved_by=entry.approved_by,
+                reversal_of=entry.reversal_of,
+                effective_at=entry.effective_at or posted_at,
+                posted_at=posted_at,
+                metadata=dict(entry.metadata or {}),
+            )
+            for index, entry in enumerate(entries)
+        ]
+
+        journal_lines = [
+            JournalPostingService._build_line(
+                journal_entry=journal_entry,
+                line=line,
+            )
+            for journal_entry, entry in zip(journal_entries, entries)
+            for line in entry.lines
+        ]
+
+        for journal_entry in journal_entries:
+            JournalPostingService._clean_entry(entry=journal_entry)
+
+        for journal_line in journal_lines:
+            JournalPostingService._clean_line(line=journal_line)
+
+        JournalEntry.objects.bulk_create(
+            journal_entries,
+            batch_size=JournalPostingService.BULK_BATCH_SIZE,
+        )
+        JournalLine.objects.bulk_create(
+            journal_lines,
+            batch_size=JournalPostingService.BULK_BATCH_SIZE,
+        )
+
+        RunningBalanceService.apply_lines(lines=journal_lines)
+
+        return journal_entries
+
     @staticmethod
     @transaction.atomic
     def fail_entry(
@@ -271,14 +396,71 @@ class JournalPostingService:
         return entry
 
 
+    @staticmethod
+    def _build_line(
+        *,
+        journal_entry: JournalEntry,
+        line: JournalLineInput,
+    ) -> JournalLine:
+        """
+        Build an unsaved journal line for an entry.
+        """
+        return JournalLine(
+            website=journal_entry.website,
+            journal_entry=journal_entry,
+            ledger_account=line.ledger_account,
+            entry_side=line.entry_side,
+            amount=line.amount,
+            currency=journal_entry.currency,
+            description=line.description,
+            user=line.user,
+            wallet_reference=line.wallet_reference,
+            payment_intent_reference=line.payment_intent_reference,
+            related_object_type=line.related_object_type,
+            related_object_id=line.related_object_id,
+            metadata=dict(line.metadata or {}),
+        )
+
+    @staticmethod
+    def _clean_entry(*, entry: JournalEntry) -> None:
+        """
+        Validate an unsaved journal entry without touching the database.
+
+        Relations and uniqueness are skipped: the tenant and references
+        were checked for the whole batch, and entry numbers are generated.
+        """
+        entry.full_clean(
+            exclude=JournalPostingService.ENTRY_RELATION_FIELDS,
+            validate_unique=False,
+            validate_constraints=False,
+        )
+
+    @staticmethod
+    def _clean_line(*, line: JournalLine) -> None:
+        """
+        Validate a journal line without touching the database.
+
+        Relations are skipped because posting already checked that the
+        accounts exist, are locked, and belong to the tenant.
+        """
+        line.full_clean(
+            exclude=JournalPostingService.LINE_RELATION_FIELDS,
+            validate_unique=False,
+            validate_constraints=False,
+        )
+
     @staticmethod
     def _validate_unique_reference(
         *,
         website,
         reference: str,
+        entry_type: str,
     ) -> None:
         """
         Prevent duplicate posted entries for the same business reference.
+
+        Uniqueness is per entry type, matching the reconciliation check,
+        so one payout can carry both a recovery and a payout entry.
         """
         if not reference:
             return
@@ -286,6 +468,7 @@ class JournalPostingService:
         duplicate_exists = JournalEntry.objects.filter(
             website=website,
             reference=reference,
+            entry_type=entry_type,
             status=JournalEntryStatus.POSTED,
         ).exists()
 
@@ -294,6 +477,40 @@ class JournalPostingService:
                 "A posted journal entry with this reference already exists."
             )
 
+    @staticmethod
+    def _validate_unique_references(
+        *,
+        website,
+        entries: list[JournalEntryInput],
+    ) -> None:
+        """
+        Check a whole batch for duplicate references with one query.
+        """
+        keys = [
+            (entry.reference, entry.entry_type)
+            for entry in entries
+            if entry.reference
+        ]
+
+        if len(keys) != len(set(keys)):
+            raise LedgerPostingError(
+                "Batch contains duplicate journal entry references."
+            )
+
+        if not keys:
+            return
+
+        posted = JournalEntry.objects.filter(
+            website=website,
+            status=JournalEntryStatus.POSTED,
+            reference__in={reference for reference, _ in keys},
+        ).values_list("reference", "entry_type")
+
+        if set(keys) & set(posted):
+            raise LedgerPostingError(
+                "A posted journal entry with this reference already exists."
+            )
+
     @staticmethod
     def _lock_line_accounts(
         *,
@@ -311,7 +528,8 @@ class JournalPostingService:
         }
 
         list(
-            LedgerAccount.objects.select_for_update().filter(
-                pk__in=account_pks,
-            )
+            LedgerAccount.objects.select_for_update()
+            .filter(pk__in=account_pks)
+            .order_by("pk")
+            .values_list("pk", flat=True)
         )
\ No newline at end of file
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
+from datetime import timedelta
 from decimal import Decimal
 from typing import Any
 
-from django.db.models import Count, Sum
+from django.conf import settings
+from django.db.models import Count, Exists, F, OuterRef, Q, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ledger.constants import EntrySide, JournalEntryStatus
-from ledger.models import JournalEntry, JournalLine
+from ledger.models import JournalEntry, JournalLine, LedgerReconciliationRun
+
+
+def _reconciliation_overlap() -> timedelta:
+    """
+    How far incremental runs reach behind the last clean run, so entries
+    that committed late with an earlier posted_at are still rechecked.
+    """
+    return timedelta(
+        seconds=getattr(settings, "LEDGER_RECONCILIATION_OVERLAP_SECONDS", 900)
+    )
 
 
 @dataclass(frozen=True)
@@ -35,6 +49,7 @@ class ReconciliationReport:
     website_id: str
     checked_at: Any
     issues: list[ReconciliationIssue]
+    checked_since: Any = None
 
     @property
     def has_issues(self) -> bool:
@@ -49,6 +64,10 @@ class LedgerReconciliationService:
     Read-only ledger audit and reconciliation service.
 
     This service does not mutate money records. It only detects issues.
+
+    Every check is a single grouped or filtered query whose rows are
+    streamed in batches. Passing ``since`` limits the checks to entries
+    and lines written after that moment.
     """
 
     SEVERITY_LOW = "low"
@@ -56,8 +75,63 @@ class LedgerReconciliationService:
     SEVERITY_HIGH = "high"
     SEVERITY_CRITICAL = "critical"
 
+    BATCH_SIZE = 2000
+    ZERO = Decimal("0.00")
+
     @classmethod
-    def reconcile_website(cls, *, website) -> ReconciliationReport:
+    def run_reconciliation(
+        cls,
+        *,
+        website,
+        incremental: bool = True,
+    ) -> ReconciliationReport:
+        """
+        Reconcile one tenant and record the run.
+
+        Incremental runs start LEDGER_RECONCILIATION_OVERLAP_SECONDS
+        before the latest clean run. A run that finds issues does not move
+        the watermark, so the next run checks the same window again until
+        it is clean.
+        """
+        started_at = timezone.now()
+        since = None
+
+        if incremental:
+            watermark = (
+                LedgerReconciliationRun.objects.filter(
+                    website=website,
+                    is_clean=True,
+                )
+                .order_by("-started_at")
+                .values_list("started_at", flat=True)
+                .first()
+            )
+            if watermark is not None:
+                since = watermark - _reconciliation_overlap()
+
+        report = cls.reconcile_website(website=website, since=since)
+
+        LedgerReconciliationRun.objects.create(
+            website=website,
+            started_at=started_at,
+            finished_at=timezone.now(),
+            checked_since=since,
+            is_clean=not report.has_issues,
+            issue_count=len(report.issues),
+            issue_summary=dict(
+                Counter(issue.code for issue in report.issues),
+            ),
+        )
+
+        return report
+
+    @classmethod
+    def reconcile_website(
+        cls,
+        *,
+        website,
+        since=None,
+    ) -> ReconciliationReport:
         """
         Run all ledger reconciliation checks for one tenant.
         """
@@ -66,31 +140,37 @@ class LedgerReconciliationService:
         issues.extend(
             cls.find_unbalanced_posted_entries(
                 website=website,
+                since=since,
             )
         )
         issues.extend(
             cls.find_entries_without_lines(
                 website=website,
+                since=since,
             )
         )
         issues.extend(
             cls.find_lines_with_wrong_tenant(
                 website=website,
+                since=since,
             )
         )
         issues.extend(
             cls.find_lines_with_wrong_currency(
                 website=website,
+                since=since,
             )
         )
         issues.extend(
             cls.find_duplicate_references(
                 website=website,
+                since=since,
             )
         )
         issues.extend(
             cls.find_posted_entries_missing_reference(
                 website=website,
+                since=since,
             )
         )
         issues.extend(
@@ -102,14 +182,40 @@ class LedgerReconciliationService:
         return ReconciliationReport(
             website_id=str(website.id),
             checked_at=timezone.now(),
-            issues=issues,
+            issues=cls._dedupe(issues),
+            checked_since=since,
         )
 
+    @staticmethod
+    def _dedupe(
+        issues: list[ReconciliationIssue],
+    ) -> list[ReconciliationIssue]:
+        """
+        Drop repeated issues, keeping the first of each.
+
+        An entry in the overlap window can match a check through more
+        than one ``since`` condition; it is reported once.
+        """
+        seen = set()
+        unique = []
+        for issue in issues:
+            key = (
+                issue.code,
+                issue.journal_entry_id,
+                issue.reference,
+                repr(sorted(issue.metadata.items())),
+            )
+            if key not in seen:
+                seen.add(key)
+                unique.append(issue)
+        return unique
+
     @classmethod
     def find_unbalanced_posted_entries(
         cls,
         *,
         website,
+        since=None,
     ) -> list[ReconciliationIssue]:
         """
         Find posted entries whose debit and credit totals do not match.
@@ -123,50 +229,68 @@ class LedgerReconciliationService:
         entries = JournalEntry.objects.filter(
             website=website,
             status=JournalEntryStatus.POSTED,
-        ).only(
-            "id",
-            "entry_number",
-            "reference",
         )
 
-        for entry in entries:
-            debit_total = (
-                JournalLine.objects.filter(
-                    website=website,
-                    journal_entry=entry,
-                    entry_side=EntrySide.DEBIT,
-                ).aggregate(total=Sum("amount"))["total"]
-                or Decimal("0.00")
+        if since is not None:
+            entries = entries.filter(posted_at__gte=since)
+
+        unbalanced = (
+            entries.order_by()
+            .annotate(
+                debit_total=Coalesce(
+                    Sum(
+                        "lines__amount",
+                        filter=Q(
+                            lines__website=website,
+                            lines__entry_side=EntrySide.DEBIT,
+                        ),
+                    ),
+                    cls.ZERO,
+                ),
+                credit_total=Coalesce(
+                    Sum(
+                        "lines__amount",
+                        filter=Q(
+                            lines__website=website,
+                            lines__entry_side=EntrySide.CREDIT,
+                        ),
+                    ),
+                    cls.ZERO,
+                ),
             )
-
-            credit_total = (
-                JournalLine.objects.filter(
-                    website=website,
-                    journal_entry=entry,
-                    entry_side=EntrySide.CREDIT,
-                ).aggregate(total=Sum("amount"))["total"]
-                or Decimal("0.00")
+            .exclude(debit_total=F("credit_total"))
+            .values(
+                "id",
+                "entry_number",
+                "reference",
+                "debit_total",
+                "credit_total",
             )
+        )
 
-            if debit_total != credit_total:
-                issues.append(
-                    ReconciliationIssue(
-                        code="UNBALANCED_POSTED_ENTRY",
-                        message=(
-                            "Posted journal entry is unbalanced. "
-                            f"Debits={debit_total}, "
-                            f"Credits={credit_total}."
-                        ),
-                        severity=cls.SEVERITY_CRITICAL,
-                        journal_entry_id=str(entry.id),
-                        entry_number=entry.entry_number,
-                        reference=entry.reference,
-                        metadata={
-                            "debit_total": str(debit_total),
-                            "credit_total": str(credit_total),
-                        },
-                    )
+        for entry in unbalanced.iterator(chunk_size=cls.BATCH_SIZE):
+            # SQLite sums drop the scale ("1" for 1.00); restore it
+            debit_total = Decimal(str(entry["debit_total"])).quantize(cls.ZERO)
+            credit_total = Decimal(str(entry["credit_total"])).quantize(cls.ZERO)
+
+            issues.append(
+                ReconciliationIssue(
+                    code="UNBALANCED_POSTED_ENTRY",
+                    message=(
+                        "Posted journal entry is unbalanced. "
+                        f"Debits={debit_total}, "
+                        f"Credits={credit_total}."
+                    ),
+                    severity=cls.SEVERITY_CRITICAL,
+                    journal_entry_id=str(entry["id"]),
+                    entry_number=entry["entry_number"],
+                    reference=entry["reference"],
+                    metadata={
+                        "debit_total": str(debit_total),
+                        "credit_total": str(credit_total),
+                    },
                 )
+            )
 
         return issues
 
@@ -175,6 +299,7 @@ class LedgerReconciliationService:
         cls,
         *,
         website,
+        since=None,
     ) -> list[ReconciliationIssue]:
         """
         Find journal entries that have no journal lines.
@@ -183,10 +308,17 @@ class LedgerReconciliationService:
 
         entries = JournalEntry.objects.filter(
             website=website,
-        ).annotate(
-            line_count=Count("lines"),
-        ).filter(
-            line_count=0,
+        )
+
+        if since is not None:
+            entries = entries.filter(
+                Q(created_at__gte=since) | Q(posted_at__gte=since),
+            )
+
+        entries = entries.filter(
+            ~Exists(
+                JournalLine.objects.filter(journal_entry=OuterRef("pk")),
+            ),
         ).only(
             "id",
             "entry_number",
@@ -194,7 +326,7 @@ class LedgerReconciliationService:
             "status",
         )
 
-        for entry in entries:
+        for entry in entries.iterator(chunk_size=cls.BATCH_SIZE):
             issues.append(
                 ReconciliationIssue(
                     code="ENTRY_WITHOUT_LINES",
@@ -216,22 +348,36 @@ class LedgerReconciliationService:
         cls,
         *,
         website,
+        since=None,
     ) -> list[ReconciliationIssue]:
         """
         Find journal lines whose account belongs to another tenant.
         """
         issues: list[ReconciliationIssue] = []
 
-        lines = JournalLine.objects.select_related(
-            "journal_entry",
-            "ledger_account",
-        ).filter(
+        lines = JournalLine.objects.filter(
             website=website,
         ).exclude(
             ledger_account__website=website,
         )
 
-        for line in lines:
+        if since is not None:
+            lines = lines.filter(
+                Q(created_at__gte=since)
+                | Q(journal_entry__posted_at__gte=since),
+            )
+
+        mismatches = lines.order_by().values(
+            "id",
+            "website_id",
+            "ledger_account_id",
+            "ledger_account__website_id",
+            "journal_entry_id",
+            "journal_entry__entry_number",
+            "journal_entry__reference",
+        )
+
+        for line in mismatches.iterator(chunk_size=cls.BATCH_SIZE):
             issues.append(
                 ReconciliationIssue(
                     code="LINE_ACCOUNT_TENANT_MISMATCH",
@@ -240,15 +386,15 @@ class LedgerReconciliationService:
                         "another website."
                     ),
                     severity=cls.SEVERITY_CRITICAL,
-                    journal_entry_id=str(line.journal_entry.id),
-                    entry_number=line.journal_entry.entry_number,
-                    reference=line.journal_entry.reference,
+                    journal_entry_id=str(line["journal_entry_id"]),
+                    entry_number=line["journal_entry__entry_number"],
+                    reference=line["journal_entry__reference"],
                     metadata={
-                        "line_id": str(line.id),
-                        "line_website_id": str(line.website.id),
-                        "account_id": str(line.ledger_account.id),
+                        "line_id": str(line["id"]),
+                        "line_website_id": str(line["website_id"]),
+                        "account_id": str(line["ledger_account_id"]),
                         "account_website_id": str(
-                            line.ledger_account.website_id,
+                            line["ledger_account__website_id"],
                         ),
                     },
                 )
@@ -261,28 +407,37 @@ class LedgerReconciliationService:
         cls,
         *,
         website,
+        since=None,
     ) -> list[ReconciliationIssue]:
         """
         Find journal lines whose account currency differs from entry currency.
         """
         issues: list[ReconciliationIssue] = []
 
-        lines = JournalLine.objects.select_related(
-            "journal_entry",
-            "ledger_account",
-        ).filter(
+        lines = JournalLine.objects.filter(
             website=website,
         ).exclude(
             ledger_account__currency__exact="",
+        ).exclude(
+            ledger_account__currency=F("journal_entry__currency"),
         )
 
-        for line in lines:
-            entry_currency = line.journal_entry.currency
-            account_currency = line.ledger_account.currency
+        if since is not None:
+            lines = lines.filter(
+                Q(created_at__gte=since)
+                | Q(journal_entry__posted_at__gte=since),
+            )
 
-            if entry_currency == account_currency:
-                continue
+        mismatches = lines.order_by().values(
+            "id",
+            "journal_entry_id",
+            "journal_entry__entry_number",
+            "journal_entry__reference",
+            "journal_entry__currency",
+            "ledger_account__currency",
+        )
 
+        for line in mismatches.iterator(chunk_size=cls.BATCH_SIZE):
             issues.append(
                 ReconciliationIssue(
                     code="LINE_ACCOUNT_CURRENCY_MISMATCH",
@@ -291,13 +446,13 @@ class LedgerReconciliationService:
                         "journal entry currency."
                     ),
                     severity=cls.SEVERITY_HIGH,
-                    journal_entry_id=str(line.journal_entry.id),
-                    entry_number=line.journal_entry.entry_number,
-                    reference=line.journal_entry.reference,
+                    journal_entry_id=str(line["journal_entry_id"]),
+                    entry_number=line["journal_entry__entry_number"],
+                    reference=line["journal_entry__reference"],
                     metadata={
-                        "line_id": str(line.id),
-                        "entry_currency": entry_currency,
-                        "account_currency": account_currency,
+                        "line_id": str(line["id"]),
+                        "entry_currency": line["journal_entry__currency"],
+                        "account_currency": line["ledger_account__currency"],
                     },
                 )
             )
@@ -309,6 +464,7 @@ class LedgerReconciliationService:
         cls,
         *,
         website,
+        since=None,
     ) -> list[ReconciliationIssue]:
         """
         Find duplicate posted journal entry references.
@@ -318,18 +474,26 @@ class LedgerReconciliationService:
         """
         issues: list[ReconciliationIssue] = []
 
-        duplicates = (
-            JournalEntry.objects.filter(
-                website=website,
-                status=JournalEntryStatus.POSTED,
+        posted = JournalEntry.objects.filter(
+            website=website,
+            status=JournalEntryStatus.POSTED,
+        ).exclude(reference="")
+
+        if since is not None:
+            posted = posted.filter(
+                reference__in=posted.filter(
+                    posted_at__gte=since,
+                ).values("reference"),
             )
-            .exclude(reference="")
+
+        duplicates = (
+            posted.order_by()
             .values("reference", "entry_type")
             .annotate(entry_count=Count("id"))
             .filter(entry_count__gt=1)
         )
 
-        for duplicate in duplicates:
+        for duplicate in duplicates.iterator(chunk_size=cls.BATCH_SIZE):
             issues.append(
                 ReconciliationIssue(
                     code="DUPLICATE_POSTED_REFERENCE",
@@ -353,6 +517,7 @@ class LedgerReconciliationService:
         cls,
         *,
         website,
+        since=None,
     ) -> list[ReconciliationIssue]:
         """
         Find posted entries missing useful trace references.
@@ -363,7 +528,12 @@ class LedgerReconciliationService:
             website=website,
             status=JournalEntryStatus.POSTED,
             reference="",
-        ).only(
+        )
+
+        if since is not None:
+            entries = entries.filter(posted_at__gte=since)
+
+        entries = entries.only(
             "id",
             "entry_number",
             "entry_type",
@@ -373,7 +543,7 @@ class LedgerReconciliationService:
             "source_object_id",
         )
 
-        for entry in entries:
+        for entry in entries.iterator(chunk_size=cls.BATCH_SIZE):
             issues.append(
                 ReconciliationIssue(
                     code="POSTED_ENTRY_MISSING_REFERENCE",
@@ -421,7 +591,7 @@ class LedgerReconciliationService:
             "created_at",
         )
 
-        for entry in entries:
+        for entry in entries.iterator(chunk_size=cls.BATCH_SIZE):
             issues.append(
                 ReconciliationIssue(
                     code="STALE_DRAFT_ENTRY",
@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ledger.constants import EntrySide, JournalEntryStatus
+from ledger.models.account_running_balance import AccountRunningBalance
+from ledger.models.journal_line import JournalLine
+from ledger.models.ledger_account import LedgerAccount
+
+
+BalanceKey = tuple[Any, str, str, bool]
+
+
+@dataclass(frozen=True)
+class RunningBalanceTotals:
+    """
+    Debit and credit totals for one running balance scope.
+    """
+
+    website_id: Any
+    debit_total: Decimal
+    credit_total: Decimal
+    line_count: int
+
+
+@dataclass(frozen=True)
+class RunningBalanceDrift:
+    """
+    Difference between a stored running balance and the journal lines.
+    """
+
+    ledger_account_id: Any
+    wallet_reference: str
+    currency: str
+    is_account_total: bool
+    expected_debit: Decimal
+    expected_credit: Decimal
+    actual_debit: Decimal
+    actual_credit: Decimal
+
+
+class RunningBalanceService:
+    """
+    Maintain per-account and per-wallet running balances.
+
+    Important:
+        Posting is the only writer in steady state. ``apply_lines``
+        must run inside the posting transaction after the touched
+        ledger accounts are locked, which serializes concurrent
+        increments of the same rows.
+    """
+
+    ZERO = Decimal("0.00")
+
+    @staticmethod
+    def _keys_for(
+        *,
+        ledger_account_id: Any,
+        wallet_reference: str,
+        currency: str,
+    ) -> tuple[BalanceKey, BalanceKey]:
+        """
+        Return the wallet-scoped and account-wide keys for one line.
+        """
+        return (
+            (ledger_account_id, wallet_reference, currency, False),
+            (ledger_account_id, "", currency, True),
+        )
+
+    @staticmethod
+    def _accumulate(
+        *,
+        totals: dict[BalanceKey, RunningBalanceTotals],
+        key: BalanceKey,
+        website_id: Any,
+        debit: Decimal,
+        credit: Decimal,
+        line_count: int,
+    ) -> None:
+        """
+        Add one delta to an in-memory totals map.
+        """
+        current = totals.get(key)
+
+        if current is None:
+            totals[key] = RunningBalanceTotals(
+                website_id=website_id,
+                debit_total=debit,
+                credit_total=credit,
+                line_count=line_count,
+            )
+            return
+
+        totals[key] = RunningBalanceTotals(
+            website_id=website_id,
+            debit_total=current.debit_total + debit,
+            credit_total=current.credit_total + credit,
+            line_count=current.line_count + line_count,
+        )
+
+    @staticmethod
+    def _deltas_for_lines(
+        *,
+        lines: Iterable[JournalLine],
+    ) -> dict[BalanceKey, RunningBalanceTotals]:
+        """
+        Collapse journal lines into one delta per running balance row.
+        """
+        deltas: dict[BalanceKey, RunningBalanceTotals] = {}
+
+        for line in lines:
+            is_debit = line.entry_side == EntrySide.DEBIT
+
+            for key in RunningBalanceService._keys_for(
+                ledger_account_id=line.ledger_account_id,
+                wallet_reference=line.wallet_reference,
+                currency=line.currency,
+            ):
+                RunningBalanceService._accumulate(
+                    totals=deltas,
+                    key=key,
+                    website_id=line.website_id,
+                    debit=line.amount if is_debit else RunningBalanceService.ZERO,
+                    credit=RunningBalanceService.ZERO if is_debit else line.amount,
+                    line_count=1,
+                )
+
+        return deltas
+
+    @staticmethod
+    def apply_lines(*, lines: Iterable[JournalLine]) -> None:
+        """
+        Add newly posted journal lines to the running balances.
+        """
+        deltas = RunningBalanceService._deltas_for_lines(lines=lines)
+        now = timezone.now()
+
+        for key, delta in deltas.items():
+            ledger_account_id, wallet_reference, currency, is_account_total = key
+
+            updated = AccountRunningBalance.objects.filter(
+                ledger_account_id=ledger_account_id,
+                wallet_reference=wallet_reference,
+                currency=currency,
+                is_account_total=is_account_total,
+            ).update(
+                debit_total=F("debit_total") + delta.debit_total,
+                credit_total=F("credit_total") + delta.credit_total,
+                line_count=F("line_count") + delta.line_count,
+                updated_at=now,
+            )
+
+            if updated:
+                continue
+
+            AccountRunningBalance.objects.create(
+                website_id=delta.website_id,
+                ledger_account_id=ledger_account_id,
+                wallet_reference=wallet_reference,
+                currency=currency,
+                is_account_total=is_account_total,
+                debit_total=delta.debit_total,
+                credit_total=delta.credit_total,
+                line_count=delta.line_count,
+            )
+
+    @staticmethod
+    def get_totals(
+        *,
+        account: LedgerAccount,
+        currency: str,
+        wallet_reference: str | None = None,
+    ) -> tuple[Decimal, Decimal]:
+        """
+        Return (debit_total, credit_total) for an account scope.
+
+        ``wallet_reference=None`` reads the account-wide row.
+        """
+        row = (
+            AccountRunningBalance.objects.filter(
+                ledger_account=account,
+                currency=currency,
+                wallet_reference=wallet_reference or "",
+                is_account_total=wallet_reference is None,
+            )
+            .values_list("debit_total", "credit_total")
+            .first()
+        )
+
+        if row is None:
+            return RunningBalanceService.ZERO, RunningBalanceService.ZERO
+
+        return row
+
+    @staticmethod
+    def get_wallet_totals(
+        *,
+        account: LedgerAccount,
+        currency: str,
+        wallet_references: Iterable[str],
+    ) -> dict[str, tuple[Decimal, Decimal]]:
+        """
+        Return (debit_total, credit_total) per wallet reference.
+
+        Reads every requested wallet row in one query. Wallets with no
+        posted lines are returned as zero totals.
+        """
+        wallet_references = set(wallet_references)
+        totals = {
+            wallet_reference: (
+                RunningBalanceService.ZERO,
+                RunningBalanceService.ZERO,
+            )
+            for wallet_reference in wallet_references
+        }
+
+        rows = AccountRunningBalance.objects.filter(
+            ledger_account=account,
+            currency=currency,
+            wallet_reference__in=wallet_references,
+            is_account_total=False,
+        ).values_list("wallet_reference", "debit_total", "credit_total")
+
+        for wallet_reference, debit_total, credit_total in rows:
+            totals[wallet_reference] = (debit_total, credit_total)
+
+        return totals
+
+    @staticmethod
+    def compute_from_lines(
+        *,
+        website=None,
+        ledger_account: LedgerAccount | None = None,
+    ) -> dict[BalanceKey, RunningBalanceTotals]:
+        """
+        Compute expected running balances from posted journal lines.
+
+        Uses one grouped query instead of one aggregate per account.
+        """
+        queryset = JournalLine.objects.filter(
+            journal_entry__status=JournalEntryStatus.POSTED,
+        )
+
+        if website is not None:
+            queryset = queryset.filter(website=website)
+
+        if ledger_account is not None:
+            queryset = queryset.filter(ledger_account=ledger_account)
+
+        grouped = (
+            queryset.order_by()
+            .values(
+                "website_id",
+                "ledger_account_id",
+                "wallet_reference",
+                "currency",
+            )
+            .annotate(
+                debit=Coalesce(
+                    Sum("amount", filter=Q(entry_side=EntrySide.DEBIT)),
+                    RunningBalanceService.ZERO,
+                ),
+                credit=Coalesce(
+                    Sum("amount", filter=Q(entry_side=EntrySide.CREDIT)),
+                    RunningBalanceService.ZERO,
+                ),
+                lines=Count("id"),
+            )
+        )
+
+        totals: dict[BalanceKey, RunningBalanceTotals] = {}
+
+        for row in grouped.iterator():
+            for key in RunningBalanceService._keys_for(
+                ledger_account_id=row["ledger_account_id"],
+                wallet_reference=row["wallet_reference"],
+                currency=row["currency"],
+            ):
+                RunningBalanceService._accumulate(
+                    totals=totals,
+                    key=key,
+                    website_id=row["website_id"],
+                    debit=row["debit"],
+                    credit=row["credit"],
+                    line_count=row["lines"],
+                )
+
+        return totals
+
+    @staticmethod
+    def _stored_totals(
+        *,
+        website=None,
+        ledger_account: LedgerAccount | None = None,
+    ) -> dict[BalanceKey, RunningBalanceTotals]:
+        """
+        Load stored running balances into an in-memory map.
+        """
+        queryset = AccountRunningBalance.objects.all()
+
+        if website is not None:
+            queryset = queryset.filter(website=website)
+
+        if ledger_account is not None:
+            queryset = queryset.filter(ledger_account=ledger_account)
+
+        return {
+            (
+                row.ledger_account_id,
+                row.wallet_reference,
+                row.currency,
+                row.is_account_total,
+            ): RunningBalanceTotals(
+                website_id=row.website_id,
+                debit_total=row.debit_total,
+                credit_total=row.credit_total,
+                line_count=row.line_count,
+            )
+            for row in queryset.iterator()
+        }
+
+    @staticmethod
+    def verify(
+        *,
+        website=None,
+        ledger_account: LedgerAccount | None = None,
+    ) -> list[RunningBalanceDrift]:
+        """
+        Compare stored running balances with full journal line sums.
+        """
+        expected = RunningBalanceService.compute_from_lines(
+            website=website,
+            ledger_account=ledger_account,
+        )
+        stored = RunningBalanceService._stored_totals(
+            website=website,
+            ledger_account=ledger_account,
+        )
+        empty = RunningBalanceTotals(
+            website_id=None,
+            debit_total=RunningBalanceService.ZERO,
+            credit_total=RunningBalanceService.ZERO,
+            line_count=0,
+        )
+        drifts: list[RunningBalanceDrift] = []
+
+        for key in expected.keys() | stored.keys():
+            want = expected.get(key, empty)
+            have = stored.get(key, empty)
+
+            if (
+                want.debit_total == have.debit_total
+                and want.credit_total == have.credit_total
+            ):
+                continue
+
+            ledger_account_id, wallet_reference, currency, is_account_total = key
+            drifts.append(
+                RunningBalanceDrift(
+                    ledger_account_id=ledger_account_id,
+                    wallet_reference=wallet_reference,
+                    currency=currency,
+                    is_account_total=is_account_total,
+                    expected_debit=want.debit_total,
+                    expected_credit=want.credit_total,
+                    actual_debit=have.debit_total,
+                    actual_credit=have.credit_total,
+                )
+            )
+
+        return drifts
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(
+        *,
+        website=None,
+        ledger_account: LedgerAccount | None = None,
+    ) -> int:
+        """
+        Replace stored running balances with full journal line sums.
+
+        Locks the affected ledger accounts so no posting interleaves
+        with the rebuild. Returns the number of rows written.
+        """
+        accounts = LedgerAccount.objects.select_for_update()
+
+        if website is not None:
+            accounts = accounts.filter(website=website)
+
+        if ledger_account is not None:
+            accounts = accounts.filter(pk=ledger_account.pk)
+
+        list(accounts.values_list("pk", flat=True))
+
+        expected = RunningBalanceService.compute_from_lines(
+            website=website,
+            ledger_account=ledger_account,
+        )
+        stale = AccountRunningBalance.objects.all()
+
+        if website is not None:
+            stale = stale.filter(website=website)
+
+        if ledger_account is not None:
+            stale = stale.filter(ledger_account=ledger_account)
+
+        stale.delete()
+
+        AccountRunningBalance.objects.bulk_create(
+            [
+                AccountRunningBalance(
+                    website_id=totals.website_id,
+                    ledger_account_id=key[0],
+                    wallet_reference=key[1],
+                    currency=key[2],
+                    is_account_total=key[3],
+                    debit_total=totals.debit_total,
+                    credit_total=totals.credit_total,
+                    line_count=totals.line_count,
+                )
+                for key, totals in expected.items()
+            ],
+            batch_size=1000,
+        )
+
+        return len(expected)
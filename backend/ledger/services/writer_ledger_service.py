@@ -9,6 +9,7 @@ from ledger.constants import EntrySide, LedgerEntryType, SourceApp
 from ledger.models import JournalEntry
 from ledger.services.account_service import AccountService
 from ledger.services.journal_posting_service import (
+    JournalEntryInput,
     JournalLineInput,
     JournalPostingService,
 )
@@ -283,8 +284,7 @@ class WriterLedgerService:
     # -------------------------
 
     @staticmethod
-    @transaction.atomic
-    def post_writer_payout(
+    def build_writer_payout_entry(
         *,
         website,
         amount: Decimal,
@@ -294,18 +294,22 @@ class WriterLedgerService:
         external_reference: str = "",
         triggered_by=None,
         metadata: dict[str, Any] | None = None,
-    ) -> JournalEntry:
+        payable=None,
+        cash=None,
+    ) -> JournalEntryInput:
         """
         Dr Writer Payable
         Cr Platform Cash
+
+        Batch callers pass the resolved accounts to skip the lookups.
         """
         WriterLedgerService._validate_amount(amount=amount)
 
-        payable = AccountService.get_system_account(
+        payable = payable or AccountService.get_system_account(
             website=website,
             key="writer_payable",
         )
-        cash = AccountService.get_system_account(
+        cash = cash or AccountService.get_system_account(
             website=website,
             key="platform_cash",
         )
@@ -326,8 +330,7 @@ class WriterLedgerService:
             ),
         ]
 
-        return JournalPostingService.post_entry(
-            website=website,
+        return JournalEntryInput(
             entry_type=LedgerEntryType.WRITER_PAYOUT,
             lines=lines,
             currency=WriterLedgerService.DEFAULT_CURRENCY,
@@ -347,7 +350,38 @@ class WriterLedgerService:
             ),
         )
 
+    @staticmethod
+    @transaction.atomic
+    def post_writer_payout(
+        *,
+        website,
+        amount: Decimal,
+        writer_reference: str,
+        writer_id: str,
+        payout_id: str,
+        external_reference: str = "",
+        triggered_by=None,
+        metadata: dict[str, Any] | None = None,
+    ) -> JournalEntry:
+        """
+        Dr Writer Payable
+        Cr Platform Cash
+        """
+        entry = WriterLedgerService.build_writer_payout_entry(
+            website=website,
+            amount=amount,
+            writer_reference=writer_reference,
+            writer_id=writer_id,
+            payout_id=payout_id,
+            external_reference=external_reference,
+            triggered_by=triggered_by,
+            metadata=metadata,
+        )
 
+        return JournalPostingService.post_entries(
+            website=website,
+            entries=[entry],
+        )[0]
 
     @staticmethod
     @transaction.atomic
@@ -532,8 +566,7 @@ class WriterLedgerService:
         )
 
     @staticmethod
-    @transaction.atomic
-    def post_writer_recovery_applied_to_payout(
+    def build_writer_recovery_applied_to_payout_entry(
         *,
         website,
         amount: Decimal,
@@ -544,14 +577,22 @@ class WriterLedgerService:
         reference: str = "",
         triggered_by=None,
         metadata: dict[str, Any] | None = None,
-    ) -> JournalEntry:
+        writer_payable=None,
+        writer_recovery=None,
+    ) -> JournalEntryInput:
+        """
+        Dr Writer Payable
+        Cr Writer Recovery
+
+        Batch callers pass the resolved accounts to skip the lookups.
+        """
         WriterLedgerService._validate_amount(amount=amount)
 
-        writer_payable = AccountService.get_system_account(
+        writer_payable = writer_payable or AccountService.get_system_account(
             website=website,
             key="writer_payable",
         )
-        writer_recovery = AccountService.get_system_account(
+        writer_recovery = writer_recovery or AccountService.get_system_account(
             website=website,
             key="writer_recovery",
         )
@@ -577,8 +618,7 @@ class WriterLedgerService:
             ),
         ]
 
-        return JournalPostingService.post_entry(
-            website=website,
+        return JournalEntryInput(
             entry_type=(
                 LedgerEntryType.WRITER_RECOVERY_APPLIED_TO_PAYOUT
             ),
@@ -598,4 +638,37 @@ class WriterLedgerService:
                     "payout_id": payout_id,
                 },
             ),
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def post_writer_recovery_applied_to_payout(
+        *,
+        website,
+        amount: Decimal,
+        writer_reference: str,
+        writer_id: str,
+        payout_id: str,
+        reason: str = "Writer recovery applied to payout.",
+        reference: str = "",
+        triggered_by=None,
+        metadata: dict[str, Any] | None = None,
+    ) -> JournalEntry:
+        entry = (
+            WriterLedgerService.build_writer_recovery_applied_to_payout_entry(
+                website=website,
+                amount=amount,
+                writer_reference=writer_reference,
+                writer_id=writer_id,
+                payout_id=payout_id,
+                reason=reason,
+                reference=reference,
+                triggered_by=triggered_by,
+                metadata=metadata,
+            )
+        )
+
+        return JournalPostingService.post_entries(
+            website=website,
+            entries=[entry],
+        )[0]
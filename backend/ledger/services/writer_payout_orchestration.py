@@ -6,10 +6,29 @@ from typing import Any
 
 from django.db import transaction
 
+from ledger.services.account_service import AccountService
 from ledger.services.balance_service import BalanceService
+from ledger.services.journal_posting_service import (
+    JournalEntryInput,
+    JournalPostingService,
+)
 from ledger.services.writer_ledger_service import WriterLedgerService
 
 
+@dataclass(frozen=True)
+class WriterPayoutRequest:
+    """
+    One writer payout to settle as part of a payout window.
+    """
+
+    writer_reference: str
+    writer_id: str
+    payout_id: str
+    gross_payout_amount: Decimal
+    external_reference: str = ""
+    metadata: dict[str, Any] | None = None
+
+
 @dataclass(frozen=True)
 class WriterPayoutSettlementResult:
     """
@@ -94,78 +113,165 @@ class WriterPayoutOrchestrationService:
             2. Apply recovery against payable.
             3. Post net payout only if cash should leave.
         """
-        cls._validate_amount(
-            amount=gross_payout_amount,
-            field_name="gross_payout_amount",
-        )
+        return cls.settle_writer_payouts(
+            website=website,
+            payouts=[
+                WriterPayoutRequest(
+                    writer_reference=writer_reference,
+                    writer_id=writer_id,
+                    payout_id=payout_id,
+                    gross_payout_amount=gross_payout_amount,
+                    external_reference=external_reference,
+                    metadata=metadata,
+                ),
+            ],
+            triggered_by=triggered_by,
+        )[0]
+
+    @classmethod
+    @transaction.atomic
+    def settle_writer_payouts(
+        cls,
+        *,
+        website,
+        payouts: list[WriterPayoutRequest],
+        triggered_by=None,
+    ) -> list[WriterPayoutSettlementResult]:
+        """
+        Settle a payout window in one pass.
+
+        Recovery balances for every writer are read in one query and all
+        recovery and payout entries are posted as a single batch, so a
+        window of thousands of writers costs a handful of round trips.
+        Results are returned in the same order as ``payouts``.
+        """
+        for payout in payouts:
+            cls._validate_amount(
+                amount=payout.gross_payout_amount,
+                field_name="gross_payout_amount",
+            )
+
+        if not payouts:
+            return []
 
-        recovery_balance = BalanceService.get_writer_recovery_balance(
+        remaining_recovery = BalanceService.get_writer_recovery_balances(
             website=website,
-            writer_reference=writer_reference,
+            writer_references=[
+                payout.writer_reference for payout in payouts
+            ],
         )
-
-        recovery_applied = cls._get_recovery_to_apply(
-            gross_payout_amount=gross_payout_amount,
-            recovery_balance=recovery_balance,
+        writer_payable = AccountService.get_system_account(
+            website=website,
+            key="writer_payable",
+        )
+        writer_recovery = AccountService.get_system_account(
+            website=website,
+            key="writer_recovery",
+        )
+        cash = AccountService.get_system_account(
+            website=website,
+            key="platform_cash",
         )
 
-        net_payout_amount = gross_payout_amount - recovery_applied
+        entries: list[JournalEntryInput] = []
+        plans: list[tuple[WriterPayoutRequest, Decimal, Decimal, int, int]] = []
 
-        recovery_entry = None
-        payout_entry = None
+        for payout in payouts:
+            recovery_balance = remaining_recovery[payout.writer_reference]
+            recovery_applied = cls._get_recovery_to_apply(
+                gross_payout_amount=payout.gross_payout_amount,
+                recovery_balance=recovery_balance,
+            )
+            remaining_recovery[payout.writer_reference] = (
+                recovery_balance - recovery_applied
+            )
+            net_payout_amount = payout.gross_payout_amount - recovery_applied
+            settlement_metadata = cls._merge_metadata(
+                base=payout.metadata,
+                extra={
+                    "gross_payout_amount": str(payout.gross_payout_amount),
+                    "recovery_applied": str(recovery_applied),
+                    "net_payout_amount": str(net_payout_amount),
+                },
+            )
 
-        if recovery_applied > cls.ZERO:
-            recovery_entry = (
-                WriterLedgerService.post_writer_recovery_applied_to_payout(
-                    website=website,
-                    amount=recovery_applied,
-                    writer_reference=writer_reference,
-                    writer_id=writer_id,
-                    payout_id=payout_id,
-                    reason="Writer recovery applied before payout.",
-                    reference=payout_id,
-                    triggered_by=triggered_by,
-                    metadata=cls._merge_metadata(
-                        base=metadata,
-                        extra={
-                            "gross_payout_amount": str(
-                                gross_payout_amount,
-                            ),
-                            "recovery_applied": str(recovery_applied),
-                            "net_payout_amount": str(net_payout_amount),
-                        },
-                    ),
+            recovery_index = -1
+            payout_index = -1
+
+            if recovery_applied > cls.ZERO:
+                recovery_index = len(entries)
+                entries.append(
+                    WriterLedgerService.build_writer_recovery_applied_to_payout_entry(
+                        website=website,
+                        amount=recovery_applied,
+                        writer_reference=payout.writer_reference,
+                        writer_id=payout.writer_id,
+                        payout_id=payout.payout_id,
+                        reason="Writer recovery applied before payout.",
+                        reference=payout.payout_id,
+                        triggered_by=triggered_by,
+                        metadata=settlement_metadata,
+                        writer_payable=writer_payable,
+                        writer_recovery=writer_recovery,
+                    )
+                )
+
+            if net_payout_amount > cls.ZERO:
+                payout_index = len(entries)
+                entries.append(
+                    WriterLedgerService.build_writer_payout_entry(
+                        website=website,
+                        amount=net_payout_amount,
+                        writer_reference=payout.writer_reference,
+                        writer_id=payout.writer_id,
+                        payout_id=payout.payout_id,
+                        external_reference=payout.external_reference,
+                        triggered_by=triggered_by,
+                        metadata=settlement_metadata,
+                        payable=writer_payable,
+                        cash=cash,
+                    )
+                )
+
+            plans.append(
+                (
+                    payout,
+                    recovery_balance,
+                    recovery_applied,
+                    recovery_index,
+                    payout_index,
                 )
             )
 
-        if net_payout_amount > cls.ZERO:
-            payout_entry = WriterLedgerService.post_writer_payout(
-                website=website,
-                amount=net_payout_amount,
-                writer_reference=writer_reference,
-                writer_id=writer_id,
-                payout_id=payout_id,
-                external_reference=external_reference,
-                triggered_by=triggered_by,
-                metadata=cls._merge_metadata(
-                    base=metadata,
-                    extra={
-                        "gross_payout_amount": str(gross_payout_amount),
-                        "recovery_applied": str(recovery_applied),
-                        "net_payout_amount": str(net_payout_amount),
-                    },
+        posted = JournalPostingService.post_entries(
+            website=website,
+            entries=entries,
+        )
+
+        return [
+            WriterPayoutSettlementResult(
+                payout_id=payout.payout_id,
+                writer_id=payout.writer_id,
+                gross_payout_amount=payout.gross_payout_amount,
+                recovery_balance=recovery_balance,
+                recovery_applied=recovery_applied,
+                net_payout_amount=(
+                    payout.gross_payout_amount - recovery_applied
+                ),
+                recovery_entry_id=(
+                    str(posted[recovery_index].id)
+                    if recovery_index >= 0
+                    else ""
+                ),
+                payout_entry_id=(
+                    str(posted[payout_index].id) if payout_index >= 0 else ""
                 ),
             )
-
-        return WriterPayoutSettlementResult(
-            payout_id=payout_id,
-            writer_id=writer_id,
-            gross_payout_amount=gross_payout_amount,
-            recovery_balance=recovery_balance,
-            recovery_applied=recovery_applied,
-            net_payout_amount=net_payout_amount,
-            recovery_entry_id=(
-                str(recovery_entry.id) if recovery_entry else ""
-            ),
-            payout_entry_id=str(payout_entry.id) if payout_entry else "",
-        )
\ No newline at end of file
+            for (
+                payout,
+                recovery_balance,
+                recovery_applied,
+                recovery_index,
+                payout_index,
+            ) in plans
+        ]
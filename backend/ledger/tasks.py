@@ -0,0 +1,39 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+
+@shared_task
+def reconcile_ledgers(incremental=True):
+    """
+    Reconcile every active website and record one run per tenant.
+
+    Incremental runs only re-check entries posted since the tenant's
+    last clean run.
+    """
+    from ledger.services.ledger_reconciliation_service import (
+        LedgerReconciliationService,
+    )
+    from websites.models import Website
+
+    websites = Website.objects.filter(is_active=True, is_deleted=False)
+    checked = 0
+    with_issues = 0
+
+    for website in websites.iterator():
+        report = LedgerReconciliationService.run_reconciliation(
+            website=website,
+            incremental=incremental,
+        )
+        checked += 1
+
+        if report.has_issues:
+            with_issues += 1
+            logger.warning(
+                "Ledger reconciliation found %s issue(s) for website %s.",
+                len(report.issues),
+                website.id,
+            )
+
+    return f"Reconciled {checked} ledgers; {with_issues} with issues."
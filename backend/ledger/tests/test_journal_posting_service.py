@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from ledger.constants import (
@@ -11,6 +12,7 @@ from ledger.constants import (
 from ledger.exceptions import LedgerPostingError
 from ledger.models import JournalEntry, JournalLine, LedgerAccount
 from ledger.services.journal_posting_service import (
+    JournalEntryInput,
     JournalLineInput,
     JournalPostingService,
 )
@@ -51,7 +53,7 @@ class JournalPostingServiceTests(TestCase):
     def test_post_entry_creates_posted_journal_entry(self) -> None:
         entry = JournalPostingService.post_entry(
             website=self.website,
-            entry_type=LedgerEntryType.WALLET_TOP_UP,
+            entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
             currency="USD",
             description="Wallet top up",
             triggered_by=self.user,
@@ -80,7 +82,7 @@ class JournalPostingServiceTests(TestCase):
         with self.assertRaises(LedgerPostingError):
             JournalPostingService.post_entry(
                 website=self.website,
-                entry_type=LedgerEntryType.WALLET_TOP_UP,
+                entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
                 currency="USD",
                 lines=[
                     JournalLineInput(
@@ -103,7 +105,7 @@ class JournalPostingServiceTests(TestCase):
         with self.assertRaises(LedgerPostingError):
             JournalPostingService.post_entry(
                 website=self.website,
-                entry_type=LedgerEntryType.WALLET_TOP_UP,
+                entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
                 currency="USD",
                 lines=[
                     JournalLineInput(
@@ -136,7 +138,7 @@ class JournalPostingServiceTests(TestCase):
         with self.assertRaises(LedgerPostingError):
             JournalPostingService.post_entry(
                 website=self.website,
-                entry_type=LedgerEntryType.WALLET_TOP_UP,
+                entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
                 currency="USD",
                 lines=[
                     JournalLineInput(
@@ -165,7 +167,7 @@ class JournalPostingServiceTests(TestCase):
         with self.assertRaises(LedgerPostingError):
             JournalPostingService.post_entry(
                 website=self.website,
-                entry_type=LedgerEntryType.WALLET_TOP_UP,
+                entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
                 currency="USD",
                 lines=[
                     JournalLineInput(
@@ -179,4 +181,135 @@ class JournalPostingServiceTests(TestCase):
                         amount=Decimal("100.00"),
                     ),
                 ],
-            )
\ No newline at end of file
+            )
+
+    def _top_up_input(
+        self,
+        *,
+        amount: Decimal,
+        reference: str,
+    ) -> JournalEntryInput:
+        return JournalEntryInput(
+            entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
+            reference=reference,
+            lines=[
+                JournalLineInput(
+                    ledger_account=self.cash_account,
+                    entry_side=EntrySide.DEBIT,
+                    amount=amount,
+                ),
+                JournalLineInput(
+                    ledger_account=self.wallet_liability_account,
+                    entry_side=EntrySide.CREDIT,
+                    amount=amount,
+                ),
+            ],
+        )
+
+    def test_post_entries_posts_every_entry_in_batch(self) -> None:
+        inputs = [
+            self._top_up_input(
+                amount=Decimal("10.00") * (index + 1),
+                reference=f"TOPUP-{index}",
+            )
+            for index in range(5)
+        ]
+
+        entries = JournalPostingService.post_entries(
+            website=self.website,
+            entries=inputs,
+        )
+
+        self.assertEqual(len(entries), 5)
+        self.assertEqual(
+            JournalEntry.objects.filter(
+                website=self.website,
+                status=JournalEntryStatus.POSTED,
+            ).count(),
+            5,
+        )
+        self.assertEqual(
+            JournalLine.objects.filter(website=self.website).count(),
+            10,
+        )
+        self.assertEqual(
+            len({entry.entry_number for entry in entries}),
+            5,
+        )
+
+    def test_post_entries_rejects_whole_batch_when_one_entry_unbalanced(
+        self,
+    ) -> None:
+        unbalanced = JournalEntryInput(
+            entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
+            lines=[
+                JournalLineInput(
+                    ledger_account=self.cash_account,
+                    entry_side=EntrySide.DEBIT,
+                    amount=Decimal("10.00"),
+                ),
+                JournalLineInput(
+                    ledger_account=self.wallet_liability_account,
+                    entry_side=EntrySide.CREDIT,
+                    amount=Decimal("9.00"),
+                ),
+            ],
+        )
+
+        with self.assertRaises(LedgerPostingError):
+            JournalPostingService.post_entries(
+                website=self.website,
+                entries=[
+                    self._top_up_input(
+                        amount=Decimal("10.00"),
+                        reference="TOPUP-1",
+                    ),
+                    unbalanced,
+                ],
+            )
+
+        self.assertFalse(
+            JournalEntry.objects.filter(website=self.website).exists()
+        )
+
+    def test_post_entries_rejects_duplicate_reference_in_batch(self) -> None:
+        with self.assertRaises(LedgerPostingError):
+            JournalPostingService.post_entries(
+                website=self.website,
+                entries=[
+                    self._top_up_input(
+                        amount=Decimal("10.00"),
+                        reference="TOPUP-1",
+                    ),
+                    self._top_up_input(
+                        amount=Decimal("20.00"),
+                        reference="TOPUP-1",
+                    ),
+                ],
+            )
+
+    def test_post_entries_validates_entries_before_insert(self) -> None:
+        invalid = JournalEntryInput(
+            entry_type="not_an_entry_type",
+            reference="TOPUP-2",
+            lines=self._top_up_input(
+                amount=Decimal("20.00"),
+                reference="TOPUP-2",
+            ).lines,
+        )
+
+        with self.assertRaises(ValidationError):
+            JournalPostingService.post_entries(
+                website=self.website,
+                entries=[
+                    self._top_up_input(
+                        amount=Decimal("10.00"),
+                        reference="TOPUP-1",
+                    ),
+                    invalid,
+                ],
+            )
+
+        self.assertFalse(
+            JournalEntry.objects.filter(website=self.website).exists()
+        )
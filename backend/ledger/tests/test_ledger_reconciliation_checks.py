@@ -0,0 +1,170 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ledger.constants import (
+    EntrySide,
+    LedgerAccountType,
+    LedgerEntryType,
+)
+from ledger.models import (
+    JournalEntry,
+    JournalLine,
+    LedgerAccount,
+    LedgerReconciliationRun,
+)
+from ledger.services.journal_posting_service import (
+    JournalLineInput,
+    JournalPostingService,
+)
+from ledger.services.ledger_reconciliation_service import (
+    LedgerReconciliationService,
+)
+from websites.models.websites import Website
+
+
+class LedgerReconciliationChecksTests(TestCase):
+    def setUp(self) -> None:
+        self.website = Website.objects.create(
+            name="Reconciliation Checks Website",
+            domain="reconciliation-checks.example.com",
+        )
+        self.cash_account = LedgerAccount.objects.create(
+            website=self.website,
+            code="PLATFORM_CASH",
+            name="Platform Cash",
+            account_type=LedgerAccountType.ASSET,
+            currency="USD",
+            is_system_account=True,
+        )
+        self.wallet_liability_account = LedgerAccount.objects.create(
+            website=self.website,
+            code="CLIENT_WALLET_LIABILITY",
+            name="Client Wallet Liability",
+            account_type=LedgerAccountType.LIABILITY,
+            currency="USD",
+            is_system_account=True,
+        )
+
+    def _top_up(self, *, amount: Decimal, reference: str) -> JournalEntry:
+        return JournalPostingService.post_entry(
+            website=self.website,
+            entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
+            reference=reference,
+            lines=[
+                JournalLineInput(
+                    ledger_account=self.cash_account,
+                    entry_side=EntrySide.DEBIT,
+                    amount=amount,
+                ),
+                JournalLineInput(
+                    ledger_account=self.wallet_liability_account,
+                    entry_side=EntrySide.CREDIT,
+                    amount=amount,
+                    wallet_reference="wallet-a",
+                ),
+            ],
+        )
+
+    def _tamper(self, *, entry: JournalEntry) -> None:
+        JournalLine.objects.filter(
+            journal_entry=entry,
+            entry_side=EntrySide.DEBIT,
+        ).update(amount=Decimal("1.00"))
+
+    def test_finds_unbalanced_entry_with_grouped_totals(self) -> None:
+        entry = self._top_up(amount=Decimal("50.00"), reference="TOPUP-1")
+        self._top_up(amount=Decimal("20.00"), reference="TOPUP-2")
+        self._tamper(entry=entry)
+
+        issues = LedgerReconciliationService.find_unbalanced_posted_entries(
+            website=self.website,
+        )
+
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0].journal_entry_id, str(entry.id))
+        self.assertEqual(issues[0].metadata["debit_total"], "1.00")
+        self.assertEqual(issues[0].metadata["credit_total"], "50.00")
+
+    def test_incremental_run_only_checks_entries_since_last_clean_run(
+        self,
+    ) -> None:
+        old_entry = self._top_up(amount=Decimal("50.00"), reference="TOPUP-1")
+
+        first = LedgerReconciliationService.run_reconciliation(
+            website=self.website,
+        )
+        self.assertFalse(first.has_issues)
+        self.assertIsNone(first.checked_since)
+
+        clean_run = LedgerReconciliationRun.objects.get(website=self.website)
+        LedgerReconciliationRun.objects.filter(pk=clean_run.pk).update(
+            started_at=timezone.now() - timedelta(seconds=1),
+        )
+        JournalEntry.objects.filter(pk=old_entry.pk).update(
+            posted_at=timezone.now() - timedelta(days=1),
+        )
+        self._tamper(entry=old_entry)
+
+        new_entry = self._top_up(amount=Decimal("30.00"), reference="TOPUP-2")
+        self._tamper(entry=new_entry)
+
+        incremental = LedgerReconciliationService.run_reconciliation(
+            website=self.website,
+        )
+        self.assertEqual(
+            [
+                issue.journal_entry_id
+                for issue in incremental.issues
+                if issue.code == "UNBALANCED_POSTED_ENTRY"
+            ],
+            [str(new_entry.id)],
+        )
+
+        full = LedgerReconciliationService.run_reconciliation(
+            website=self.website,
+            incremental=False,
+        )
+        self.assertEqual(
+            sum(
+                issue.code == "UNBALANCED_POSTED_ENTRY"
+                for issue in full.issues
+            ),
+            2,
+        )
+
+        latest = LedgerReconciliationRun.objects.filter(
+            website=self.website,
+        ).order_by("-started_at").first()
+        self.assertFalse(latest.is_clean)
+        self.assertEqual(
+            latest.issue_summary["UNBALANCED_POSTED_ENTRY"],
+            2,
+        )
+
+    def test_incremental_run_rechecks_entries_posted_just_before_watermark(
+        self,
+    ) -> None:
+        LedgerReconciliationService.run_reconciliation(website=self.website)
+
+        # Committed after the clean run, but stamped a little before it.
+        late_entry = self._top_up(amount=Decimal("40.00"), reference="TOPUP-3")
+        clean_run = LedgerReconciliationRun.objects.get(website=self.website)
+        JournalEntry.objects.filter(pk=late_entry.pk).update(
+            posted_at=clean_run.started_at - timedelta(seconds=5),
+        )
+        self._tamper(entry=late_entry)
+
+        report = LedgerReconciliationService.run_reconciliation(
+            website=self.website,
+        )
+
+        unbalanced = [
+            issue.journal_entry_id
+            for issue in report.issues
+            if issue.code == "UNBALANCED_POSTED_ENTRY"
+        ]
+        self.assertEqual(unbalanced, [str(late_entry.id)])
+        self.assertLess(report.checked_since, clean_run.started_at)
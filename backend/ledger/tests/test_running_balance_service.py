@@ -0,0 +1,106 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from ledger.constants import (
+    EntrySide,
+    LedgerAccountType,
+    LedgerEntryType,
+)
+from ledger.models import AccountRunningBalance, LedgerAccount
+from ledger.services.balance_service import BalanceService
+from ledger.services.journal_posting_service import (
+    JournalLineInput,
+    JournalPostingService,
+)
+from ledger.services.running_balance_service import RunningBalanceService
+from websites.models.websites import Website
+
+
+class RunningBalanceServiceTests(TestCase):
+    def setUp(self) -> None:
+        self.website = Website.objects.create(
+            name="Running Balance Website",
+            domain="running-balance.example.com",
+        )
+        self.cash_account = LedgerAccount.objects.create(
+            website=self.website,
+            code="PLATFORM_CASH",
+            name="Platform Cash",
+            account_type=LedgerAccountType.ASSET,
+            currency="USD",
+            is_system_account=True,
+        )
+        self.wallet_liability_account = LedgerAccount.objects.create(
+            website=self.website,
+            code="CLIENT_WALLET_LIABILITY",
+            name="Client Wallet Liability",
+            account_type=LedgerAccountType.LIABILITY,
+            currency="USD",
+            is_system_account=True,
+        )
+
+    def _top_up(self, *, amount: Decimal, wallet_reference: str) -> None:
+        JournalPostingService.post_entry(
+            website=self.website,
+            entry_type=LedgerEntryType.CLIENT_WALLET_TOP_UP,
+            lines=[
+                JournalLineInput(
+                    ledger_account=self.cash_account,
+                    entry_side=EntrySide.DEBIT,
+                    amount=amount,
+                ),
+                JournalLineInput(
+                    ledger_account=self.wallet_liability_account,
+                    entry_side=EntrySide.CREDIT,
+                    amount=amount,
+                    wallet_reference=wallet_reference,
+                ),
+            ],
+        )
+
+    def test_posting_maintains_account_and_wallet_balances(self) -> None:
+        self._top_up(amount=Decimal("100.00"), wallet_reference="wallet-a")
+        self._top_up(amount=Decimal("40.00"), wallet_reference="wallet-b")
+        self._top_up(amount=Decimal("10.00"), wallet_reference="wallet-a")
+
+        self.assertEqual(
+            BalanceService.get_account_balance(account=self.cash_account),
+            Decimal("150.00"),
+        )
+        self.assertEqual(
+            BalanceService.get_account_balance(
+                account=self.wallet_liability_account,
+            ),
+            Decimal("150.00"),
+        )
+        self.assertEqual(
+            BalanceService._credit_normal_balance(
+                account=self.wallet_liability_account,
+                wallet_reference="wallet-a",
+                currency="USD",
+            ),
+            Decimal("110.00"),
+        )
+        self.assertEqual(RunningBalanceService.verify(website=self.website), [])
+
+    def test_verify_reports_drift_and_rebuild_repairs_it(self) -> None:
+        self._top_up(amount=Decimal("75.00"), wallet_reference="wallet-a")
+        AccountRunningBalance.objects.filter(
+            ledger_account=self.cash_account,
+            is_account_total=True,
+        ).update(debit_total=Decimal("1.00"))
+
+        drifts = RunningBalanceService.verify(website=self.website)
+
+        self.assertEqual(len(drifts), 1)
+        self.assertEqual(drifts[0].expected_debit, Decimal("75.00"))
+        self.assertEqual(drifts[0].actual_debit, Decimal("1.00"))
+
+        RunningBalanceService.rebuild(website=self.website)
+
+        self.assertEqual(RunningBalanceService.verify(website=self.website), [])
+        self.assertEqual(
+            BalanceService.get_account_balance(account=self.cash_account),
+            Decimal("75.00"),
+        )
@@ -0,0 +1,169 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from ledger.constants import (
+    EntrySide,
+    JournalEntryStatus,
+    LedgerAccountType,
+    LedgerEntryType,
+)
+from ledger.models import JournalEntry, LedgerAccount
+from ledger.services.journal_posting_service import (
+    JournalLineInput,
+    JournalPostingService,
+)
+from ledger.services.writer_payout_orchestration import (
+    WriterPayoutOrchestrationService,
+    WriterPayoutRequest,
+)
+from users.models import User
+from websites.models.websites import Website
+
+
+class WriterPayoutOrchestrationServiceTests(TestCase):
+    def setUp(self) -> None:
+        self.website = Website.objects.create(
+            name="Payout Window Website",
+            domain="payouts.example.com",
+        )
+        self.user = User.objects.create_user(
+            username="payoutrunner",
+            email="payoutrunner@example.com",
+            password="password123",
+            website=self.website,
+        )
+
+        self.writer_payable = LedgerAccount.objects.create(
+            website=self.website,
+            code="WRITER_PAYABLE",
+            name="Writer Payable",
+            account_type=LedgerAccountType.LIABILITY,
+            currency="USD",
+            is_system_account=True,
+        )
+        self.writer_recovery = LedgerAccount.objects.create(
+            website=self.website,
+            code="WRITER_RECOVERY",
+            name="Writer Recovery",
+            account_type=LedgerAccountType.ASSET,
+            currency="USD",
+            is_system_account=True,
+        )
+        LedgerAccount.objects.create(
+            website=self.website,
+            code="PLATFORM_CASH",
+            name="Platform Cash",
+            account_type=LedgerAccountType.ASSET,
+            currency="USD",
+            is_system_account=True,
+        )
+
+    def _record_recovery(self, *, writer_reference: str, amount: Decimal) -> None:
+        JournalPostingService.post_entry(
+            website=self.website,
+            entry_type=LedgerEntryType.WRITER_EARNING_RECOVERY,
+            reference=f"RECOVERY-{writer_reference}",
+            lines=[
+                JournalLineInput(
+                    ledger_account=self.writer_payable,
+                    entry_side=EntrySide.DEBIT,
+                    amount=amount,
+                    wallet_reference=writer_reference,
+                ),
+                JournalLineInput(
+                    ledger_account=self.writer_recovery,
+                    entry_side=EntrySide.CREDIT,
+                    amount=amount,
+                    wallet_reference=writer_reference,
+                ),
+            ],
+        )
+
+    def _payout(
+        self,
+        *,
+        writer: str,
+        payout_id: str,
+        amount: str,
+    ) -> WriterPayoutRequest:
+        return WriterPayoutRequest(
+            writer_reference=writer,
+            writer_id=writer,
+            payout_id=payout_id,
+            gross_payout_amount=Decimal(amount),
+        )
+
+    def test_settle_writer_payouts_spreads_recovery_across_window(self) -> None:
+        self._record_recovery(writer_reference="writer_1", amount=Decimal("30.00"))
+
+        results = WriterPayoutOrchestrationService.settle_writer_payouts(
+            website=self.website,
+            payouts=[
+                self._payout(writer="writer_1", payout_id="P-1", amount="20.00"),
+                self._payout(writer="writer_1", payout_id="P-2", amount="50.00"),
+                self._payout(writer="writer_2", payout_id="P-3", amount="40.00"),
+            ],
+            triggered_by=self.user,
+        )
+
+        self.assertEqual([r.payout_id for r in results], ["P-1", "P-2", "P-3"])
+
+        first, second, third = results
+        self.assertEqual(first.recovery_balance, Decimal("30.00"))
+        self.assertEqual(first.recovery_applied, Decimal("20.00"))
+        self.assertEqual(first.net_payout_amount, Decimal("0.00"))
+        self.assertNotEqual(first.recovery_entry_id, "")
+        self.assertEqual(first.payout_entry_id, "")
+
+        self.assertEqual(second.recovery_balance, Decimal("10.00"))
+        self.assertEqual(second.recovery_applied, Decimal("10.00"))
+        self.assertEqual(second.net_payout_amount, Decimal("40.00"))
+        self.assertNotEqual(second.recovery_entry_id, "")
+        self.assertNotEqual(second.payout_entry_id, "")
+
+        self.assertEqual(third.recovery_applied, Decimal("0.00"))
+        self.assertEqual(third.net_payout_amount, Decimal("40.00"))
+        self.assertEqual(third.recovery_entry_id, "")
+
+        payout_entry = JournalEntry.objects.get(pk=second.payout_entry_id)
+        self.assertEqual(payout_entry.status, JournalEntryStatus.POSTED)
+        self.assertEqual(payout_entry.entry_type, LedgerEntryType.WRITER_PAYOUT)
+        self.assertEqual(payout_entry.metadata["net_payout_amount"], "40.00")
+        self.assertEqual(
+            JournalEntry.objects.filter(
+                website=self.website,
+                entry_type=LedgerEntryType.WRITER_RECOVERY_APPLIED_TO_PAYOUT,
+            ).count(),
+            2,
+        )
+
+    def test_settle_writer_payouts_rejects_window_with_invalid_amount(self) -> None:
+        with self.assertRaises(ValueError):
+            WriterPayoutOrchestrationService.settle_writer_payouts(
+                website=self.website,
+                payouts=[
+                    self._payout(writer="writer_1", payout_id="P-1", amount="20.00"),
+                    self._payout(writer="writer_2", payout_id="P-2", amount="0.00"),
+                ],
+            )
+
+        self.assertFalse(
+            JournalEntry.objects.filter(website=self.website).exists()
+        )
+
+    def test_settle_writer_payout_posts_single_payout(self) -> None:
+        result = WriterPayoutOrchestrationService.settle_writer_payout(
+            website=self.website,
+            writer_reference="writer_1",
+            writer_id="writer_1",
+            payout_id="P-9",
+            gross_payout_amount=Decimal("25.00"),
+            external_reference="bank_txn_9",
+        )
+
+        self.assertEqual(result.recovery_applied, Decimal("0.00"))
+        self.assertEqual(result.net_payout_amount, Decimal("25.00"))
+        entry = JournalEntry.objects.get(pk=result.payout_entry_id)
+        self.assertEqual(entry.external_reference, "bank_txn_9")
+        self.assertEqual(entry.lines.count(), 2)
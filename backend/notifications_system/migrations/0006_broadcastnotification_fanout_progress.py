@@ -0,0 +1,28 @@
+# Generated by Django 5.2.2 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications_system', '0005_add_dispute_writer_response_support_management_and_orders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='broadcastnotification',
+            name='fanout_cursor',
+            field=models.PositiveBigIntegerField(blank=True, help_text='Highest recipient user id already fanned out.', null=True),
+        ),
+        migrations.AddField(
+            model_name='broadcastnotification',
+            name='fanout_recipient_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='broadcastnotification',
+            name='fanout_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
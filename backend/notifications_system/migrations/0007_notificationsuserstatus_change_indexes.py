@@ -0,0 +1,21 @@
+# Generated by Django 5.2.2 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications_system', '0006_broadcastnotification_fanout_progress'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notificationsuserstatus',
+            index=models.Index(fields=['updated_at'], name='notificatio_updated_9a9f0e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationsuserstatus',
+            index=models.Index(fields=['read_at'], name='notificatio_read_at_601efb_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.2 on 2026-10-17 01:17
+
+from django.db import migrations, models
+
+
+def claim_existing_keys(apps, schema_editor):
+    """
+    Claim the dedupe_key of existing rows before the unique index goes.
+    """
+    Outbox = apps.get_model('notifications_system', 'Outbox')
+    DedupeKey = apps.get_model('core', 'DedupeKey')
+
+    keys = (
+        Outbox.objects.order_by()
+        .values_list('dedupe_key', flat=True)
+        .distinct()
+        .iterator(chunk_size=1000)
+    )
+    batch = []
+    for key in keys:
+        batch.append(DedupeKey(scope='notifications_system.Outbox', key=key))
+        if len(batch) == 1000:
+            DedupeKey.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    DedupeKey.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications_system', '0007_notificationsuserstatus_change_indexes'),
+        ('core', '0004_dedupekey'),
+    ]
+
+    operations = [
+        migrations.RunPython(claim_existing_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='outbox',
+            name='dedupe_key',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique key to prevent duplicate event processing.', max_length=256),
+        ),
+    ]
@@ -60,6 +60,15 @@ class BroadcastNotification(models.Model):
     expires_at = models.DateTimeField(null=True, blank=True)
     archived_at = models.DateTimeField(null=True, blank=True)
 
+    # Fan-out progress — lets an interrupted fan-out resume where it stopped
+    fanout_started_at = models.DateTimeField(null=True, blank=True)
+    fanout_cursor = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Highest recipient user id already fanned out.",
+    )
+    fanout_recipient_count = models.PositiveIntegerField(default=0)
+
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -87,6 +96,10 @@ class BroadcastNotification(models.Model):
     def is_expired(self):
         return bool(self.expires_at and self.expires_at < timezone.now())
 
+    @property
+    def is_fanout_in_progress(self):
+        return bool(self.fanout_started_at and not self.sent_at)
+
     def is_visible_to(self, user):
         """Check whether this broadcast should be shown to a given user."""
         if self.show_to_all:
@@ -65,6 +65,9 @@ class NotificationsUserStatus(models.Model):
             models.Index(fields=['user', 'website', 'is_acknowledged']),
             models.Index(fields=['user', 'is_pinned']),
             models.Index(fields=['notification', 'priority']),
+            # Incremental unread-count rebuilds look up recent changes.
+            models.Index(fields=['updated_at']),
+            models.Index(fields=['read_at']),
         ]
 
     def __str__(self):
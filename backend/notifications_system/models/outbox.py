@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from notifications_system.enums import DeliveryStatus
 
@@ -18,6 +18,9 @@ class Outbox(models.Model):
         2. Worker picks up rows where processed_at IS NULL
         3. Worker dispatches to NotificationService
         4. Worker marks row as processed or failed
+
+    dedupe_key is kept unique in core_dedupe_key rather than by a
+    unique index, so the table can be partitioned by created_at.
     """
     PENDING = 'pending'
     PROCESSING = 'processing'
@@ -54,7 +57,7 @@ class Outbox(models.Model):
     dedupe_key = models.CharField(
         max_length=256,
         blank=True,
-        unique=True,
+        db_index=True,
         help_text="Unique key to prevent duplicate event processing.",
     )
 
@@ -89,6 +92,17 @@ class Outbox(models.Model):
     def __str__(self):
         return f"{self.event_key} [{self.status}] attempts={self.attempts}"
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        from core.services.dedupe_key_service import DedupeKeyService
+
+        # raises IntegrityError on a duplicate, like the unique index did
+        with transaction.atomic():
+            DedupeKeyService.claim(self._meta.label, self.dedupe_key)
+            super().save(*args, **kwargs)
+
     @property
     def is_processable(self):
         """True if this event is ready to be picked up by the worker."""
@@ -2,25 +2,43 @@
 notifications_system/services/broadcast_services.py
 
 Creates broadcast records and fans out delivery to recipients.
-Fan-out is async — a Celery task handles per-user notify() calls
-so the request returns immediately after writing the broadcast row.
+Fan-out is async — a Celery task writes outbox rows in chunks and
+queues one delivery task per chunk, so the request returns
+immediately after writing the broadcast row.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Iterable, List, Optional
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
 
-from django.db.models import QuerySet
-from django.utils import timezone
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
 
 from notifications_system.enums import (
+    DeliveryStatus,
     NotificationChannel,
     NotificationPriority,
+    get_event_category,
+    is_valid_event,
 )
 
 logger = logging.getLogger(__name__)
 
+# Recipients written per fan-out transaction and per delivery task.
+FANOUT_CHUNK_SIZE = getattr(settings, 'BROADCAST_FANOUT_CHUNK_SIZE', 1000)
+
+# How long requeue_pending() leaves broadcast outbox rows to
+# process_broadcast_chunk before delivering them one by one.
+CHUNK_REQUEUE_GRACE = timedelta(
+    minutes=getattr(settings, 'BROADCAST_CHUNK_REQUEUE_MINUTES', 15)
+)
+
 
 class BroadcastService:
     """
@@ -28,7 +46,7 @@ class BroadcastService:
 
     Broadcasts are admin-triggered notifications sent to multiple users.
     Fan-out is always async — the broadcast row is written synchronously,
-    per-user delivery is queued to Celery.
+    chunked delivery is queued to Celery.
     """
 
     @staticmethod
@@ -123,79 +141,529 @@ class BroadcastService:
         """
         Execute fan-out for a broadcast.
         Called by process_broadcast_fanout Celery task.
-        Resolves recipients and calls NotificationService.notify() per user.
+
+        Recipients are walked in id order, FANOUT_CHUNK_SIZE at a time.
+        Each chunk writes its outbox rows with one bulk insert and
+        advances fanout_cursor in the same transaction, then queues a
+        single process_broadcast_chunk task. A crashed or retried
+        fan-out resumes after the last committed chunk.
         """
         from notifications_system.models.broadcast_notification import (
             BroadcastNotification,
         )
-        from notifications_system.services.notification_service import (
-            NotificationService,
-        )
 
         try:
-            broadcast = BroadcastNotification.objects.get(id=broadcast_id)
+            broadcast = BroadcastNotification.objects.select_related(
+                'website',
+            ).get(id=broadcast_id)
         except BroadcastNotification.DoesNotExist:
             logger.warning(
                 "fanout() broadcast not found: id=%s.", broadcast_id
             )
             return
 
+        if not broadcast.is_active or broadcast.sent_at:
+            logger.info(
+                "fanout() skipped: broadcast=%s inactive or already sent.",
+                broadcast_id,
+            )
+            return
+
         if broadcast.is_expired:
             logger.info(
                 "fanout() skipped: broadcast=%s is expired.", broadcast_id
             )
             return
 
-        recipients = BroadcastService._resolve_recipients(broadcast)
-        context = {
-            'title': broadcast.title,
-            'message': broadcast.message,
-            'broadcast_id': broadcast.pk,
-            'website_name': broadcast.website.name if broadcast.website else '',
-        }
+        if not is_valid_event(broadcast.event_type):
+            logger.warning(
+                "fanout() skipped: unregistered event_key=%s broadcast=%s.",
+                broadcast.event_type,
+                broadcast_id,
+            )
+            return
+
+        if not getattr(settings, 'ENABLE_NOTIFICATIONS', True):
+            logger.info(
+                "Notifications disabled globally. Skipping broadcast=%s.",
+                broadcast_id,
+            )
+            return
 
-        queued = 0
-        for recipient in recipients.iterator():
-            if not broadcast.is_visible_to(recipient):
-                continue
+        if broadcast.fanout_started_at:
+            logger.info(
+                "fanout() resuming: broadcast=%s after user=%s.",
+                broadcast_id,
+                broadcast.fanout_cursor,
+            )
+        else:
+            BroadcastNotification.objects.filter(
+                pk=broadcast.pk,
+                fanout_started_at__isnull=True,
+            ).update(fanout_started_at=timezone.now())
+
+        payload = BroadcastService._build_payload(broadcast)
+        recipients = BroadcastService._resolve_recipients(broadcast).order_by('id')
+
+        chunks = 0
+        while BroadcastService._fanout_chunk(
+            broadcast=broadcast,
+            recipients=recipients,
+            payload=payload,
+        ):
+            chunks += 1
+
+        # Mark broadcast as sent — only if it was not cancelled midway
+        updated = BroadcastNotification.objects.filter(
+            pk=broadcast.pk,
+            is_active=True,
+            sent_at__isnull=True,
+        ).update(sent_at=timezone.now())
 
-            NotificationService.notify(
+        logger.info(
+            "fanout() %s: broadcast=%s chunks=%s.",
+            'complete' if updated else 'stopped',
+            broadcast_id,
+            chunks,
+        )
+
+    @staticmethod
+    def deliver_chunk(broadcast_id: int, outbox_ids: List[int]) -> int:
+        """
+        Deliver one fan-out chunk.
+        Called by process_broadcast_chunk Celery task.
+
+        Does for the whole chunk what NotificationDispatcher.dispatch()
+        does per user: preference checks, Notification and
+        NotificationsUserStatus rows, and Delivery rows — each written
+        with one bulk insert. In-app delivery bumps unread counters with
+        one grouped UPDATE per website. Templates are rendered once per
+        channel and website since every recipient shares the context.
+
+        Rows already processed or locked by another worker are skipped,
+        so the task is safe to retry.
+
+        Returns:
+            Number of notifications created.
+        """
+        from notifications_system.models.outbox import Outbox
+        from websites.models.websites import Website
+
+        created = 0
+        queued_delivery_ids: List[int] = []
+        pushes: List[tuple] = []
+
+        with transaction.atomic():
+            entries = list(
+                Outbox.objects.select_for_update(skip_locked=True, of=('self',))
+                .filter(id__in=outbox_ids, status=Outbox.PENDING)
+                .values_list('id', 'user_id', 'user__role', 'website_id', 'payload')
+            )
+            if not entries:
+                return 0
+
+            payload = entries[0][4] or {}
+            by_website: Dict[int, List[tuple]] = defaultdict(list)
+            for _, user_id, role, website_id, _ in entries:
+                by_website[website_id].append((user_id, role))
+
+            websites = Website.objects.in_bulk(list(by_website))
+            for website_id, recipients in by_website.items():
+                website = websites.get(website_id)
+                if website is None:
+                    continue
+                count, delivery_ids, website_pushes = (
+                    BroadcastService._deliver_website_group(
+                        broadcast_id=broadcast_id,
+                        website=website,
+                        recipients=recipients,
+                        payload=payload,
+                    )
+                )
+                created += count
+                queued_delivery_ids.extend(delivery_ids)
+                pushes.extend(website_pushes)
+
+            Outbox.objects.filter(
+                id__in=[entry[0] for entry in entries],
+            ).update(status=Outbox.PROCESSED, processed_at=timezone.now())
+
+            transaction.on_commit(
+                lambda: BroadcastService._after_chunk_commit(
+                    queued_delivery_ids, pushes,
+                )
+            )
+
+        logger.info(
+            "deliver_chunk() complete: broadcast=%s outbox_rows=%s "
+            "notifications=%s.",
+            broadcast_id,
+            len(entries),
+            created,
+        )
+        return created
+
+    # -------------------------
+    # Fan-out helpers
+    # -------------------------
+
+    @staticmethod
+    def _build_payload(broadcast) -> Dict[str, Any]:
+        """Outbox payload shared by every recipient of a broadcast."""
+        from notifications_system.services.notification_service import (
+            NotificationService,
+        )
+
+        return {
+            'context': {
+                'title': broadcast.title,
+                'message': broadcast.message,
+                'broadcast_id': broadcast.pk,
+                'website_name': broadcast.website.name if broadcast.website else '',
+            },
+            'channels': NotificationService._resolve_channels(
                 event_key=broadcast.event_type,
-                recipient=recipient,
-                website=broadcast.website,
-                context=context,
                 channels=broadcast.channels or None,
-                triggered_by=broadcast.created_by,
-                is_critical=False,
+            ),
+            'priority': NotificationPriority.NORMAL,
+            'is_critical': False,
+            'is_silent': False,
+            'is_digest': False,
+            'is_broadcast': True,
+            'broadcast_id': broadcast.pk,
+            'digest_group': None,
+            'triggered_by_id': broadcast.created_by_id,
+            'category': get_event_category(broadcast.event_type),
+            'event_key': broadcast.event_type,
+        }
+
+    @staticmethod
+    def _fanout_chunk(*, broadcast, recipients: QuerySet, payload: dict) -> bool:
+        """
+        Write outbox rows for the next chunk of recipients.
+
+        The broadcast row is locked so two fan-out runs for the same
+        broadcast cannot interleave, and the cursor only moves forward
+        together with the outbox rows it covers.
+
+        Returns:
+            False when there are no recipients left or the broadcast
+            was cancelled, True otherwise.
+        """
+        from notifications_system.models.broadcast_notification import (
+            BroadcastNotification,
+        )
+        from core.services.dedupe_key_service import DedupeKeyService
+        from notifications_system.models.outbox import Outbox
+
+        with transaction.atomic():
+            locked = BroadcastNotification.objects.select_for_update().only(
+                'id', 'is_active', 'fanout_cursor', 'fanout_recipient_count',
+            ).get(pk=broadcast.pk)
+
+            if not locked.is_active:
+                return False
+
+            rows = list(
+                recipients.filter(id__gt=locked.fanout_cursor or 0)
+                .values_list('id', 'website_id')[:FANOUT_CHUNK_SIZE]
+            )
+            if not rows:
+                return False
+
+            # Broadcast rows are delivered by process_broadcast_chunk.
+            # The delayed retry time keeps requeue_pending() away from
+            # them unless that task never runs.
+            retry_at = timezone.now() + CHUNK_REQUEUE_GRACE
+            outboxes = [
+                Outbox(
+                    event_key=broadcast.event_type,
+                    user_id=user_id,
+                    website_id=broadcast.website_id or user_website_id,
+                    payload=payload,
+                    dedupe_key=BroadcastService._build_dedupe_key(
+                        broadcast_id=broadcast.pk,
+                        recipient_id=user_id,
+                    ),
+                    next_retry_at=retry_at,
+                )
+                for user_id, user_website_id in rows
+                if broadcast.website_id or user_website_id
+            ]
+            # bulk_create skips Outbox.save(), so claim the keys here
+            claimed = DedupeKeyService.claim_many(
+                Outbox._meta.label,
+                [outbox.dedupe_key for outbox in outboxes],
+            )
+            Outbox.objects.bulk_create([
+                outbox for outbox in outboxes if outbox.dedupe_key in claimed
+            ])
+
+            outbox_ids = list(
+                Outbox.objects.filter(
+                    dedupe_key__in=[outbox.dedupe_key for outbox in outboxes],
+                    status=Outbox.PENDING,
+                ).values_list('id', flat=True)
+            )
+
+            locked.fanout_cursor = rows[-1][0]
+            locked.fanout_recipient_count += len(outboxes)
+            locked.save(update_fields=[
+                'fanout_cursor', 'fanout_recipient_count', 'updated_at',
+            ])
+
+            if outbox_ids:
+                transaction.on_commit(
+                    lambda: BroadcastService._queue_chunk(broadcast.pk, outbox_ids)
+                )
+
+        return True
+
+    @staticmethod
+    def _queue_chunk(broadcast_id: int, outbox_ids: List[int]) -> None:
+        """
+        Queue the delivery task for one chunk.
+        If Celery is unavailable the rows stay PENDING and
+        requeue_pending() delivers them individually.
+        """
+        if not getattr(settings, 'ENABLE_CELERY', True):
+            return
+
+        try:
+            from notifications_system.tasks.send import process_broadcast_chunk
+            process_broadcast_chunk.delay(broadcast_id, outbox_ids) # type: ignore[attr-defined]
+        except Exception as exc:
+            logger.warning(
+                "_queue_chunk() failed to queue task: broadcast=%s "
+                "rows=%s error=%s.",
+                broadcast_id,
+                len(outbox_ids),
+                exc,
+            )
+
+    @staticmethod
+    def _deliver_website_group(
+        *,
+        broadcast_id: int,
+        website,
+        recipients: List[tuple],
+        payload: dict,
+    ):
+        """
+        Bulk-create notification state for recipients on one website.
+
+        Returns:
+            (notifications created, queued Delivery ids, in-app pushes)
+        """
+        from notifications_system.models.delivery import Delivery
+        from notifications_system.models.notifications import Notification
+        from notifications_system.models.notifications_user_status import (
+            NotificationsUserStatus,
+        )
+        from notifications_system.models.user_notification_meta import (
+            UserNotificationMeta,
+        )
+        from notifications_system.services.preference_service import (
+            PreferenceService,
+        )
+        from notifications_system.services.template_service import (
+            TemplateService,
+        )
+
+        event_key = payload.get('event_key', '')
+        priority = payload.get('priority', NotificationPriority.NORMAL)
+        context = dict(payload.get('context') or {})
+        if not context.get('website_name'):
+            context['website_name'] = website.name
+
+        allowed = PreferenceService.resolve_channels_for_recipients(
+            recipients=recipients,
+            website=website,
+            event_key=event_key,
+            channels=payload.get('channels') or [NotificationChannel.IN_APP],
+        )
+
+        # Same context for everyone — render once per channel
+        rendered_by_channel: Dict[str, dict] = {}
+        for channel in {c for channels in allowed.values() for c in channels}:
+            template = TemplateService.resolve(
+                event_key=event_key,
+                channel=channel,
+                website=website,
+            )
+            if template:
+                rendered_by_channel[channel] = TemplateService.render(
+                    template, context,
+                )
+            else:
+                logger.warning(
+                    "_deliver_website_group() no template: "
+                    "event=%s channel=%s website=%s.",
+                    event_key,
+                    channel,
+                    website.pk,
+                )
+
+        snapshot = (
+            rendered_by_channel.get(NotificationChannel.IN_APP)
+            or next(iter(rendered_by_channel.values()), {})
+        )
+        now = timezone.now()
+
+        user_channels = {
+            user_id: [c for c in channels if c in rendered_by_channel]
+            for user_id, channels in allowed.items()
+        }
+        user_channels = {
+            user_id: channels
+            for user_id, channels in user_channels.items()
+            if channels
+        }
+        if not user_channels:
+            return 0, [], []
+
+        notifications = Notification.objects.bulk_create([
+            Notification(
+                user_id=user_id,
+                website=website,
+                event_key=event_key,
+                channels=channels,
+                payload=context,
+                rendered=snapshot,
+                actor_id=payload.get('triggered_by_id'),
+                priority=priority,
+                category=payload.get('category') or get_event_category(event_key),
                 is_broadcast=True,
+                status=(
+                    DeliveryStatus.SENT
+                    if channels == [NotificationChannel.IN_APP]
+                    else DeliveryStatus.PENDING
+                ),
+                sent_at=now if channels == [NotificationChannel.IN_APP] else None,
+            )
+            for user_id, channels in user_channels.items()
+        ])
+
+        NotificationsUserStatus.objects.bulk_create([
+            NotificationsUserStatus(
+                user_id=notification.user_id,
+                website=website,
+                notification=notification,
+                priority=priority,
+            )
+            for notification in notifications
+        ])
+
+        deliveries = Delivery.objects.bulk_create([
+            Delivery(
+                event_key=event_key,
+                user_id=notification.user_id,
+                website=website,
+                notification=notification,
+                channel=channel,
+                priority=priority,
+                payload=context,
+                rendered=rendered_by_channel[channel],
+                dedupe_key=(
+                    f"broadcast:{broadcast_id}:{notification.user_id}:{channel}"
+                ),
+                **(
+                    {'status': DeliveryStatus.SENT, 'attempts': 1, 'sent_at': now}
+                    if channel == NotificationChannel.IN_APP
+                    else {'status': DeliveryStatus.QUEUED}
+                ),
+            )
+            for notification in notifications
+            for channel in user_channels[notification.user_id]
+        ])
+
+        # In-app delivery is the unread counter bump — one UPDATE for the group
+        in_app_user_ids = [
+            notification.user_id
+            for notification in notifications
+            if NotificationChannel.IN_APP in user_channels[notification.user_id]
+        ]
+        if in_app_user_ids:
+            UserNotificationMeta.objects.bulk_create(
+                [
+                    UserNotificationMeta(user_id=user_id, website=website)
+                    for user_id in in_app_user_ids
+                ],
+                ignore_conflicts=True,
+            )
+            UserNotificationMeta.objects.filter(
+                website=website,
+                user_id__in=in_app_user_ids,
+            ).update(
+                unread_count=F('unread_count') + 1,
+                last_notified_at=now,
+                updated_at=now,
             )
-            queued += 1
 
-        # Mark broadcast as sent
-        broadcast.sent_at = timezone.now()
-        broadcast.save(update_fields=['sent_at'])
+        pushes = [
+            (notification, rendered_by_channel[NotificationChannel.IN_APP])
+            for notification in notifications
+            if NotificationChannel.IN_APP in user_channels[notification.user_id]
+        ]
+        queued_delivery_ids = [
+            delivery.pk
+            for delivery in deliveries
+            if delivery.status == DeliveryStatus.QUEUED
+        ]
+        return len(notifications), queued_delivery_ids, pushes
 
-        logger.info(
-            "fanout() complete: broadcast=%s recipients=%s.",
-            broadcast_id,
-            queued,
+    @staticmethod
+    def _after_chunk_commit(delivery_ids: List[int], pushes: List[tuple]) -> None:
+        """
+        Queue external channel sends, bump poll state and push
+        in-app notifications.
+        """
+        from notifications_system.services.dispatcher import _push_ws
+        from notifications_system.services.poll_state_service import (
+            PollStateService,
+        )
+        from notifications_system.tasks.send import send_channel_notification
+
+        for delivery_id in delivery_ids:
+            send_channel_notification.delay(delivery_id) # type: ignore[attr-defined]
+
+        PollStateService.record_many(
+            (
+                notification.user_id,
+                notification.website_id,
+                PollStateService.serialize_latest(notification),
+            )
+            for notification, _ in pushes
         )
 
+        for notification, rendered in pushes:
+            _push_ws(notification, rendered)
+
+    @staticmethod
+    def _build_dedupe_key(*, broadcast_id: int, recipient_id: int) -> str:
+        """
+        Outbox dedupe key scoped to the broadcast, so a recipient gets
+        each broadcast exactly once even across fan-out retries.
+        """
+        raw = f"broadcast:{broadcast_id}:{recipient_id}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
     @staticmethod
     def _resolve_recipients(broadcast) -> QuerySet:
         """
         Resolve recipient queryset for a broadcast.
         Website-scoped unless show_to_all with no website = platform-wide.
+        Mirrors BroadcastNotification.is_visible_to() in SQL.
         """
-        User = settings.AUTH_USER_MODEL
+        User = get_user_model()
 
         qs = User.objects.filter(is_active=True)
 
         if broadcast.website:
             qs = qs.filter(website=broadcast.website)
 
-        if not broadcast.show_to_all and broadcast.target_roles:
-            qs = qs.filter(role__in=broadcast.target_roles)
+        if not broadcast.show_to_all:
+            qs = qs.filter(role__in=broadcast.target_roles or [])
 
         return qs
 
@@ -9,13 +9,18 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
+from itertools import groupby
 from typing import Any, Dict, Iterable, List, Optional
 
 from django.conf import settings
+from django.db.models.functions import Mod
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+# Users per digest chunk — one query to load, one UPDATE to mark sent.
+DIGEST_CHUNK_USERS = getattr(settings, 'NOTIFICATION_DIGEST_CHUNK_USERS', 200)
+
 
 class DigestService:
     """
@@ -197,78 +202,154 @@ class DigestService:
     # -------------------------
 
     @staticmethod
-    def send_due_digests() -> None:
+    def send_due_digests(*, lane: int = 0, lanes: int = 1) -> int:
         """
-        Process and send all due unsent digests.
-        Grouped by user to send one email per user per run.
-        Called by the Celery beat task.
+        Process and send due unsent digests.
+        One email per user per website per run.
+
+        Streams recipients in user_id order, DIGEST_CHUNK_USERS at a
+        time, so only one chunk of digest rows is ever in memory.
+        Each chunk is marked sent with a single UPDATE.
+
+        The process_due_digests task runs `lanes` of these in a Celery
+        group; each lane only takes users where user_id % lanes == lane.
+        Called with the defaults it processes every due digest.
+
+        Returns:
+            Count of digest emails sent.
         """
         from notifications_system.models.digest_notifications import (
             NotificationDigest,
         )
 
         now = timezone.now()
-        due = (
+        due = NotificationDigest.objects.filter(
+            is_sent=False,
+            scheduled_for__lte=now,
+        )
+        if lanes > 1:
+            due = due.annotate(_lane=Mod('user_id', lanes)).filter(_lane=lane)
+
+        sent = 0
+        last_user_id = 0
+        while True:
+            user_ids = list(
+                due.filter(user_id__gt=last_user_id)
+                .order_by('user_id')
+                .values_list('user_id', flat=True)
+                .distinct()[:DIGEST_CHUNK_USERS]
+            )
+            if not user_ids:
+                break
+            last_user_id = user_ids[-1]
+
+            sent += DigestService._send_chunk(user_ids=user_ids, now=now)
+
+        return sent
+
+    @staticmethod
+    def _send_chunk(*, user_ids: List[int], now) -> int:
+        """
+        Send digests for one chunk of users.
+        Rows for users whose send failed stay unsent for the next run.
+        """
+        from django.contrib.auth import get_user_model
+        from notifications_system.models.digest_notifications import (
+            NotificationDigest,
+        )
+        from websites.models.websites import Website
+
+        digests = list(
             NotificationDigest.objects.filter(
                 is_sent=False,
                 scheduled_for__lte=now,
-            )
-            .select_related('user', 'website')
-            .order_by('user_id', 'scheduled_for')
+                user_id__in=user_ids,
+            ).order_by('user_id', 'website_id', 'scheduled_for')
         )
 
-        grouped: Dict[int, List] = {}
-        for digest in due:
-            grouped.setdefault(digest.user_id, []).append(digest)
+        users = get_user_model().objects.in_bulk(user_ids)
+        websites = Website.objects.in_bulk({d.website_id for d in digests})
+        templates: Dict[int, Any] = {}
+
+        sent_ids: List[int] = []
+        sent = 0
+        for (user_id, website_id), group in groupby(
+            digests, key=lambda d: (d.user_id, d.website_id)
+        ):
+            group = list(group)
+            if DigestService._send_user_digest(
+                user=users.get(user_id),
+                website=websites.get(website_id),
+                digests=group,
+                templates=templates,
+            ):
+                sent_ids.extend(d.id for d in group)
+                sent += 1
+
+        if sent_ids:
+            NotificationDigest.objects.filter(id__in=sent_ids).update(
+                is_sent=True,
+                sent_at=timezone.now(),
+            )
 
-        for user_id, digests in grouped.items():
-            DigestService._send_user_digest(user_id, digests)
+        logger.info(
+            "_send_chunk() users=%s emails_sent=%s rows_marked=%s.",
+            len(user_ids),
+            sent,
+            len(sent_ids),
+        )
+        return sent
 
     @staticmethod
-    def _send_user_digest(user_id: int, digests: List) -> None:
+    def _send_user_digest(
+        *,
+        user,
+        website,
+        digests: List,
+        templates: Dict[int, Any],
+    ) -> bool:
         """
-        Render and send a single user's digest email.
-        Marks all included digest rows as sent on success.
+        Render and send a single user's digest email for one website.
+
+        templates caches the resolved digest template per website for
+        the chunk; rendering reuses TemplateService's compiled fields.
+
+        Returns:
+            True if sent — the caller marks the rows sent.
         """
         from notifications_system.services.email_service import EmailService
         from notifications_system.services.template_service import TemplateService
         from notifications_system.enums import NotificationChannel
-        from notifications_system.models.digest_notifications import (
-            NotificationDigest,
-        )
 
-        User = settings.AUTH_USER_MODEL
-
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        if user is None or website is None:
             logger.warning(
-                "_send_user_digest() user not found: user_id=%s.", user_id
+                "_send_user_digest() user or website missing: digests=%s.",
+                [d.id for d in digests],
             )
-            return
+            return False
 
         if not user.email or not user.is_active:
             logger.info(
                 "_send_user_digest() skipped: user=%s no email or inactive.",
-                user_id,
+                user.id,
             )
-            return
-
-        website = digests[0].website
+            return False
 
         # Resolve digest template
-        template = TemplateService.resolve(
-            event_key='scheduled.digest_daily',
-            channel=NotificationChannel.EMAIL,
-            website=website,
-        )
+        if website.id not in templates:
+            templates[website.id] = TemplateService.resolve(
+                event_key='scheduled.digest_daily',
+                channel=NotificationChannel.EMAIL,
+                website=website,
+            )
+        template = templates[website.id]
         if not template:
             logger.warning(
                 "_send_user_digest() no template: user=%s website=%s.",
-                user_id,
-                website.id if website else None,
+                user.id,
+                website.id,
             )
-            return
+            return False
 
         # Build context from all digest payloads
         context = {
@@ -282,7 +363,7 @@ class DigestService:
                 }
                 for d in digests
             ],
-            'website_name': website.name if website else '',
+            'website_name': website.name,
         }
 
         rendered = TemplateService.render(template, context)
@@ -293,26 +374,20 @@ class DigestService:
                 rendered=rendered,
                 website=website,
             )
-
-            # Mark all included digests as sent
-            digest_ids = [d.id for d in digests]
-            NotificationDigest.objects.filter(id__in=digest_ids).update(
-                is_sent=True,
-                sent_at=timezone.now(),
-            )
-
-            logger.info(
-                "_send_user_digest() sent: user=%s digest_count=%s.",
-                user_id,
-                len(digests),
-            )
-
         except Exception as exc:
             logger.error(
                 "_send_user_digest() failed: user=%s error=%s.",
-                user_id,
+                user.id,
                 exc,
             )
+            return False
+
+        logger.info(
+            "_send_user_digest() sent: user=%s digest_count=%s.",
+            user.id,
+            len(digests),
+        )
+        return True
 
     # -------------------------
     # Maintenance
@@ -26,6 +26,7 @@ from django.utils import timezone
 
 from notifications_system.enums import (
     DeliveryStatus,
+    NotificationChannel,
     NotificationPriority,
     get_event_category,
 )
@@ -186,6 +187,7 @@ class NotificationDispatcher:
 
         # --- Per-channel delivery
         delivered_to_any = False
+        in_app_queued = False
         for channel in channels:
 
             # Check per-channel user preference
@@ -201,13 +203,27 @@ class NotificationDispatcher:
                 )
                 continue
 
-            NotificationDispatcher._queue_channel_delivery(
+            queued = NotificationDispatcher._queue_channel_delivery(
                 notification=notification,
                 channel=channel,
                 context=context,
                 priority=priority,
             )
             delivered_to_any = True
+            if queued and channel == NotificationChannel.IN_APP:
+                in_app_queued = True
+
+        # Bump the Redis poll state so open tabs see the new notification
+        if in_app_queued:
+            from notifications_system.services.poll_state_service import (
+                PollStateService,
+            )
+            latest = PollStateService.serialize_latest(notification)
+            transaction.on_commit(
+                lambda: PollStateService.record_new(
+                    recipient.id, website.id, latest,
+                )
+            )
 
         # If every channel was suppressed by preferences
         # mark notification as cancelled so it does not
@@ -231,7 +247,7 @@ class NotificationDispatcher:
         channel: str,
         context: Dict[str, Any],
         priority: str,
-    ) -> None:
+    ) -> bool:
         """
         Resolve template, render, create Delivery row, queue send task.
 
@@ -244,6 +260,9 @@ class NotificationDispatcher:
             channel: Channel string e.g. 'email', 'in_app'
             context: Template context variables
             priority: Delivery priority
+
+        Returns:
+            True if a Delivery was queued, False if no template.
         """
         from notifications_system.models.delivery import Delivery
         from notifications_system.services.template_service import TemplateService
@@ -264,7 +283,7 @@ class NotificationDispatcher:
                 channel,
                 notification.website_id,
             )
-            return
+            return False
 
         # --- Render
         rendered = TemplateService.render(template, context)
@@ -274,7 +293,6 @@ class NotificationDispatcher:
         # the channel-agnostic rendering. Fall back to first available.
         # Previously this wrote whichever channel happened to render last,
         # making Notification.rendered non-deterministic.
-        from notifications_system.enums import NotificationChannel
         should_snapshot = (
             channel == NotificationChannel.IN_APP or not notification.rendered
         )
@@ -317,6 +335,7 @@ class NotificationDispatcher:
             channel,
             notification.id,
         )
+        return True
 
 def _push_ws(notification, rendered: dict) -> None:
     """
@@ -18,9 +18,10 @@ Note on delivery:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
-from django.db.models import QuerySet
+from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from notifications_system.enums import (
@@ -30,6 +31,9 @@ from notifications_system.enums import (
 
 logger = logging.getLogger(__name__)
 
+# Meta rows compared and corrected per batch in rebuild_unread_counts().
+UNREAD_REBUILD_CHUNK_SIZE = 2000
+
 
 class InAppService:
     """
@@ -158,53 +162,95 @@ class InAppService:
         )
 
     @staticmethod
-    def get_for_poll(user, website) -> Optional[Dict[str, Any]]:
+    def get_for_poll(user, website=None) -> Dict[str, Any]:
         """
         Return the minimal payload needed for the poll endpoint.
 
-        Returns the most recent unread notification for toast display
-        alongside the cached unread count. Designed to be fast —
-        one integer read and one indexed query.
+        Served from the Redis poll hash (see PollStateService) — one
+        HGETALL and no SQL. Only a user with no hash yet, or a Redis
+        outage, falls back to the database; the result then seeds
+        the hash for the next poll, unless a concurrent write or seed
+        got there first, in which case the published hash wins.
+
+        Args:
+            user: Polling user
+            website: Website — defaults to user.website, loaded only
+                when the SQL fallback runs
 
         Returns:
-            Dict with 'unread_count' and 'latest' or None.
+            Dict with 'unread_count', 'latest' and 'version'.
+            'version' is None when Redis is unavailable.
         """
-        from notifications_system.models.notifications import Notification
-        from notifications_system.models.user_notification_meta import (
-            UserNotificationMeta,
+        from notifications_system.services.poll_state_service import (
+            PollStateService,
         )
+
+        website_id = (
+            website.id if website is not None
+            else getattr(user, 'website_id', None)
+        )
+
+        state = PollStateService.get(user.id, website_id)
+        if state is not None:
+            return state
+
+        if website is None:
+            website = getattr(user, 'website', None)
+
+        token = PollStateService.begin_seed(user.id, website_id)
+        unread_count, latest = InAppService._load_poll_state(user, website)
+        version = PollStateService.finish_seed(
+            user.id,
+            website_id,
+            token,
+            unread_count=unread_count,
+            latest=latest,
+        )
+        if version is None:
+            state = PollStateService.get(user.id, website_id)
+            if state is not None:
+                return state
+
+        return {
+            'unread_count': unread_count,
+            'latest': latest,
+            'version': version,
+        }
+
+    @staticmethod
+    def _load_poll_state(user, website):
+        """
+        Load unread count and the latest unread notification from SQL.
+
+        The count comes from the unread status rows rather than
+        UserNotificationMeta.unread_count, which dispatch does not
+        increment, so a seeded hash matches what record_new() adds
+        to it afterwards.
+
+        Returns:
+            (unread_count, latest toast payload or None)
+        """
+        from notifications_system.models.notifications import Notification
         from notifications_system.models.notifications_user_status import (
             NotificationsUserStatus,
         )
-
-        meta, _ = UserNotificationMeta.objects.get_or_create(
-            user=user,
-            website=website,
+        from notifications_system.services.poll_state_service import (
+            PollStateService,
         )
 
-        # Most recent unread notification for toast
-        unread_notification_ids = NotificationsUserStatus.objects.filter(
+        unread = NotificationsUserStatus.objects.filter(
             user=user,
             website=website,
             is_read=False,
-        ).values_list('notification_id', flat=True)
+        )
 
+        # Most recent unread notification for toast
         latest = Notification.objects.filter(
-            id__in=unread_notification_ids,
+            id__in=unread.values_list('notification_id', flat=True),
             status=DeliveryStatus.SENT,
         ).order_by('-created_at').first()
 
-        return {
-            'unread_count': meta.unread_count,
-            'latest': {
-                'id': latest.id,
-                'title': latest.title,
-                'message': latest.message,
-                'event_key': latest.event_key,
-                'category': latest.category,
-                'created_at': latest.created_at.isoformat(),
-            } if latest else None,
-        }
+        return unread.count(), PollStateService.serialize_latest(latest)
 
     # ─────────────────────────────────────────────────────────
     # Read state mutations
@@ -257,6 +303,7 @@ class InAppService:
 
         user_status.mark_read()
         InAppService._recalculate_unread(user, website)
+        InAppService._refresh_poll_state(user, website)
 
         logger.debug(
             "InAppService.mark_read(): notification=%s user=%s.",
@@ -296,6 +343,16 @@ class InAppService:
             website=website,
         ).update(unread_count=0)
 
+        from notifications_system.services.poll_state_service import (
+            PollStateService,
+        )
+        PollStateService.replace(
+            user.id,
+            getattr(website, 'id', None),
+            unread_count=0,
+            latest=None,
+        )
+
         logger.info(
             "InAppService.mark_all_read(): marked %s read "
             "for user=%s website=%s.",
@@ -412,6 +469,138 @@ class InAppService:
         )
         return meta.unread_count
 
+    @staticmethod
+    def rebuild_unread_counts(*, since=None) -> int:
+        """
+        Recalculate cached unread counts from NotificationsUserStatus.
+
+        Counts for every (user, website) pair come from one grouped
+        query. Meta rows are then compared UNREAD_REBUILD_CHUNK_SIZE
+        at a time, and drifted rows are recounted in the UPDATE itself
+        so increments that land after the grouped query are kept.
+
+        Args:
+            since: Incremental mode — only recheck users with a status
+                row updated or read at or after this time (both
+                indexed; updated_at is also set on creation). Deleted
+                status rows are only caught by a full run.
+
+        Returns:
+            Count of meta rows corrected.
+        """
+        from notifications_system.models.notifications_user_status import (
+            NotificationsUserStatus,
+        )
+        from notifications_system.models.user_notification_meta import (
+            UserNotificationMeta,
+        )
+
+        metas = UserNotificationMeta.objects.all()
+        statuses = NotificationsUserStatus.objects.filter(is_read=False)
+
+        if since is not None:
+            # Kept as a subquery so a busy window does not turn into
+            # an IN list of every changed user id.
+            changed_users = NotificationsUserStatus.objects.filter(
+                Q(updated_at__gte=since) | Q(read_at__gte=since)
+            ).values('user_id')
+            if not changed_users.exists():
+                return 0
+            metas = metas.filter(user_id__in=changed_users)
+            statuses = statuses.filter(user_id__in=changed_users)
+
+        actual_counts = {
+            (row['user_id'], row['website_id']): row['unread']
+            for row in statuses.values('user_id', 'website_id')
+            .annotate(unread=Count('id'))
+            .order_by()
+            .iterator()
+        }
+
+        corrected = 0
+        last_pk = 0
+        while True:
+            chunk = list(
+                metas.filter(pk__gt=last_pk)
+                .order_by('pk')
+                .only('id', 'user_id', 'website_id', 'unread_count')
+                [:UNREAD_REBUILD_CHUNK_SIZE]
+            )
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+
+            drifted = [
+                meta for meta in chunk
+                if meta.unread_count
+                != actual_counts.get((meta.user_id, meta.website_id), 0)
+            ]
+
+            if drifted:
+                InAppService._recount_unread(drifted)
+                InAppService._forget_poll_state(drifted)
+                corrected += len(drifted)
+
+        return corrected
+
+    @staticmethod
+    def _recount_unread(metas) -> None:
+        """
+        Set unread_count on meta rows from a correlated COUNT.
+
+        The count is evaluated by the UPDATE, not copied from an
+        earlier snapshot, so concurrent F('unread_count') + 1 writes
+        are not overwritten with a stale value.
+        """
+        from notifications_system.models.notifications_user_status import (
+            NotificationsUserStatus,
+        )
+        from notifications_system.models.user_notification_meta import (
+            UserNotificationMeta,
+        )
+
+        def unread(**website_filter):
+            return Coalesce(
+                Subquery(
+                    NotificationsUserStatus.objects.filter(
+                        user_id=OuterRef('user_id'),
+                        is_read=False,
+                        **website_filter,
+                    )
+                    .order_by()
+                    .values('user_id')
+                    .annotate(unread=Count('id'))
+                    .values('unread')
+                ),
+                0,
+            )
+
+        now = timezone.now()
+        scoped = [meta.pk for meta in metas if meta.website_id is not None]
+        global_ = [meta.pk for meta in metas if meta.website_id is None]
+
+        if scoped:
+            UserNotificationMeta.objects.filter(pk__in=scoped).update(
+                unread_count=unread(website_id=OuterRef('website_id')),
+                updated_at=now,
+            )
+        if global_:
+            UserNotificationMeta.objects.filter(pk__in=global_).update(
+                unread_count=unread(website__isnull=True),
+                updated_at=now,
+            )
+
+    @staticmethod
+    def _forget_poll_state(metas) -> None:
+        """Drop Redis poll state so the next poll reloads corrected counts."""
+        from notifications_system.services.poll_state_service import (
+            PollStateService,
+        )
+
+        PollStateService.forget_many(
+            (meta.user_id, meta.website_id) for meta in metas
+        )
+
     @staticmethod
     def touch(user, website) -> None:
         """
@@ -462,4 +651,22 @@ class InAppService:
             website=website,
         ).update(unread_count=count)
 
-        return count
\ No newline at end of file
+        return count
+
+    @staticmethod
+    def _refresh_poll_state(user, website) -> None:
+        """
+        Rewrite the Redis poll hash from SQL and bump its version.
+        Called after read-state changes so open tabs pick them up.
+        """
+        from notifications_system.services.poll_state_service import (
+            PollStateService,
+        )
+
+        unread_count, latest = InAppService._load_poll_state(user, website)
+        PollStateService.replace(
+            user.id,
+            getattr(website, 'id', None),
+            unread_count=unread_count,
+            latest=latest,
+        )
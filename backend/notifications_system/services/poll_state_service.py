@@ -0,0 +1,366 @@
+# notifications_system/services/poll_state_service.py
+"""
+Redis-held poll state for the in-app notification bell.
+
+One hash per user per website:
+    unread   — unread in-app count
+    version  — feed version, bumped on every change
+    latest   — JSON of the most recent unread notification, '' if none
+
+Writers (dispatcher, broadcast fan-out, mark-read) update the hash
+atomically with small Lua scripts. The poll endpoint reads it with a single HGETALL, so
+an idle poll never touches the database.
+
+Redis is a cache here — UserNotificationMeta and NotificationsUserStatus
+stay the source of truth. A missing hash is rebuilt from SQL on the
+next poll, and every method degrades to a no-op if Redis is down.
+
+Seeding is two-phase so a slow SQL load cannot overwrite newer state:
+begin_seed() leaves a placeholder (a 'seeding' token, no version)
+before the load, writers mark a placeholder 'stale', and finish_seed()
+publishes only if its token is still current, nothing went stale and
+no one published a version in the meantime.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Idle users' hashes expire and are rebuilt from SQL on their next poll.
+POLL_STATE_TTL_SECONDS = getattr(
+    settings, 'NOTIFICATION_POLL_STATE_TTL_SECONDS', 7 * 24 * 3600
+)
+
+# A seed placeholder outlives at most one slow SQL load.
+POLL_SEED_TIMEOUT_SECONDS = 60
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> Redis:
+    """Return the process-wide Redis client."""
+    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+
+# Bump an existing hash atomically. A missing hash is left alone so a
+# half-written hash without a seeded version can never appear; a seed
+# placeholder is marked stale so its pending seed is discarded.
+_RECORD_NEW_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if redis.call('HEXISTS', KEYS[1], 'version') == 0 then
+    redis.call('HSET', KEYS[1], 'stale', 1)
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], 'unread', 1)
+redis.call('HSET', KEYS[1], 'latest', ARGV[1])
+redis.call('HINCRBY', KEYS[1], 'version', 1)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+# Overwrite unread + latest. Bump the version of an existing hash,
+# or start a new one at ARGV[3] (current time in ms).
+_REPLACE_LUA = """
+local version
+if redis.call('HEXISTS', KEYS[1], 'version') == 1 then
+    version = redis.call('HINCRBY', KEYS[1], 'version', 1)
+else
+    version = ARGV[3]
+    redis.call('HSET', KEYS[1], 'version', version)
+end
+redis.call('HSET', KEYS[1], 'unread', ARGV[1], 'latest', ARGV[2])
+redis.call('HDEL', KEYS[1], 'seeding', 'stale')
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return version
+"""
+
+
+# Claim the seed of a hash that has no version yet. ARGV[1] is the
+# seeder's token; a newer seeder takes over from an older one.
+_BEGIN_SEED_LUA = """
+if redis.call('HEXISTS', KEYS[1], 'version') == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'seeding', ARGV[1])
+redis.call('HDEL', KEYS[1], 'stale')
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+# Publish a seed only if this seeder still owns the placeholder and no
+# write touched it. A stale placeholder is dropped so the next poll
+# reseeds. ARGV: token, version, unread, latest, ttl.
+_FINISH_SEED_LUA = """
+if redis.call('HEXISTS', KEYS[1], 'version') == 1 then
+    return false
+end
+if redis.call('HGET', KEYS[1], 'seeding') ~= ARGV[1] then
+    return false
+end
+if redis.call('HEXISTS', KEYS[1], 'stale') == 1 then
+    redis.call('DEL', KEYS[1])
+    return false
+end
+redis.call('HDEL', KEYS[1], 'seeding')
+redis.call('HSET', KEYS[1], 'version', ARGV[2], 'unread', ARGV[3], 'latest', ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return ARGV[2]
+"""
+
+
+@lru_cache(maxsize=1)
+def _record_new_script(client: Redis):
+    return client.register_script(_RECORD_NEW_LUA)
+
+
+@lru_cache(maxsize=1)
+def _replace_script(client: Redis):
+    return client.register_script(_REPLACE_LUA)
+
+
+@lru_cache(maxsize=1)
+def _begin_seed_script(client: Redis):
+    return client.register_script(_BEGIN_SEED_LUA)
+
+
+@lru_cache(maxsize=1)
+def _finish_seed_script(client: Redis):
+    return client.register_script(_FINISH_SEED_LUA)
+
+
+class PollStateService:
+    """
+    Read and update the per-user poll hash.
+    """
+
+    @staticmethod
+    def _client() -> Redis:
+        return _shared_client()
+
+    @staticmethod
+    def _key(user_id: int, website_id: Optional[int]) -> str:
+        return f"notif:poll:{website_id or 'global'}:{user_id}"
+
+    @staticmethod
+    def serialize_latest(notification) -> Optional[Dict[str, Any]]:
+        """Toast payload for a notification — same shape the poll returns."""
+        if notification is None:
+            return None
+        return {
+            'id': notification.id,
+            'title': notification.title,
+            'message': notification.message,
+            'event_key': notification.event_key,
+            'category': notification.category,
+            'created_at': notification.created_at.isoformat(),
+        }
+
+    # -------------------------
+    # Reads
+    # -------------------------
+
+    @staticmethod
+    def get(user_id: int, website_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Return {'unread_count', 'latest', 'version'} or None if the
+        hash is missing or Redis is unavailable.
+        """
+        try:
+            state = PollStateService._client().hgetall(
+                PollStateService._key(user_id, website_id)
+            )
+        except RedisError as exc:
+            logger.warning("PollStateService.get() Redis error: %s", exc)
+            return None
+
+        if not state or 'version' not in state:
+            return None
+
+        latest = state.get('latest')
+        return {
+            'unread_count': int(state.get('unread') or 0),
+            'latest': json.loads(latest) if latest else None,
+            'version': state['version'],
+        }
+
+    @staticmethod
+    def get_version(user_id: int, website_id: Optional[int]) -> Optional[str]:
+        """Current feed version — one HGET. Used by long polls."""
+        try:
+            return PollStateService._client().hget(
+                PollStateService._key(user_id, website_id),
+                'version',
+            )
+        except RedisError as exc:
+            logger.warning("PollStateService.get_version() Redis error: %s", exc)
+            return None
+
+    # -------------------------
+    # Writes
+    # -------------------------
+
+    @staticmethod
+    def replace(
+        user_id: int,
+        website_id: Optional[int],
+        *,
+        unread_count: int,
+        latest: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Overwrite unread count and latest, and bump the version.
+
+        Used after read-state changes, with counts loaded after the
+        change. A missing hash is seeded through begin_seed() and
+        finish_seed() instead. A new hash starts its version at the current time in
+        milliseconds, so a rebuilt hash never reuses a version an old
+        ETag might hold.
+
+        Returns the new version, or None if Redis is unavailable.
+        """
+        key = PollStateService._key(user_id, website_id)
+        try:
+            client = PollStateService._client()
+            return str(_replace_script(client)(
+                keys=[key],
+                args=[
+                    unread_count,
+                    json.dumps(latest) if latest else '',
+                    int(time.time() * 1000),
+                    POLL_STATE_TTL_SECONDS,
+                ],
+            ))
+        except RedisError as exc:
+            logger.warning("PollStateService.replace() Redis error: %s", exc)
+            PollStateService.forget(user_id, website_id)
+            return None
+
+    @staticmethod
+    def begin_seed(user_id: int, website_id: Optional[int]) -> Optional[str]:
+        """
+        Claim the seed of a missing hash before loading it from SQL.
+
+        Returns a token for finish_seed(), or None if the hash already
+        has a version or Redis is unavailable.
+        """
+        token = uuid.uuid4().hex
+        try:
+            client = PollStateService._client()
+            claimed = _begin_seed_script(client)(
+                keys=[PollStateService._key(user_id, website_id)],
+                args=[token, POLL_SEED_TIMEOUT_SECONDS],
+            )
+        except RedisError as exc:
+            logger.warning("PollStateService.begin_seed() Redis error: %s", exc)
+            return None
+        return token if claimed else None
+
+    @staticmethod
+    def finish_seed(
+        user_id: int,
+        website_id: Optional[int],
+        token: Optional[str],
+        *,
+        unread_count: int,
+        latest: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Publish state loaded after begin_seed().
+
+        Returns the new version, or None if the seed was superseded,
+        went stale, or Redis is unavailable. Callers then re-read the
+        hash rather than trusting their own load.
+        """
+        if token is None:
+            return None
+
+        try:
+            client = PollStateService._client()
+            version = _finish_seed_script(client)(
+                keys=[PollStateService._key(user_id, website_id)],
+                args=[
+                    token,
+                    int(time.time() * 1000),
+                    unread_count,
+                    json.dumps(latest) if latest else '',
+                    POLL_STATE_TTL_SECONDS,
+                ],
+            )
+        except RedisError as exc:
+            logger.warning("PollStateService.finish_seed() Redis error: %s", exc)
+            return None
+        return str(version) if version is not None else None
+
+    @staticmethod
+    def record_new(user_id: int, website_id: Optional[int], latest: Dict[str, Any]) -> None:
+        """
+        Record a newly delivered in-app notification.
+
+        Only touches an existing hash — a missing one is seeded on the
+        next poll from a COUNT of unread status rows, which includes
+        this notification.
+        """
+        PollStateService.record_many([(user_id, website_id, latest)])
+
+    @staticmethod
+    def record_many(entries: Iterable[tuple]) -> None:
+        """
+        Bulk record_new() for (user_id, website_id, latest) entries.
+        One pipelined round trip for the whole batch.
+        """
+        entries = list(entries)
+        if not entries:
+            return
+
+        try:
+            client = PollStateService._client()
+            record = _record_new_script(client)
+            pipe = client.pipeline(transaction=False)
+            for user_id, website_id, latest in entries:
+                record(
+                    keys=[PollStateService._key(user_id, website_id)],
+                    args=[json.dumps(latest), POLL_STATE_TTL_SECONDS],
+                    client=pipe,
+                )
+            pipe.execute()
+        except RedisError as exc:
+            logger.warning("PollStateService.record_many() Redis error: %s", exc)
+            for user_id, website_id, _ in entries:
+                PollStateService.forget(user_id, website_id)
+
+    @staticmethod
+    def forget(user_id: int, website_id: Optional[int]) -> None:
+        """Drop the hash so the next poll rebuilds it from SQL."""
+        try:
+            PollStateService._client().delete(
+                PollStateService._key(user_id, website_id)
+            )
+        except RedisError as exc:
+            logger.warning("PollStateService.forget() Redis error: %s", exc)
+
+    @staticmethod
+    def forget_many(pairs: Iterable[tuple]) -> None:
+        """forget() for many (user_id, website_id) pairs in one DEL."""
+        keys = [
+            PollStateService._key(user_id, website_id)
+            for user_id, website_id in pairs
+        ]
+        if not keys:
+            return
+        try:
+            PollStateService._client().delete(*keys)
+        except RedisError as exc:
+            logger.warning("PollStateService.forget_many() Redis error: %s", exc)
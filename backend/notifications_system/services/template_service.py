@@ -6,8 +6,11 @@ Absorbed render.py — all template logic lives here.
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 
+from django.conf import settings
 from django.core.cache import cache
 from django.db.models import Case, IntegerField, Q, Value, When
 from django.template import Context, Template
@@ -16,6 +19,19 @@ logger = logging.getLogger(__name__)
 
 TEMPLATE_CACHE_TTL = 300 # 5 minutes
 
+# Max compiled NotificationTemplates kept per process.
+COMPILED_TEMPLATE_CACHE_SIZE = getattr(
+    settings, 'NOTIFICATION_COMPILED_TEMPLATE_CACHE_SIZE', 512
+)
+
+# Every renderable text field on NotificationTemplate.
+RENDER_FIELDS = ('subject', 'body_html', 'body_text', 'title', 'message')
+
+# (template pk, updated_at, locale) → {field: compiled template or None}.
+# Saving a template bumps updated_at, so edits never match a stale entry.
+_compiled_templates: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
 
 def _is_template_path(text: str) -> bool:
     """
@@ -153,6 +169,8 @@ class TemplateService:
         """
         Render a template with context variables.
         Uses Django's template engine for {{variable}} substitution.
+        Fields are compiled once per template version and reused
+        from an in-process LRU — see _compiled_fields().
 
         Args:
             template: NotificationTemplate instance
@@ -164,36 +182,29 @@ class TemplateService:
             In-app: title, message
         """
         ctx = Context(context or {})
+        compiled_fields = TemplateService._compiled_fields(template)
 
-        def render_field(text: str) -> str:
+        rendered = {}
+        for field in RENDER_FIELDS:
+            text = getattr(template, field, '')
             if not text:
-                return ''
+                continue
+
+            compiled = compiled_fields.get(field)
+            if compiled is None:
+                rendered[field] = text # return unrendered rather than crashing
+                continue
+
             try:
                 if _is_template_path(text):
-                    from django.template.loader import render_to_string
-                    return render_to_string(text, context or {})
-                return Template(text).render(ctx)
+                    rendered[field] = compiled.render(context or {})
+                else:
+                    rendered[field] = compiled.render(ctx)
             except Exception as exc:
                 logger.warning(
                     "TemplateService.render() field rendering failed: %s", exc
                 )
-                return text # return unrendered rather than crashing
-
-        rendered = {}
-
-        # Email fields
-        if template.subject:
-            rendered['subject'] = render_field(template.subject)
-        if template.body_html:
-            rendered['body_html'] = render_field(template.body_html)
-        if template.body_text:
-            rendered['body_text'] = render_field(template.body_text)
-
-        # In-app fields
-        if template.title:
-            rendered['title'] = render_field(template.title)
-        if template.message:
-            rendered['message'] = render_field(template.message)
+                rendered[field] = text
 
         return rendered
 
@@ -202,9 +213,12 @@ class TemplateService:
         """
         Invalidate cached template resolution for an event + channel + website.
         Call this when a template is created, updated, or deactivated.
+        Also drops this process's compiled templates.
         """
         from notifications_system.models.notification_event import NotificationEvent
 
+        TemplateService.clear_compiled_cache()
+
         website_id = getattr(website, 'id', None)
         event = NotificationEvent.objects.filter(event_key=event_key).first()
         if not event:
@@ -219,6 +233,61 @@ class TemplateService:
             )
             cache.delete(key)
 
+    @staticmethod
+    def clear_compiled_cache() -> None:
+        """Drop every compiled template held by this process."""
+        with _compiled_lock:
+            _compiled_templates.clear()
+
+    @staticmethod
+    def _compiled_fields(template) -> Dict[str, Any]:
+        """
+        Return compiled templates for every non-empty render field.
+
+        Keyed by (pk, updated_at, locale) in a bounded LRU. Unsaved
+        templates (no pk) are compiled without being cached.
+        """
+        key = (template.pk, getattr(template, 'updated_at', None), template.locale)
+
+        if template.pk is not None:
+            with _compiled_lock:
+                compiled_fields = _compiled_templates.get(key)
+                if compiled_fields is not None:
+                    _compiled_templates.move_to_end(key)
+                    return compiled_fields
+
+        compiled_fields = {
+            field: TemplateService._compile(text)
+            for field in RENDER_FIELDS
+            if (text := getattr(template, field, ''))
+        }
+
+        if template.pk is not None:
+            with _compiled_lock:
+                _compiled_templates[key] = compiled_fields
+                while len(_compiled_templates) > COMPILED_TEMPLATE_CACHE_SIZE:
+                    _compiled_templates.popitem(last=False)
+
+        return compiled_fields
+
+    @staticmethod
+    def _compile(text: str):
+        """
+        Compile one template field.
+        File paths go through the template loader, inline text through
+        Template(). Returns None if the text does not compile.
+        """
+        try:
+            if _is_template_path(text):
+                from django.template.loader import get_template
+                return get_template(text)
+            return Template(text)
+        except Exception as exc:
+            logger.warning(
+                "TemplateService._compile() field compilation failed: %s", exc
+            )
+            return None
+
     @staticmethod
     def _locale_chain(locale: str) -> list:
         """
@@ -4,19 +4,53 @@ from __future__ import annotations
 
 import logging
 
-from celery import shared_task
+from celery import group, shared_task
+from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Parallel digest senders. Each lane streams its own share of users,
+# so this bounds concurrency regardless of backlog size.
+DIGEST_LANES = getattr(settings, 'NOTIFICATION_DIGEST_LANES', 4)
+
+# A lane still running from the previous hour keeps its lock; the new
+# run skips that lane instead of sending the same rows twice.
+DIGEST_LANE_LOCK_SECONDS = 55 * 60
+
 
 @shared_task
 def process_due_digests() -> None:
     """
     Send all due unsent digests.
     Scheduled via Celery beat — run every hour.
+
+    Fans out one send_digest_lane task per lane as a Celery group.
+    """
+    logger.info("process_due_digests: starting %s lanes.", DIGEST_LANES)
+    group(
+        send_digest_lane.s(lane, DIGEST_LANES)
+        for lane in range(DIGEST_LANES)
+    ).apply_async()
+
+
+@shared_task(name='notifications_system.tasks.digest.send_digest_lane')
+def send_digest_lane(lane: int, lanes: int) -> None:
+    """
+    Send due digests for users where user_id % lanes == lane.
     """
     from notifications_system.services.digest_service import DigestService
 
-    logger.info("process_due_digests: starting.")
-    DigestService.send_due_digests()
-    logger.info("process_due_digests: complete.")
\ No newline at end of file
+    lock_key = f"notif:digest_lane:{lanes}:{lane}"
+    if not cache.add(lock_key, 1, timeout=DIGEST_LANE_LOCK_SECONDS):
+        logger.info("send_digest_lane: lane=%s/%s still running.", lane, lanes)
+        return
+
+    try:
+        sent = DigestService.send_due_digests(lane=lane, lanes=lanes)
+    finally:
+        cache.delete(lock_key)
+
+    logger.info(
+        "send_digest_lane: lane=%s/%s sent %s digests.", lane, lanes, sent,
+    )
@@ -15,6 +15,11 @@ Full Celery Beat schedule — add this block to your settings:
             'task': 'notifications_system.tasks.maintenance.rebuild_unread_counts',
             'schedule': crontab(hour=4, minute=0),
         },
+        'notif-rebuild-unread-counts-incremental': {
+            'task': 'notifications_system.tasks.maintenance.rebuild_unread_counts',
+            'schedule': crontab(minute=15),
+            'kwargs': {'incremental': True},
+        },
         'notif-cleanup-processed-outbox': {
             'task': 'notifications_system.tasks.maintenance.cleanup_processed_outbox',
             'schedule': crontab(hour=3, minute=30),
@@ -35,6 +40,10 @@ Full Celery Beat schedule — add this block to your settings:
             'task': 'notifications_system.tasks.maintenance.process_pending_webhook_events',
             'schedule': crontab(minute='*/5'),
         },
+        'notif-resume-stalled-broadcasts': {
+            'task': 'notifications_system.tasks.maintenance.resume_stalled_broadcasts',
+            'schedule': crontab(minute='*/10'),
+        },
     }
 """
 from __future__ import annotations
@@ -60,35 +69,34 @@ def clear_stale_digests(before_days: int = 30) -> None:
     logger.info("clear_stale_digests: deleted %s rows.", deleted)
 
 
+# Start time of the last successful rebuild_unread_counts run.
+UNREAD_REBUILD_WATERMARK_KEY = 'notif:unread_rebuild:last_run'
+
+
 @shared_task
-def rebuild_unread_counts() -> None:
+def rebuild_unread_counts(incremental: bool = False) -> None:
     """
     Recalculate unread counts from source of truth.
     Run daily or manually after data migrations if counts drift.
-    """
-    from notifications_system.models.user_notification_meta import (
-        UserNotificationMeta,
-    )
-    from notifications_system.models.notifications_user_status import (
-        NotificationsUserStatus,
-    )
 
-    metas = UserNotificationMeta.objects.select_related('user', 'website').all()
-    updated = 0
+    incremental=True only rechecks users whose status rows changed
+    since the last successful run, and falls back to a full run when
+    there is no previous run recorded.
+    """
+    from django.core.cache import cache
+    from notifications_system.services.inapp_service import InAppService
 
-    for meta in metas.iterator():
-        actual_count = NotificationsUserStatus.objects.filter(
-            user=meta.user,
-            website=meta.website,
-            is_read=False,
-        ).count()
+    started_at = timezone.now()
+    since = cache.get(UNREAD_REBUILD_WATERMARK_KEY) if incremental else None
 
-        if meta.unread_count != actual_count:
-            meta.unread_count = actual_count
-            meta.save(update_fields=['unread_count', 'updated_at'])
-            updated += 1
+    updated = InAppService.rebuild_unread_counts(since=since)
+    cache.set(UNREAD_REBUILD_WATERMARK_KEY, started_at, timeout=None)
 
-    logger.info("rebuild_unread_counts: updated %s meta rows.", updated)
+    logger.info(
+        "rebuild_unread_counts: updated %s meta rows (%s).",
+        updated,
+        'incremental' if since else 'full',
+    )
 
 
 @shared_task
@@ -99,17 +107,30 @@ def cleanup_processed_outbox(before_days: int = 7) -> None:
     Recycles dedupe_keys so the same event can be legitimately
     re-sent after the retention window. Override via OUTBOX_RETAIN_DAYS
     in settings. Run daily.
+
+    Once the table is partitioned, rows are left for the monthly
+    partition retention and only their dedupe keys are recycled here.
     """
     from django.conf import settings
+    from core.services.dedupe_key_service import DedupeKeyService
+    from core.services.partition_service import PartitionService
     from notifications_system.models.outbox import Outbox
 
     before_days = getattr(settings, 'OUTBOX_RETAIN_DAYS', before_days)
     threshold = timezone.now() - timedelta(days=before_days)
-    deleted, _ = Outbox.objects.filter(
-        status=Outbox.PROCESSED,
-        processed_at__lt=threshold,
-    ).delete()
-    logger.info("cleanup_processed_outbox: deleted %s rows.", deleted)
+    expired = {'status': Outbox.PROCESSED, 'processed_at__lt': threshold}
+
+    if not PartitionService.is_partitioned(Outbox._meta.db_table):
+        deleted, _ = Outbox.objects.filter(**expired).delete()
+        logger.info("cleanup_processed_outbox: deleted %s rows.", deleted)
+
+    released = DedupeKeyService.release_unused(
+        Outbox._meta.label,
+        Outbox.objects.exclude(**expired),
+        'dedupe_key',
+        before=threshold,
+    )
+    logger.info("cleanup_processed_outbox: released %s dedupe keys.", released)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -264,4 +285,37 @@ def process_pending_webhook_events() -> None:
         processed,
         failed,
         ignored,
-    )
\ No newline at end of file
+    )
+
+
+@shared_task(name='notifications_system.tasks.maintenance.resume_stalled_broadcasts')
+def resume_stalled_broadcasts(stalled_minutes: int = 10) -> None:
+    """
+    Requeue broadcast fan-outs that started but stopped making progress.
+
+    Each fan-out chunk commits its cursor, so a worker crash or a
+    dropped task leaves the broadcast with fanout_started_at set and
+    sent_at empty. Requeueing resumes after the last committed chunk.
+
+    Run every 10 minutes.
+    """
+    from notifications_system.models.broadcast_notification import (
+        BroadcastNotification,
+    )
+    from notifications_system.services.broadcast_services import BroadcastService
+
+    threshold = timezone.now() - timedelta(minutes=stalled_minutes)
+    stalled = BroadcastNotification.objects.filter(
+        is_active=True,
+        fanout_started_at__isnull=False,
+        sent_at__isnull=True,
+        updated_at__lt=threshold,
+    ).values_list('id', flat=True)
+
+    count = 0
+    for broadcast_id in stalled:
+        BroadcastService._queue_fanout(broadcast_id)
+        count += 1
+
+    if count:
+        logger.info("resume_stalled_broadcasts: requeued %s broadcasts.", count)
@@ -257,10 +257,12 @@ def process_broadcast_fanout(self, broadcast_id: int) -> None:
     Fan out a broadcast to all recipients.
 
     Called by BroadcastService._queue_fanout() after the
-    BroadcastNotification row is written.
+    BroadcastNotification row is written, and by
+    resume_stalled_broadcasts for fan-outs that stopped midway.
 
-    Each recipient gets their own notify() call which writes
-    its own outbox row — fully independent delivery per user.
+    Recipients are written to the outbox in chunks, each chunk
+    handed to process_broadcast_chunk. A retry resumes after the
+    last committed chunk.
 
     Retry once after 30 seconds on failure.
     """
@@ -277,6 +279,33 @@ def process_broadcast_fanout(self, broadcast_id: int) -> None:
         raise self.retry(exc=exc)
 
 
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    name='notifications_system.tasks.send.process_broadcast_chunk',
+)
+def process_broadcast_chunk(self, broadcast_id: int, outbox_ids: list) -> None:
+    """
+    Deliver one chunk of broadcast outbox rows in bulk.
+
+    Called by BroadcastService._queue_chunk() once per fan-out chunk.
+    Already-processed rows are skipped, so retries are safe.
+    """
+    from notifications_system.services.broadcast_services import BroadcastService
+
+    try:
+        BroadcastService.deliver_chunk(broadcast_id, outbox_ids)
+    except Exception as exc:
+        logger.error(
+            "process_broadcast_chunk: broadcast=%s rows=%s failed: %s.",
+            broadcast_id,
+            len(outbox_ids),
+            exc,
+        )
+        raise self.retry(exc=exc)
+
+
 # ─────────────────────────────────────────────────────────────
 # Private helpers
 # ─────────────────────────────────────────────────────────────
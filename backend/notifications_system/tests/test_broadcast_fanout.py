@@ -0,0 +1,147 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from notifications_system.enums import NotificationChannel, NotificationEvent
+from notifications_system.models.broadcast_notification import (
+    BroadcastNotification,
+)
+from notifications_system.models.event_config import NotificationEventConfig
+from notifications_system.models.notifications import Notification
+from notifications_system.models.notifications_user_status import (
+    NotificationsUserStatus,
+)
+from notifications_system.models.outbox import Outbox
+from notifications_system.models.user_notification_meta import (
+    UserNotificationMeta,
+)
+from notifications_system.services import broadcast_services
+from notifications_system.services.broadcast_services import BroadcastService
+
+User = get_user_model()
+
+
+@pytest.fixture
+def recipients(website):
+    return [
+        User.objects.create_user(
+            username=f"broadcast_client_{index}",
+            email=f"broadcast{index}@test.com",
+            password="testpass123",
+            role="client",
+            website=website,
+            is_active=True,
+        )
+        for index in range(3)
+    ]
+
+
+@pytest.fixture
+def broadcast(website):
+    return BroadcastNotification.objects.create(
+        title="Maintenance",
+        message="Scheduled maintenance tonight.",
+        event_type=NotificationEvent.ADMIN_BROADCAST,
+        website=website,
+        channels=[NotificationChannel.IN_APP],
+        show_to_all=True,
+    )
+
+
+@pytest.fixture
+def queued_chunks():
+    chunks = []
+    with patch.object(broadcast_services, "FANOUT_CHUNK_SIZE", 2), \
+            patch.object(
+                BroadcastService,
+                "_queue_chunk",
+                side_effect=lambda broadcast_id, ids: chunks.append(ids),
+            ):
+        yield chunks
+
+
+@pytest.mark.django_db(transaction=True)
+def test_fanout_writes_outbox_in_chunks(broadcast, recipients, queued_chunks):
+    BroadcastService.fanout(broadcast.pk)
+
+    broadcast.refresh_from_db()
+    assert broadcast.sent_at is not None
+    assert broadcast.fanout_cursor == max(user.pk for user in recipients)
+    assert broadcast.fanout_recipient_count == 3
+    assert [len(chunk) for chunk in queued_chunks] == [2, 1]
+    assert Outbox.objects.filter(payload__broadcast_id=broadcast.pk).count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_fanout_resumes_after_cursor(broadcast, recipients, queued_chunks):
+    BroadcastNotification.objects.filter(pk=broadcast.pk).update(
+        fanout_cursor=recipients[0].pk,
+    )
+
+    BroadcastService.fanout(broadcast.pk)
+
+    outbox_users = set(Outbox.objects.values_list("user_id", flat=True))
+    assert outbox_users == {recipients[1].pk, recipients[2].pk}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_deliver_chunk_bulk_creates_notifications(
+    broadcast,
+    recipients,
+    queued_chunks,
+):
+    BroadcastService.fanout(broadcast.pk)
+
+    with patch(
+        "notifications_system.services.template_service.TemplateService.resolve",
+        return_value=object(),
+    ), patch(
+        "notifications_system.services.template_service.TemplateService.render",
+        return_value={"title": "Maintenance", "message": "Tonight"},
+    ), patch.object(BroadcastService, "_after_chunk_commit"):
+        for chunk in queued_chunks:
+            BroadcastService.deliver_chunk(broadcast.pk, chunk)
+        # A retried chunk is a no-op
+        assert BroadcastService.deliver_chunk(broadcast.pk, queued_chunks[0]) == 0
+
+    assert Notification.objects.filter(is_broadcast=True).count() == 3
+    assert NotificationsUserStatus.objects.count() == 3
+    assert not Outbox.objects.filter(status=Outbox.PENDING).exists()
+    assert list(
+        UserNotificationMeta.objects.values_list("unread_count", flat=True)
+    ) == [1, 1, 1]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_deliver_chunk_skips_recipients_on_cooldown(
+    broadcast,
+    recipients,
+    queued_chunks,
+):
+    NotificationEventConfig.objects.create(
+        event_key=broadcast.event_type,
+        label="Broadcast",
+        cooldown_seconds=3600,
+    )
+    Notification.objects.create(
+        user=recipients[0],
+        website=broadcast.website,
+        event_key=broadcast.event_type,
+    )
+    BroadcastService.fanout(broadcast.pk)
+
+    with patch(
+        "notifications_system.services.template_service.TemplateService.resolve",
+        return_value=object(),
+    ), patch(
+        "notifications_system.services.template_service.TemplateService.render",
+        return_value={"title": "Maintenance", "message": "Tonight"},
+    ), patch.object(BroadcastService, "_after_chunk_commit"):
+        for chunk in queued_chunks:
+            BroadcastService.deliver_chunk(broadcast.pk, chunk)
+
+    assert set(
+        Notification.objects.filter(is_broadcast=True)
+        .values_list("user_id", flat=True)
+    ) == {recipients[1].pk, recipients[2].pk}
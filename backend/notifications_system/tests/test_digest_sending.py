@@ -0,0 +1,68 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from notifications_system.models.digest_notifications import NotificationDigest
+from notifications_system.services import digest_service
+from notifications_system.services.digest_service import DigestService
+
+
+def _due_digest(user, website, event_key='order.completed'):
+    return NotificationDigest.objects.create(
+        user=user,
+        website=website,
+        digest_group='daily_summary',
+        event='order_updates',
+        event_key=event_key,
+        payload={'order_id': 1},
+        scheduled_for=timezone.now() - timedelta(minutes=1),
+    )
+
+
+@pytest.fixture
+def digest_delivery():
+    with patch.object(digest_service, 'DIGEST_CHUNK_USERS', 1), patch(
+        'notifications_system.services.template_service.TemplateService.resolve',
+        return_value=object(),
+    ), patch(
+        'notifications_system.services.template_service.TemplateService.render',
+        return_value={'subject': 'Digest', 'body_html': '<p>Digest</p>'},
+    ), patch(
+        'notifications_system.services.email_service.EmailService.send_rendered',
+    ) as send:
+        yield send
+
+
+@pytest.mark.django_db
+def test_send_due_digests_sends_one_email_per_user(
+    client_user,
+    other_client,
+    website,
+    digest_delivery,
+):
+    _due_digest(client_user, website, 'order.completed')
+    _due_digest(client_user, website, 'order.assigned')
+    _due_digest(other_client, website)
+
+    assert DigestService.send_due_digests() == 2
+    assert digest_delivery.call_count == 2
+    assert not NotificationDigest.objects.filter(is_sent=False).exists()
+
+
+@pytest.mark.django_db
+def test_failed_send_leaves_rows_unsent(
+    client_user,
+    other_client,
+    website,
+    digest_delivery,
+):
+    failing = _due_digest(client_user, website)
+    _due_digest(other_client, website)
+    digest_delivery.side_effect = [RuntimeError('provider down'), None]
+
+    assert DigestService.send_due_digests() == 1
+
+    failing.refresh_from_db()
+    assert failing.is_sent is False
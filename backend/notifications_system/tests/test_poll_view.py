@@ -0,0 +1,197 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from notifications_system.services.poll_state_service import PollStateService
+from notifications_system.throttles import NotificationPollThrottle
+from notifications_system.views.polling import (
+    NotificationPollView,
+    notification_poll,
+)
+
+STATE = {
+    'unread_count': 2,
+    'latest': {'id': 7, 'title': 'Order ready'},
+    'version': '1700000000000',
+}
+
+
+def _poll(user, **headers):
+    request = APIRequestFactory().get('/notifications/poll/', **headers)
+    force_authenticate(request, user=user)
+    return NotificationPollView.as_view()(request)
+
+
+@pytest.fixture(autouse=True)
+def poll_rate():
+    # settings.test replaces DEFAULT_THROTTLE_RATES without this scope
+    with patch.dict(
+        NotificationPollThrottle.THROTTLE_RATES,
+        {'notification_poll': '1000/minute'},
+    ):
+        yield
+
+
+def _long_poll(user, wait):
+    request = APIRequestFactory().get(
+        f'/notifications/poll/?wait={wait}',
+        HTTP_IF_NONE_MATCH='"1700000000000"',
+    )
+    force_authenticate(request, user=user)
+    return async_to_sync(notification_poll)(request)
+
+
+@pytest.fixture
+def cached_state():
+    with patch.object(PollStateService, 'get', return_value=dict(STATE)):
+        yield
+
+
+@pytest.mark.django_db
+def test_poll_returns_state_with_etag(client_user, cached_state):
+    response = _poll(client_user)
+
+    assert response.status_code == 200
+    assert response.data['unread_count'] == 2
+    assert response['ETag'] == '"1700000000000"'
+
+
+@pytest.mark.django_db
+def test_unchanged_poll_is_304_without_queries(
+    client_user,
+    cached_state,
+    django_assert_num_queries,
+):
+    with django_assert_num_queries(0):
+        response = _poll(client_user, HTTP_IF_NONE_MATCH='"1700000000000"')
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_long_poll_returns_new_state_when_version_changes(client_user):
+    changed = dict(STATE, version='1700000000001')
+
+    with patch.object(
+        PollStateService,
+        'get',
+        side_effect=[dict(STATE), changed],
+    ), patch.object(
+        PollStateService,
+        'get_version',
+        return_value='1700000000001',
+    ), patch(
+        'notifications_system.views.polling.asyncio.sleep',
+        new_callable=AsyncMock,
+    ) as sleep:
+        response = _long_poll(client_user, wait=5)
+
+    assert response.status_code == 200
+    assert response['ETag'] == '"1700000000001"'
+    sleep.assert_awaited_once()
+
+
+@pytest.mark.django_db
+def test_long_poll_times_out_with_304(client_user, cached_state):
+    with patch.object(
+        PollStateService,
+        'get_version',
+        return_value='1700000000000',
+    ) as get_version:
+        response = _long_poll(client_user, wait=1)
+
+    assert response.status_code == 304
+    assert get_version.called
+
+
+@pytest.mark.django_db
+def test_sync_view_never_waits(client_user, cached_state):
+    request = APIRequestFactory().get(
+        '/notifications/poll/?wait=5',
+        HTTP_IF_NONE_MATCH='"1700000000000"',
+    )
+    force_authenticate(request, user=client_user)
+
+    with patch.object(PollStateService, 'get_version') as get_version:
+        response = NotificationPollView.as_view()(request)
+
+    assert response.status_code == 304
+    get_version.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_missing_hash_is_seeded_from_sql(client_user):
+    from notifications_system.services.inapp_service import InAppService
+
+    with (
+        patch.object(PollStateService, 'get', return_value=None),
+        patch.object(PollStateService, 'begin_seed', return_value='tok') as begin,
+        patch.object(
+            PollStateService,
+            'finish_seed',
+            return_value='1700000000000',
+        ) as finish,
+        patch.object(InAppService, '_load_poll_state', return_value=(3, None)),
+    ):
+        state = InAppService.get_for_poll(client_user)
+
+    assert state == {
+        'unread_count': 3,
+        'latest': None,
+        'version': '1700000000000',
+    }
+    begin.assert_called_once_with(client_user.id, client_user.website_id)
+    assert finish.call_args.args[2] == 'tok'
+
+
+@pytest.mark.django_db
+def test_superseded_seed_returns_published_state(client_user):
+    from notifications_system.services.inapp_service import InAppService
+
+    # First read misses; by the time the SQL load finishes a writer
+    # has published a newer hash, which must win over the stale load.
+    with (
+        patch.object(PollStateService, 'get', side_effect=[None, dict(STATE)]),
+        patch.object(PollStateService, 'begin_seed', return_value='tok'),
+        patch.object(PollStateService, 'finish_seed', return_value=None),
+        patch.object(InAppService, '_load_poll_state', return_value=(1, None)),
+    ):
+        state = InAppService.get_for_poll(client_user)
+
+    assert state == STATE
+
+
+@pytest.mark.django_db
+def test_seed_counts_unread_status_rows(client_user, website):
+    from notifications_system.enums import DeliveryStatus
+    from notifications_system.models.notifications import Notification
+    from notifications_system.models.notifications_user_status import (
+        NotificationsUserStatus,
+    )
+    from notifications_system.models.user_notification_meta import (
+        UserNotificationMeta,
+    )
+    from notifications_system.services.inapp_service import InAppService
+
+    # dispatch leaves the meta counter untouched
+    UserNotificationMeta.objects.create(user=client_user, website=website)
+    for is_read in (False, False, True):
+        notification = Notification.objects.create(
+            user=client_user,
+            website=website,
+            event_key='order.completed',
+            status=DeliveryStatus.SENT,
+        )
+        NotificationsUserStatus.objects.create(
+            notification=notification,
+            user=client_user,
+            website=website,
+            is_read=is_read,
+        )
+
+    unread_count, latest = InAppService._load_poll_state(client_user, website)
+
+    assert unread_count == 2
+    assert latest is not None
@@ -0,0 +1,63 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from notifications_system.models.notifications_template import (
+    NotificationTemplate,
+)
+from notifications_system.services import template_service
+from notifications_system.services.template_service import TemplateService
+
+
+@pytest.fixture(autouse=True)
+def empty_compiled_cache():
+    TemplateService.clear_compiled_cache()
+    yield
+    TemplateService.clear_compiled_cache()
+
+
+def _template(**fields):
+    defaults = {
+        'pk': 1,
+        'channel': 'in_app',
+        'locale': 'en',
+        'title': 'Hello {{ name }}',
+        'message': 'Order #{{ order_id }} is ready.',
+        'updated_at': timezone.now(),
+    }
+    defaults.update(fields)
+    return NotificationTemplate(**defaults)
+
+
+def test_render_compiles_each_field_once():
+    template = _template()
+
+    with patch.object(
+        template_service,
+        'Template',
+        wraps=template_service.Template,
+    ) as compile_spy:
+        first = TemplateService.render(template, {'name': 'Ann', 'order_id': 1})
+        second = TemplateService.render(template, {'name': 'Bo', 'order_id': 2})
+
+    assert compile_spy.call_count == 2
+    assert first == {'title': 'Hello Ann', 'message': 'Order #1 is ready.'}
+    assert second == {'title': 'Hello Bo', 'message': 'Order #2 is ready.'}
+
+
+def test_edited_template_is_recompiled():
+    template = _template()
+    TemplateService.render(template, {'name': 'Ann'})
+
+    template.title = 'Hi {{ name }}'
+    template.updated_at = template.updated_at + timedelta(seconds=1)
+
+    assert TemplateService.render(template, {'name': 'Ann'})['title'] == 'Hi Ann'
+
+
+def test_invalid_field_is_returned_unrendered():
+    template = _template(title='Hello {% broken', message='')
+
+    assert TemplateService.render(template, {}) == {'title': 'Hello {% broken'}
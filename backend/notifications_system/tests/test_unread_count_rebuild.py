@@ -0,0 +1,118 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from notifications_system.models.notifications import Notification
+from notifications_system.models.notifications_user_status import (
+    NotificationsUserStatus,
+)
+from notifications_system.models.user_notification_meta import (
+    UserNotificationMeta,
+)
+from notifications_system.services.inapp_service import InAppService
+from notifications_system.services.poll_state_service import PollStateService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    with patch.object(PollStateService, 'forget_many'):
+        yield
+
+
+def _unread(user, website, count, *, platform_wide=False):
+    for _ in range(count):
+        notification = Notification.objects.create(
+            user=user,
+            website=website,
+            event_key='order.completed',
+        )
+        NotificationsUserStatus.objects.create(
+            user=user,
+            website=None if platform_wide else website,
+            notification=notification,
+        )
+
+
+@pytest.mark.django_db
+def test_full_rebuild_fixes_drifted_counts(client_user, other_client, website):
+    _unread(client_user, website, 3)
+    _unread(other_client, website, 1)
+    drifted = UserNotificationMeta.objects.create(
+        user=client_user, website=website, unread_count=9,
+    )
+    correct = UserNotificationMeta.objects.create(
+        user=other_client, website=website, unread_count=1,
+    )
+
+    assert InAppService.rebuild_unread_counts() == 1
+
+    drifted.refresh_from_db()
+    correct.refresh_from_db()
+    assert drifted.unread_count == 3
+    assert correct.unread_count == 1
+
+
+@pytest.mark.django_db
+def test_incremental_rebuild_skips_unchanged_users(
+    client_user,
+    other_client,
+    website,
+):
+    _unread(client_user, website, 2)
+    UserNotificationMeta.objects.create(
+        user=client_user, website=website, unread_count=0,
+    )
+    untouched = UserNotificationMeta.objects.create(
+        user=other_client, website=website, unread_count=5,
+    )
+
+    since = timezone.now() - timedelta(minutes=5)
+    assert InAppService.rebuild_unread_counts(since=since) == 1
+
+    untouched.refresh_from_db()
+    assert untouched.unread_count == 5
+    assert UserNotificationMeta.objects.get(user=client_user).unread_count == 2
+
+
+@pytest.mark.django_db
+def test_rebuild_keeps_deliveries_that_land_after_the_count(
+    client_user,
+    website,
+):
+    _unread(client_user, website, 3)
+    meta = UserNotificationMeta.objects.create(
+        user=client_user, website=website, unread_count=0,
+    )
+    recount = InAppService._recount_unread
+
+    def deliver_then_recount(metas):
+        # A delivery commits between the grouped count and the UPDATE.
+        _unread(client_user, website, 1)
+        recount(metas)
+
+    with patch.object(
+        InAppService,
+        '_recount_unread',
+        side_effect=deliver_then_recount,
+    ):
+        assert InAppService.rebuild_unread_counts() == 1
+
+    meta.refresh_from_db()
+    assert meta.unread_count == 4
+
+
+@pytest.mark.django_db
+def test_rebuild_counts_platform_wide_meta_separately(client_user, website):
+    _unread(client_user, website, 2)
+    # Status rows without a website feed the platform-wide meta row.
+    _unread(client_user, website, 1, platform_wide=True)
+    global_meta = UserNotificationMeta.objects.create(
+        user=client_user, website=None, unread_count=7,
+    )
+
+    assert InAppService.rebuild_unread_counts() == 1
+
+    global_meta.refresh_from_db()
+    assert global_meta.unread_count == 1
@@ -6,7 +6,7 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
 from notifications_system.views.notifications import NotificationFeedViewSet
-from notifications_system.views.polling import NotificationPollView
+from notifications_system.views.polling import notification_poll
 from notifications_system.views.preferences import (
     NotificationPreferenceView,
     NotificationEventPreferenceViewSet,
@@ -95,7 +95,7 @@ urlpatterns = [
     # Poll endpoint (throttled)
     path(
         'poll/',
-        NotificationPollView.as_view(),
+        notification_poll,
         name='notification-poll',
     ),
 ]
@@ -4,29 +4,116 @@ Frontend calls this every 30 seconds to check for new notifications.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from notifications_system.services.inapp_service import InAppService
+from notifications_system.services.poll_state_service import PollStateService
 from notifications_system.throttles import NotificationPollThrottle
 
+# Upper bound for ?wait= — keep below proxy and worker timeouts.
+LONG_POLL_MAX_SECONDS = getattr(settings, 'NOTIFICATION_LONG_POLL_MAX_SECONDS', 25)
+LONG_POLL_CHECK_SECONDS = 1
+
 
 class NotificationPollView(APIView):
     """
     GET /notifications/poll/
 
     Returns unread count and the most recent unread notification
-    for toast display. Designed to be fast — one integer read
-    and one indexed query.
+    for toast display. Served from Redis — an idle poll runs no
+    notification queries.
 
-    Frontend calls this every 30 seconds. The throttle
-    (4/minute) prevents faster polling.
+    Conditional requests:
+        The response carries an ETag derived from the feed version.
+        Sending it back in If-None-Match returns 304 when nothing
+        changed. Adding ?wait=<seconds> holds a 304 until the version
+        changes or the wait (max LONG_POLL_MAX_SECONDS) runs out, so
+        one request replaces several short polls. The wait happens in
+        notification_poll, outside this sync view.
     """
     permission_classes = [IsAuthenticated]
     throttle_classes = [NotificationPollThrottle]
 
     def get(self, request):
-        website = getattr(request.user, 'website', None)
-        payload = InAppService.get_for_poll(request.user, website)
-        return Response(payload)
\ No newline at end of file
+        payload = InAppService.get_for_poll(request.user)
+        etag = self._etag(payload)
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(
+                status=status.HTTP_304_NOT_MODIFIED,
+                headers={'ETag': etag},
+            )
+
+        return Response(
+            payload,
+            headers={'ETag': etag, 'Cache-Control': 'private, no-cache'},
+        )
+
+    @staticmethod
+    def _etag(payload) -> str:
+        """
+        Version-based ETag. Falls back to a content hash when Redis
+        is unavailable and the payload has no version.
+        """
+        if payload.get('version') is not None:
+            return quote_etag(str(payload['version']))
+        digest = hashlib.sha1(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return quote_etag(digest)
+
+    @staticmethod
+    def _wait_seconds(request) -> int:
+        try:
+            wait = int(request.GET.get('wait', 0))
+        except (TypeError, ValueError):
+            return 0
+        return max(0, min(wait, LONG_POLL_MAX_SECONDS))
+
+
+_poll_view = NotificationPollView.as_view()
+
+
+async def notification_poll(request):
+    """
+    Route for NotificationPollView that holds ?wait= polls.
+
+    The poll runs in the sync view. A 304 for a request with ?wait= is
+    then held here on asyncio.sleep, checking the feed version once a
+    second with a single Redis HGET, and the view runs again once it
+    changes. A waiting client costs a coroutine rather than the thread
+    Daphne shares between all sync views.
+    """
+    response = await sync_to_async(_poll_view)(request)
+    wait = NotificationPollView._wait_seconds(request)
+
+    # only version ETags can be compared against the Redis hash
+    version = response.get('ETag', '').strip('"')
+    if response.status_code != status.HTTP_304_NOT_MODIFIED or not (
+        wait and version.isdigit()
+    ):
+        return response
+
+    # set by DRF's authentication on the underlying request
+    user = request.user
+    website_id = getattr(user, 'website_id', None)
+    get_version = sync_to_async(PollStateService.get_version, thread_sensitive=False)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while loop.time() < deadline:
+        await asyncio.sleep(LONG_POLL_CHECK_SECONDS)
+        if await get_version(user.id, website_id) != version:
+            return await sync_to_async(_poll_view)(request)
+
+    return response
@@ -42,6 +42,9 @@ from order_pricing_core.api.views.pricing_snapshot_views import (
 from order_pricing_core.api.views.public_estimate_views import (
     PublicPaperEstimateView,
 )
+from order_pricing_core.api.views.public_estimate_views import (
+    PublicPaperPriceMatrixView,
+)
 from order_pricing_core.api.views.public_config_views import (
     PublicPricingConfigView,
 )
@@ -84,6 +87,11 @@ urlpatterns = [
         PublicPaperEstimateView.as_view(),
         name="public-paper-estimate",
     ),
+    path(
+        "public/price-matrix/",
+        PublicPaperPriceMatrixView.as_view(),
+        name="public-paper-price-matrix",
+    ),
     path(
         "quotes/paper/start/",
         PaperOrderQuoteStartView.as_view(),
@@ -4,8 +4,11 @@ Public, non-persistent pricing estimates for marketing calculators.
 
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Any
 
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import permissions
@@ -26,8 +29,16 @@ from order_pricing_core.models import ServiceCatalogItem
 from order_pricing_core.models import SubjectRate
 from order_pricing_core.models import WebsitePricingProfile
 from order_pricing_core.models import WorkTypeRate
+from order_pricing_core.selectors.pricing_catalog_selectors import (
+    get_pricing_catalog,
+)
 from websites.models.websites import Website
 
+PRICE_MATRIX_MAX_CELLS = 2000
+PRICE_MATRIX_CACHE_KEY = (
+    "order_pricing_core:price_matrix:{website_id}:{version}:{digest}"
+)
+
 
 class PublicPaperEstimateSerializer(serializers.Serializer):
     """Small public calculator payload."""
@@ -48,6 +59,34 @@ class PublicPaperEstimateSerializer(serializers.Serializer):
     )
 
 
+class PublicPaperPriceMatrixSerializer(serializers.Serializer):
+    """Cartesian product of inputs for a public price table."""
+
+    service_code = serializers.CharField(required=False, allow_blank=True)
+    pages = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=500),
+        min_length=1,
+        max_length=100,
+    )
+    deadline_hours = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=50,
+    )
+    academic_level_codes = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        max_length=20,
+    )
+    spacing = serializers.ChoiceField(
+        choices=SpacingMode.CHOICES,
+        default=SpacingMode.DEFAULT,
+    )
+    paper_type_code = serializers.CharField(required=False, allow_blank=True)
+    work_type_code = serializers.CharField(required=False, allow_blank=True)
+    subject_code = serializers.CharField(required=False, allow_blank=True)
+
+
 def _resolve_website(request) -> Website | None:
     website = getattr(request, "website", None)
     if website is not None:
@@ -85,6 +124,28 @@ def _active_code(model, *, website, requested: str) -> str:
     return item.code
 
 
+def _ordered_codes(options) -> list[str]:
+    """
+    Return catalog codes in admin display order (sort_order, then id).
+    """
+    return sorted(
+        options,
+        key=lambda code: (options[code].sort_order, options[code].id),
+    )
+
+
+def _catalog_code(options, *, label: str, requested: str) -> str:
+    if requested and requested in options:
+        return requested
+
+    codes = _ordered_codes(options)
+    if not codes:
+        raise DjangoValidationError(
+            {label: "No active pricing option is configured."}
+        )
+    return codes[0]
+
+
 def _service_for(*, website, requested: str) -> ServiceCatalogItem:
     queryset = ServiceCatalogItem.objects.filter(
         website=website,
@@ -216,3 +277,136 @@ class PublicPaperEstimateView(APIView):
                 "suggestions": result.suggestions,
             }
         )
+
+
+class PublicPaperPriceMatrixView(APIView):
+    """
+    POST /api/v1/pricing/public/price-matrix/
+
+    Prices a pages x deadline x academic level grid in one request for
+    public price tables. Results are cached per website and pricing
+    catalog version, so any catalog change serves fresh prices.
+    """
+
+    permission_classes = [permissions.AllowAny]
+
+    def post(self, request) -> Response:
+        serializer = PublicPaperPriceMatrixSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data: dict[str, Any] = dict(serializer.validated_data)
+
+        website = _resolve_website(request)
+        if website is None:
+            return Response(
+                {"detail": "No website is available for pricing."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        pages = sorted(set(data["pages"]))
+        deadline_hours = sorted(set(data["deadline_hours"]))
+
+        try:
+            catalog = get_pricing_catalog(website=website)
+            profile = catalog.get_profile()
+            service = _service_for(
+                website=website,
+                requested=data.get("service_code", ""),
+            )
+            academic_level_codes = list(
+                dict.fromkeys(
+                    data.get("academic_level_codes")
+                    or _ordered_codes(catalog.academic_levels)
+                )
+            )
+            request_key = {
+                "service_code": service.service_code,
+                "pages": pages,
+                "deadline_hours": deadline_hours,
+                "academic_level_codes": academic_level_codes,
+                "spacing": data["spacing"],
+                "paper_type_code": _catalog_code(
+                    catalog.paper_types,
+                    label="PaperTypeRate",
+                    requested=data.get("paper_type_code", ""),
+                ),
+                "work_type_code": _catalog_code(
+                    catalog.work_types,
+                    label="WorkTypeRate",
+                    requested=data.get("work_type_code", ""),
+                ),
+                "subject_code": _catalog_code(
+                    catalog.subjects,
+                    label="SubjectRate",
+                    requested=data.get("subject_code", ""),
+                ),
+            }
+        except (DjangoValidationError, ObjectDoesNotExist):
+            return Response(
+                {"detail": "Pricing is not fully configured for this website."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cell_count = (
+            len(pages) * len(deadline_hours) * len(academic_level_codes)
+        )
+        if cell_count > PRICE_MATRIX_MAX_CELLS:
+            return Response(
+                {
+                    "detail": (
+                        "Price matrix is too large. "
+                        f"Maximum is {PRICE_MATRIX_MAX_CELLS} cells."
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cache_key = None
+        if catalog.version is not None:
+            digest = hashlib.sha256(
+                json.dumps(request_key, sort_keys=True).encode()
+            ).hexdigest()
+            cache_key = PRICE_MATRIX_CACHE_KEY.format(
+                website_id=website.pk,
+                version=catalog.version,
+                digest=digest,
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return Response(cached)
+
+        try:
+            cells = PaperOrderPricingCalculator().calculate_matrix(
+                website=website,
+                pages_options=pages,
+                deadline_hours_options=deadline_hours,
+                academic_level_codes=academic_level_codes,
+                spacing=request_key["spacing"],
+                paper_type_code=request_key["paper_type_code"],
+                work_type_code=request_key["work_type_code"],
+                subject_code=request_key["subject_code"],
+            )
+        except (DjangoValidationError, ObjectDoesNotExist):
+            return Response(
+                {"detail": "Pricing is not fully configured for this website."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        body = {
+            "currency": profile.currency,
+            **request_key,
+            "cells": [
+                {
+                    "pages": cell.pages,
+                    "deadline_hours": cell.deadline_hours,
+                    "academic_level_code": cell.academic_level_code,
+                    "total": _money(cell.total),
+                    "suggestions": cell.suggestions,
+                }
+                for cell in cells
+            ],
+        }
+
+        if cache_key is not None:
+            cache.set(cache_key, body)
+
+        return Response(body)
@@ -39,6 +39,19 @@ class PriceCalculationResult:
     suggestions: list[dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class PriceMatrixCell:
+    """
+    Represents one cell of a batch-priced matrix.
+    """
+
+    pages: int
+    deadline_hours: int
+    academic_level_code: str
+    total: Decimal
+    suggestions: list[dict[str, Any]] = field(default_factory=list)
+
+
 class BasePricingCalculator:
     """
     Base class for all pricing calculators.
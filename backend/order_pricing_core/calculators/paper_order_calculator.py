@@ -12,18 +12,19 @@ from django.core.exceptions import ValidationError
 from order_pricing_core.calculators.base import BasePricingCalculator
 from order_pricing_core.calculators.base import PriceBreakdownItem
 from order_pricing_core.calculators.base import PriceCalculationResult
+from order_pricing_core.calculators.base import PriceMatrixCell
 from order_pricing_core.constants import BreakdownLineType
 from order_pricing_core.constants import QuoteMode
 from order_pricing_core.constants import SpacingMode
-from order_pricing_core.models import AcademicLevelRate
-from order_pricing_core.models import AnalysisLevelRate
 from order_pricing_core.models import DeadlineRate
-from order_pricing_core.models import PaperTypeRate
-from order_pricing_core.models import ServiceAddon
 from order_pricing_core.models import SubjectRate
-from order_pricing_core.models import WorkTypeRate
-from order_pricing_core.models import WriterLevelRate
 from order_pricing_core.models import WebsitePricingProfile
+from order_pricing_core.selectors.pricing_catalog_selectors import (
+    PricingCatalog,
+)
+from order_pricing_core.selectors.pricing_catalog_selectors import (
+    get_pricing_catalog,
+)
 from order_pricing_core.validators.deadline_validators import (
     deadline_is_tight,
 )
@@ -46,6 +47,9 @@ TWOPLACES = Decimal("0.01")
 class PaperOrderPricingCalculator(BasePricingCalculator):
     """
     Calculator for standard paper-based orders.
+
+    Rates are read from the website's cached pricing catalog rather
+    than queried per call.
     """
 
     def calculate(
@@ -62,10 +66,8 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
         if mode not in {QuoteMode.ESTIMATE, QuoteMode.FINAL}:
             raise ValidationError({"mode": "Unsupported quote mode."})
 
-        profile = WebsitePricingProfile.objects.get(
-            website=website,
-            is_active=True,
-        )
+        catalog = get_pricing_catalog(website=website)
+        profile = catalog.get_profile()
 
         pages = require_positive_int(payload, "pages", "Pages")
         deadline_hours = require_positive_int(
@@ -90,7 +92,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
             )
 
         return self._final_result(
-            website=website,
+            catalog=catalog,
             profile=profile,
             pages=pages,
             deadline_hours=deadline_hours,
@@ -131,6 +133,108 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
             suggestions=suggestions,
         )
 
+    def calculate_matrix(
+        self,
+        *,
+        website,
+        pages_options: list[int],
+        deadline_hours_options: list[int],
+        academic_level_codes: list[str],
+        spacing: str,
+        paper_type_code: str,
+        work_type_code: str,
+        subject_code: str,
+    ) -> list[PriceMatrixCell]:
+        """
+        Price every pages x deadline x academic level combination.
+
+        Rates are looked up once and shared prefixes of the multiplier
+        chain are computed once per row. Multipliers are applied in the
+        same order and rounded at the same steps as ``_final_result``,
+        so every cell matches a single final quote exactly.
+        """
+        catalog = get_pricing_catalog(website=website)
+        profile = catalog.get_profile()
+
+        shared_multipliers = [
+            self._get_spacing_multiplier(profile=profile, spacing=spacing),
+            catalog.get_paper_type(paper_type_code).multiplier,
+            catalog.get_work_type(work_type_code).multiplier,
+        ]
+        subject_multiplier = self._get_subject_multiplier(
+            catalog.get_subject(subject_code),
+        )
+        level_multipliers = [
+            (code, catalog.get_academic_level(code).multiplier)
+            for code in academic_level_codes
+        ]
+        deadline_multipliers = [
+            (
+                hours,
+                self._get_deadline_rate(
+                    catalog=catalog,
+                    deadline_hours=hours,
+                ).multiplier,
+            )
+            for hours in deadline_hours_options
+        ]
+
+        cells: list[PriceMatrixCell] = []
+
+        for pages in pages_options:
+            page_subtotal = self._apply_chain(
+                subtotal=self._money(
+                    Decimal(pages) * profile.base_price_per_page
+                ),
+                multipliers=shared_multipliers,
+            )
+            suggestions_by_hours = {
+                hours: self._build_deadline_suggestions(
+                    profile=profile,
+                    pages=pages,
+                    deadline_hours=hours,
+                )
+                for hours, _ in deadline_multipliers
+            }
+
+            for code, level_multiplier in level_multipliers:
+                level_subtotal = self._apply_chain(
+                    subtotal=page_subtotal,
+                    multipliers=[level_multiplier, subject_multiplier],
+                )
+
+                for hours, deadline_multiplier in deadline_multipliers:
+                    subtotal = self._money(
+                        max(
+                            self._money(level_subtotal * deadline_multiplier),
+                            profile.minimum_paper_order_charge,
+                        )
+                    )
+                    cells.append(
+                        PriceMatrixCell(
+                            pages=pages,
+                            deadline_hours=hours,
+                            academic_level_code=code,
+                            total=subtotal,
+                            suggestions=suggestions_by_hours[hours],
+                        )
+                    )
+
+        return cells
+
+    def _apply_chain(
+        self,
+        *,
+        subtotal: Decimal,
+        multipliers: list[Decimal],
+    ) -> Decimal:
+        """
+        Apply multipliers in order, rounding after each step.
+        """
+        for multiplier in multipliers:
+            subtotal = self._money(subtotal * multiplier)
+        return subtotal
+
     def _estimate_result(
         self,
         *,
@@ -191,7 +295,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
     def _final_result(
         self,
         *,
-        website,
+        catalog: PricingCatalog,
         profile: WebsitePricingProfile,
         pages: int,
         deadline_hours: int,
@@ -209,30 +313,12 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
         """
         Build the final calculated price result.
         """
-        paper_type_rate = PaperTypeRate.objects.get(
-            website=website,
-            code=paper_type_code,
-            is_active=True,
-        )
-        work_type_rate = WorkTypeRate.objects.get(
-            website=website,
-            code=work_type_code,
-            is_active=True,
-        )
-        subject_rate = SubjectRate.objects.select_related(
-            "category"
-        ).get(
-            website=website,
-            code=subject_code,
-            is_active=True,
-        )
-        academic_level_rate = AcademicLevelRate.objects.get(
-            website=website,
-            code=academic_level_code,
-            is_active=True,
-        )
+        paper_type_rate = catalog.get_paper_type(paper_type_code)
+        work_type_rate = catalog.get_work_type(work_type_code)
+        subject_rate = catalog.get_subject(subject_code)
+        academic_level_rate = catalog.get_academic_level(academic_level_code)
         deadline_rate = self._get_deadline_rate(
-            website=website,
+            catalog=catalog,
             deadline_hours=deadline_hours,
         )
 
@@ -306,7 +392,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
 
         if analysis_level:
             subtotal = self._apply_analysis_level(
-                website=website,
+                catalog=catalog,
                 subtotal=subtotal,
                 analysis_level=analysis_level,
                 lines=lines,
@@ -314,7 +400,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
 
         if writer_level_code:
             subtotal = self._apply_writer_level(
-                website=website,
+                catalog=catalog,
                 subtotal=subtotal,
                 writer_level_code=writer_level_code,
                 lines=lines,
@@ -328,7 +414,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
             )
 
         subtotal = self._apply_addons(
-            website=website,
+            catalog=catalog,
             subtotal=subtotal,
             addon_codes=addon_codes,
             lines=lines,
@@ -374,17 +460,13 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
     def _get_deadline_rate(
         self,
         *,
-        website,
+        catalog: PricingCatalog,
         deadline_hours: int,
     ) -> DeadlineRate:
         """
         Return the first matching deadline band.
         """
-        deadline_rate = DeadlineRate.objects.filter(
-            website=website,
-            is_active=True,
-            max_hours__gte=deadline_hours,
-        ).order_by("max_hours").first()
+        deadline_rate = catalog.get_deadline_rate(deadline_hours)
 
         if deadline_rate is None:
             raise ValidationError(
@@ -446,7 +528,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
     def _apply_analysis_level(
         self,
         *,
-        website,
+        catalog: PricingCatalog,
         subtotal: Decimal,
         analysis_level: str,
         lines: list[PriceBreakdownItem],
@@ -454,11 +536,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
         """
         Apply analysis-level multiplier when selected.
         """
-        analysis_rate = AnalysisLevelRate.objects.get(
-            website=website,
-            level=analysis_level,
-            is_active=True,
-        )
+        analysis_rate = catalog.get_analysis_level(analysis_level)
         return self._apply_multiplier(
             subtotal=subtotal,
             multiplier=analysis_rate.multiplier,
@@ -470,7 +548,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
     def _apply_writer_level(
         self,
         *,
-        website,
+        catalog: PricingCatalog,
         subtotal: Decimal,
         writer_level_code: str,
         lines: list[PriceBreakdownItem],
@@ -478,11 +556,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
         """
         Apply writer-level upsell pricing.
         """
-        writer_level_rate = WriterLevelRate.objects.get(
-            website=website,
-            code=writer_level_code,
-            is_active=True,
-        )
+        writer_level_rate = catalog.get_writer_level(writer_level_code)
 
         if writer_level_rate.is_flat_fee:
             fee = self._money(writer_level_rate.amount)
@@ -529,7 +603,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
     def _apply_addons(
         self,
         *,
-        website,
+        catalog: PricingCatalog,
         subtotal: Decimal,
         addon_codes: list[Any],
         lines: list[PriceBreakdownItem],
@@ -547,11 +621,7 @@ class PaperOrderPricingCalculator(BasePricingCalculator):
         if not codes:
             return subtotal
 
-        addons = ServiceAddon.objects.filter(
-            website=website,
-            addon_code__in=codes,
-            is_active=True,
-        ).order_by("sort_order", "id")
+        addons = catalog.get_addons(codes)
 
         running_total = subtotal
         for addon in addons:
@@ -0,0 +1,264 @@
+"""
+Pricing catalog snapshot selectors for the order_pricing_core app.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Mapping
+from dataclasses import dataclass
+from threading import Lock
+from types import MappingProxyType
+from typing import Any
+
+from django.core.cache import cache
+
+from order_pricing_core.models import AcademicLevelRate
+from order_pricing_core.models import AnalysisLevelRate
+from order_pricing_core.models import DeadlineRate
+from order_pricing_core.models import PaperTypeRate
+from order_pricing_core.models import ServiceAddon
+from order_pricing_core.models import SubjectRate
+from order_pricing_core.models import WebsitePricingProfile
+from order_pricing_core.models import WorkTypeRate
+from order_pricing_core.models import WriterLevelRate
+
+
+@dataclass(frozen=True)
+class PricingCatalog:
+    """
+    Immutable snapshot of one website's active pricing catalog.
+
+    Lookups mirror the ORM: a missing entry raises the model's
+    ``DoesNotExist`` so callers keep their existing error handling.
+    """
+
+    website_id: Any
+    version: Any
+    built_at: float
+    profile: WebsitePricingProfile | None
+    paper_types: Mapping[str, PaperTypeRate]
+    work_types: Mapping[str, WorkTypeRate]
+    subjects: Mapping[str, SubjectRate]
+    academic_levels: Mapping[str, AcademicLevelRate]
+    analysis_levels: Mapping[str, AnalysisLevelRate]
+    writer_levels: Mapping[str, WriterLevelRate]
+    addons: tuple[ServiceAddon, ...]
+    deadline_max_hours: tuple[int, ...]
+    deadline_rates: tuple[DeadlineRate, ...]
+
+    def get_profile(self) -> WebsitePricingProfile:
+        if self.profile is None:
+            raise WebsitePricingProfile.DoesNotExist(
+                "No active pricing profile for this website."
+            )
+        return self.profile
+
+    def get_paper_type(self, code: str) -> PaperTypeRate:
+        return self._lookup(self.paper_types, code, PaperTypeRate)
+
+    def get_work_type(self, code: str) -> WorkTypeRate:
+        return self._lookup(self.work_types, code, WorkTypeRate)
+
+    def get_subject(self, code: str) -> SubjectRate:
+        return self._lookup(self.subjects, code, SubjectRate)
+
+    def get_academic_level(self, code: str) -> AcademicLevelRate:
+        return self._lookup(self.academic_levels, code, AcademicLevelRate)
+
+    def get_analysis_level(self, level: str) -> AnalysisLevelRate:
+        return self._lookup(self.analysis_levels, level, AnalysisLevelRate)
+
+    def get_writer_level(self, code: str) -> WriterLevelRate:
+        return self._lookup(self.writer_levels, code, WriterLevelRate)
+
+    def get_deadline_rate(self, deadline_hours: int) -> DeadlineRate | None:
+        """
+        Return the tightest band whose max_hours covers the deadline.
+        """
+        index = bisect_left(self.deadline_max_hours, deadline_hours)
+        if index == len(self.deadline_rates):
+            return None
+        return self.deadline_rates[index]
+
+    def get_addons(self, codes: list[str]) -> list[ServiceAddon]:
+        """
+        Return active addons for the given codes in catalog order.
+        """
+        wanted = set(codes)
+        return [addon for addon in self.addons if addon.addon_code in wanted]
+
+    @staticmethod
+    def _lookup(mapping: Mapping[str, Any], code: str, model) -> Any:
+        try:
+            return mapping[code]
+        except KeyError as exc:
+            raise model.DoesNotExist(
+                f"{model.__name__} '{code}' is not active for this website."
+            ) from exc
+
+
+class PricingCatalogCache:
+    """
+    Keep an in-process pricing catalog snapshot per website.
+
+    Each snapshot is tagged with a version stamp stored in the shared
+    cache. Catalog writes replace the stamp, so every process rebuilds
+    its snapshot on the next read. In the steady state a quote costs
+    one cache read and no database queries.
+    """
+
+    VERSION_KEY = "order_pricing_core:catalog_version:{website_id}"
+    LOCAL_TTL_SECONDS = 60
+
+    _catalogs: dict[Any, PricingCatalog] = {}
+    _lock = Lock()
+
+    @classmethod
+    def get_catalog(cls, *, website) -> PricingCatalog:
+        """
+        Return the current pricing catalog for a website.
+        """
+        website_id = website.pk
+        version = cls._current_version(website_id=website_id)
+        catalog = cls._catalogs.get(website_id)
+
+        if catalog is not None and cls._is_fresh(
+            catalog=catalog,
+            version=version,
+        ):
+            return catalog
+
+        catalog = cls._build(website_id=website_id, version=version)
+
+        with cls._lock:
+            cls._catalogs[website_id] = catalog
+
+        return catalog
+
+    @classmethod
+    def invalidate(cls, *, website_id) -> None:
+        """
+        Publish a new version stamp and drop the local snapshot.
+        """
+        cache.set(
+            cls.VERSION_KEY.format(website_id=website_id),
+            time.time_ns(),
+            timeout=None,
+        )
+
+        cls.discard(website_id=website_id)
+
+    @classmethod
+    def discard(cls, *, website_id) -> None:
+        """
+        Drop this process's snapshot without publishing a new version.
+
+        Catalog writes call this straight away, so the writing process
+        never reads its own stale snapshot, even when the commit hook
+        never runs (TestCase) or there is no shared cache (DummyCache).
+        """
+        with cls._lock:
+            cls._catalogs.pop(website_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop every local snapshot.
+        """
+        with cls._lock:
+            cls._catalogs.clear()
+
+    @classmethod
+    def _current_version(cls, *, website_id) -> Any:
+        """
+        Read the shared version stamp, seeding it on first use.
+
+        Returns None when the cache is unavailable.
+        """
+        key = cls.VERSION_KEY.format(website_id=website_id)
+        version = cache.get(key)
+
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+
+        return version
+
+    @classmethod
+    def _is_fresh(cls, *, catalog: PricingCatalog, version: Any) -> bool:
+        """
+        Fall back to a short local TTL when no version stamp is available.
+        """
+        if version is None:
+            age = time.monotonic() - catalog.built_at
+            return age < cls.LOCAL_TTL_SECONDS
+        return catalog.version == version
+
+    @staticmethod
+    def _by_code(queryset, field: str = "code") -> Mapping[str, Any]:
+        return MappingProxyType(
+            {getattr(item, field): item for item in queryset}
+        )
+
+    @classmethod
+    def _build(cls, *, website_id, version: Any) -> PricingCatalog:
+        """
+        Load the whole active catalog for a website.
+        """
+        active = {"website_id": website_id, "is_active": True}
+
+        deadline_rates = tuple(
+            DeadlineRate.objects.filter(**active).order_by(
+                "max_hours",
+                "sort_order",
+                "id",
+            )
+        )
+
+        return PricingCatalog(
+            website_id=website_id,
+            version=version,
+            built_at=time.monotonic(),
+            profile=WebsitePricingProfile.objects.filter(**active).first(),
+            paper_types=cls._by_code(PaperTypeRate.objects.filter(**active)),
+            work_types=cls._by_code(WorkTypeRate.objects.filter(**active)),
+            subjects=cls._by_code(
+                SubjectRate.objects.select_related("category").filter(
+                    **active
+                )
+            ),
+            academic_levels=cls._by_code(
+                AcademicLevelRate.objects.filter(**active)
+            ),
+            analysis_levels=cls._by_code(
+                AnalysisLevelRate.objects.filter(**active),
+                field="level",
+            ),
+            writer_levels=cls._by_code(
+                WriterLevelRate.objects.filter(**active)
+            ),
+            addons=tuple(
+                ServiceAddon.objects.filter(**active).order_by(
+                    "sort_order",
+                    "id",
+                )
+            ),
+            deadline_max_hours=tuple(
+                rate.max_hours for rate in deadline_rates
+            ),
+            deadline_rates=deadline_rates,
+        )
+
+
+def get_pricing_catalog(*, website) -> PricingCatalog:
+    return PricingCatalogCache.get_catalog(website=website)
+
+
+def invalidate_pricing_catalog(*, website_id) -> None:
+    PricingCatalogCache.invalidate(website_id=website_id)
+
+
+def discard_pricing_catalog(*, website_id) -> None:
+    PricingCatalogCache.discard(website_id=website_id)
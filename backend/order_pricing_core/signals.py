@@ -1,13 +1,63 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.core.cache import cache
+from .models import AcademicLevelRate
+from .models import AnalysisLevelRate
+from .models import DeadlineRate
+from .models import PaperTypeRate
 from .models import PricingConfiguration
+from .models import ServiceAddon
+from .models import SubjectCategory
+from .models import SubjectRate
+from .models import WebsitePricingProfile
+from .models import WorkTypeRate
+from .models import WriterLevelRate
+from .selectors.pricing_catalog_selectors import discard_pricing_catalog
+from .selectors.pricing_catalog_selectors import invalidate_pricing_catalog
 
 CACHE_KEY_PREFERRED_WRITER_COST = "preferred_writer_cost"
 
+PRICING_CATALOG_MODELS = (
+    AcademicLevelRate,
+    AnalysisLevelRate,
+    DeadlineRate,
+    PaperTypeRate,
+    ServiceAddon,
+    SubjectCategory,
+    SubjectRate,
+    WebsitePricingProfile,
+    WorkTypeRate,
+    WriterLevelRate,
+)
+
 @receiver(post_save, sender=PricingConfiguration)
 def clear_preferred_writer_cost_cache(sender, instance, **kwargs):
     """
     Clear the preferred writer cost cache when PricingConfig is saved.
     """
-    cache.delete(CACHE_KEY_PREFERRED_WRITER_COST)
\ No newline at end of file
+    cache.delete(CACHE_KEY_PREFERRED_WRITER_COST)
+
+
+def invalidate_pricing_catalog_on_change(sender, instance, **kwargs):
+    """
+    Drop the local catalog now and publish a new version on commit.
+    """
+    website_id = instance.website_id
+    discard_pricing_catalog(website_id=website_id)
+    transaction.on_commit(
+        lambda: invalidate_pricing_catalog(website_id=website_id)
+    )
+
+
+for _model in PRICING_CATALOG_MODELS:
+    post_save.connect(
+        invalidate_pricing_catalog_on_change,
+        sender=_model,
+        dispatch_uid=f"pricing_catalog_save_{_model.__name__}",
+    )
+    post_delete.connect(
+        invalidate_pricing_catalog_on_change,
+        sender=_model,
+        dispatch_uid=f"pricing_catalog_delete_{_model.__name__}",
+    )
@@ -1,3 +1,263 @@
-from django.test import TestCase
+from decimal import Decimal
+from itertools import product
 
-# Create your tests here.
+from django.test import TestCase, override_settings
+
+from order_pricing_core.api.views.public_estimate_views import _catalog_code
+from order_pricing_core.calculators.paper_order_calculator import (
+    PaperOrderPricingCalculator,
+)
+from order_pricing_core.constants import QuoteMode, SpacingMode
+from order_pricing_core.models import (
+    AcademicLevelRate,
+    DeadlineRate,
+    PaperTypeRate,
+    SubjectCategory,
+    SubjectRate,
+    WebsitePricingProfile,
+    WorkTypeRate,
+)
+from order_pricing_core.selectors.pricing_catalog_selectors import (
+    PricingCatalogCache,
+    get_pricing_catalog,
+)
+from websites.models.websites import Website
+
+
+class PricingCatalogTests(TestCase):
+    """
+    Tests for the cached per-website pricing catalog.
+    """
+
+    def setUp(self) -> None:
+        PricingCatalogCache.clear()
+        self.addCleanup(PricingCatalogCache.clear)
+        self.website = Website.objects.create(
+            name="Gradecrest",
+            domain="gradecrest.test",
+        )
+
+    def _deadline(self, max_hours: int, **kwargs) -> DeadlineRate:
+        return DeadlineRate.objects.create(
+            website=self.website,
+            label=f"{max_hours}h",
+            max_hours=max_hours,
+            **kwargs,
+        )
+
+    def test_deadline_lookup_picks_tightest_covering_band(self) -> None:
+        day = self._deadline(24, multiplier=Decimal("1.5000"))
+        three_days = self._deadline(72)
+        week = self._deadline(168)
+        self._deadline(48, is_active=False)
+
+        catalog = get_pricing_catalog(website=self.website)
+
+        self.assertEqual(catalog.get_deadline_rate(1), day)
+        self.assertEqual(catalog.get_deadline_rate(24), day)
+        self.assertEqual(catalog.get_deadline_rate(25), three_days)
+        self.assertEqual(catalog.get_deadline_rate(48), three_days)
+        self.assertEqual(catalog.get_deadline_rate(168), week)
+        self.assertIsNone(catalog.get_deadline_rate(169))
+
+    def test_missing_code_raises_model_does_not_exist(self) -> None:
+        catalog = get_pricing_catalog(website=self.website)
+
+        with self.assertRaises(PaperTypeRate.DoesNotExist):
+            catalog.get_paper_type("essay")
+
+    def test_snapshot_is_reused_until_catalog_changes(self) -> None:
+        first = get_pricing_catalog(website=self.website)
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_pricing_catalog(website=self.website), first)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+        },
+    )
+    def test_write_publishes_new_version_on_commit(self) -> None:
+        first = get_pricing_catalog(website=self.website)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PaperTypeRate.objects.create(
+                website=self.website,
+                code="essay",
+                label="Essay",
+            )
+
+        second = get_pricing_catalog(website=self.website)
+        self.assertNotEqual(second.version, first.version)
+        self.assertEqual(second.get_paper_type("essay").label, "Essay")
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+            },
+        },
+    )
+    def test_write_is_visible_without_shared_cache_or_commit(self) -> None:
+        rate = PaperTypeRate.objects.create(
+            website=self.website,
+            code="essay",
+            label="Essay",
+        )
+        get_pricing_catalog(website=self.website)
+
+        rate.multiplier = Decimal("1.2500")
+        rate.save()
+
+        catalog = get_pricing_catalog(website=self.website)
+        self.assertEqual(
+            catalog.get_paper_type("essay").multiplier,
+            Decimal("1.2500"),
+        )
+
+
+class PriceMatrixParityTests(TestCase):
+    """
+    Every matrix cell must equal the per-item final quote to the cent.
+    """
+
+    def setUp(self) -> None:
+        PricingCatalogCache.clear()
+        self.addCleanup(PricingCatalogCache.clear)
+        self.website = Website.objects.create(
+            name="Gradecrest",
+            domain="gradecrest.test",
+        )
+        WebsitePricingProfile.objects.create(
+            website=self.website,
+            base_price_per_page=Decimal("13.37"),
+            single_spacing_multiplier=Decimal("1.9350"),
+            minimum_paper_order_charge=Decimal("25.00"),
+        )
+        PaperTypeRate.objects.create(
+            website=self.website,
+            code="essay",
+            label="Essay",
+            multiplier=Decimal("1.0725"),
+        )
+        WorkTypeRate.objects.create(
+            website=self.website,
+            code="writing",
+            label="Writing",
+            multiplier=Decimal("1.1333"),
+        )
+        category = SubjectCategory.objects.create(
+            website=self.website,
+            code="stem",
+            label="STEM",
+            multiplier=Decimal("1.0875"),
+        )
+        SubjectRate.objects.create(
+            website=self.website,
+            code="physics",
+            label="Physics",
+            category=category,
+        )
+        for sort_order, (code, multiplier) in enumerate(
+            [
+                ("masters", "1.3125"),
+                ("college", "1.0000"),
+                ("phd", "1.6667"),
+            ]
+        ):
+            AcademicLevelRate.objects.create(
+                website=self.website,
+                code=code,
+                label=code.title(),
+                multiplier=Decimal(multiplier),
+                sort_order=sort_order,
+            )
+        for max_hours, multiplier in [
+            (6, "2.1250"),
+            (24, "1.4995"),
+            (72, "1.1500"),
+            (336, "1.0000"),
+        ]:
+            DeadlineRate.objects.create(
+                website=self.website,
+                label=f"{max_hours}h",
+                max_hours=max_hours,
+                multiplier=Decimal(multiplier),
+            )
+        self.calculator = PaperOrderPricingCalculator()
+
+    def test_matrix_cells_equal_single_final_quotes(self) -> None:
+        pages_options = [1, 2, 7, 33]
+        deadline_options = [3, 24, 25, 200]
+        levels = ["college", "masters", "phd"]
+
+        for spacing in (SpacingMode.DOUBLE, SpacingMode.SINGLE):
+            cells = self.calculator.calculate_matrix(
+                website=self.website,
+                pages_options=pages_options,
+                deadline_hours_options=deadline_options,
+                academic_level_codes=levels,
+                spacing=spacing,
+                paper_type_code="essay",
+                work_type_code="writing",
+                subject_code="physics",
+            )
+            self.assertEqual(
+                len(cells),
+                len(pages_options) * len(deadline_options) * len(levels),
+            )
+            by_key = {
+                (cell.pages, cell.deadline_hours, cell.academic_level_code): cell
+                for cell in cells
+            }
+
+            for pages, hours, level in product(
+                pages_options,
+                deadline_options,
+                levels,
+            ):
+                quote = self.calculator.calculate(
+                    website=self.website,
+                    service=None,
+                    payload={
+                        "pages": pages,
+                        "deadline_hours": hours,
+                        "spacing": spacing,
+                        "paper_type_code": "essay",
+                        "work_type_code": "writing",
+                        "subject_code": "physics",
+                        "academic_level_code": level,
+                    },
+                    mode=QuoteMode.FINAL,
+                )
+                cell = by_key[(pages, hours, level)]
+                with self.subTest(
+                    spacing=spacing,
+                    pages=pages,
+                    hours=hours,
+                    level=level,
+                ):
+                    self.assertEqual(cell.total, quote.total)
+                    self.assertEqual(cell.total.as_tuple().exponent, -2)
+
+    def test_default_code_follows_sort_order(self) -> None:
+        catalog = get_pricing_catalog(website=self.website)
+
+        self.assertEqual(
+            _catalog_code(
+                catalog.academic_levels,
+                label="AcademicLevelRate",
+                requested="",
+            ),
+            "masters",
+        )
+        self.assertEqual(
+            _catalog_code(
+                catalog.academic_levels,
+                label="AcademicLevelRate",
+                requested="phd",
+            ),
+            "phd",
+        )
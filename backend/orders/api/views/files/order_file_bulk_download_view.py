@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import io
-import zipfile
+from itertools import chain
+from typing import Iterator
 
 from django.http import StreamingHttpResponse
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from core.utils.streaming import streaming_content
 from files_management.enums import FileVisibility
 from files_management.selectors import FileAttachmentSelector
+from files_management.storage.zip_stream import StreamingZipWriter
 from orders.api.views.files.order_file_views import OrderFileBaseView
 from orders.services.order_file_download_service import OrderFileDownloadService
 
@@ -27,11 +29,20 @@ _WRITER_EXCLUDED = {
 }
 _STAFF_ROLES = {"admin", "superadmin", "editor", "support"}
 
+# Read size per storage request; bounds worker memory per download.
+ZIP_CHUNK_SIZE = 1024 * 1024
+
 
 class OrderFileBulkDownloadView(OrderFileBaseView):
     """
     Stream a ZIP archive of all order files the requesting user can access.
 
+    Entries are written as each file is read from storage, so memory
+    stays at one chunk and the download starts immediately. Under ASGI
+    the archive is fed through an async iterator; a plain generator
+    would be collected in full before the first byte is sent. Already
+    compressed formats (PDF, DOCX, images, ...) are stored, not deflated.
+
     Skips: external links (no binary to zip), files that fail the delivery
     guard, files whose storage read fails.
 
@@ -64,7 +75,7 @@ class OrderFileBulkDownloadView(OrderFileBaseView):
             )
             .filter(is_active=True, managed_file__isnull=False)
             .exclude(visibility__in=excluded_visibility)
-            .select_related("managed_file")
+            .select_related("managed_file", "managed_file__bucket")
         )
 
         if section == "final":
@@ -75,74 +86,101 @@ class OrderFileBulkDownloadView(OrderFileBaseView):
         ip = request.META.get("REMOTE_ADDR", "")
         ua = request.META.get("HTTP_USER_AGENT", "")
 
-        def _iter_zip():
-            buf = io.BytesIO()
-            seen_names: dict[str, int] = {}
-
-            with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
-                for att in attachments:
-                    mf = att.managed_file
-                    if not mf:
-                        continue
-
-                    # Try delivery guard — skip blocked files silently
-                    try:
-                        OrderFileDownloadService.get_download_url(
-                            order=order,
-                            user=user,
-                            attachment=att,
-                            ip_address=ip,
-                            user_agent=ua,
-                        )
-                    except Exception:
-                        continue
-
-                    # Read file bytes
-                    data = _read_managed_file(mf)
-                    if not data:
-                        continue
-
-                    # De-duplicate filenames
-                    name = mf.original_filename or f"file_{att.id}"
-                    if name in seen_names:
-                        seen_names[name] += 1
-                        base, _, ext = name.rpartition(".")
-                        name = f"{base}_{seen_names[name]}.{ext}" if ext else f"{name}_{seen_names[name]}"
-                    else:
-                        seen_names[name] = 0
-
-                    zf.writestr(name, data)
-
-            buf.seek(0)
-            while chunk := buf.read(65536):
-                yield chunk
+        # The delivery guard runs here, in the request thread; the ZIP
+        # generator below only reads storage, so under ASGI it can be
+        # driven from worker threads without touching the database.
+        deliverable = []
+        for att in attachments.iterator():
+            mf = att.managed_file
+            if not mf:
+                continue
+
+            # Try delivery guard — skip blocked files silently
+            try:
+                OrderFileDownloadService.get_download_url(
+                    order=order,
+                    user=user,
+                    attachment=att,
+                    ip_address=ip,
+                    user_agent=ua,
+                )
+            except Exception:
+                continue
+            deliverable.append((att.id, mf))
 
         zip_name = f"order-{order_id}-files.zip"
         response = StreamingHttpResponse(
-            _iter_zip(),
+            streaming_content(request, _iter_zip(deliverable)),
             content_type="application/zip",
         )
         response["Content-Disposition"] = f'attachment; filename="{zip_name}"'
         return response
 
 
-def _read_managed_file(managed_file) -> bytes | None:
-    """Read file bytes from local storage or Spaces."""
+def _iter_zip(files) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of ``(attachment_id, managed_file)`` pairs.
+
+    Unreadable or empty files are left out of the archive.
+    """
+    writer = StreamingZipWriter()
+    seen_names: dict[str, int] = {}
+
+    for attachment_id, mf in files:
+        # Pull the first chunk before writing a header so
+        # unreadable or empty files are still skipped
+        chunks = _iter_managed_file(mf)
+        first = next(chunks, None)
+        if not first:
+            continue
+
+        # De-duplicate filenames
+        name = mf.original_filename or f"file_{attachment_id}"
+        if name in seen_names:
+            seen_names[name] += 1
+            base, _, ext = name.rpartition(".")
+            name = f"{base}_{seen_names[name]}.{ext}" if ext else f"{name}_{seen_names[name]}"
+        else:
+            seen_names[name] = 0
+
+        yield from writer.add(
+            name,
+            chain([first], chunks),
+            modified=mf.updated_at,
+        )
+
+    yield from writer.close()
+
+
+def _iter_managed_file(managed_file) -> Iterator[bytes]:
+    """
+    Yield file bytes in ZIP_CHUNK_SIZE pieces from local storage or Spaces.
+
+    Yields nothing if the file cannot be opened from either.
+    """
+    source = None
     try:
         if managed_file.file:
             managed_file.file.open("rb")
-            data = managed_file.file.read()
-            managed_file.file.close()
-            return data
+            source = managed_file.file.chunks(ZIP_CHUNK_SIZE)
+            close = managed_file.file.close
     except Exception:
-        pass
+        source = None
+
+    if source is None:
+        try:
+            from files_management.services.storage_service import StorageService
+            client = StorageService._get_client(managed_file.bucket)
+            body = client.get_object(
+                Bucket=managed_file.bucket.spaces_bucket_name,
+                Key=managed_file.storage_key,
+            )["Body"]
+            source = body.iter_chunks(ZIP_CHUNK_SIZE)
+            close = body.close
+        except Exception:
+            return
+
     try:
-        from files_management.services.storage_service import StorageService
-        client = StorageService._get_client(managed_file.bucket)
-        response = client.get_object(
-            Bucket=managed_file.bucket.spaces_bucket_name,
-            Key=managed_file.storage_key,
-        )
-        return response["Body"].read()
-    except Exception:
-        return None
+        yield from source
+    finally:
+        close()
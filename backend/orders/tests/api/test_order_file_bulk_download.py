@@ -0,0 +1,75 @@
+"""
+Tests for the bulk download ZIP stream.
+"""
+import io
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory, RequestFactory, SimpleTestCase
+from django.utils import timezone
+
+from core.utils.streaming import streaming_content
+from orders.api.views.files import order_file_bulk_download_view as bulk
+
+
+def _file(name: str, size: int = 5000) -> SimpleNamespace:
+    return SimpleNamespace(
+        original_filename=name,
+        updated_at=timezone.now(),
+        data=bytes(range(256)) * (size // 256 + 1),
+    )
+
+
+class BulkDownloadStreamTests(SimpleTestCase):
+    """
+    The archive must reach the client file by file, not all at once.
+    """
+
+    def setUp(self) -> None:
+        self.reads: list[str] = []
+
+        def fake_iter(mf):
+            self.reads.append(mf.original_filename)
+            yield mf.data[:1024]
+            yield mf.data[1024:]
+
+        patcher = patch.object(bulk, "_iter_managed_file", fake_iter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.files = [(1, _file("a.txt")), (2, _file("b.txt")), (3, _file("c.txt"))]
+
+    def test_asgi_stream_is_delivered_incrementally(self) -> None:
+        request = AsyncRequestFactory().get("/")
+        content = streaming_content(request, bulk._iter_zip(self.files))
+        self.assertTrue(hasattr(content, "__aiter__"))
+
+        async def first_chunk():
+            chunk = await content.__anext__()
+            await content.aclose()
+            return chunk
+
+        first = async_to_sync(first_chunk)()
+
+        self.assertTrue(first.startswith(b"PK\x03\x04"))
+        self.assertEqual(self.reads, ["a.txt"])
+
+    def test_asgi_stream_yields_complete_archive(self) -> None:
+        request = AsyncRequestFactory().get("/")
+        content = streaming_content(request, bulk._iter_zip(self.files))
+
+        async def collect():
+            return b"".join([chunk async for chunk in content])
+
+        archive = zipfile.ZipFile(io.BytesIO(async_to_sync(collect)()))
+
+        self.assertEqual(archive.namelist(), ["a.txt", "b.txt", "c.txt"])
+        self.assertEqual(archive.read("b.txt"), self.files[1][1].data)
+
+    def test_wsgi_keeps_sync_iterator(self) -> None:
+        request = RequestFactory().get("/")
+        iterator = bulk._iter_zip(self.files)
+
+        self.assertIs(streaming_content(request, iterator), iterator)
@@ -1,7 +1,7 @@
 # File: myapp/middleware.py
 from django.shortcuts import redirect
 from django.contrib.auth import logout
-from .models import Blacklist
+from .services.blacklist_membership_service import BlacklistMembershipService
 
 class BlacklistMiddleware:
     """Middleware to prevent blacklisted users from accessing the system."""
@@ -11,10 +11,12 @@ class BlacklistMiddleware:
 
     def __call__(self, request):
         if request.user.is_authenticated:
-            user_blacklisted = Blacklist.objects.filter(user=request.user, is_active=True).exists()
-            ip_blacklisted = Blacklist.objects.filter(ip_address=request.META.get('REMOTE_ADDR'), is_active=True).exists()
+            blacklisted = BlacklistMembershipService.is_blacklisted(
+                user_id=request.user.pk,
+                ip=request.META.get('REMOTE_ADDR'),
+            )
 
-            if user_blacklisted or ip_blacklisted:
+            if blacklisted:
                 logout(request)
                 return redirect("blacklist_notice") # Redirect to a "You're Blacklisted" page.
 
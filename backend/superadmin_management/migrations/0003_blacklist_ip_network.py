@@ -0,0 +1,18 @@
+# Generated by Django 6.0.5 on 2026-10-16 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadmin_management', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blacklist',
+            name='ip_network',
+            field=models.CharField(blank=True, help_text='CIDR range to block, e.g. 203.0.113.0/24.', max_length=49, null=True),
+        ),
+    ]
@@ -27,7 +27,10 @@ UserActionLog — removed. Consolidated into SuperadminLog.
               more structure.
 """
 
+import ipaddress
+
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.timezone import now
 
@@ -257,7 +260,7 @@ class Blacklist(models.Model):
 
     This model covers:
         email — blocks registration and login with this email
-        ip — blocks all requests from this IP
+        ip — blocks all requests from this IP or CIDR range
         user — blocks non-writer user accounts (clients, editors, support)
 
     For writer users, this model ALSO creates a record so that
@@ -293,6 +296,12 @@ class Blacklist(models.Model):
         blank=True,
         db_index=True,
     )
+    ip_network = models.CharField(
+        max_length=49,
+        null=True,
+        blank=True,
+        help_text="CIDR range to block, e.g. 203.0.113.0/24.",
+    )
     reason = models.TextField()
     blacklisted_by = models.ForeignKey(
         User,
@@ -319,10 +328,20 @@ class Blacklist(models.Model):
             self.user or
             self.email or
             self.ip_address or
+            self.ip_network or
             "unknown"
         )
         return f"Blacklist({self.blacklist_type}): {target}"
 
+    def clean(self) -> None:
+        if self.ip_network:
+            try:
+                ipaddress.ip_network(self.ip_network, strict=False)
+            except ValueError as exc:
+                raise ValidationError(
+                    {"ip_network": "Enter a valid CIDR range."}
+                ) from exc
+
     class Meta:
         verbose_name = "Blacklist Record"
         verbose_name_plural = "Blacklist Records"
@@ -1,5 +1,8 @@
 from rest_framework.permissions import BasePermission
-from superadmin_management.models import SuperadminProfile, Blacklist
+from superadmin_management.models import SuperadminProfile
+from superadmin_management.services.blacklist_membership_service import (
+    BlacklistMembershipService,
+)
 
 class IsSuperadmin(BasePermission):
     """Custom permission to allow only Superadmins with an active profile."""
@@ -14,7 +17,7 @@ class IsSuperadmin(BasePermission):
             return False
 
         # Check if the user is blacklisted
-        if Blacklist.objects.filter(user=request.user, is_active=True).exists():
+        if BlacklistMembershipService.is_user_blacklisted(request.user.pk):
             return False
 
         return True # User is a valid Superadmin
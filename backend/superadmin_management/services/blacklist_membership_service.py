@@ -0,0 +1,129 @@
+"""
+Compiled in-memory blacklist membership checks.
+
+Active Blacklist rows are compiled into a set of user ids and a CIDR
+prefix table keyed by (ip version, prefix length). Checking a request
+costs a set lookup per distinct prefix length, with no query. Each
+process rebuilds when the version key in the shared cache changes.
+"""
+import ipaddress
+import logging
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+
+from superadmin_management.models import Blacklist
+
+logger = logging.getLogger(__name__)
+
+
+class BlacklistMembershipService:
+    """
+    Answer "is this user or IP blacklisted?" from process memory.
+    """
+
+    VERSION_KEY = "superadmin_management:blacklist:version"
+    VERSION_CHECK_SECONDS = 5
+
+    _lock = threading.Lock()
+    _version = None
+    _checked_at = 0.0
+    _loaded = False
+    _user_ids: frozenset = frozenset()
+    # {(ip version, prefix length): {masked network address as int}}
+    _networks: dict = {}
+
+    @classmethod
+    def is_blacklisted(cls, *, user_id=None, ip: str | None = None) -> bool:
+        cls._ensure_fresh()
+
+        if user_id is not None and user_id in cls._user_ids:
+            return True
+
+        return bool(ip) and cls._ip_blocked(ip)
+
+    @classmethod
+    def is_user_blacklisted(cls, user_id) -> bool:
+        return cls.is_blacklisted(user_id=user_id)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Publish a new version so every process recompiles its tables.
+        """
+        cache.set(cls.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        with cls._lock:
+            cls._loaded = False
+
+    @classmethod
+    def _ip_blocked(cls, ip: str) -> bool:
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+
+        value = int(address)
+        bits = address.max_prefixlen
+
+        for (version, prefixlen), networks in cls._networks.items():
+            if version != address.version:
+                continue
+            mask = ((1 << prefixlen) - 1) << (bits - prefixlen)
+            if (value & mask) in networks:
+                return True
+
+        return False
+
+    @classmethod
+    def _ensure_fresh(cls) -> None:
+        now = time.monotonic()
+        if cls._loaded and now - cls._checked_at < cls.VERSION_CHECK_SECONDS:
+            return
+
+        version = cache.get(cls.VERSION_KEY)
+        if version is None:
+            cache.add(cls.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+            version = cache.get(cls.VERSION_KEY)
+
+        with cls._lock:
+            cls._checked_at = now
+            if cls._loaded and version is not None and version == cls._version:
+                return
+            cls._build(version=version)
+
+    @classmethod
+    def _build(cls, *, version) -> None:
+        user_ids = set()
+        networks: dict = {}
+
+        rows = Blacklist.objects.filter(is_active=True).values_list(
+            "user_id",
+            "ip_address",
+            "ip_network",
+        )
+
+        for user_id, ip_address, ip_network in rows.iterator():
+            if user_id is not None:
+                user_ids.add(user_id)
+
+            for value in (ip_address, ip_network):
+                if not value:
+                    continue
+                try:
+                    network = ipaddress.ip_network(value, strict=False)
+                except ValueError:
+                    logger.warning("Skipping invalid blacklist IP %r.", value)
+                    continue
+                networks.setdefault(
+                    (network.version, network.prefixlen),
+                    set(),
+                ).add(int(network.network_address))
+
+        cls._user_ids = frozenset(user_ids)
+        cls._networks = {
+            key: frozenset(values) for key, values in networks.items()
+        }
+        cls._version = version
+        cls._loaded = True
@@ -11,20 +11,23 @@ class BlacklistService:
 
     @staticmethod
     @transaction.atomic
-    def blacklist(*, superadmin, user=None, email=None, ip_address=None, reason="", website=None):
+    def blacklist(*, superadmin, user=None, email=None, ip_address=None, ip_network=None, reason="", website=None):
 
-        if not user and not email and not ip_address:
+        if not user and not email and not ip_address and not ip_network:
             raise ValueError("Must provide target")
 
-        entry = Blacklist.objects.create(
+        entry = Blacklist(
             user=user,
             email=email,
             ip_address=ip_address,
+            ip_network=ip_network,
             reason=reason,
             blacklisted_by=superadmin,
             website=website,
             is_active=True,
         )
+        entry.clean()
+        entry.save()
 
         if user:
             WriterGovernanceService.blacklist_writer(
@@ -1,4 +1,5 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.core.mail import send_mail
 from django.conf import settings
@@ -7,7 +8,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-from .models import SuperadminLog
+from .models import Blacklist, SuperadminLog
+from .services.blacklist_membership_service import BlacklistMembershipService
 from .utils import SuperadminNotifier
 from orders.models.order_disputes import Dispute
 from client_management.models import BlacklistedEmail
@@ -193,3 +195,12 @@ def notify_superadmins_on_admin_promotion_request(sender, instance, created, **k
                 category="admin",
                 website=website
             )
+
+
+### Recompile Blacklist Membership When Entries Change
+@receiver(post_save, sender=Blacklist)
+@receiver(post_delete, sender=Blacklist)
+def invalidate_blacklist_membership(sender, **kwargs):
+    """Bumps the blacklist version now and again once the write commits."""
+    BlacklistMembershipService.invalidate()
+    transaction.on_commit(BlacklistMembershipService.invalidate)
@@ -36,6 +36,9 @@ from superadmin_management.models import (
     SuperadminLog,
     SuperadminProfile,
 )
+from superadmin_management.services.blacklist_membership_service import (
+    BlacklistMembershipService,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -744,6 +747,7 @@ class SuperadminService:
             Blacklist.objects.filter(
                 user=user, is_active=True
             ).update(is_active=False, lifted_at=now())
+            transaction.on_commit(BlacklistMembershipService.invalidate)
 
         elif appeal.appeal_type == Appeal.AppealType.PROBATION:
             if hasattr(user, "is_on_probation"):
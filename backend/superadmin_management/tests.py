@@ -1,3 +1,137 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-# Create your tests here.
+from superadmin_management.models import Appeal, Blacklist
+from superadmin_management.services.blacklist_membership_service import (
+    BlacklistMembershipService,
+)
+from superadmin_management.superadmin_service import SuperadminService
+from websites.models.websites import Website
+
+
+class BlacklistMembershipServiceTests(TestCase):
+    """
+    Tests for the compiled in-memory blacklist.
+    """
+
+    def setUp(self) -> None:
+        self.website = Website.objects.create(
+            name="Gradecrest",
+            domain="gradecrest.test",
+        )
+        self.user = get_user_model().objects.create_user(
+            email="client@example.com",
+            password="pass",
+            website=self.website,
+        )
+        BlacklistMembershipService.invalidate()
+        self.addCleanup(BlacklistMembershipService.invalidate)
+
+    def _block(self, **kwargs) -> Blacklist:
+        return Blacklist.objects.create(reason="abuse", **kwargs)
+
+    def test_user_membership(self) -> None:
+        self._block(user=self.user)
+
+        self.assertTrue(BlacklistMembershipService.is_user_blacklisted(self.user.pk))
+        self.assertFalse(
+            BlacklistMembershipService.is_user_blacklisted(self.user.pk + 1)
+        )
+
+    def test_exact_ip_match(self) -> None:
+        self._block(
+            blacklist_type=Blacklist.BlacklistType.IP,
+            ip_address="198.51.100.7",
+        )
+
+        self.assertTrue(BlacklistMembershipService.is_blacklisted(ip="198.51.100.7"))
+        self.assertFalse(BlacklistMembershipService.is_blacklisted(ip="198.51.100.8"))
+
+    def test_ipv4_cidr_match(self) -> None:
+        self._block(
+            blacklist_type=Blacklist.BlacklistType.IP,
+            ip_network="203.0.113.0/24",
+        )
+
+        self.assertTrue(BlacklistMembershipService.is_blacklisted(ip="203.0.113.0"))
+        self.assertTrue(BlacklistMembershipService.is_blacklisted(ip="203.0.113.255"))
+        self.assertFalse(BlacklistMembershipService.is_blacklisted(ip="203.0.114.1"))
+
+    def test_ipv6_cidr_does_not_match_ipv4(self) -> None:
+        self._block(
+            blacklist_type=Blacklist.BlacklistType.IP,
+            ip_network="2001:db8:abcd::/48",
+        )
+
+        self.assertTrue(
+            BlacklistMembershipService.is_blacklisted(ip="2001:db8:abcd:12::1")
+        )
+        self.assertFalse(
+            BlacklistMembershipService.is_blacklisted(ip="2001:db8:abce::1")
+        )
+        self.assertFalse(BlacklistMembershipService.is_blacklisted(ip="32.1.13.184"))
+
+    def test_host_bits_in_network_are_masked(self) -> None:
+        self._block(
+            blacklist_type=Blacklist.BlacklistType.IP,
+            ip_network="10.1.2.3/16",
+        )
+
+        self.assertTrue(BlacklistMembershipService.is_blacklisted(ip="10.1.200.9"))
+
+    def test_inactive_invalid_and_malformed_entries_are_ignored(self) -> None:
+        self._block(ip_address="192.0.2.1", is_active=False)
+        self._block(ip_network="not-a-network")
+
+        self.assertFalse(BlacklistMembershipService.is_blacklisted(ip="192.0.2.1"))
+        self.assertFalse(BlacklistMembershipService.is_blacklisted(ip="garbage"))
+        self.assertFalse(BlacklistMembershipService.is_blacklisted())
+
+    def test_lookups_after_build_run_no_queries(self) -> None:
+        self._block(ip_network="203.0.113.0/24")
+        BlacklistMembershipService.is_blacklisted(ip="203.0.113.1")
+
+        with self.assertNumQueries(0):
+            BlacklistMembershipService.is_blacklisted(
+                user_id=self.user.pk,
+                ip="203.0.113.1",
+            )
+
+    def test_save_refreshes_membership(self) -> None:
+        entry = self._block(user=self.user)
+        self.assertTrue(BlacklistMembershipService.is_user_blacklisted(self.user.pk))
+
+        entry.is_active = False
+        entry.save()
+
+        self.assertFalse(BlacklistMembershipService.is_user_blacklisted(self.user.pk))
+
+    def test_approved_appeal_invalidates_after_commit(self) -> None:
+        self._block(user=self.user)
+        self.assertTrue(BlacklistMembershipService.is_user_blacklisted(self.user.pk))
+        appeal = Appeal.objects.create(
+            user=self.user,
+            appeal_type=Appeal.AppealType.BLACKLIST,
+            reason="Mistaken identity.",
+        )
+
+        # The user flag lives outside the core User model; only the
+        # Blacklist lift matters here.
+        with (
+            mock.patch.object(get_user_model(), "save"),
+            self.captureOnCommitCallbacks() as callbacks,
+        ):
+            SuperadminService._approve_non_writer_appeal(
+                appeal=appeal,
+                superadmin=None,
+            )
+
+        # The lift is not published until the transaction commits.
+        self.assertTrue(BlacklistMembershipService.is_user_blacklisted(self.user.pk))
+
+        for callback in callbacks:
+            callback()
+
+        self.assertFalse(BlacklistMembershipService.is_user_blacklisted(self.user.pk))
@@ -7,6 +7,8 @@ from django.utils.timezone import now # Fix missing import
 from django.contrib.postgres.fields import JSONField # PostgreSQL JSON support
 from django.conf import settings
 
+from core.managers.tenant_resolution import TenantResolutionQuerySet
+
 User = settings.AUTH_USER_MODEL
 
 def validate_hex_color(value):
@@ -215,6 +217,8 @@ class Website(models.Model):
         help_text="Email where critical order & payment notifications are forwarded for this website (e.g., a Gmail inbox for admins).",
     )
 
+    objects = TenantResolutionQuerySet.as_manager()
+
     def validate_registration_allowed(self):
         """
         Validates if registration is allowed for this website.
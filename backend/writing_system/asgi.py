@@ -1,5 +1,9 @@
 """
 ASGI config for writing_system project.
+
+Long-lived streams such as ``/api/v1/communications/events/stream/``
+are async views and must be served from this application (daphne),
+not from the sync Gunicorn workers.
 """
 
 import os
@@ -398,6 +398,18 @@ COMMUNICATIONS_SSE_CHANNEL = env(
     "COMMUNICATIONS_SSE_CHANNEL",
     "communications:sse",
 )
+COMMUNICATIONS_SSE_MAILBOX_SIZE = env_int(
+    "COMMUNICATIONS_SSE_MAILBOX_SIZE",
+    256,
+)
+COMMUNICATIONS_SSE_REPLAY_LENGTH = env_int(
+    "COMMUNICATIONS_SSE_REPLAY_LENGTH",
+    200,
+)
+COMMUNICATIONS_SSE_REPLAY_TTL_SECONDS = env_int(
+    "COMMUNICATIONS_SSE_REPLAY_TTL_SECONDS",
+    3600,
+)
 
 CACHES = {
     "default": {
@@ -459,6 +471,7 @@ CELERY_IMPORTS = [
     "orders.tasks.unpaid_order_reminder_tasks",
     "files_management.tasks.quotas",
     "files_management.tasks.cleanup",
+    "event_system.tasks.outbox_dispatch_tasks",
 ]
 
 from celery.schedules import crontab # noqa: E402
@@ -476,6 +489,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "files_management.tasks.cleanup.cleanup_expired_files",
         "schedule": crontab(hour=2, minute=0), # nightly 02:00
     },
+    "files.expire_upload_sessions": {
+        "task": "files_management.tasks.cleanup.expire_upload_sessions",
+        "schedule": crontab(minute=20), # hourly
+    },
 
     # ----------------------------------------------------------------
     # Notifications
@@ -496,10 +513,19 @@ CELERY_BEAT_SCHEDULE = {
         "task": "notifications_system.tasks.maintenance.rebuild_unread_counts",
         "schedule": crontab(hour=4, minute=0), # nightly 04:00
     },
+    "notifications.rebuild_unread_counts_incremental": {
+        "task": "notifications_system.tasks.maintenance.rebuild_unread_counts",
+        "schedule": crontab(minute=15), # hourly, changed users only
+        "kwargs": {"incremental": True},
+    },
     "notifications.clear_stale_digests": {
         "task": "notifications_system.tasks.maintenance.clear_stale_digests",
         "schedule": crontab(hour=3, minute=30, day_of_week=0), # weekly Sunday 03:30
     },
+    "notifications.resume_stalled_broadcasts": {
+        "task": "notifications_system.tasks.maintenance.resume_stalled_broadcasts",
+        "schedule": 600, # every 10 min (seconds)
+    },
 
     # ----------------------------------------------------------------
     # Authentication cleanup
@@ -545,6 +571,14 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": crontab(minute="*/30"), # every 30 min
     },
 
+    # ----------------------------------------------------------------
+    # Ledger
+    # ----------------------------------------------------------------
+    "ledger.reconcile_ledgers": {
+        "task": "ledger.tasks.reconcile_ledgers",
+        "schedule": crontab(hour=2, minute=30), # nightly 02:30
+    },
+
     # ----------------------------------------------------------------
     # Wallets
     # ----------------------------------------------------------------
@@ -673,6 +707,60 @@ IMPERSONATION_SESSION_IDLE_TIMEOUT = env_int(
     15 * 60,
 )
 SESSION_WARNING_TIME = env_int("SESSION_WARNING_TIME", 30 * 60)
+# LoginSession activity is buffered in Redis and flushed in bulk.
+SESSION_ACTIVITY_FLUSH_SECONDS = env_int("SESSION_ACTIVITY_FLUSH_SECONDS", 30)
+SESSION_ACTIVITY_WRITE_INTERVAL = env_int("SESSION_ACTIVITY_WRITE_INTERVAL", 60)
+CELERY_BEAT_SCHEDULE["auth.flush_session_activity"] = {
+    "task": "authentication.tasks.flush_session_activity_task",
+    "schedule": SESSION_ACTIVITY_FLUSH_SECONDS, # every N seconds
+}
+
+# Audit events can be buffered in Redis and bulk-inserted by a flusher
+# instead of one INSERT per event on the request path.
+AUDIT_BUFFERED_INGESTION = env_bool("AUDIT_BUFFERED_INGESTION", False)
+AUDIT_BUFFER_FLUSH_SECONDS = env_int("AUDIT_BUFFER_FLUSH_SECONDS", 5)
+AUDIT_BUFFER_FLUSH_BATCH_SIZE = env_int("AUDIT_BUFFER_FLUSH_BATCH_SIZE", 500)
+if AUDIT_BUFFERED_INGESTION:
+    CELERY_BEAT_SCHEDULE["audit.flush_ingest_buffer"] = {
+        "task": "audit_logging.tasks.flush_audit_buffer_task",
+        "schedule": AUDIT_BUFFER_FLUSH_SECONDS, # every N seconds
+    }
+# Audit hash chains are per tenant; every N events is sealed with a
+# signed Merkle-root checkpoint.
+AUDIT_CHAIN_SEGMENT_SIZE = env_int("AUDIT_CHAIN_SEGMENT_SIZE", 1000)
+CELERY_BEAT_SCHEDULE["audit.seal_chain_segments"] = {
+    "task": "audit_logging.tasks.seal_audit_segments_task",
+    "schedule": crontab(minute=40), # hourly catch-up
+}
+
+# Event outbox drains in adaptive SKIP LOCKED batches; the beat tick
+# restarts the worker loop if it ever stops re-queueing itself.
+EVENT_BATCH_MIN_SIZE = env_int("EVENT_BATCH_MIN_SIZE", 10)
+EVENT_BATCH_MAX_SIZE = env_int("EVENT_BATCH_MAX_SIZE", 500)
+EVENT_OUTBOX_DRAIN_SECONDS = env_int("EVENT_OUTBOX_DRAIN_SECONDS", 50)
+EVENT_OUTBOX_DRAIN_WORKERS = env_int("EVENT_OUTBOX_DRAIN_WORKERS", 4)
+CELERY_BEAT_SCHEDULE["events.drain_outbox"] = {
+    "task": "event_system.drain_event_outbox",
+    "schedule": 60, # every minute
+}
+
+# Monthly range partitions for the outbox and analytics metric tables.
+# Retention (in whole months) overrides the defaults registered in
+# core.services.partition_service, keyed by 'app_label.Model'.
+PARTITION_MONTHS_AHEAD = env_int("PARTITION_MONTHS_AHEAD", 2)
+PARTITION_RETENTION_MONTHS = {}
+PARTITION_ARCHIVE_PREFIX = env("PARTITION_ARCHIVE_PREFIX", "archives/partitions")
+CELERY_BEAT_SCHEDULE["core.maintain_table_partitions"] = {
+    "task": "core.tasks.maintain_table_partitions",
+    "schedule": crontab(hour=2, minute=10),
+}
+
+# Incremental ledger reconciliation rechecks this far behind the last
+# clean run, catching entries that committed late with an older posted_at.
+LEDGER_RECONCILIATION_OVERLAP_SECONDS = env_int(
+    "LEDGER_RECONCILIATION_OVERLAP_SECONDS",
+    15 * 60,
+)
 
 PASSKEY_CHALLENGE_TTL = env_int("PASSKEY_CHALLENGE_TTL", 300)
 PASSKEY_REDIS_PREFIX = env("PASSKEY_REDIS_PREFIX", "passkey")
@@ -876,6 +964,14 @@ EMBEDDING_API_KEY = env("EMBEDDING_API_KEY", "")
 # Signed download URL expiry for private order files (seconds).
 FILE_SIGNED_URL_EXPIRY_SECONDS = env_int("FILE_SIGNED_URL_EXPIRY_SECONDS", 900)
 
+# ── Direct multipart uploads ───────────────────────────────────────────────────
+# "spaces" issues presigned S3 part URLs; "local" is a stand-in for tests/dev.
+FILE_MULTIPART_BACKEND = env("FILE_MULTIPART_BACKEND", "spaces")
+FILE_UPLOAD_PART_SIZE = env_int("FILE_UPLOAD_PART_SIZE", 8 * 1024 * 1024)
+FILE_UPLOAD_SESSION_TTL_SECONDS = env_int("FILE_UPLOAD_SESSION_TTL_SECONDS", 86400)
+# Completed uploads still unverified after this are failed and cleaned up.
+FILE_UPLOAD_VERIFY_TIMEOUT_SECONDS = env_int("FILE_UPLOAD_VERIFY_TIMEOUT_SECONDS", 21600)
+
 SILENCED_SYSTEM_CHECKS = env_list("SILENCED_SYSTEM_CHECKS", "")
 
 # treebeard 5.x warns that Wagtail's managers don't subclass MP_NodeManager.